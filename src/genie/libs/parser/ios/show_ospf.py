@@ -18,8 +18,6 @@ IOS parsers for the following show commands:
 # Python
 import re
 
-from netaddr import IPAddress, IPNetwork
-
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional
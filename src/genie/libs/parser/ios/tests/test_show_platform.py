@@ -676,7 +676,7 @@ class TestShowVersion(unittest.TestCase):
     def test_empty(self):
         self.dev1 = Mock(**self.empty_output)
         version_obj = ShowVersion(device=self.dev1)
-        with self.assertRaises(AttributeError):
+        with self.assertRaises(SchemaEmptyParserError):
             parsered_output = version_obj.parse()
 
     def test_semi_empty(self):
@@ -1,8 +1,10 @@
 # Metaparser
 from genie.metaparser import MetaParser
-import genie.parsergen as pg
 import re
 
+# Parser
+from genie.libs.parser.utils.table import parse_table
+
 
 # ===========================================
 # Schema for 'show app-hosting list'
@@ -35,10 +37,7 @@ class ShowApphostingList(ShowApphostingListSchema):
         # ---------------------------------------------------------                                                                                                 
         # utd                                      RUNNING   
         if out:
-            out = pg.oper_fill_tabular(device_output=out,
-                                    header_fields=["App id", "State"],
-                                    index=[0])
-            return_dict = out.entries
+            return_dict = parse_table(out, ["App id", "State"])
             app_id ={}
             for keys in return_dict.keys() :
                 app_dict={}
@@ -22,6 +22,7 @@ from genie.metaparser.util.schemaengine import Schema, Any, Optional
 
 # parser utils
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.spec import Spec, Rule, Set
 
 
 # =============================================
@@ -73,6 +74,31 @@ class ShowArp(ShowArpSchema):
     cli_command = ['show arp','show arp vrf {vrf}','show arp vrf {vrf} {intf_or_ip}','show arp {intf_or_ip}']
     exclude = ['age']
 
+    # Internet  192.168.234.1           -   58bf.eaff.e508  ARPA   Vlan100
+    # Internet  10.169.197.93          -   fa16.3eff.b7ad  ARPA
+    p1 = (r'^(?P<protocol>\w+) +(?P<address>[\d\.\:]+) +(?P<age>[\d\-]+) +'
+          r'(?P<mac>[\w\.]+) +(?P<type>\w+)( +(?P<interface>[\w\.\/\-]+))?$')
+
+    spec = Spec(
+        Rule(p1,
+             Set(('interfaces', '{interface}', 'ipv4', 'neighbors',
+                  '{address}'),
+                 {'ip': 'address',
+                  'link_layer_address': 'mac',
+                  'type': 'type',
+                  'origin': ('age', lambda age:
+                             'static' if age == '-' else 'dynamic'),
+                  'age': 'age',
+                  'protocol': 'protocol'}),
+             when=('interface', bool)),
+        Rule(p1,
+             Set(('global_static_table', '{address}'),
+                 {'ip_address': 'address',
+                  'mac_address': 'mac',
+                  'encap_type': 'type',
+                  'age': 'age',
+                  'protocol': 'protocol'})))
+
     def cli(self, vrf='', intf_or_ip='', cmd=None, output=None):
         if output is None:
             if not cmd:
@@ -88,47 +114,7 @@ class ShowArp(ShowArpSchema):
         else:
             out = output
 
-        # Internet  192.168.234.1           -   58bf.eaff.e508  ARPA   Vlan100
-        # Internet  10.169.197.93          -   fa16.3eff.b7ad  ARPA
-        p1 = re.compile(r'^(?P<protocol>\w+) +(?P<address>[\d\.\:]+) +(?P<age>[\d\-]+) +'
-                         '(?P<mac>[\w\.]+) +(?P<type>\w+)( +(?P<interface>[\w\.\/\-]+))?$')
-        # initial variables
-        ret_dict = {}
-
-        for line in out.splitlines():
-            line = line.strip()
-
-            # Internet  192.168.234.1           -   58bf.eaff.e508  ARPA   Vlan100
-            # Internet  10.169.197.93          -   fa16.3eff.b7ad  ARPA
-            m = p1.match(line)
-            if m:
-                group = m.groupdict()
-                address = group['address']
-                interface = group['interface']
-                if interface:
-                    final_dict = ret_dict.setdefault('interfaces', {}).setdefault(
-                        interface, {}).setdefault('ipv4', {}).setdefault(
-                        'neighbors', {}).setdefault(address, {})
-                    
-                    final_dict['ip'] = address
-                    final_dict['link_layer_address'] = group['mac']
-                    final_dict['type'] = group['type']
-                    if group['age'] == '-':
-                        final_dict['origin'] = 'static'
-                    else:
-                        final_dict['origin'] = 'dynamic'
-                else:
-                    final_dict = ret_dict.setdefault(
-                        'global_static_table', {}).setdefault(address, {})
-                    final_dict['ip_address'] = address
-                    final_dict['mac_address'] = group['mac']
-                    final_dict['encap_type'] = group['type']
-
-                final_dict['age'] = group['age']
-                final_dict['protocol'] = group['protocol']
-                continue
-
-        return ret_dict
+        return self.spec.parse(out)
 
 # =====================================
 # Parser for 'show ip arp, show ip arp vrf <vrf>'
@@ -115,6 +115,9 @@ from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional
 
 # Parser
 from genie.libs.parser.iosxe.show_vrf import ShowVrf
+from genie.libs.parser.utils import budget
+from genie.libs.parser.utils import parallel
+from genie.libs.parser.utils import bgp_paths
 
 
 # ============================================
@@ -236,10 +239,14 @@ class ShowBgpSuperParser(ShowBgpSchema):
         #     Network          Next Hop            Metric LocPrf Weight Path
         # *>   [5][65535:1][0][24][10.1.1.0]/17
         # *>  100:2051:VEID-2:Blk-1/136
-        p3_1 = re.compile(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)?'
-                          r'(?P<path_type>(i|e|c|l|a|r|I))?\s*'
+        # The status codes are matched once, (?=(?P<x>...))(?P=x) does not
+        # backtrack: whitespace quantifiers overlapping the status codes made
+        # the patterns cubic on unexpected lines
+        p3_1 = re.compile(r'^\s*(?:(?=(?P<status_codes>[sxSdh*>][sxSdh*>\s]*))'
+                          r'(?P=status_codes))?'
+                          r'(?:(?P<path_type>[ieclarI])\s*)?'
                           r'(?P<prefix>[a-zA-Z0-9\.\:\/\[\]\,\-]+)'
-                          r'(?: *(?P<param>[a-zA-Z0-9\.\:\/\[\]\,]+))?$')
+                          r'(?: +(?P<param>[a-zA-Z0-9\.\:\/\[\]\,]+))?$')
 
         #     Network          Next Hop            Metric LocPrf Weight Path
         # * i                  10.4.1.1               2219    100      0 200 33299 51178 47751 {27016} e
@@ -248,10 +255,13 @@ class ShowBgpSuperParser(ShowBgpSchema):
         # r>                    0.0.0.0                 0         32768 ?
         # *m                    0.0.0.0                 0         32768 ?
         # * i                  ::FFFF:10.4.1.1        2219    100      0 200 33299 51178 47751 {27016} e
-        p3_2 = re.compile(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|m|r|\s)+)?'
-                          r'(?P<path_type>(i|e|c|l|a|r|I))?\s{10,20}'
+        p3_2 = re.compile(r'^(?:\s*(?=(?P<status_codes>[sxSdh*>mr]'
+                          r'(?:[sxSdh*>mr]|\s+(?=[sxSdh*>mrieclarI]))*))'
+                          r'(?P=status_codes))?'
+                          r'(?:\s*(?P<path_type>[ieclarI])\s{10,20}|\s{10,})'
                           r'(?P<next_hop>[a-zA-Z0-9\.\:]+)'
-                          r' +(?P<metric>(?:\d+(?=[ \d]{13}\d ))?) +(?P<local_prf>(?:\d+(?=[ \d]{6}\d ))?) +(?P<weight>\d+)'
+                          r' (?: *(?P<metric>\d+(?=[ \d]{13}\d )))?'
+                          r' (?: *(?P<local_prf>\d+(?=[ \d]{6}\d )))? +(?P<weight>\d+)'
                           r'(?P<termination>[\s\S]+)$')
 
         # Network            Next Hop            Metric     LocPrf     Weight Path
@@ -262,12 +272,13 @@ class ShowBgpSuperParser(ShowBgpSchema):
         # *>i 2001:db8:cdc9:121::/64   ::FFFF:10.4.1.1        2219    100      0 200 33299 51178 47751 {27016} e
         # *>  100:2051:VEID-2:Blk-1/136
         # *>i10.1.1.0/24   0.0.0.0                   0    100      0 1234 60000 ?
-        p4 = re.compile(r'^\s*(?P<status_codes>(?:s|x|S|d|h|m|r|\*|\>|\s)+)?'
-                        r'(?P<path_type>(?:i|e|c|l|a|r|I))? *'
+        p4 = re.compile(r'^\s*(?:(?=(?P<status_codes>[sxSdhmr*>][sxSdhmr*>\s]*))'
+                        r'(?P=status_codes))?'
+                        r'(?:(?P<path_type>[ieclarI]) *)?'
                         r'(?P<prefix>[a-zA-Z0-9\.\:\/\-\[\]]+) +'
-                        r'(?P<next_hop>[a-zA-Z0-9\.\:]+) +'
-                        r'(?P<metric>(?:\d+(?=[ \d]{13}\d ))?) +'
-                        r'(?P<local_prf>(?:\d+(?=[ \d]{6}\d ))?) +'
+                        r'(?P<next_hop>[a-zA-Z0-9\.\:]+)'
+                        r' (?: *(?P<metric>\d+(?=[ \d]{13}\d )))?'
+                        r' (?: *(?P<local_prf>\d+(?=[ \d]{6}\d )))? +'
                         r'(?P<weight>\d+)(?P<path>[0-9 \S\{\}]+)$')
 
         # AF-Private Import to Address-Family: L2VPN E-VPN, Pfx Count/Limit: 2/1000
@@ -283,7 +294,7 @@ class ShowBgpSuperParser(ShowBgpSchema):
                         r'( +\(default for vrf +(?P<default_vrf>(\S+))\))?'
                         r'( +VRF Router ID (?P<vrf_router_id>(\S+)))?$')
 
-        for line in output.splitlines():
+        for line in budget.lines(output, route_dict):
             line = line.rstrip()
 
             # For address family: IPv4 Unicast
@@ -890,7 +901,8 @@ class ShowBgpAllDetailSchema(MetaParser):
 #   * 'show ip bgp {address_family} vrf {vrf} detail'
 #   * 'show ip bgp {address_family} rd {rd} detail'
 # ======================================================
-class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
+class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema,
+                               bgp_paths.SharedAttributes):
 
     ''' Super Parser for:
         * 'show bgp all detail'
@@ -899,6 +911,9 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
         * 'show bgp {address_family} rd {rd} detail'
         * 'show ip bgp {address_family} vrf {vrf} detail'
         * 'show ip bgp {address_family} rd {rd} detail'
+
+        parse_attributes() stores the AS paths (route_info), communities
+        and extended communities of the paths once, see bgp_paths.
     '''
 
     def cli(self, address_family='', vrf='', rd='', output=None):
@@ -1329,7 +1344,8 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
 
                 # Adding the keys we got from 'route_info' line
                 if route_info:
-                    subdict['route_info'] = route_info
+                    subdict['route_info'] = self._attribute('as_path',
+                                                            route_info)
                    
                 # Adding the keys we got from 'route_status' line                   
                 if route_status:
@@ -1395,7 +1411,8 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
                 if 'evpn' not in subdict:
                     subdict['evpn'] = {}
 
-                ext_community = group['ext_community']
+                ext_community = self._attribute('ext_community',
+                                                group['ext_community'])
                 subdict['evpn']['ext_community'] = ext_community
 
                 if group['encap']:
@@ -1410,7 +1427,8 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
             m = p8_2.match(line)
             if m:
                 group = m.groupdict()
-                ext_community = group['ext_community']
+                ext_community = self._attribute('ext_community',
+                                                group['ext_community'])
 
                 if 'evpn' in subdict:
                     subdict['evpn']['ext_community'] = ext_community
@@ -1426,7 +1444,8 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
             # Community: 1:1 65100:101 65100:175 65100:500 65100:601 65151:65000 65351:1
             m = p8_3.match(line)
             if m:
-                subdict['community'] = m.groupdict()['community']
+                subdict['community'] = self._attribute(
+                    'community', m.groupdict()['community'])
                 continue
 
             # AGI version(0), VE Block Size(10) Label Base(16)
@@ -2782,39 +2801,113 @@ class ShowBgpNeighborSuperParser(MetaParser):
         * 'show ip bgp {address_family} vrf {vrf} neighbors {neighbor}'
     '''
 
+    # For address family: IPv4 Unicast
+    # For address family: L2VPN E-VPN
+    p1 = re.compile(r'^For +address +family: +(?P<af>[a-zA-Z0-9\-\s]+)$')
+
+    # BGP neighbor is 10.16.2.2,  remote AS 100, internal link
+    p2_1 = re.compile(r'^BGP +neighbor +is +(?P<neighbor>(\S+)), +remote +AS'
+                     ' +(?P<remote_as>(\d+)), +(?P<link>[a-zA-Z]+) +link$')
+
+    # BGP neighbor is 10.66.6.6,  vrf VRF2,  remote AS 400, external link
+    # BGP neighbor is 172.17.111.1,  vrf SH_BGP_VRF100,  remote AS 65000, external link
+    p2_2 = re.compile(r'^BGP +neighbor +is +(?P<neighbor>(\S+)), +vrf'
+                       ' +(?P<vrf>(\S+)), +remote +AS +(?P<remote_as>(\d+)),'
+                       ' +(?P<link>[a-zA-Z]+) +link$')
+
+    # IOS output
+    # BGP neighbor is 10.51.1.101,  remote AS 300,  local AS 101, external link
+    # BGP neighbor is 10.51.1.101,  remote AS 300,  local AS 101 no-prepend replace-as, external link
+    p2_3 = re.compile(r'^BGP +neighbor +is +(?P<neighbor>(\S+)),'
+                       '(?: +vrf +(?P<vrf>(\S+)),)?'
+                       ' +remote +AS +(?P<remote_as>(\d+)),'
+                       ' +local +AS +(?P<local_as>\d+)(?P<no_prepend> no-prepend)?'
+                       '(?P<replace_as> replace-as)?, +(?P<link>(\S+)) +link$')
+
+    # Outputs of more lines are split at the neighbors and parsed by a pool
+    # of processes
+    parallel_lines = 100000
+
+    # Processes of the pool, default one per CPU; 1 parses sequentially
+    parallel_workers = None
+
     def cli(self, neighbor='', address_family='', vrf='', output=None):
 
+        lines = output.splitlines()
+        if len(lines) < self.parallel_lines or \
+                parallel.workers(self.parallel_workers) <= 1:
+            return self._parse_neighbors(lines)
+        try:
+            return self._parse_parallel(lines)
+        except Exception:
+            # A chunk could not be parsed alone, or the pool failed
+            return self._parse_neighbors(lines)
+
+    @classmethod
+    def _split_neighbors(cls, lines):
+        ''' return (starts, af_names, list_of_neighbors): the indexes of the
+            'BGP neighbor is' lines, the address family of each neighbor and
+            the list of neighbors of the sequential parse '''
+        starts = []
+        af_names = []
+        list_of_neighbors = []
+        listed = set()
+        af_name = None
+        for index, line in enumerate(lines):
+            # Most lines are neither, skipped without strip() and match()
+            if 'For' in line:
+                m = cls.p1.match(line.strip())
+                if m:
+                    af_name = m.groupdict()['af'].lower().replace("-", "")
+                    continue
+            if 'BGP' in line:
+                line = line.strip()
+                for pattern in (cls.p2_1, cls.p2_2, cls.p2_3):
+                    m = pattern.match(line)
+                    if m:
+                        break
+                else:
+                    continue
+                neighbor = m.groupdict()['neighbor']
+                # Only the neighbors without vrf and local AS are not repeated
+                if pattern is not cls.p2_1 or neighbor not in listed:
+                    list_of_neighbors.append(neighbor)
+                    listed.add(neighbor)
+                starts.append(index)
+                af_names.append(af_name)
+        return starts, af_names, list_of_neighbors
+
+    def _parse_parallel(self, lines):
+        ''' parse chunks of neighbors in a pool of processes and merge their
+            results '''
+        starts, af_names, list_of_neighbors = self._split_neighbors(lines)
+        count = parallel.workers(self.parallel_workers)
+        af_at = dict(zip(starts, af_names))
+        jobs = [('\n'.join(lines[first:last]), af_at.get(first))
+                for first, last in parallel.split(lines, starts, count)]
+        ret_dict = {}
+        for result in parallel.run(_parse_neighbor_chunk, jobs, count):
+            parallel.merge(ret_dict, result)
+        if list_of_neighbors:
+            ret_dict['list_of_neighbors'] = list_of_neighbors
+        return ret_dict
+
+    @classmethod
+    def _parse_neighbors(cls, lines, af_name=None):
+        ''' parse the lines of neighbors, af_name the address family of
+            the lines before the first 'For address family' '''
+
         # Init vars
         ret_dict = {}
         list_of_neighbors = []
-        af_name = None ; af_dict = {} ; nbr_dict = {}
+        af_dict = {} ; nbr_dict = {}
         message_statistics = False
         prefix_activity = True
         local_prefix = False
         refresh_activity = False
 
-        # For address family: IPv4 Unicast
-        # For address family: L2VPN E-VPN
-        p1 = re.compile(r'^For +address +family: +(?P<af>[a-zA-Z0-9\-\s]+)$')
-
-        # BGP neighbor is 10.16.2.2,  remote AS 100, internal link
-        p2_1 = re.compile(r'^BGP +neighbor +is +(?P<neighbor>(\S+)), +remote +AS'
-                         ' +(?P<remote_as>(\d+)), +(?P<link>[a-zA-Z]+) +link$')
-
-        # BGP neighbor is 10.66.6.6,  vrf VRF2,  remote AS 400, external link
-        # BGP neighbor is 172.17.111.1,  vrf SH_BGP_VRF100,  remote AS 65000, external link
-        p2_2 = re.compile(r'^BGP +neighbor +is +(?P<neighbor>(\S+)), +vrf'
-                           ' +(?P<vrf>(\S+)), +remote +AS +(?P<remote_as>(\d+)),'
-                           ' +(?P<link>[a-zA-Z]+) +link$')
-
-        # IOS output
-        # BGP neighbor is 10.51.1.101,  remote AS 300,  local AS 101, external link
-        # BGP neighbor is 10.51.1.101,  remote AS 300,  local AS 101 no-prepend replace-as, external link
-        p2_3 = re.compile(r'^BGP +neighbor +is +(?P<neighbor>(\S+)),'
-                           '(?: +vrf +(?P<vrf>(\S+)),)?'
-                           ' +remote +AS +(?P<remote_as>(\d+)),'
-                           ' +local +AS +(?P<local_as>\d+)(?P<no_prepend> no-prepend)?'
-                           '(?P<replace_as> replace-as)?, +(?P<link>(\S+)) +link$')
+        # For address family / BGP neighbor is, shared with _split_neighbors
+        p1, p2_1, p2_2, p2_3 = cls.p1, cls.p2_1, cls.p2_2, cls.p2_3
 
         # Description: router22222222
         p3 = re.compile(r'^Description: +(?P<description>(\S+))$')
@@ -3154,7 +3247,7 @@ class ShowBgpNeighborSuperParser(MetaParser):
         # No active TCP connection
         p72 = re.compile(r'^No +active +TCP +connection$')
 
-        for line in output.splitlines():
+        for line in lines:
 
             line = line.strip()
 
@@ -3972,6 +4065,12 @@ class ShowBgpNeighborSuperParser(MetaParser):
         return ret_dict
 
 
+def _parse_neighbor_chunk(text, af_name):
+    ''' entry of the processes parsing a chunk of 'show bgp neighbors' '''
+    return ShowBgpNeighborSuperParser._parse_neighbors(text.splitlines(),
+                                                       af_name=af_name)
+
+
 # =========================================================
 # Parser for:
 #   * 'show bgp all neighbors'
@@ -4360,12 +4459,17 @@ class ShowBgpNeighborsAdvertisedRoutesSuperParser(ShowBgpNeighborsAdvertisedRout
         p1 = re.compile(r'^\s*For +address +family:'
                             ' +(?P<address_family>[a-zA-Z0-9\s\-\_]+)$')
 
-        p3_1 = re.compile(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)?'
-                            '(?P<path_type>(i|e|c|l|a|r|I))?'
-                            '(?P<prefix>[a-zA-Z0-9\.\:\/\[\]\,]+)'
-                            '(?: *(?P<next_hop>[a-zA-Z0-9\.\:\/\[\]\,]+))?$')
-
-        p3_2 = re.compile(r'^\s*(?P<status_codes>(s|x|S|d|b|h|\*|\>|\s)+)'
+        # The status codes are matched once, a lookahead followed by its
+        # backreference does not backtrack, and numbers end on a non space:
+        # whitespace quantifiers overlapping them made the patterns
+        # exponential on unexpected lines
+        p3_1 = re.compile(r'^\s*(?:(?=(?P<status_codes>[sxSdh*>][sxSdh*>\s]*))'
+                            r'(?P=status_codes))?'
+                            r'(?P<path_type>(i|e|c|l|a|r|I))?'
+                            r'(?P<prefix>[a-zA-Z0-9\.\:\/\[\]\,]+)'
+                            r'(?: +(?P<next_hop>[a-zA-Z0-9\.\:\/\[\]\,]+))?$')
+
+        p3_2 = re.compile(r'^\s*(?P<status_codes>(?=([sxSdbh*>][sxSdbh*>\s]*))\2|\s)'
                             '(?P<path_type>(i|e|c|l|a|r|I))?(\s)?'
                             '(?P<prefix>(([0-9]+[\.][0-9]+[\.][0-9]+'
                             '[\.][0-9]+[\/]?[0-9]*)|([a-zA-Z0-9]+[\:]'
@@ -4374,19 +4478,22 @@ class ShowBgpNeighborsAdvertisedRoutesSuperParser(ShowBgpNeighborsAdvertisedRout
                             '([a-zA-Z0-9]+[\:][a-zA-Z0-9]+[\:]'
                             '[a-zA-Z0-9]+[\:][\:][\/][0-9]+)))'
                             ' +(?P<next_hop>[a-zA-Z0-9\.\:]+)'
-                            ' +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}]+)'
+                            ' +(?P<numbers>[a-zA-Z0-9\(\)\{\}]'
+                            '(?:[a-zA-Z0-9\s\(\)\{\}]*[a-zA-Z0-9\(\)\{\}])?)'
                             ' +(?P<origin_codes>(i|e|\?|\&|\|))$')
 
-        p3_3 = re.compile(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)?'
-                            '(?P<path_type>(i|e|c|l|a|r|I))?'
-                            ' +(?P<next_hop>(([0-9]+[\.][0-9]+[\.][0-9]'
-                            '+[\.][0-9]+)|([a-zA-Z0-9]+[\:][a-zA-Z0-9]+'
-                            '[\:][a-zA-Z0-9]+[\:][a-zA-Z0-9]+[\:]'
-                            '[a-zA-Z0-9]+[\:][\:][a-zA-Z0-9])|'
-                            '([a-zA-Z0-9]+[\:][a-zA-Z0-9]+[\:][a-zA-Z0-9]+'
-                            '[\:][a-zA-Z0-9]+[\:][\:][a-zA-Z0-9])))?'
-                            '(?: +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}]+))?'
-                            ' +(?P<origin_codes>(i|e|\?|\|))$')
+        p3_3 = re.compile(r'^(?:\s*(?=(?P<status_codes>[sxSdh*>]'
+                            r'(?:\s*[sxSdh*>])*))(?P=status_codes))?'
+                            r'(?:\s*(?P<path_type>(i|e|c|l|a|r|I)))?'
+                            r' +(?:(?P<next_hop>(([0-9]+[\.][0-9]+[\.][0-9]'
+                            r'+[\.][0-9]+)|([a-zA-Z0-9]+[\:][a-zA-Z0-9]+'
+                            r'[\:][a-zA-Z0-9]+[\:][a-zA-Z0-9]+[\:]'
+                            r'[a-zA-Z0-9]+[\:][\:][a-zA-Z0-9])|'
+                            r'([a-zA-Z0-9]+[\:][a-zA-Z0-9]+[\:][a-zA-Z0-9]+'
+                            r'[\:][a-zA-Z0-9]+[\:][\:][a-zA-Z0-9]))) +)?'
+                            r'(?:(?P<numbers>[a-zA-Z0-9\(\)\{\}]'
+                            r'(?:[a-zA-Z0-9\s\(\)\{\}]*[a-zA-Z0-9\(\)\{\}])?) +)?'
+                            r'(?P<origin_codes>(i|e|\?|\|))$')
 
         p4 = re.compile(r'^\s*Route +Distinguisher *: '
                             '+(?P<route_distinguisher>(\S+))'
@@ -4442,10 +4549,11 @@ class ShowBgpNeighborsAdvertisedRoutesSuperParser(ShowBgpNeighborsAdvertisedRout
         # *>i10.49.0.0/16         10.106.101.1                        100          0 10 20 30 40 50 60 70 80 90 i
         # *>i10.4.2.0/24         10.106.102.4                        100          0 {62112 33492 4872 41787 13166 50081 21461 58376 29755 1135} i
         # *>i  172.16.51.0/24    192.168.36.220          0    100      0 ?
-        p3_2 = re.compile(r'^\s*(?P<status_codes>(s|x|S|d|b|h|\*|\>|\s)+)'
-            '(?P<path_type>(i|e|c|l|a|r|I))?(\s+)?(?P<prefix>\S+) +(?P<next_hop>'
-            '[a-zA-Z0-9\.\:]+) +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}]+) +'
-            '(?P<origin_codes>(i|e|\?|\&|\|))$')
+        p3_2 = re.compile(r'^\s*(?P<status_codes>(?=([sxSdbh*>][sxSdbh*>\s]*))\2|\s(?=\S))'
+            r'(?P<path_type>(i|e|c|l|a|r|I))?(\s+)?(?P<prefix>\S+) +(?P<next_hop>'
+            r'[a-zA-Z0-9\.\:]+) +(?P<numbers>[a-zA-Z0-9\(\)\{\}]'
+            r'(?:[a-zA-Z0-9\s\(\)\{\}]*[a-zA-Z0-9\(\)\{\}])?) +'
+            r'(?P<origin_codes>(i|e|\?|\&|\|))$')
 
         #                     0.0.0.0               100      32768 i
         #                     10.106.101.1            4444       100 0 3 10 20 30 40 50 60 70 80 90 i
@@ -4456,7 +4564,7 @@ class ShowBgpNeighborsAdvertisedRoutesSuperParser(ShowBgpNeighborsAdvertisedRout
         # Route Distinguisher: 300:1 (default for vrf VRF1) VRF Router ID 10.94.44.44
 
 
-        for line in output.splitlines():
+        for line in budget.lines(output, route_dict):
             line = line.rstrip()
 
             # For address family: IPv4 Unicast
@@ -5028,21 +5136,25 @@ class ShowBgpNeighborsReceivedRoutesSuperParser(ShowBgpNeighborsReceivedRoutesSc
         p2 = re.compile(r'^\s*BGP +table +version +is'
                             ' +(?P<bgp_table_version>[0-9]+), +[Ll]ocal +[Rr]outer'
                             ' +ID +is +(?P<local_router_id>(\S+))$')
-        p3_1 = re.compile(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)?'
-                            '(?P<path_type>(i|e|c|l|a|r|I))?'
-                            '(?P<prefix>[a-zA-Z0-9\.\:\/\[\]\,]+)'
-                        '(?: *(?P<next_hop>[a-zA-Z0-9\.\:\/\[\]\,]+))?$')
-        p3_2 = re.compile(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)'
-                            '(?P<path_type>(i|e|c|l|a|r|I))?(\s)?'
-                            '(?P<prefix>(([0-9]+[\.][0-9]+[\.][0-9]+'
-                            '[\.][0-9]+[\/][0-9]+)|([a-zA-Z0-9]+[\:]'
-                            '[a-zA-Z0-9]+[\:][a-zA-Z0-9]+[\:]'
-                            '[a-zA-Z0-9]+[\:][\:][\/][0-9]+)|'
-                            '([a-zA-Z0-9]+[\:][a-zA-Z0-9]+[\:]'
-                            '[a-zA-Z0-9]+[\:][\:][\/][0-9]+)))'
-                            ' +(?P<next_hop>[a-zA-Z0-9\.\:]+)'
-                            ' +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}]+)'
-                            ' +(?P<origin_codes>(i|e|\?|\&|\|))$')
+        # Status codes matched once and numbers ending on a non space, as in
+        # ShowBgpNeighborsAdvertisedRoutesSuperParser
+        p3_1 = re.compile(r'^\s*(?:(?=(?P<status_codes>[sxSdh*>][sxSdh*>\s]*))'
+                            r'(?P=status_codes))?'
+                            r'(?P<path_type>(i|e|c|l|a|r|I))?'
+                            r'(?P<prefix>[a-zA-Z0-9\.\:\/\[\]\,]+)'
+                            r'(?: +(?P<next_hop>[a-zA-Z0-9\.\:\/\[\]\,]+))?$')
+        p3_2 = re.compile(r'^\s*(?P<status_codes>(?=([sxSdh*>][sxSdh*>\s]*))\2|\s)'
+                            r'(?P<path_type>(i|e|c|l|a|r|I))?(\s)?'
+                            r'(?P<prefix>(([0-9]+[\.][0-9]+[\.][0-9]+'
+                            r'[\.][0-9]+[\/][0-9]+)|([a-zA-Z0-9]+[\:]'
+                            r'[a-zA-Z0-9]+[\:][a-zA-Z0-9]+[\:]'
+                            r'[a-zA-Z0-9]+[\:][\:][\/][0-9]+)|'
+                            r'([a-zA-Z0-9]+[\:][a-zA-Z0-9]+[\:]'
+                            r'[a-zA-Z0-9]+[\:][\:][\/][0-9]+)))'
+                            r' +(?P<next_hop>[a-zA-Z0-9\.\:]+)'
+                            r' +(?P<numbers>[a-zA-Z0-9\(\)\{\}]'
+                            r'(?:[a-zA-Z0-9\s\(\)\{\}]*[a-zA-Z0-9\(\)\{\}])?)'
+                            r' +(?P<origin_codes>(i|e|\?|\&|\|))$')
         p3_3 = re.compile(r'^\s*(?P<next_hop>[a-zA-Z0-9\.\:]+)'
                             '(?: +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}]+))?'
                             ' +(?P<origin_codes>(i|e|\?|\|))$')
@@ -5075,7 +5187,7 @@ class ShowBgpNeighborsReceivedRoutesSuperParser(ShowBgpNeighborsReceivedRoutesSc
         index = 1
         bgp_table_version = local_router_id = ''
 
-        for line in output.splitlines():
+        for line in budget.lines(output, route_dict):
             line = line.rstrip()
 
             # For address family: IPv4 Unicast
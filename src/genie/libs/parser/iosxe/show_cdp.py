@@ -12,6 +12,7 @@ import re
 
 # Metaparser
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.spec import Spec, Rule, Set
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any, Optional
 
@@ -38,12 +39,81 @@ class ShowCdpNeighborsSchema(MetaParser):
 # ================================
 # Parser for 'show cdp neighbors'
 # ================================
+def _convert_intf(intf):
+    return Common.convert_intf_name(intf=intf.strip())
+
+
+# Entry of a neighbor, counted from 1
+_NEIGHBOR = ('cdp', 'index', '#index')
+
+# Columns of a neighbor, after its device id
+_COLUMNS = {
+    'local_interface': ('local_interface', _convert_intf),
+    'hold_time': ('hold_time', int),
+    'capability': ('capability', str.strip),
+    'platform': ('platform', str.strip, ''),
+    'port_id': ('port_id', _convert_intf),
+}
+
+
 class ShowCdpNeighbors(ShowCdpNeighborsSchema):
 
     exclude = ['hold_time']
 
     cli_command = 'show cdp neighbors'
 
+    # Capability Codes: R - Router, T - Trans Bridge, B - Source Route Bridge
+    #                   S - Switch, H - Host, I - IGMP, r - Repeater, P - Phone,
+    #                   D - Remote, C - CVTA, M - Two-port Mac Relay
+
+    # Specifically for situations when Platform and Port Id are concatenated
+    # RX-SWV.cisco.com Fas 0/1            167         T S       WS-C3524-XFas 0/13
+    # C2950-1          Fas 0/0            148         S I       WS-C2950T-Fas 0/15
+    p1 = (r'^(?P<device_id>\S+) +'
+          r'(?P<local_interface>[a-zA-Z]+[\s]*[\d\/\.]+) +'
+          r'(?P<hold_time>\d+) +(?P<capability>[RTBSHIrPDCM\s]+) +'
+          r'(?P<platform>\S+)'
+          r'(?P<port_id>(Fa|Gi|GE).\s*\d*\/*\d*)$')
+
+    # No platform
+    # R5.cisco.com Gig 0/0 125 R B Gig 0/0
+    # SEP08000F8BA7FD  Gig 1/0/7         179              H P   Mitel 532 Port 1
+    p2 = (r'^(?P<device_id>\S+) +'
+          r'(?P<local_interface>[a-zA-Z]+[\s]*[\d\/\.]+) +'
+          r'(?P<hold_time>\d+) +'
+          r'(?P<capability>[RTBSHIrPDCM\s]+)'
+          r'(?: +(?P<platform>[\w\-]+ (\d+)?))? +'
+          r'(?P<port_id>[a-zA-Z0-9\/]+( [a-zA-Z0-9\/\s]+)?)$')
+
+    # device6 Gig 0 157 R S I C887VA-W-W Gi 0
+    # SEP08000FA9B170  Gig 1/0/9         158              H P   Mitel 532 Port 1
+    p3 = (r'^(?P<device_id>\S+) +'
+          r'(?P<local_interface>[a-zA-Z]+[\s]*[\d\/\.]+) +'
+          r'(?P<hold_time>\d+) +(?P<capability>[RTBSHIrPDCM\s]+) +'
+          r'(?P<platform>\S+(?: \d+)?) '
+          r'(?P<port_id>[a-zA-Z0-9\/\s]+)$')
+
+    # p4 and p5 for two-line output, where device id is on a separate line
+    p4 = r'^(?P<device_id>\S+)$'
+    p5 = (r'(?P<local_interface>[a-zA-Z]+[\s]*[\d/.]+) +'
+          r'(?P<hold_time>\d+) +(?P<capability>[RTBSHIrPDCM\s]+) +'
+          r'(?P<platform>\S+) (?P<port_id>[\.a-zA-Z0-9/\s]+)$')
+
+    spec = Spec(
+        *[Rule(pattern,
+               Set(_NEIGHBOR,
+                   dict(_COLUMNS, device_id=('device_id', str.strip))),
+               opens=True)
+          for pattern in (p1, p2, p3)],
+        # The port of the neighbor above, when wrapped
+        Rule(p4, Set((), {'port_id': ('device_id', _convert_intf)}),
+             when=('device_id', lambda device_id: 'Eth' in device_id),
+             depth=1),
+        Rule(p4, Set(_NEIGHBOR, {'device_id': ('device_id', str.strip)}),
+             when=('device_id', lambda device_id: 'Eth' not in device_id),
+             opens=True),
+        Rule(p5, Set((), _COLUMNS), depth=1))
+
     def cli(self, output=None):
 
         if output is None:
@@ -51,109 +121,7 @@ class ShowCdpNeighbors(ShowCdpNeighborsSchema):
         else:
             out = output
 
-        # Capability Codes: R - Router, T - Trans Bridge, B - Source Route Bridge
-        #                   S - Switch, H - Host, I - IGMP, r - Repeater, P - Phone,
-        #                   D - Remote, C - CVTA, M - Two-port Mac Relay
-
-        # Specifically for situations when Platform and Port Id are concatenated        
-        # RX-SWV.cisco.com Fas 0/1            167         T S       WS-C3524-XFas 0/13
-        # C2950-1          Fas 0/0            148         S I       WS-C2950T-Fas 0/15
-        p1 = re.compile(r'^(?P<device_id>\S+) +'
-                         '(?P<local_interface>[a-zA-Z]+[\s]*[\d\/\.]+) +'
-                         '(?P<hold_time>\d+) +(?P<capability>[RTBSHIrPDCM\s]+) +'
-                         '(?P<platform>\S+)'
-                         '(?P<port_id>(Fa|Gi|GE).\s*\d*\/*\d*)$')
-
-        # No platform
-        # R5.cisco.com Gig 0/0 125 R B Gig 0/0
-        # SEP08000F8BA7FD  Gig 1/0/7         179              H P   Mitel 532 Port 1
-        p2 = re.compile(r'^(?P<device_id>\S+) +'
-                        r'(?P<local_interface>[a-zA-Z]+[\s]*[\d\/\.]+) +'
-                        r'(?P<hold_time>\d+) +'
-                        r'(?P<capability>[RTBSHIrPDCM\s]+)'
-                        r'(?: +(?P<platform>[\w\-]+ (\d+)?))? +'
-                        r'(?P<port_id>[a-zA-Z0-9\/]+( [a-zA-Z0-9\/\s]+)?)$')
-
-        # device6 Gig 0 157 R S I C887VA-W-W Gi 0
-        # SEP08000FA9B170  Gig 1/0/9         158              H P   Mitel 532 Port 1
-        p3 = re.compile(r'^(?P<device_id>\S+) +'
-                        r'(?P<local_interface>[a-zA-Z]+[\s]*[\d\/\.]+) +'
-                        r'(?P<hold_time>\d+) +(?P<capability>[RTBSHIrPDCM\s]+) +'
-                        r'(?P<platform>\S+(?: \d+)?) '
-                        r'(?P<port_id>[a-zA-Z0-9\/\s]+)$')
-
-        # p4 and p5 for two-line output, where device id is on a separate line
-        p4 = re.compile(r'^(?P<device_id>\S+)$')
-        p5 = re.compile(r'(?P<local_interface>[a-zA-Z]+[\s]*[\d/.]+) +'
-                        r'(?P<hold_time>\d+) +(?P<capability>[RTBSHIrPDCM\s]+) +'
-                        r'(?P<platform>\S+) (?P<port_id>[\.a-zA-Z0-9/\s]+)$')
-
-        device_id_index = 0
-        parsed_dict = {}
-
-        for line in out.splitlines():
-            line = line.strip()
-
-            result = p1.match(line)
-
-            if not result:
-                result = p2.match(line)
-                if not result:
-                    result = p3.match(line)
-            if result:
-
-                device_id_index += 1
-
-                device_dict = parsed_dict.setdefault('cdp', {}) \
-                        .setdefault('index', {}).setdefault(device_id_index, {})
-
-                group = result.groupdict()
-                device_dict['device_id'] = group['device_id'].strip()
-                device_dict['local_interface'] = Common.convert_intf_name\
-                    (intf=group['local_interface'].strip())
-                device_dict['hold_time'] = int(group['hold_time'])
-                device_dict['capability'] = group['capability'].strip()
-                if group['platform']:
-                    device_dict['platform'] = group['platform'].strip()
-                elif not group['platform']:
-                    device_dict['platform'] = ''
-
-                device_dict['port_id'] = Common.convert_intf_name\
-                    (intf=group['port_id'].strip())
-                continue
-
-            result = p4.match(line)
-            if result:
-                group = result.groupdict()
-                if 'Eth' not in group['device_id']:
-                    device_id_index += 1
-                    device_dict = parsed_dict.setdefault('cdp', {}) \
-                        .setdefault('index', {}).setdefault(device_id_index, {})
-                    device_dict['device_id'] = group['device_id'].strip()
-                else:
-                    device_dict['port_id'] = Common \
-                        .convert_intf_name(intf=group['device_id'].strip())
-                continue
-
-            result = p5.match(line)
-            if result:
-                group = result.groupdict()
-                device_dict = parsed_dict.setdefault('cdp', {}) \
-                    .setdefault('index', {}).setdefault(device_id_index, {})
-                device_dict['local_interface'] = Common \
-                    .convert_intf_name(intf=group['local_interface'].strip())
-                device_dict['hold_time'] = int(group['hold_time'])
-                device_dict['capability'] = group['capability'].strip()
-                if group['platform']:
-                    device_dict['platform'] = group['platform'].strip()
-                elif not group['platform']:
-                    device_dict['platform'] = ''
-
-                device_dict['port_id'] = Common \
-                    .convert_intf_name(intf=group['port_id'].strip())
-                continue
-
-        return parsed_dict
+        return self.spec.parse(out)
 
 
 class ShowCdpNeighborsDetailSchema(MetaParser):
@@ -15,6 +15,7 @@ from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional, And, D
 
 # Common
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils import budget
 
 # =========================================================
 # Schema for 'show flow monitor {name} cache format table'
@@ -247,7 +248,9 @@ class ShowFlowMonitorCache(ShowFlowMonitorCacheSchema):
         # - Event aged                                 0
         # - Watermark aged                             6
         # - Emergency aged                             0
-        p7 = re.compile(r'^- +(?P<key>[\S\s]+?)( +\( +(?P<secs>\d+) +secs\))? +(?P<value>\d+)$')
+        # The key starts and ends on a non space, the lazy key overlapped
+        # the spaces around it and made the pattern cubic on unexpected lines
+        p7 = re.compile(r'^- +(?P<key>\S(?:[\S\s]*?\S)?)( +\( +(?P<secs>\d+) +secs\))? +(?P<value>\d+)$')
 
         # 0   (DEFAULT)   192.168.189.254    192.168.189.253    Null   Te0/0/0.1003     2
         p8 = re.compile(r'^(?P<ip_vrf_id_input>\d+ +\(\S+\)) +(?P<ipv4_src_addr>\S+) '
@@ -272,7 +275,7 @@ class ShowFlowMonitorCache(ShowFlowMonitorCacheSchema):
         # counter packets:           3
         p14 = re.compile(r'^counter packets: +(?P<pkts>\d+)$')
 
-        for line in out.splitlines():
+        for line in budget.lines(out, ret_dict):
             line = line.strip()
 
             # Cache type:                               Normal (Platform cache)
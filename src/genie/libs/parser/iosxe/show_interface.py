@@ -20,7 +20,6 @@ import logging
 import pprint
 import re
 import unittest
-from genie import parsergen
 from collections import defaultdict
 
 from pyats.log.utils import banner
@@ -47,6 +46,9 @@ from genie.metaparser.util.schemaengine import Schema, \
                                          Use
 # import parser utils
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.lazy import LazyRecords
+from genie.libs.parser.utils import budget
+from genie.libs.parser.utils.table import parse_table
 
 logger = logging.getLogger(__name__)
 
@@ -208,6 +210,29 @@ class ShowInterfaces(ShowInterfacesSchema):
         'out_lost_carrier', '(Tunnel.*)', 'input_queue_flushes',
         'reliability']
 
+    # Interface header lines, also used to index the records in parse_lazy
+    # GigabitEthernet1 is up, line protocol is up 
+    # Port-channel12 is up, line protocol is up (connected)
+    # Vlan1 is administratively down, line protocol is down , Autostate Enabled
+    # Dialer1 is up (spoofing), line protocol is up (spoofing)
+    p1 = re.compile(r'^(?P<interface>[\w\/\.\-]+) +is +(?P<enabled>[\w\s]+)(?: '
+                    r'+\S+)?, +line +protocol +is +(?P<line_protocol>\w+)(?: '
+                    r'*\((?P<attribute>\S+)\)|( +\, +Autostate +(?P<autostate>\S+)))?.*$')
+    p1_1 =  re.compile(r'^(?P<interface>[\w\/\.\-]+) +is'
+                       r' +(?P<enabled>[\w\s]+),'
+                       r' +line +protocol +is +(?P<line_protocol>\w+)'
+                       r'( *, *(?P<attribute>[\w\s]+))?$')
+
+    # Lines completing the record of another interface
+    # Members in this channel: Gi1/0/2
+    # Members in this channel: Fo1/0/2 Fo1/0/4
+    p15 = re.compile(r'^Members +in +this +channel: +'
+                      '(?P<port_channel_member_intfs>[\w\/\.\s\,]+)$')
+    # Interface is unnumbered. Using address of Loopback0 (10.4.1.1)
+    # Interface is unnumbered. Using address of GigabitEthernet0/2.1 (192.168.154.1)
+    p35 = re.compile(r'^Interface +is +unnumbered. +Using +address +of +'
+                      '(?P<unnumbered_intf>[\w\/\.]+) +'
+                      '\((?P<unnumbered_ip>[\w\.\:]+)\)$')
 
     def cli(self,interface="",output=None):
         if output is None:
@@ -219,17 +244,8 @@ class ShowInterfaces(ShowInterfacesSchema):
         else:
             out = output
 
-        # GigabitEthernet1 is up, line protocol is up 
-        # Port-channel12 is up, line protocol is up (connected)
-        # Vlan1 is administratively down, line protocol is down , Autostate Enabled
-        # Dialer1 is up (spoofing), line protocol is up (spoofing)
-        p1 = re.compile(r'^(?P<interface>[\w\/\.\-]+) +is +(?P<enabled>[\w\s]+)(?: '
-                        r'+\S+)?, +line +protocol +is +(?P<line_protocol>\w+)(?: '
-                        r'*\((?P<attribute>\S+)\)|( +\, +Autostate +(?P<autostate>\S+)))?.*$')
-        p1_1 =  re.compile(r'^(?P<interface>[\w\/\.\-]+) +is'
-                           r' +(?P<enabled>[\w\s]+),'
-                           r' +line +protocol +is +(?P<line_protocol>\w+)'
-                           r'( *, *(?P<attribute>[\w\s]+))?$')
+        p1 = self.p1
+        p1_1 = self.p1_1
 
         # Hardware is Gigabit Ethernet, address is 0057.d2ff.428c (bia 0057.d2ff.428c)
         # Hardware is Loopback
@@ -309,10 +325,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                           'output +(?P<last_output>[\w\.\:]+), '
                           'output +hang +(?P<output_hang>[\w\.\:]+)$')
 
-        # Members in this channel: Gi1/0/2
-        # Members in this channel: Fo1/0/2 Fo1/0/4
-        p15 = re.compile(r'^Members +in +this +channel: +'
-                          '(?P<port_channel_member_intfs>[\w\/\.\s\,]+)$')   
+        p15 = self.p15
 
         # No. of active members in this channel: 12 
         p15_1 = re.compile(r'^No\. +of +active +members +in +this +'
@@ -426,11 +439,7 @@ class ShowInterfaces(ShowInterfacesSchema):
         p34 = re.compile(r'^(?P<out_buffer_failure>[0-9]+) +output +buffer +failures, +'
                           '(?P<out_buffers_swapped>[0-9]+) +output +buffers +swapped +out$')
 
-        # Interface is unnumbered. Using address of Loopback0 (10.4.1.1)
-        # Interface is unnumbered. Using address of GigabitEthernet0/2.1 (192.168.154.1)
-        p35 = re.compile(r'^Interface +is +unnumbered. +Using +address +of +'
-                          '(?P<unnumbered_intf>[\w\/\.]+) +'
-                          '\((?P<unnumbered_ip>[\w\.\:]+)\)$')
+        p35 = self.p35
         
         # 8 maximum active VCs, 1024 VCs per VP, 1 current VCCs
         p36 = re.compile(r'^(?P<maximum_active_vcs>\d+) +maximum +active +VCs, +'
@@ -469,7 +478,7 @@ class ShowInterfaces(ShowInterfacesSchema):
 
         interface_dict = {}
         unnumbered_dict = {}
-        for line in out.splitlines():
+        for line in budget.lines(out, interface_dict):
             line = line.strip()
             # GigabitEthernet1 is up, line protocol is up 
             # Port-channel12 is up, line protocol is up (connected)
@@ -1177,8 +1186,50 @@ class ShowInterfaces(ShowInterfacesSchema):
                                 ['interface_ref'] = unnumbered_intf
         return(interface_dict)
 
+    def parse_lazy(self, interface='', output=None):
+        '''Index the interface blocks of the output once and only parse
+           the block of an interface when it is accessed
+
+            Args:
+                interface (`str`): interface to execute the command for
+                output (`str`): output to parse instead of executing
+
+            Returns:
+                LazyRecords, read-only mapping of interface name to the
+                same record as parse() returns
+        '''
+        if output is None:
+            if interface:
+                cmd = self.cli_command[1].format(interface=interface)
+            else:
+                cmd = self.cli_command[0]
+            output = self.device.execute(cmd)
+
+        return LazyRecords(output=output,
+                           parse=lambda text: self.cli(output=text),
+                           headers=(self.p1, self.p1_1),
+                           marker='line protocol',
+                           links=self._lazy_links,
+                           validate=Schema(self.schema).validate)
+
+    def _lazy_links(self, records):
+        '''Port-channel members and unnumbered interfaces are completed by
+           the block of another interface'''
+        for start, line in records.lines_containing('Members in this channel'):
+            m = self.p15.match(line)
+            if m:
+                port_channel = records.owner(start)
+                for intf in m.groupdict()['port_channel_member_intfs'].split(' '):
+                    if intf.strip():
+                        yield Common.convert_intf_name(intf.strip()), port_channel
+
+        for start, line in records.lines_containing('Interface is unnumbered'):
+            m = self.p35.match(line)
+            if m:
+                yield records.owner(start), m.groupdict()['unnumbered_intf']
+
 
-# parser using parsergen
+# parser using utils.table
 # ----------------------
 class ShowIpInterfaceBriefSchema(MetaParser):
     """Parser for show ip interface brief"""
@@ -1240,28 +1291,24 @@ class ShowIpInterfaceBrief(ShowIpInterfaceBriefSchema):
             out = output
 
         if out:
-            res = parsergen.oper_fill_tabular(device_output=out,
-                                              device_os='iosxe',
-                                              table_terminal_pattern=r"^\n",
-                                              header_fields=
-                                               [ "Interface",
-                                                 "IP-Address",
-                                                 "OK\?",
-                                                 "Method",
-                                                 "Status",
-                                                 "Protocol" ],
-                                              label_fields=
-                                               [ "Interface",
-                                                 "ip_address",
-                                                 "interface_is_ok",
-                                                 "method",
-                                                 "status",
-                                                 "protocol" ],
-                                              index=[0])
-
-            # Building the schema out of the parsergen output
-            if res.entries:
-                for intf, intf_dict in res.entries.items():
+            entries = parse_table(out,
+                                  [ "Interface",
+                                    "IP-Address",
+                                    "OK\?",
+                                    "Method",
+                                    "Status",
+                                    "Protocol" ],
+                                  labels=
+                                   [ "Interface",
+                                     "ip_address",
+                                     "interface_is_ok",
+                                     "method",
+                                     "status",
+                                     "protocol" ])
+
+            # Building the schema out of the table
+            if entries:
+                for intf, intf_dict in entries.items():
                     intf = Common.convert_intf_name(intf)
                     del intf_dict['Interface']
                     parsed_dict.setdefault('interface', {}).update({intf: intf_dict})
@@ -11,6 +11,9 @@ import re
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
 
+# Parser Utils
+from genie.libs.parser.utils import log_tail
+
 
 # ==============================================
 # Schema for:
@@ -25,6 +28,7 @@ class ShowLoggingSchema(MetaParser):
 
     schema = {
         'logs': list,
+        Optional('entries'): list,
         }
 
 
@@ -42,14 +46,33 @@ class ShowLogging(ShowLoggingSchema):
     cli_command = ['show logging | include {include}',
                    'show logging',]
 
-    def cli(self, include='', output=None):
+    # 000123: *Jun  5 05:09:30.838 EST: %IP-4-DUPADDR: Duplicate address 172.16.1.216 on GigabitEthernet1
+    # Jun  5 05:11:04.626 EST: Rollback:Acquired Configuration lock.
+    p_entry = re.compile(r'^(?:(?P<sequence>\d+): +)?[*.]?'
+                         r'(?P<timestamp>(?:\d{4} +)?[A-Z][a-z]{2} +\d+'
+                         r'(?: +\d{4})? +\d+:\d+:\d+(?:\.\d+)?'
+                         r'(?: +[A-Z]{2,5})?): +'
+                         r'(?:%(?P<facility>[\w-]+?)-(?P<severity>\d)-'
+                         r'(?P<mnemonic>[\w-]+): +)?(?P<message>.*)$')
+
+    def cli(self, include='', output=None, incremental=False):
+        '''parse the log buffer
+
+            Args:
+                include (`str`): filter passed to '| include'
+                output (`str`): output to parse instead of executing
+                incremental (`bool`): only return the log lines added since
+                                      the previous incremental poll of this
+                                      device, split into 'entries'
+        '''
+
+        # Build the command
+        if include:
+            cmd = self.cli_command[0].format(include=include)
+        else:
+            cmd = self.cli_command[1]
 
         if output is None:
-            # Build the command
-            if include:
-                cmd = self.cli_command[0].format(include=include)
-            else:
-                cmd = self.cli_command[1]
             # Execute the command
             out = self.device.execute(cmd)
         else:
@@ -57,15 +80,25 @@ class ShowLogging(ShowLoggingSchema):
 
         # Init vars
         parsed_dict = {}
-        log_lines = []
+        log_lines = [line for line in map(str.strip, out.splitlines()) if line]
+
+        if incremental:
+            # Header counters change on every poll, only tail the buffer
+            # Log Buffer (4096 bytes):
+            for index, line in enumerate(log_lines):
+                if line.startswith('Log Buffer'):
+                    log_lines = log_lines[index + 1:]
+                    break
 
-        for line in out.splitlines():
-            line = line.strip()
+            logs, entries = log_tail.tail(device=self.device, command=cmd,
+                                          lines=log_lines,
+                                          pattern=self.p_entry)
+            parsed_dict['logs'] = logs
+            parsed_dict['entries'] = entries
+            return parsed_dict
 
-            # Add line to 'logs'
-            if line:
-                log_lines.append(line)
-                parsed_dict['logs'] = log_lines
-                continue
+        # Add lines to 'logs'
+        if log_lines:
+            parsed_dict['logs'] = log_lines
 
         return parsed_dict
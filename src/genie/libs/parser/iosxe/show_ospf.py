@@ -34,12 +34,13 @@ IOSXE parsers for the following show commands:
 # Python
 import re
 import xmltodict
-from netaddr import IPAddress, IPNetwork
 
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.select import select_command
+from genie.libs.parser.utils import ip
 
 # ===========================================================
 # Schema for:
@@ -130,7 +131,7 @@ class ShowIpOspfSegmentRoutingLocalBlock(ShowIpOspfSegmentRoutingLocalBlockSchem
             m = p2.match(line)
             if m:
                 area_dict = inst_dict.setdefault('areas', {}).\
-                    setdefault(str(IPAddress(str(m.groupdict()['area']))), {})
+                    setdefault(ip.area(m.groupdict()['area']), {})
                 continue
 
             # Router ID        SR Capable   SRLB Base   SRLB Range
@@ -1159,9 +1160,9 @@ class ShowIpOspf(ShowIpOspfSchema):
                 parsed_area = str(m.groupdict()['area'])
                 n = re.match('BACKBONE\((?P<area_num>(\S+))\)', parsed_area)
                 if n:
-                    area = str(IPAddress(str(n.groupdict()['area_num'])))
+                    area = ip.area(n.groupdict()['area_num'])
                 else:
-                    area = str(IPAddress(str(m.groupdict()['area'])))
+                    area = ip.area(m.groupdict()['area'])
 
                 # Create dict
                 if 'areas' not in sub_dict:
@@ -1412,7 +1413,7 @@ class ShowIpOspfInterfaceBrief(ShowIpOspfInterfaceBriefSchema):
                     str(group['interface']))
                 instance = str(group['instance'])
                 ip_address = str(group['address'])
-                area = str(IPAddress(str(group['area'])))
+                area = ip.area(group['area'])
                 state = group['state']
                 cost = int(group['cost'])
                 nbrs_full = int(group['nbrs_full'])
@@ -1753,6 +1754,9 @@ class ShowIpOspfInterface(ShowIpOspfInterfaceSchema):
     ''' Parser for:
         * 'show ip ospf interface'
         * 'show ip ospf interface {interface}'
+
+        select (`dict`) narrows the executed command on 'interface',
+        e.g. select={'interface': 'GigabitEthernet1'}
     '''
 
     cli_command = ['show ip ospf interface {interface}',
@@ -1764,9 +1768,13 @@ class ShowIpOspfInterface(ShowIpOspfInterfaceSchema):
         'max_flood_scan_length', 'max_flood_scan_time_msec', 'state']
 
 
-    def cli(self, interface=None, output=None):
+    def cli(self, interface=None, output=None, select=None):
         if output is None:
-            if interface:
+            if select:
+                # Only execute the variant narrowed on the selection
+                cmd = select_command(self.cli_command, select,
+                                     interface=interface)
+            elif interface:
                 cmd = self.cli_command[0].format(interface=interface)
             else:
                 cmd = self.cli_command[1]
@@ -1959,7 +1967,7 @@ class ShowIpOspfInterface(ShowIpOspfInterfaceSchema):
             m = p2.match(line)
             if m:
                 ip_address = str(m.groupdict()['address'])
-                area = str(IPAddress(str(m.groupdict()['area'])))
+                area = ip.area(m.groupdict()['area'])
                 if m.groupdict()['intf_id']:
                     intf_id = int(m.groupdict()['intf_id'])
                 if m.groupdict()['attach']:
@@ -2020,7 +2028,7 @@ class ShowIpOspfInterface(ShowIpOspfInterfaceSchema):
 
                                 # Check parameters match
                                 if q_addr == vl_addr:
-                                    vl_transit_area_id = str(IPAddress(str(q.groupdict()['q_area'])))
+                                    vl_transit_area_id = ip.area(q.groupdict()['q_area'])
                                     break
 
                     if vl_transit_area_id is not None:
@@ -2057,7 +2065,7 @@ class ShowIpOspfInterface(ShowIpOspfInterfaceSchema):
                                           ' +(?P<local_id>(\S+))'
                                           ' +(?P<remote_id>(\S+)) +(.*)', line)
                             if q:
-                                q_area = str(IPAddress(str(q.groupdict()['q_area'])))
+                                q_area = ip.area(q.groupdict()['q_area'])
                                 q_remote_id = str(q.groupdict()['remote_id'])
 
                                 # Check parameters match
@@ -2703,7 +2711,7 @@ class ShowIpOspfLinksParser(MetaParser):
             # Area 1 source address 10.229.11.11
             m = p2.match(line)
             if m:
-                area = str(IPAddress(str(m.groupdict()['area'])))
+                area = ip.area(m.groupdict()['area'])
                 source_address = str(m.groupdict()['source_address'])
 
                 # Set link_name for sham_link
@@ -2780,7 +2788,7 @@ class ShowIpOspfLinksParser(MetaParser):
             # Transit area 1, via interface GigabitEthernet0/1
             m = p5.match(line)
             if m:
-                area = str(IPAddress(str(m.groupdict()['area'])))
+                area = ip.area(m.groupdict()['area'])
 
                 # Set link_name for virtual_link
                 link_name = '{} {}'.format(area, vl_router_id)
@@ -3341,7 +3349,7 @@ class ShowIpOspfNeighborDetail(ShowIpOspfNeighborDetailSchema):
             # In the area 0 via interface TenGigabitEthernet3/1/1, BFD enabled
             m = p2.match(line)
             if m:
-                area = str(IPAddress(str(m.groupdict()['area'])))
+                area = ip.area(m.groupdict()['area'])
                 interface = str(m.groupdict()['interface'])
                 instance = None
                 router_id = None
@@ -3439,7 +3447,7 @@ class ShowIpOspfNeighborDetail(ShowIpOspfNeighborDetailSchema):
                                 q_addr = str(q.groupdict()['addr'])
                                 # Check parameters match
                                 if q_addr == vl_addr:
-                                    vl_transit_area_id = str(IPAddress(str(q.groupdict()['q_area'])))
+                                    vl_transit_area_id = ip.area(q.groupdict()['q_area'])
                                     break
 
                     if vl_transit_area_id is not None:
@@ -3477,7 +3485,7 @@ class ShowIpOspfNeighborDetail(ShowIpOspfNeighborDetailSchema):
                                           ' +(?P<local_id>(\S+))'
                                           ' +(?P<remote_id>(\S+)) +(.*)', line)
                             if q:
-                                q_area = str(IPAddress(str(q.groupdict()['q_area'])))
+                                q_area = ip.area(q.groupdict()['q_area'])
                                 q_remote_id = str(q.groupdict()['remote_id'])
 
                                 # Check parameters match
@@ -3798,7 +3806,7 @@ class ShowIpOspfDatabase(ShowIpOspfDatabaseSchema):
                 if group['area']:
                     try:
                         int(group['area'])
-                        area = str(IPAddress(str(group['area'])))
+                        area = ip.area(group['area'])
                     except Exception:
                         area = str(group['area'])
                 else:
@@ -4136,7 +4144,7 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
                 if m.groupdict()['area']:
                     try:
                         int(m.groupdict()['area'])
-                        area = str(IPAddress(str(m.groupdict()['area'])))
+                        area = ip.area(m.groupdict()['area'])
                     except Exception:
                         area = str(m.groupdict()['area'])
                 else:
@@ -4342,7 +4350,7 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
             m = p10.match(line)
             if m:
                 dummy = '{}/{}'.format('0.0.0.0', m.groupdict()['net_mask'])
-                db_dict['network_mask'] = str(IPNetwork(dummy).netmask)
+                db_dict['network_mask'] = ip.prefix(dummy)[1]
                 continue
 
             # Metric Type: 2 (Larger than any link state path)
@@ -5786,7 +5794,7 @@ class ShowIpOspfMplsLdpInterface(ShowIpOspfMplsLdpInterfaceSchema):
                 instance = str(m.groupdict()['instance'])
                 try:
                     int(m.groupdict()['area'])
-                    area = str(IPAddress(str(m.groupdict()['area'])))
+                    area = ip.area(m.groupdict()['area'])
                 except:
                     area = m.groupdict()['area']
                 if m.groupdict()['vrf']:
@@ -6094,7 +6102,7 @@ class ShowIpOspfMplsTrafficEngLink(ShowIpOspfMplsTrafficEngLinkSchema):
             # Area 0 has 2 MPLS TE links. Area instance is 2.
             m = p2.match(line)
             if m:
-                area = str(IPAddress(str(m.groupdict()['area'])))
+                area = ip.area(m.groupdict()['area'])
                 total_links = int(m.groupdict()['links'])
                 area_instance = int(m.groupdict()['area_instance'])
                 # Create dict
@@ -6131,7 +6139,7 @@ class ShowIpOspfMplsTrafficEngLink(ShowIpOspfMplsTrafficEngLinkSchema):
             if m:
                 try:
                     int(m.groupdict()['area'])
-                    area = str(IPAddress(str(m.groupdict()['area'])))
+                    area = ip.area(m.groupdict()['area'])
                 except:
                     area = m.groupdict()['area']
                 # Create dict
@@ -7570,7 +7578,7 @@ class ShowIpOspfSegmentRoutingProtectedAdjacencies(ShowIpOspfSegmentRoutingProte
             m = p2.match(line)
             if m:
                 group = m.groupdict()
-                area_id = str(IPAddress(str(group['area_id'])))
+                area_id = ip.area(group['area_id'])
                 area_dict = process_id_dict.setdefault('areas', {}). \
                                 setdefault(area_id, {})                
                 continue
@@ -7700,7 +7708,7 @@ class ShowIpOspfSegmentRoutingSidDatabase(ShowIpOspfSegmentRoutingSidDatabaseSch
                 if group.get('adv_rtr_id'):
                     index_dict.update({'adv_rtr_id': group['adv_rtr_id']})
                 if group.get('area_id'):
-                    index_dict.update({'area_id': str(IPAddress(group['area_id']))})
+                    index_dict.update({'area_id': ip.area(group['area_id'])})
                 if group.get('type'):
                     index_dict.update({'type': group['type']})
                 if group.get('algo'):
@@ -8195,7 +8203,7 @@ class ShowIpOspfSegmentRouting(ShowIpOspfSegmentRoutingSchema):
                 group = m.groupdict()
                 area = group['area']
                 if area.isdigit():
-                    area = str(IPAddress(str(area)))
+                    area = ip.area(area)
                 topology_name = group['topology_name']
                 forwarding = group['forwarding']
                 strict_spf = group['strict_spf']
@@ -28,11 +28,7 @@ from xml.dom import minidom
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional
 from genie.libs.parser.utils.common import Common
-# genie.parsergen
-try:
-    import genie.parsergen
-except (ImportError, OSError):
-    pass
+from genie.libs.parser.utils.table import parse_table
 
 log = logging.getLogger(__name__)
 
@@ -1200,63 +1196,58 @@ class ShowVersion(ShowVersionSchema):
                 continue
 
         # table2 for C3850
-        tmp2 = genie.parsergen.oper_fill_tabular(right_justified=True,
-                                                 header_fields=["Switch",
-                                                                "Ports",
-                                                                "Model             ",
-                                                                'SW Version       ',
-                                                                "SW Image              ",
-                                                                "Mode   "],
-                                                 label_fields=["switch_num",
-                                                               "ports",
-                                                               "model",
-                                                               "sw_ver",
-                                                               'sw_image',
-                                                               'mode'],
-                                                 index=[0, ],
-                                                 table_terminal_pattern=r"(^\n|^\s*$)",
-                                                 device_output=out,
-                                                 device_os='iosxe')
-
-        if not tmp2.entries:
+        tmp2 = parse_table(out,
+                           ["Switch",
+                            "Ports",
+                            "Model             ",
+                            'SW Version       ',
+                            "SW Image              ",
+                            "Mode   "],
+                           labels=["switch_num",
+                                   "ports",
+                                   "model",
+                                   "sw_ver",
+                                   'sw_image',
+                                   'mode'],
+                           right_justified=True,
+                           terminal=r"(^\n|^\s*$)")
+
+        if not tmp2:
             # table2 for IOS
-            tmp2 = genie.parsergen.oper_fill_tabular(right_justified=True,
-                                                     header_fields=["Switch",
-                                                                    "Ports",
-                                                                    "Model             ",
-                                                                    'SW Version       ',
-                                                                    "SW Image              "],
-                                                     label_fields=["switch_num",
-                                                                   "ports",
-                                                                   "model",
-                                                                   "sw_ver",
-                                                                   'sw_image'],
-                                                     index=[0, ],
-                                                     table_terminal_pattern=r"(^\n|^\s*$)",
-                                                     device_output=out,
-                                                     device_os='ios')
+            tmp2 = parse_table(out,
+                               ["Switch",
+                                "Ports",
+                                "Model             ",
+                                'SW Version       ',
+                                "SW Image              "],
+                               labels=["switch_num",
+                                       "ports",
+                                       "model",
+                                       "sw_ver",
+                                       'sw_image'],
+                               right_justified=True,
+                               terminal=r"(^\n|^\s*$)")
         # switch_number
         # license table for Cat3850
-        tmp = genie.parsergen.oper_fill_tabular(right_justified=True,
-                                                header_fields=["Current            ",
-                                                               "Type            ",
-                                                               "Next reboot  "],
-                                                label_fields=["license_level",
-                                                              "license_type",
-                                                              "next_reload_license_level"],
-                                                table_terminal_pattern=r"(^\n|^\s*$)",
-                                                device_output=out,
-                                                device_os='iosxe')
-
-        if tmp.entries:
+        tmp = parse_table(out,
+                          ["Current            ",
+                           "Type            ",
+                           "Next reboot  "],
+                          labels=["license_level",
+                                  "license_type",
+                                  "next_reload_license_level"],
+                          right_justified=True,
+                          terminal=r"(^\n|^\s*$)")
+
+        if tmp:
             res = tmp
-            for key in res.entries.keys():
-                for k, v in res.entries[key].items():
+            for key in res.keys():
+                for k, v in res[key].items():
                     version_dict['version'][k] = v
 
-        if tmp2.entries:
+        if tmp2:
             res2 = tmp2
-            for key in res2.entries.keys():
+            for key in res2.keys():
                 if 'switch_num' not in version_dict['version']:
                     version_dict['version']['switch_num'] = {}
                 if '*' in key:
@@ -1266,7 +1257,7 @@ class ShowVersion(ShowVersionSchema):
                     if m:
                         if switch_no not in version_dict['version']['switch_num']:
                             version_dict['version']['switch_num'][switch_no] = {}
-                        for k, v in res2.entries[key].items():
+                        for k, v in res2[key].items():
                             if 'switch_num' != k:
                                 version_dict['version']['switch_num'][switch_no][k] = v
 
@@ -1277,7 +1268,7 @@ class ShowVersion(ShowVersionSchema):
                         version_dict['version']['switch_num'][switch_no].\
                             update(active_dict) if active_dict else None
                 else:
-                    for k, v in res2.entries[key].items():
+                    for k, v in res2[key].items():
                         if key not in version_dict['version']['switch_num']:
                             version_dict['version']['switch_num'][key] = {}
                         if 'switch_num' != k:
@@ -8,6 +8,10 @@ from genie.metaparser.util.schemaengine import Schema, \
                                          Any, \
                                          Optional
 
+# import parser utils
+from genie.libs.parser.utils.select import select_command
+from genie.libs.parser.utils import budget
+
 
 # ====================================================
 #  distributor class for show ip route
@@ -179,17 +183,24 @@ class ShowIpRouteSchema(MetaParser):
 class ShowIpRoute(ShowIpRouteSchema):
     """Parser for :
         show ip route
-        show ip route vrf <vrf>"""
+        show ip route vrf <vrf>
+
+        select (`dict`) narrows the executed command on 'vrf' and
+        'protocol', e.g. select={'vrf': 'VRF1'}"""
     # not using name 'cli_command' because dont want find_parsers() to discover them
     command = ['show ip route vrf {vrf}', 'show ip route vrf {vrf} {protocol}',
                    'show ip route', 'show ip route {protocol}']
     exclude = ['updated']
     IP_VER='ipv4'
 
-    def cli(self, vrf=None, protocol=None, output=None):
+    def cli(self, vrf=None, protocol=None, output=None, select=None):
 
         if output is None:
-            if vrf and protocol:
+            if select:
+                # Only execute the variant narrowed on the selection
+                cmd = select_command(self.command, select,
+                                     vrf=vrf, protocol=protocol)
+            elif vrf and protocol:
                 cmd = self.command[1].format(vrf=vrf, protocol=protocol)
             elif vrf:
                 cmd = self.command[0].format(vrf=vrf)
@@ -201,6 +212,8 @@ class ShowIpRoute(ShowIpRouteSchema):
         else:
             out = output
 
+        if select:
+            vrf = select.get('vrf', vrf)
         af = self.IP_VER
         route = ""
         if not vrf:
@@ -254,7 +267,7 @@ class ShowIpRoute(ShowIpRouteSchema):
         ret_dict = {}
         index = 0
 
-        for line in out.splitlines():
+        for line in budget.lines(out, result_dict):
             if line:
                 line = line.strip()
             else:
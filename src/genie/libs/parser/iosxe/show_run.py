@@ -8,7 +8,6 @@ IOSXE parsers for the following show commands:
 import re
 import xmltodict
 import collections
-from netaddr import IPAddress, IPNetwork
 
 # Metaparser
 from genie.metaparser import MetaParser
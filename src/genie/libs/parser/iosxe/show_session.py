@@ -2,9 +2,9 @@
 
 """
 import re
-import genie.parsergen as pg
 # import parser utils
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.table import parse_table
 
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
@@ -133,14 +133,11 @@ class ShowUsers(ShowUsersSchema):
         # initial return dictionary
         ret_dict = {}
 
-        pg_result = pg.oper_fill_tabular(device_output=out, device_os='iosxe',
-                                         index=[1],
-                                         header_fields=[' ', ' Line', 'User', 'Host\(s\)', 'Idle', '  Location'],
-                                         label_fields=['busy', 'line', 'user', 'host', 'idle', 'location'],
-                                         table_terminal_pattern='Interface\s+User\s+Mode\s+Idle\s+Peer\s+Address')
-
-        # returns a dictionary
-        pg_entries = pg_result.entries
+        pg_entries = parse_table(out,
+                                 [' ', ' Line', 'User', 'Host\(s\)', 'Idle', '  Location'],
+                                 labels=['busy', 'line', 'user', 'host', 'idle', 'location'],
+                                 index=[1],
+                                 terminal='Interface\s+User\s+Mode\s+Idle\s+Peer\s+Address')
         line_dict = {}
 
         # ============= iosxe pg_entries ================
@@ -218,12 +215,9 @@ class ShowUsers(ShowUsersSchema):
         # unknown      NETCONF(ONEP)      com.cisco.ne 00:00:49
         # unknown      a(ONEP)            com.cisco.sy 00:00:49
 
-        interface_result = pg.oper_fill_tabular(device_output=out,
-                                                device_os='iosxe',
-                                                index=[0,1],
-                                                header_fields=['Interface', 'User', 'Mode', 'Idle', 'Peer Address'])
-
-        interface_entries = interface_result.entries
+        interface_entries = parse_table(out,
+                                        ['Interface', 'User', 'Mode', 'Idle', 'Peer Address'],
+                                        index=[0,1])
 
         # ========= interface_entries =====================
         # {'unknown': {'NETCONF(ONEP)': {'Idle': '00:00:49',
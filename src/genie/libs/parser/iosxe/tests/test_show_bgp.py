@@ -6346,7 +6346,51 @@ class TestShowIpBgpDetail(unittest.TestCase):
         obj = ShowIpBgpAllDetail(device=self.device)
         parsed_output = obj.parse(address_family='vpnv4')
         self.assertEqual(parsed_output, self.golden_parsed_output8)
-        
+
+
+class TestShowBgpDetailAttributes(unittest.TestCase):
+
+    output = TestShowIpBgpDetail.golden_output8['execute.return_value']
+
+    def _paths(self, parsed):
+        for vrf in parsed['instance']['default']['vrf'].values():
+            for af in vrf['address_family'].values():
+                for prefix in af.get('prefixes', {}).values():
+                    for path in prefix.get('index', {}).values():
+                        yield path
+
+    def test_shared_attributes(self):
+        self.maxDiff = None
+        obj = ShowIpBgpAllDetail(device=Mock())
+        parsed, attributes = obj.parse_attributes(
+            output=self.output, address_family='vpnv4')
+        self.assertEqual(parsed, TestShowIpBgpDetail.golden_parsed_output8)
+        self.assertIsNone(obj.attributes)
+
+        communities = {}
+        for path in self._paths(parsed):
+            community = communities.setdefault(path['community'],
+                                               path['community'])
+            self.assertIs(path['community'], community)
+            self.assertIn(path['route_info'],
+                          attributes.values['as_path'].values)
+        self.assertEqual(len(attributes.values['community']),
+                         len(communities))
+
+    def test_as_tuples(self):
+        obj = ShowIpBgpAllDetail(device=Mock())
+        parsed, attributes = obj.parse_attributes(
+            output=self.output, address_family='vpnv4', as_tuples=True)
+        paths = list(self._paths(parsed))
+        self.assertEqual(paths[0]['route_info'],
+                         (65000, 65201, 4400004007, 4400004507, 4400004001,
+                          4400004505, 4400004005, 4400004504, 1234, 5678))
+        self.assertEqual(paths[0]['community'],
+                         (65100 << 16 | 106, 65100 << 16 | 500,
+                          65100 << 16 | 601, 65361 << 16 | 3))
+        self.assertEqual(paths[0]['ext_community'], ('RT:65000:31838',))
+        self.assertIs(paths[2]['route_info'], paths[3]['route_info'])
+
 #-------------------------------------------------------------------------------
 
 
@@ -18837,6 +18881,46 @@ class TestShowIpBgpAllNeighbors(unittest.TestCase):
         self.assertEqual(parsed_output, self.golden_parsed_output1)
 
 
+# ==================================================================
+# Unit test for the parallel parse of the neighbors:
+#   * 'show bgp all neighbors'
+#   * 'show bgp neighbors'
+#   * 'show ip bgp neighbors'
+#   * 'show ip bgp all neighbors'
+# ==================================================================
+class TestShowBgpNeighborsParallel(unittest.TestCase):
+
+    goldens = [(ShowBgpAllNeighbors, TestShowBgpAllNeighbors, 5),
+               (ShowBgpNeighbors, TestShowBgpNeighbors, 2),
+               (ShowIpBgpNeighbors, TestShowIpBgpNeighbors, 5),
+               (ShowIpBgpAllNeighbors, TestShowIpBgpAllNeighbors, 1)]
+
+    def test_golden_outputs(self):
+        self.maxDiff = None
+        split = 0
+        for parser, test, count in self.goldens:
+            for number in range(1, count + 1):
+                output = getattr(test, 'golden_output{}'.format(number))[
+                    'execute.return_value']
+                lines = output.splitlines()
+                obj = parser(device=Mock())
+                obj.parallel_workers = 3
+                if len(obj._split_neighbors(lines)[0]) > 1:
+                    split += 1
+                self.assertEqual(obj._parse_parallel(lines),
+                                 obj._parse_neighbors(lines))
+        self.assertGreater(split, 5)
+
+    def test_threshold(self):
+        output = TestShowBgpAllNeighbors.golden_output1[
+            'execute.return_value']
+        obj = ShowBgpAllNeighbors(device=Mock())
+        expected = obj.cli(output=output)
+        obj.parallel_lines = 0
+        obj.parallel_workers = 2
+        self.assertEqual(obj.cli(output=output), expected)
+
+
 #-------------------------------------------------------------------------------
 
 
@@ -16899,6 +16899,24 @@ Tunnel10 is up, line protocol is up
         self.maxDiff = None
         self.assertEqual(parsed_output,self.golden_parsed_output_2)
 
+    def test_golden_lazy(self):
+        self.maxDiff = None
+        for output, expected in [
+                (self.golden_output, self.golden_parsed_output),
+                (self.golden_output_1, self.golden_parsed_output_1),
+                (self.golden_output_2, self.golden_parsed_output_2),
+                (self.golden_interface_output_2,
+                 self.golden_parsed_interface_output_2)]:
+            self.device = Mock(**output)
+            obj = ShowInterfaces(device=self.device)
+            parsed_output = obj.parse_lazy()
+            self.assertEqual(sorted(parsed_output), sorted(expected))
+            # Single lookup only parses the requested interface
+            name = list(expected)[-1]
+            self.assertEqual(parsed_output[name], expected[name])
+            self.assertEqual(parsed_output.parsed(), [name])
+            self.assertEqual(dict(parsed_output), expected)
+
 #############################################################################
 # unitest For Show ip interface
 #############################################################################
@@ -10,6 +10,7 @@ from genie.metaparser.util.exceptions import SchemaEmptyParserError
 
 # Parser
 from genie.libs.parser.iosxe.show_logging import ShowLogging
+from genie.libs.parser.utils import log_tail
 
 # ==============================================
 # Unittest for:
@@ -113,6 +114,76 @@ class test_show_logging(unittest.TestCase):
         parsed_output = obj.parse(include='Rollback')
         self.assertEqual(parsed_output, self.golden_parsed_output_2)
 
+    golden_output_3 = {'execute.return_value': '''
+        Log Buffer (4096 bytes):
+        000101: *Jun  5 05:10:59.519 EST: %SYS-5-CONFIG_I: Configured from console by cisco on console
+        000102: *Jun  5 05:11:04.626 EST: %SYS-5-CONFIG_R: Config Replace is Done
+        '''}
+
+    golden_output_4 = {'execute.return_value': '''
+        Syslog logging: enabled (0 messages dropped, 150 messages rate-limited, 0 flushes, 0 overruns, xml disabled, filtering disabled)
+        Log Buffer (4096 bytes):
+        000101: *Jun  5 05:10:59.519 EST: %SYS-5-CONFIG_I: Configured from console by cisco on console
+        000102: *Jun  5 05:11:04.626 EST: %SYS-5-CONFIG_R: Config Replace is Done
+        000103: *Jun  5 05:11:14.115 EST: Rollback:Acquired Configuration lock.
+        '''}
+
+    golden_parsed_output_4 = {
+        'logs': [
+            '000103: *Jun  5 05:11:14.115 EST: Rollback:Acquired Configuration lock.',
+        ],
+        'entries': [
+            {'sequence': 103,
+             'timestamp': 'Jun  5 05:11:14.115 EST',
+             'message': 'Rollback:Acquired Configuration lock.'},
+        ],
+    }
+
+    golden_output_5 = {'execute.return_value': '''
+        Log Buffer (4096 bytes):
+        000104: *Jun  5 05:11:20.001 EST: %LINK-3-UPDOWN: Interface GigabitEthernet1, changed state to down
+        '''}
+
+    golden_parsed_output_5 = {
+        'logs': [
+            '000104: *Jun  5 05:11:20.001 EST: %LINK-3-UPDOWN: Interface GigabitEthernet1, changed state to down',
+        ],
+        'entries': [
+            {'sequence': 104,
+             'timestamp': 'Jun  5 05:11:20.001 EST',
+             'facility': 'LINK',
+             'severity': 3,
+             'mnemonic': 'UPDOWN',
+             'message': 'Interface GigabitEthernet1, changed state to down'},
+        ],
+    }
+
+    def test_show_logging_incremental(self):
+        self.maxDiff = None
+        log_tail.reset()
+
+        # First poll returns the whole buffer, without the header
+        self.device = Mock(**self.golden_output_3)
+        obj = ShowLogging(device=self.device)
+        parsed_output = obj.parse(incremental=True)
+        self.assertEqual(len(parsed_output['entries']), 2)
+
+        # Next polls only return the new lines
+        self.device.execute.return_value = \
+            self.golden_output_4['execute.return_value']
+        parsed_output = obj.parse(incremental=True)
+        self.assertEqual(parsed_output, self.golden_parsed_output_4)
+
+        # Nothing new
+        parsed_output = obj.parse(incremental=True)
+        self.assertEqual(parsed_output, {'logs': [], 'entries': []})
+
+        # Last line rotated out, sequence number is used as high-water mark
+        self.device.execute.return_value = \
+            self.golden_output_5['execute.return_value']
+        parsed_output = obj.parse(incremental=True)
+        self.assertEqual(parsed_output, self.golden_parsed_output_5)
+
 
 if __name__ == '__main__':
     unittest.main()
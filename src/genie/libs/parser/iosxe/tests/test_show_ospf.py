@@ -1747,6 +1747,11 @@ class test_show_ip_ospf_interface(unittest.TestCase):
         parsed_output = obj.parse(interface='GigabitEthernet2')
         self.assertEqual(parsed_output, self.golden_parsed_output3)
 
+        # Same command and result when selecting the interface
+        obj = ShowIpOspfInterface(device=self.device)
+        parsed_output = obj.parse(select={'interface': 'GigabitEthernet2'})
+        self.assertEqual(parsed_output, self.golden_parsed_output3)
+
 
     def test_show_ip_ospf_interface_full4(self):
 
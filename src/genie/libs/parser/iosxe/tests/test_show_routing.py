@@ -935,6 +935,39 @@ class TestShowIpRoute(unittest.TestCase):
         parsed_output = obj.parse(vrf='VRF1')
         self.assertEqual(parsed_output, self.golden_parsed_output_2_with_vrf)
 
+    def test_show_ip_route_select_vrf(self):
+        self.maxDiff = None
+        self.device = Mock(**self.golden_output_2_with_vrf)
+        obj = ShowIpRoute(device=self.device)
+        parsed_output = obj.parse(select={'vrf': 'VRF1'})
+        self.device.execute.assert_called_once_with('show ip route vrf VRF1')
+        self.assertEqual(parsed_output, self.golden_parsed_output_2_with_vrf)
+
+    def test_show_ip_route_select_protocol(self):
+        self.maxDiff = None
+        # Device output of 'show ip route ospf' on the device of golden_output_1
+        self.device = Mock(**{'execute.return_value': '''
+        R1_iosv#show ip route ospf
+        Codes: L - local, C - connected, S - static, R - RIP, M - mobile, B - BGP
+               D - EIGRP, EX - EIGRP external, O - OSPF, IA - OSPF inter area
+
+        Gateway of last resort is not set
+
+              10.0.0.0/8 is variably subnetted, 5 subnets, 2 masks
+        O        10.2.3.0/24 [110/2] via 10.186.2.2, 06:46:59, GigabitEthernet0/1
+                             [110/2] via 10.1.2.2, 06:46:59, GigabitEthernet0/0
+        '''})
+        obj = ShowIpRoute(device=self.device)
+        parsed_output = obj.parse(select={'protocol': 'ospf'})
+        self.device.execute.assert_called_once_with('show ip route ospf')
+
+        routes = self.golden_parsed_output_1['vrf']['default'][
+            'address_family']['ipv4']['routes']
+        self.assertEqual(parsed_output, {'vrf': {'default': {
+            'address_family': {'ipv4': {'routes': {
+                route: value for route, value in routes.items()
+                if value['source_protocol'] == 'ospf'}}}}}})
+
     def test_show_ip_route3(self):
         self.maxDiff = None
         self.device = Mock(**self.golden_output3)
@@ -58,6 +58,8 @@ from genie.metaparser.util.schemaengine import Schema, Any, Optional, Or, And,\
 
 # Parser
 from genie.libs.parser.yang.bgp_openconfig_yang import BgpOpenconfigYang
+from genie.libs.parser.utils import bgp_paths
+from genie.libs.parser.utils import budget
 
 # Logger
 logger = logging.getLogger(__name__)
@@ -3537,6 +3539,24 @@ class ShowBgpInstanceNeighborsReceivedRoutes(ShowBgpInstanceNeighborsReceivedRou
                    'show bgp instance {instance} {vrf_type} {vrf} {address_family} neighbors {neighbor} {route_type}',
                    'show bgp instance {instance} {vrf_type} {vrf} neighbors {neighbor} {route_type}']
 
+    def _command(self, vrf_type, neighbor, vrf, instance, address_family, route_type):
+        if vrf_type == 'all':
+            return self.cli_command[0].format(instance=instance,
+                                              neighbor=neighbor,
+                                              route_type=route_type)
+        if address_family:
+            return self.cli_command[1].format(instance=instance,
+                                              neighbor=neighbor,
+                                              address_family=address_family,
+                                              vrf_type=vrf_type,
+                                              vrf=vrf,
+                                              route_type=route_type)
+        return self.cli_command[2].format(instance=instance,
+                                          neighbor=neighbor,
+                                          vrf_type=vrf_type,
+                                          vrf=vrf,
+                                          route_type=route_type)
+
     def cli(self, vrf_type='all', neighbor='', vrf='all', instance='all', address_family='', route_type='received routes', output=None):
 
         assert vrf_type in ['all', 'vrf']
@@ -3544,31 +3564,77 @@ class ShowBgpInstanceNeighborsReceivedRoutes(ShowBgpInstanceNeighborsReceivedRou
         assert address_family in ['', 'ipv4 unicast', 'ipv6 unicast']
 
         if output is None:
-            if vrf_type == 'all':
-                out = self.device.execute(self.cli_command[0].format(instance=instance,
-                                                                         neighbor=neighbor,
-                                                                         route_type=route_type))
-            else:
-                if address_family:
-                    out = self.device.execute(self.cli_command[1].format(instance=instance,
-                                                                         neighbor=neighbor,
-                                                                         address_family=address_family,
-                                                                         vrf_type=vrf_type,
-                                                                         vrf=vrf,
-                                                                         route_type=route_type))
-                else:
-                    out = self.device.execute(self.cli_command[2].format(instance=instance,
-                                                                         neighbor=neighbor,
-                                                                         vrf_type=vrf_type,
-                                                                         vrf=vrf,
-                                                                         route_type=route_type))
-
+            out = self.device.execute(self._command(
+                vrf_type, neighbor, vrf, instance, address_family, route_type))
         else:
             out = output
 
-        # Init vars
+        # handle route table name
+        routes = 'received' if 'received' in route_type else 'routes'
+
         ret_dict = {}
+        for _, sub_dict, prefix, index, path_dict in self._paths(
+                ret_dict, out, vrf_type, address_family):
+            bgp_paths.add_path(sub_dict, routes, prefix, index, path_dict)
+        return ret_dict
+
+    def parse_stream(self, vrf_type='all', neighbor='', vrf='all',
+                     instance='all', address_family='',
+                     route_type='received routes', output=None, tables=None):
+        '''Yield the paths one at a time as the lines are read, without
+           building the whole dictionary
+
+            Args:
+                vrf_type, neighbor, vrf, instance, address_family,
+                route_type: as for parse()
+                output (`str`): output to parse instead of executing, or
+                                an iterable of its lines such as a file
+                tables (`dict`): filled with the dictionary parse() returns
+                                 without the routes, when given
+
+            Returns:
+                iterator of BgpPath records. Nothing is validated against
+                the schema
+        '''
+        assert vrf_type in ['all', 'vrf']
+        assert route_type in ['received routes', 'routes']
+        assert address_family in ['', 'ipv4 unicast', 'ipv6 unicast']
+        if output is None:
+            output = self.device.execute(self._command(
+                vrf_type, neighbor, vrf, instance, address_family, route_type))
+        return (bgp_paths.BgpPath(*keys, prefix, index, path_dict)
+                for keys, _, prefix, index, path_dict in self._paths(
+                    {} if tables is None else tables, output, vrf_type,
+                    address_family))
+
+    def parse_compact(self, vrf_type='all', neighbor='', vrf='all',
+                      instance='all', address_family='',
+                      route_type='received routes', output=None):
+        '''Parse into CompactPaths, the next hops and AS paths stored once
+           and referenced by integer ids
+
+            Returns:
+                CompactPaths, its to_dict() is the dictionary parse()
+                returns. Nothing is validated against the schema
+        '''
+        tables = {}
+        return bgp_paths.CompactPaths(
+            self.parse_stream(vrf_type=vrf_type, neighbor=neighbor, vrf=vrf,
+                              instance=instance,
+                              address_family=address_family,
+                              route_type=route_type, output=output,
+                              tables=tables),
+            tables=tables,
+            key='received' if 'received' in route_type else 'routes')
+
+    def _paths(self, ret_dict, out, vrf_type, address_family):
+        '''(keys, sub_dict, prefix, index, path_dict) of each path of the
+           output, keys (instance, vrf, address family); the rest of the
+           parsed dictionary goes to ret_dict. A path is yielded once the
+           next path or section starts'''
         instance = None
+        # (keys, sub_dict, prefix, index, path_dict) not yielded yet
+        pending = None
         address_family = None
 
         if vrf_type == 'all':
@@ -3581,8 +3647,6 @@ class ShowBgpInstanceNeighborsReceivedRoutes(ShowBgpInstanceNeighborsReceivedRou
             else:
                 af = 'vpnv4 unicast'
 
-        # handle route table name
-        routes = 'received' if 'received' in route_type else 'routes'
         p1 = re.compile(r'^BGP *instance *(?P<instance_number>[0-9]+): *(?P<instance>[a-zA-Z0-9\-\_\']+)$')
         p15 = re.compile(r'^BGP *VRF *(?P<vrf>[a-zA-Z0-9]+), *'
                             'state: *(?P<state>[a-zA-Z]+)$')
@@ -3616,7 +3680,7 @@ class ShowBgpInstanceNeighborsReceivedRoutes(ShowBgpInstanceNeighborsReceivedRou
                             '(?P<locprf>[0-9]+) +(?P<weight>[0-9]+) '
                             '*(?P<path>[\S]+)$')
 
-        for line in out.splitlines():
+        for line in budget.lines(out, ret_dict):
             line = line.strip()
 
             if not line:
@@ -3626,6 +3690,9 @@ class ShowBgpInstanceNeighborsReceivedRoutes(ShowBgpInstanceNeighborsReceivedRou
 
             m = p1.match(line)
             if m:
+                if pending:
+                    yield pending
+                    pending = None
                 instance = m.groupdict()['instance']
                 instance = instance.replace("'","")
                 instance_number = str(m.groupdict()['instance_number'])
@@ -3640,6 +3707,9 @@ class ShowBgpInstanceNeighborsReceivedRoutes(ShowBgpInstanceNeighborsReceivedRou
 
             m = p15.match(line)
             if m:
+                if pending:
+                    yield pending
+                    pending = None
                 vrf = m.groupdict()['vrf']
                 state = m.groupdict()['state'].lower()
                 ret_dict.setdefault('instance', {}).setdefault(instance, {})
@@ -3669,16 +3739,16 @@ class ShowBgpInstanceNeighborsReceivedRoutes(ShowBgpInstanceNeighborsReceivedRou
             m = p17.match(line)
             if m:
                 if m.groupdict()['metric']:
-                    sub_dict[routes][prefix]['index'][index]['metric'] = \
+                    path_dict['metric'] = \
                         m.groupdict()['metric']
 
-                sub_dict[routes][prefix]['index'][index]['next_hop'] = \
+                path_dict['next_hop'] = \
                     m.groupdict()['next_hop']
-                sub_dict[routes][prefix]['index'][index]['locprf'] = \
+                path_dict['locprf'] = \
                     m.groupdict()['locprf']
-                sub_dict[routes][prefix]['index'][index]['weight'] = \
+                path_dict['weight'] = \
                     m.groupdict()['weight']
-                sub_dict[routes][prefix]['index'][index]['path'] = \
+                path_dict['path'] = \
                     m.groupdict()['path'].strip()
                 continue
 
@@ -3686,6 +3756,9 @@ class ShowBgpInstanceNeighborsReceivedRoutes(ShowBgpInstanceNeighborsReceivedRou
 
             m = p2.match(line)
             if m:
+                if pending:
+                    yield pending
+                    pending = None
                 address_family = m.groupdict()['address_family'].lower()
                 if 'vrf' not in ret_dict['instance'][instance]:
                     ret_dict['instance'][instance]['vrf'] = {}
@@ -3765,12 +3838,16 @@ class ShowBgpInstanceNeighborsReceivedRoutes(ShowBgpInstanceNeighborsReceivedRou
 
             m = p12.match(line)
             if m:
+                if pending:
+                    yield pending
+                    pending = None
                 rd = m.groupdict()['route_distinguisher']
                 addr = (address_family or af) + ' RD ' + rd
                 if 'address_family' not in ret_dict['instance'][instance]['vrf'][vrf]:
                     ret_dict['instance'][instance]['vrf'][vrf]['address_family'] = {}
                 if address_family not in ret_dict['instance'][instance]['vrf'][vrf]['address_family']:
                     sub_dict = ret_dict['instance'][instance]['vrf'][vrf]['address_family'][addr] = {}
+                    keys = instance, vrf, addr
                 try:
                     sub_dict['state'] = state
                 except Exception:
@@ -3862,6 +3939,7 @@ class ShowBgpInstanceNeighborsReceivedRoutes(ShowBgpInstanceNeighborsReceivedRou
                         ret_dict['instance'][instance]['vrf'][vrf]['address_family'] = {}
                     if address_family not in ret_dict['instance'][instance]['vrf'][vrf]['address_family']:
                         sub_dict = ret_dict['instance'][instance]['vrf'][vrf]['address_family'][addr] = {}
+                        keys = instance, vrf, addr
                     try:
                         sub_dict['state'] = state
                     except Exception:
@@ -3941,8 +4019,6 @@ class ShowBgpInstanceNeighborsReceivedRoutes(ShowBgpInstanceNeighborsReceivedRou
                 status_codes = status_codes.replace(" ", "")
                 next_hop = m.groupdict()['next_hop']
                 prefix = m.groupdict()['prefix']
-                if routes not in sub_dict:
-                    sub_dict[routes] = {}
 
                 if prefix:
                     index = 1
@@ -3950,18 +4026,14 @@ class ShowBgpInstanceNeighborsReceivedRoutes(ShowBgpInstanceNeighborsReceivedRou
                 else:
                     prefix = pre_net
                     index += 1
-                
-                if prefix not in sub_dict[routes]:
-                    sub_dict[routes][prefix] = {}
-
-                if 'index' not in sub_dict[routes][prefix]:
-                    sub_dict[routes][prefix]['index'] = {}
 
-                if index not in sub_dict[routes][prefix]['index']:
-                    sub_dict[routes][prefix]['index'][index] = {}
+                if pending:
+                    yield pending
+                path_dict = {}
+                pending = keys, sub_dict, prefix, index, path_dict
 
-                sub_dict[routes][prefix]['index'][index]['next_hop'] = next_hop
-                sub_dict[routes][prefix]['index'][index]['status_codes'] = status_codes
+                path_dict['next_hop'] = next_hop
+                path_dict['status_codes'] = status_codes
 
                 # dealing with the group of metric, locprf, weight, path
                 group_num = m.groupdict()['number']
@@ -3991,34 +4063,34 @@ class ShowBgpInstanceNeighborsReceivedRoutes(ShowBgpInstanceNeighborsReceivedRou
                                .match(group_num)
 
                     if m1:
-                        sub_dict[routes][prefix]['index'][index]['metric'] = \
+                        path_dict['metric'] = \
                             m1.groupdict()['metric']
-                        sub_dict[routes][prefix]['index'][index]['locprf'] = \
+                        path_dict['locprf'] = \
                             m1.groupdict()['locprf']
-                        sub_dict[routes][prefix]['index'][index]['weight'] = \
+                        path_dict['weight'] = \
                             m1.groupdict()['weight']
-                        sub_dict[routes][prefix]['index'][index]['path'] = \
+                        path_dict['path'] = \
                             m1.groupdict()['path'].strip()
                     elif m2:
                         if len(m2.groupdict()['space']) > 8:
-                            sub_dict[routes][prefix]['index'][index]['metric'] = \
+                            path_dict['metric'] = \
                                 m2.groupdict()['value']
                         else:
-                            sub_dict[routes][prefix]['index'][index]['locprf'] = \
+                            path_dict['locprf'] = \
                                 m2.groupdict()['value']
     
-                        sub_dict[routes][prefix]['index'][index]['weight'] = \
+                        path_dict['weight'] = \
                             m2.groupdict()['weight']
-                        sub_dict[routes][prefix]['index'][index]['path'] = \
+                        path_dict['path'] = \
                             m2.groupdict()['path'].strip()
                     elif m3:
-                        sub_dict[routes][prefix]['index'][index]['weight'] = \
+                        path_dict['weight'] = \
                             m3.groupdict()['weight']
-                        sub_dict[routes][prefix]['index'][index]['path'] = \
+                        path_dict['path'] = \
                             m3.groupdict()['path'].strip()
 
                 if m.groupdict()['origin_codes']:
-                    sub_dict[routes][prefix]['index'][index]['origin_codes'] = \
+                    path_dict['origin_codes'] = \
                         m.groupdict()['origin_codes']
                 continue
 
@@ -4026,25 +4098,29 @@ class ShowBgpInstanceNeighborsReceivedRoutes(ShowBgpInstanceNeighborsReceivedRou
 
             m = p13_1.match(line)
             if m:
-                if 'path' in sub_dict[routes][prefix]['index'][index]:
-                    sub_dict[routes][prefix]['index'][index]['path'] += \
+                if 'path' in path_dict:
+                    path_dict['path'] += \
                         ' ' + m.groupdict()['path'].strip()
 
                 if m.groupdict()['origin_codes']:
-                    sub_dict[routes][prefix]['index'][index]['origin_codes'] = \
+                    path_dict['origin_codes'] = \
                         m.groupdict()['origin_codes']
 
             # Processed 5 prefixes, 5 paths
 
             m = p14.match(line)
             if m:
+                if pending:
+                    yield pending
+                    pending = None
                 processed_prefixes = int(m.groupdict()['processed_prefixes'])
                 processed_paths = int(m.groupdict()['processed_paths'])
                 sub_dict['processed_prefixes'] = processed_prefixes
                 sub_dict['processed_paths'] = processed_paths                    
                 continue
-    
-        return ret_dict 
+
+        if pending:
+            yield pending
 
 
 # ===============================================================================
@@ -4117,27 +4193,87 @@ class ShowBgpInstanceNeighborsAdvertisedRoutes(ShowBgpInstanceNeighborsAdvertise
                    'show bgp instance {instance} {vrf_type} {vrf} {address_family} neighbors {neighbor} advertised-routes',
                    'show bgp instance {instance} {vrf_type} {vrf} neighbors {neighbor} advertised-routes']
 
+    def _command(self, vrf_type, neighbor, vrf, instance, address_family):
+        if vrf_type == 'all':
+            return self.cli_command[0].format(instance=instance,
+                                              neighbor=neighbor)
+        if address_family:
+            return self.cli_command[1].format(instance=instance,
+                                              neighbor=neighbor,
+                                              address_family=address_family,
+                                              vrf_type=vrf_type, vrf=vrf)
+        return self.cli_command[2].format(instance=instance,
+                                          neighbor=neighbor,
+                                          vrf_type=vrf_type, vrf=vrf)
+
     def cli(self, vrf_type='all', neighbor='', vrf='all', instance='all', address_family='', output=None):
         assert vrf_type in ['all', 'vrf']
         assert address_family in ['', 'ipv4 unicast', 'ipv6 unicast']
         if output is None:
-            if vrf_type == 'all':
-                out = self.device.execute(self.cli_command[0].format(instance=instance,
-                                                                  neighbor=neighbor))
-            else:
-                if address_family:
-                    out = self.device.execute(self.cli_command[1].format(instance=instance,
-                                                                  neighbor=neighbor,
-                                                                  address_family=address_family,
-                                                                  vrf_type=vrf_type, vrf=vrf))
-                else:
-                    out = self.device.execute(self.cli_command[2].format(instance=instance,
-                                                                  neighbor=neighbor,
-                                                                  vrf_type=vrf_type, vrf=vrf))
+            out = self.device.execute(self._command(
+                vrf_type, neighbor, vrf, instance, address_family))
         else:
             out = output
 
         ret_dict = {}
+        for _, sub_dict, prefix, index, path_dict in self._paths(
+                ret_dict, out, vrf_type, vrf, address_family):
+            bgp_paths.add_path(sub_dict, 'advertised', prefix, index,
+                               path_dict)
+        return ret_dict
+
+    def parse_stream(self, vrf_type='all', neighbor='', vrf='all',
+                     instance='all', address_family='', output=None,
+                     tables=None):
+        '''Yield the paths one at a time as the lines are read, without
+           building the whole dictionary
+
+            Args:
+                vrf_type, neighbor, vrf, instance, address_family: as for
+                parse()
+                output (`str`): output to parse instead of executing, or
+                                an iterable of its lines such as a file
+                tables (`dict`): filled with the dictionary parse() returns
+                                 without the advertised routes, when given
+
+            Returns:
+                iterator of BgpPath records. Nothing is validated against
+                the schema
+        '''
+        assert vrf_type in ['all', 'vrf']
+        assert address_family in ['', 'ipv4 unicast', 'ipv6 unicast']
+        if output is None:
+            output = self.device.execute(self._command(
+                vrf_type, neighbor, vrf, instance, address_family))
+        return (bgp_paths.BgpPath(*keys, prefix, index, path_dict)
+                for keys, _, prefix, index, path_dict in self._paths(
+                    {} if tables is None else tables, output, vrf_type, vrf,
+                    address_family))
+
+    def parse_compact(self, vrf_type='all', neighbor='', vrf='all',
+                      instance='all', address_family='', output=None):
+        '''Parse into CompactPaths, the next hops and AS paths stored once
+           and referenced by integer ids
+
+            Returns:
+                CompactPaths, its to_dict() is the dictionary parse()
+                returns. Nothing is validated against the schema
+        '''
+        tables = {}
+        return bgp_paths.CompactPaths(
+            self.parse_stream(vrf_type=vrf_type, neighbor=neighbor, vrf=vrf,
+                              instance=instance,
+                              address_family=address_family, output=output,
+                              tables=tables),
+            tables=tables, key='advertised')
+
+    def _paths(self, ret_dict, out, vrf_type, vrf, address_family):
+        '''(keys, sub_dict, prefix, index, path_dict) of each path of the
+           output, keys (instance, vrf, address family); the rest of the
+           parsed dictionary goes to ret_dict. A path is yielded once the
+           next path or section starts'''
+        # (keys, sub_dict, prefix, index, path_dict) not yielded yet
+        pending = None
 
         if vrf_type == 'all':
             vrf = 'default'
@@ -4166,13 +4302,16 @@ class ShowBgpInstanceNeighborsAdvertisedRoutes(ShowBgpInstanceNeighborsAdvertise
         p6 = re.compile(
             r'^Processed *(?P<processed_prefixes>[0-9]+) *prefixes, *(?P<processed_paths>[0-9]+) *paths$')
 
-        for line in out.splitlines():
+        for line in budget.lines(out, ret_dict):
             line = line.strip()
 
             # BGP instance 0: 'default'
 
             m = p1.match(line)
             if m:
+                if pending:
+                    yield pending
+                    pending = None
                 instance = m.groupdict()['instance']
                 instance = instance.replace("'","")
 
@@ -4186,6 +4325,9 @@ class ShowBgpInstanceNeighborsAdvertisedRoutes(ShowBgpInstanceNeighborsAdvertise
 
             m = p2.match(line)
             if m:
+                if pending:
+                    yield pending
+                    pending = None
                 ret_dict.setdefault('instance', {}).setdefault(instance, {})
                 vrf = m.groupdict()['vrf']
                 if 'vrf' not in ret_dict['instance'][instance]:
@@ -4198,6 +4340,9 @@ class ShowBgpInstanceNeighborsAdvertisedRoutes(ShowBgpInstanceNeighborsAdvertise
 
             m = p7.match(line)
             if m and vrf == 'default':
+                if pending:
+                    yield pending
+                    pending = None
                 address_family = m.groupdict()['address_family'].lower()
                 if vrf_type == 'all' and vrf == 'default':
                     if 'vrf' not in ret_dict['instance'][instance]:
@@ -4210,6 +4355,9 @@ class ShowBgpInstanceNeighborsAdvertisedRoutes(ShowBgpInstanceNeighborsAdvertise
 
             m = p3.match(line)
             if m:
+                if pending:
+                    yield pending
+                    pending = None
                 rd = m.groupdict()['route_distinguisher']
                 addr = (address_family or af) + ' RD ' + rd
                 default_vrf = m.groupdict()['default_vrf']
@@ -4220,6 +4368,7 @@ class ShowBgpInstanceNeighborsAdvertisedRoutes(ShowBgpInstanceNeighborsAdvertise
                     ret_dict['instance'][instance]['vrf'][vrf]['address_family'] = {}
                 if address_family not in ret_dict['instance'][instance]['vrf'][vrf]['address_family']:
                     sub_dict = ret_dict['instance'][instance]['vrf'][vrf]['address_family'][addr] = {}
+                    keys = instance, vrf, addr
                 sub_dict['route_distinguisher'] = rd
                 sub_dict['default_vrf'] = default_vrf if default_vrf else 'default'
                 continue
@@ -4239,6 +4388,7 @@ class ShowBgpInstanceNeighborsAdvertisedRoutes(ShowBgpInstanceNeighborsAdvertise
                         ret_dict['instance'][instance]['vrf'][vrf]['address_family'] = {}
                     if address_family not in ret_dict['instance'][instance]['vrf'][vrf]['address_family']:
                         sub_dict = ret_dict['instance'][instance]['vrf'][vrf]['address_family'][addr] = {}
+                        keys = instance, vrf, addr
                 if m:
                     prefix = m.groupdict()['prefix']
                     next_hop = m.groupdict()['next_hop']
@@ -4251,24 +4401,20 @@ class ShowBgpInstanceNeighborsAdvertisedRoutes(ShowBgpInstanceNeighborsAdvertise
                 else:
                     prefix = pre_net
                     index += 1
-                if 'advertised' not in sub_dict:
-                    sub_dict['advertised'] = {}
 
-                if prefix not in sub_dict['advertised']:
-                    sub_dict['advertised'][prefix] = {}
-                if 'index' not in sub_dict['advertised'][prefix]:
-                    sub_dict['advertised'][prefix]['index'] = {}
-                if index not in sub_dict['advertised'][prefix]['index']:
-                    sub_dict['advertised'][prefix]['index'][index] = {}
+                if pending:
+                    yield pending
+                path_dict = {}
+                pending = keys, sub_dict, prefix, index, path_dict
 
                 if froms:
-                    sub_dict['advertised'][prefix]['index'][index]['froms'] = froms
+                    path_dict['froms'] = froms
                 if path:
-                    sub_dict['advertised'][prefix]['index'][index]['path'] = path
+                    path_dict['path'] = path
                 if origin_code:
-                    sub_dict['advertised'][prefix]['index'][index]['origin_code'] = origin_code
+                    path_dict['origin_code'] = origin_code
                 if next_hop:
-                    sub_dict['advertised'][prefix]['index'][index]['next_hop'] = next_hop
+                    path_dict['next_hop'] = next_hop
                     continue
 
             #                                                    200 33299 51178 47751 {27017}e
@@ -4278,15 +4424,18 @@ class ShowBgpInstanceNeighborsAdvertisedRoutes(ShowBgpInstanceNeighborsAdvertise
                 path = m.groupdict()['path']
                 origin_code = m.groupdict()['origin_code']
                 if path:
-                    sub_dict['advertised'][prefix]['index'][index]['path'] = path
+                    path_dict['path'] = path
                 if origin_code:
-                    sub_dict['advertised'][prefix]['index'][index]['origin_code'] = origin_code
+                    path_dict['origin_code'] = origin_code
                     continue
 
             # Processed 5 prefixes, l5 paths
 
             m = p6.match(line)
             if m:
+                if pending:
+                    yield pending
+                    pending = None
                 processed_prefixes = str(m.groupdict()['processed_prefixes'])
                 processed_paths = str(m.groupdict()['processed_paths'])
 
@@ -4294,7 +4443,8 @@ class ShowBgpInstanceNeighborsAdvertisedRoutes(ShowBgpInstanceNeighborsAdvertise
                 sub_dict['processed_paths'] = processed_paths
                 continue
 
-        return ret_dict
+        if pending:
+            yield pending
 
 
 # ====================================================================
@@ -4380,6 +4530,20 @@ class ShowBgpInstanceNeighborsRoutes(ShowBgpInstanceNeighborsRoutesSchema, ShowB
         return super().cli(neighbor=neighbor, vrf_type=vrf_type, address_family=address_family,
             route_type='routes', vrf=vrf, instance=instance, output=output)
 
+    def parse_stream(self, vrf_type='all', neighbor='', vrf='all',
+                     instance='all', address_family='', route_type='routes',
+                     output=None, tables=None):
+        return super().parse_stream(neighbor=neighbor, vrf_type=vrf_type,
+            address_family=address_family, route_type='routes', vrf=vrf,
+            instance=instance, output=output, tables=tables)
+
+    def parse_compact(self, vrf_type='all', neighbor='', vrf='all',
+                      instance='all', address_family='', route_type='routes',
+                      output=None):
+        return super().parse_compact(neighbor=neighbor, vrf_type=vrf_type,
+            address_family=address_family, route_type='routes', vrf=vrf,
+            instance=instance, output=output)
+
 
 # ====================================================
 # Parser for:
@@ -4924,6 +5088,18 @@ class ShowBgpInstanceAllAll(ShowBgpInstanceAllAllSchema):
 
     exclude = ['bgp_table_version', 'rd_version', 'nsr_initial_init_ver_status', 'nsr_initial_initsync_version']
 
+    def _command(self, vrf_type, address_family, instance, vrf):
+        if vrf_type == 'all':
+            return self.cli_command[0].format(instance=instance)
+        if address_family:
+            return self.cli_command[2].format(instance=instance,
+                                              address_family=address_family,
+                                              vrf_type=vrf_type,
+                                              vrf=vrf)
+        return self.cli_command[1].format(instance=instance,
+                                          vrf_type=vrf_type,
+                                          vrf=vrf)
+
     def cli(self, vrf_type='all', address_family='', instance='all', vrf='all', output=None):
 
         # Verify vrf_type and address_family
@@ -4932,24 +5108,66 @@ class ShowBgpInstanceAllAll(ShowBgpInstanceAllAllSchema):
 
         # Execute command
         if output is None:
-            if vrf_type == 'all':
-                output = self.device.execute(self.cli_command[0].\
-                                             format(instance=instance))
-            else:
-                if address_family:
-                    output = self.device.execute(self.cli_command[2].\
-                                                 format(instance=instance,
-                                                 address_family=address_family,
-                                                 vrf_type=vrf_type,
-                                                 vrf=vrf))
-                else:
-                    output = self.device.execute(self.cli_command[1].\
-                                                 format(instance=instance,
-                                                        vrf_type=vrf_type,
-                                                        vrf=vrf))
-        # Init
+            output = self.device.execute(self._command(
+                vrf_type, address_family, instance, vrf))
+
         parsed_dict = {}
+        for _, af_dict, prefix, index, pfx_dict in self._paths(
+                parsed_dict, output, vrf_type, address_family, vrf):
+            bgp_paths.add_path(af_dict, 'prefix', prefix, index, pfx_dict)
+        return parsed_dict
+
+    def parse_stream(self, vrf_type='all', address_family='', instance='all',
+                     vrf='all', output=None, tables=None):
+        '''Yield the paths one at a time as the lines are read, without
+           building the whole dictionary
+
+            Args:
+                vrf_type, address_family, instance, vrf: as for parse()
+                output (`str`): output to parse instead of executing, or
+                                an iterable of its lines such as a file
+                tables (`dict`): filled with the dictionary parse() returns
+                                 without the prefixes, when given
+
+            Returns:
+                iterator of BgpPath records. Nothing is validated against
+                the schema
+        '''
+        assert vrf_type in ['all', 'vrf']
+        assert address_family in ['', 'ipv4 unicast', 'ipv6 unicast']
+        if output is None:
+            output = self.device.execute(self._command(
+                vrf_type, address_family, instance, vrf))
+        return (bgp_paths.BgpPath(*keys, prefix, index, pfx_dict)
+                for keys, _, prefix, index, pfx_dict in self._paths(
+                    {} if tables is None else tables, output, vrf_type,
+                    address_family, vrf))
+
+    def parse_compact(self, vrf_type='all', address_family='',
+                      instance='all', vrf='all', output=None):
+        '''Parse into CompactPaths, the next hops and AS paths stored once
+           and referenced by integer ids
+
+            Returns:
+                CompactPaths, its to_dict() is the dictionary parse()
+                returns. Nothing is validated against the schema
+        '''
+        tables = {}
+        return bgp_paths.CompactPaths(
+            self.parse_stream(vrf_type=vrf_type,
+                              address_family=address_family,
+                              instance=instance, vrf=vrf, output=output,
+                              tables=tables),
+            tables=tables, key='prefix')
+
+    def _paths(self, parsed_dict, output, vrf_type, address_family, vrf):
+        '''(keys, af_dict, prefix, index, pfx_dict) of each path of the
+           output, keys (instance, vrf, address family); the rest of the
+           parsed dictionary goes to parsed_dict. A path is yielded once
+           the next path or section starts'''
         last_prefix = None
+        # (keys, af_dict, prefix, index, pfx_dict) not yielded yet
+        pending = None
 
         # Determind VRF and AF
         if vrf_type == 'all':
@@ -5064,12 +5282,15 @@ class ShowBgpInstanceAllAll(ShowBgpInstanceAllAllSchema):
         p18 = re.compile(r'^\s*Processed +(?P<processed_prefix>[0-9]+)'
                          r' +prefixes, +(?P<processed_paths>[0-9]+) +paths$')
 
-        for line in output.splitlines():
+        for line in budget.lines(output, parsed_dict):
             line = line.rstrip()
 
             # BGP instance 0: 'default'
             m = p1.match(line)
             if m:
+                if pending:
+                    yield pending
+                    pending = None
                 group = m.groupdict()
                 instance = group['instance'].replace("'","")
                 instance_number = group['instance_number']
@@ -5084,6 +5305,9 @@ class ShowBgpInstanceAllAll(ShowBgpInstanceAllAllSchema):
             # VRF: VRF1
             m = p2.match(line)
             if m:
+                if pending:
+                    yield pending
+                    pending = None
                 vrf = m.groupdict()['vrf']
                 vrf_dict = inst_dict.setdefault('vrf', {}).setdefault(vrf, {})
                 # Address family is default - init ipv4 unicast dictionary here
@@ -5092,22 +5316,30 @@ class ShowBgpInstanceAllAll(ShowBgpInstanceAllAllSchema):
                     original_address_family = address_family
                     af_dict = vrf_dict.setdefault('address_family', {}).\
                                        setdefault(address_family, {})
+                    keys = instance, vrf, address_family
                 continue
 
             # Address Family: VPNv4 Unicast
             # Address family: IPv6 Labeled-unicast
             m = p3.match(line)
             if m:
+                if pending:
+                    yield pending
+                    pending = None
                 address_family = m.groupdict()['address_family'].lower()
                 original_address_family = address_family
                 af_dict = vrf_dict.setdefault('address_family', {}).\
                                        setdefault(address_family, {})
+                keys = instance, vrf, address_family
                 af_dict['instance_number'] = instance_number
                 continue
 
             # BGP VRF VRF1, state: Active
             m = p4.match(line)
             if m:
+                if pending:
+                    yield pending
+                    pending = None
                 group = m.groupdict()
                 # if no vrf key, set it to be the user input
                 if not vrf:
@@ -5118,6 +5350,7 @@ class ShowBgpInstanceAllAll(ShowBgpInstanceAllAllSchema):
                         original_address_family = address_family
                         af_dict = vrf_dict.setdefault('address_family', {}).\
                                            setdefault(address_family, {})
+                        keys = instance, vrf, address_family
                 # Set keys
                 af_dict['bgp_vrf'] = group['bgp_vrf'].lower()
                 af_dict['vrf_state'] = group['vrf_state'].lower()
@@ -5194,6 +5427,9 @@ class ShowBgpInstanceAllAll(ShowBgpInstanceAllAllSchema):
             # Route Distinguisher: 200:1 (default for vrf VRF1)
             m = p15.match(line)
             if m:
+                if pending:
+                    yield pending
+                    pending = None
                 group = m.groupdict()
                 rd = group['route_distinguisher']
                 # Set af
@@ -5201,6 +5437,7 @@ class ShowBgpInstanceAllAll(ShowBgpInstanceAllAllSchema):
                 # New dict
                 af_dict = vrf_dict.setdefault('address_family', {}).\
                                    setdefault(address_family, {})
+                keys = instance, vrf, address_family
                 # Set keys
                 af_dict['route_distinguisher'] = rd
                 if group['default_vrf']:
@@ -5218,9 +5455,11 @@ class ShowBgpInstanceAllAll(ShowBgpInstanceAllAllSchema):
                     index = 1
                 else:
                     index += 1
+                if pending:
+                    yield pending
                 # Set dict
-                pfx_dict = af_dict.setdefault('prefix', {}).setdefault(last_prefix, {}).\
-                                   setdefault('index', {}).setdefault(index, {})
+                pfx_dict = {}
+                pending = keys, af_dict, last_prefix, index, pfx_dict
                 # Set keys
                 pfx_dict['status_codes'] = group['status_codes'].strip().replace(" ", "")
                 if group['next_hop']:
@@ -5266,9 +5505,11 @@ class ShowBgpInstanceAllAll(ShowBgpInstanceAllAllSchema):
                     index = 1
                 else:
                     index += 1
+                if pending:
+                    yield pending
                 # Set dict
-                pfx_dict = af_dict.setdefault('prefix', {}).setdefault(last_prefix, {}).\
-                                   setdefault('index', {}).setdefault(index, {})
+                pfx_dict = {}
+                pending = keys, af_dict, last_prefix, index, pfx_dict
                 # Set keys
                 pfx_dict['next_hop'] = group['next_hop']
                 pfx_dict['status_codes'] = group['status_codes'].strip().replace(" ", "")
@@ -5315,12 +5556,16 @@ class ShowBgpInstanceAllAll(ShowBgpInstanceAllAllSchema):
             # Processed 40 prefixes, 50 paths
             m = p18.match(line)
             if m:
+                if pending:
+                    yield pending
+                    pending = None
                 group = m.groupdict()
                 af_dict['processed_prefix'] = int(group['processed_prefix'])
                 af_dict['processed_paths'] = int(group['processed_paths'])
                 continue
 
-        return parsed_dict 
+        if pending:
+            yield pending
 
 
 ################################################################################
@@ -6385,9 +6630,14 @@ class ShowBgpL2vpnEvpnAdvertisedSchema(MetaParser):
 # ===========================================
 # Parser for 'show bgp l2vpn evpn advertised'
 # ===========================================
-class ShowBgpL2vpnEvpnAdvertised(ShowBgpL2vpnEvpnAdvertisedSchema):
+class ShowBgpL2vpnEvpnAdvertised(ShowBgpL2vpnEvpnAdvertisedSchema,
+                                 bgp_paths.SharedAttributes):
     '''Parser for:
         * 'show bgp l2vpn evpn advertised'
+
+        parse_attributes() stores the AS paths, communities and extended
+        communities of the inbound and outbound attributes once, see
+        bgp_paths.
     '''
 
     cli_command = 'show bgp l2vpn evpn advertised'
@@ -6538,21 +6788,24 @@ class ShowBgpL2vpnEvpnAdvertised(ShowBgpL2vpnEvpnAdvertisedSchema):
             m = p11.match(line)
             if m:
                 value = m.groupdict()['aspath']
-                attr_dict['aspath'] = value if value != None else ""
+                attr_dict['aspath'] = self._attribute(
+                    'as_path', value if value != None else "")
                 continue
 
             #    community: no-export
             m = p12.match(line)
             if m:
                 value = m.groupdict()['community']
-                attr_dict['community'] = value.split() if value != None else []
+                attr_dict['community'] = self._attribute(
+                    'community', value.split() if value != None else [])
                 continue
 
             #    extended community: SoO:0.0.0.0:0 RT:100:7
             m = p13.match(line)
             if m:
                 value = m.groupdict()['extended_community']
-                attr_dict['extended_community'] = value.split() if value != None else []
+                attr_dict['extended_community'] = self._attribute(
+                    'ext_community', value.split() if value != None else [])
                 continue
 
         return parsed_dict
@@ -16,12 +16,14 @@ IOSXR parsers for the following show commands:
 
 # Python
 import re
-from netaddr import IPAddress, IPNetwork
 
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional
 
+# Parser
+from genie.libs.parser.utils import ip
+
 
 # ==================================================
 # Schema for 'show ospf vrf all-inclusive interface'
@@ -471,7 +473,7 @@ class ShowOspfVrfAllInclusiveInterface(ShowOspfVrfAllInclusiveInterfaceSchema):
                 ip_address = str(m.groupdict()["address"])
                 area = str(m.groupdict()["area"])
                 if area.isdigit():
-                    area = str(IPAddress(area))
+                    area = ip.area(area)
                 continue
 
             # Process ID 1, Router ID 10.36.3.3, Network Type POINT_TO_POINT
@@ -591,7 +593,7 @@ class ShowOspfVrfAllInclusiveInterface(ShowOspfVrfAllInclusiveInterfaceSchema):
                                 q_inst = str(q.groupdict()["q_inst"])
                                 q_area = str(q.groupdict()["q_area"])
                                 if q_area.isdigit():
-                                    q_area = str(IPAddress(q_area))
+                                    q_area = ip.area(q_area)
                                 remote_id = str(q.groupdict()["remote_id"])
 
                                 # Check parameters match
@@ -1142,7 +1144,7 @@ class ShowOspfVrfAllInclusiveNeighborDetail(
             if m:
                 area = str(m.groupdict()["area"])
                 if area.isdigit():
-                    area = str(IPAddress(area))
+                    area = ip.area(area)
                 interface = str(m.groupdict()["interface"])
 
                 # Determine if 'interface' or 'virtual_link'
@@ -2300,11 +2302,11 @@ class ShowOspfVrfAllInclusive(ShowOspfVrfAllInclusiveSchema):
                 if n:
                     area = str(n.groupdict()["area_num"])
                     if area.isdigit():
-                        area = str(IPAddress(area))
+                        area = ip.area(area)
                 else:
                     area = str(m.groupdict()["area"])
                     if area.isdigit():
-                        area = str(IPAddress(area))
+                        area = ip.area(area)
 
                 # Create dict
                 if "areas" not in sub_dict:
@@ -2732,7 +2734,7 @@ class ShowOspfVrfAllInclusiveLinksParser(MetaParser):
             if m:
                 area = str(m.groupdict()["area"])
                 if area.isdigit():
-                    area = str(IPAddress(area))
+                    area = ip.area(area)
                 source_address = str(m.groupdict()["source_address"])
 
                 # Set link_name for sham_link
@@ -2805,7 +2807,7 @@ class ShowOspfVrfAllInclusiveLinksParser(MetaParser):
             if m:
                 area = str(m.groupdict()["area"])
                 if area.isdigit():
-                    area = str(IPAddress(area))
+                    area = ip.area(area)
 
                 # Set link_name for virtual_link
                 link_name = area + " " + vl_router_id
@@ -3324,7 +3326,7 @@ class ShowOspfMplsTrafficEngLink(ShowOspfMplsTrafficEngLinkSchema):
             if m:
                 area = str(m.groupdict()["area"])
                 if area.isdigit():
-                    area = str(IPAddress(area))
+                    area = ip.area(area)
                 if (
                     "areas"
                     not in ret_dict["vrf"][vrf]["address_family"][af]["instance"][
@@ -3379,7 +3381,7 @@ class ShowOspfMplsTrafficEngLink(ShowOspfMplsTrafficEngLinkSchema):
             if m:
                 area = str(m.groupdict()["area"])
                 if area.isdigit():
-                    area = str(IPAddress(area))
+                    area = ip.area(area)
                 if (
                     "areas"
                     not in ret_dict["vrf"][vrf]["address_family"][af]["instance"][
@@ -3804,7 +3806,7 @@ class ShowOspfVrfAllInclusiveDatabaseParser(MetaParser):
                 if m.groupdict()["area"]:
                     try:
                         int(m.groupdict()["area"])
-                        area = str(IPAddress(str(m.groupdict()["area"])))
+                        area = ip.area(m.groupdict()["area"])
                     except Exception:
                         area = str(m.groupdict()["area"])
                 else:
@@ -3964,7 +3966,7 @@ class ShowOspfVrfAllInclusiveDatabaseParser(MetaParser):
             m = p10.match(line)
             if m:
                 dummy = "{}/{}".format("0.0.0.0", m.groupdict()["net_mask"])
-                db_dict["network_mask"] = str(IPNetwork(dummy).netmask)
+                db_dict["network_mask"] = ip.prefix(dummy)[1]
                 continue
 
             # Metric Type: 2 (Larger than any link state path)
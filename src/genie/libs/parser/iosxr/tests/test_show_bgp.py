@@ -36,6 +36,7 @@ from genie.libs.parser.iosxr.show_bgp import (
     ShowBgpSummary,
     ShowBgpEgressEngineering,
 )
+from genie.libs.parser.utils import bgp_paths
 
 
 # ================================================================================
@@ -10316,6 +10317,84 @@ class TestShowBgpInstanceAllAll(unittest.TestCase):
         self.assertEqual(parsed_output, self.golden_parsed_output5)
 
 
+# ==============================================================
+# Unit test for the path records and compact mode of:
+#   * 'show bgp instance all all all'
+#   * 'show bgp instance all vrf all'
+#   * 'show bgp instance all vrf all neighbors <WORD> received routes'
+#   * 'show bgp instance all all all neighbors <WORD> routes'
+#   * 'show bgp instance all vrf all neighbors <WORD> advertised-routes'
+# ==============================================================
+class TestShowBgpInstancePathRecords(unittest.TestCase):
+
+    maxDiff = None
+
+    goldens = [
+        (ShowBgpInstanceAllAll, TestShowBgpInstanceAllAll, "1",
+         {"vrf_type": "all"}, "prefix"),
+        (ShowBgpInstanceAllAll, TestShowBgpInstanceAllAll, "3",
+         {"vrf_type": "vrf"}, "prefix"),
+        (ShowBgpInstanceNeighborsReceivedRoutes,
+         TestShowBgpInstanceAllVrfAllNeighborsReceivedRoutes, "",
+         {"vrf_type": "vrf", "neighbor": "10.186.5.5"}, "received"),
+        (ShowBgpInstanceNeighborsRoutes,
+         TestShowBgpInstanceAllAllAllNeighborsRoutes, "",
+         {"vrf_type": "all", "neighbor": "10.36.3.3"}, "routes"),
+        (ShowBgpInstanceNeighborsAdvertisedRoutes,
+         TestShowBgpInstanceAllVrfAllNeighborsAdvertisedRoutes, "",
+         {"vrf_type": "vrf", "neighbor": "10.186.5.5"}, "advertised"),
+    ]
+
+    def test_stream(self):
+        for parser, test, number, kwargs, key in self.goldens:
+            output = getattr(test, "golden_output" + number)[
+                "execute.return_value"]
+            tables = {}
+            obj = parser(device=Mock())
+            for path in obj.parse_stream(output=output, tables=tables,
+                                         **kwargs):
+                af_dict = tables["instance"][path.instance]["vrf"][path.vrf][
+                    "address_family"][path.address_family]
+                bgp_paths.add_path(af_dict, key, path.prefix, path.index,
+                                   path.path)
+            self.assertEqual(tables, getattr(
+                test, "golden_parsed_output" + number))
+
+    def test_compact(self):
+        for parser, test, number, kwargs, key in self.goldens:
+            output = getattr(test, "golden_output" + number)[
+                "execute.return_value"]
+            obj = parser(device=Mock())
+            compact = obj.parse_compact(output=output, **kwargs)
+            self.assertEqual(compact.to_dict(), getattr(
+                test, "golden_parsed_output" + number))
+
+    def test_compact_values(self):
+        output = TestShowBgpInstanceAllAll.golden_output1[
+            "execute.return_value"]
+        obj = ShowBgpInstanceAllAll(device=Mock())
+        compact = obj.parse_compact(vrf_type="all", output=output)
+        self.assertEqual(len(compact), 28)
+        self.assertEqual(sorted(compact.values["next_hop"].values[1:]),
+                         ["10.186.5.5", "10.64.4.4", "2001:db8:20:1:5::5"])
+        self.assertEqual(len(compact.values["path"]), 3)
+        path = next(iter(compact))
+        self.assertEqual(path.instance, "default")
+        self.assertEqual(path.address_family,
+                         "vpnv4 unicast RD 200:1")
+        self.assertEqual(path.prefix, "10.1.1.0/24")
+        self.assertEqual(path.path["path"], "200 33299 51178 47751 {27016}")
+
+    def test_stream_command(self):
+        self.device = Mock(**TestShowBgpInstanceAllAll.golden_output3)
+        obj = ShowBgpInstanceAllAll(device=self.device)
+        paths = obj.parse_stream(vrf_type="vrf", vrf="VRF1",
+                                 address_family="ipv4 unicast")
+        self.assertEqual(next(paths).index, 1)
+        self.device.execute.assert_called_once_with(
+            "show bgp instance all vrf VRF1 ipv4 unicast")
+
+
 # =============================================
 # Unit test for 'show bgp l2vpn evpn'
 # =============================================
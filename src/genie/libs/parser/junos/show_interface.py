@@ -20,6 +20,7 @@ from genie.metaparser.util.schemaengine import Schema, Any, Optional, Use, Or
 
 # import parser utils
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils import junos_display
 
 
 # =======================================================
@@ -767,6 +768,306 @@ class ShowInterfacesSchema(MetaParser):
 class ShowInterfaces(ShowInterfacesSchema):
     cli_command = ['show interfaces']
 
+    # Elements of the '| display xml' and '| display json' outputs
+    xml_shape = {
+        'interface-information': {
+            '@junos:style': str,
+            'physical-interface': [{
+                'active-alarms': {
+                    'interface-alarms': {
+                        'alarm-not-present': bool,
+                        'ethernet-alarm-link-down': bool,
+                    },
+                },
+                'active-defects': {
+                    'interface-alarms': {
+                        'alarm-not-present': bool,
+                        'ethernet-alarm-link-down': bool,
+                    },
+                },
+                'admin-status': {
+                    '#text': str,
+                    '@junos:format': str,
+                },
+                'bpdu-error': str,
+                'clocking': str,
+                'current-physical-address': str,
+                'description': str,
+                'eth-switch-error': str,
+                'ethernet-fec-mode': {
+                    '@junos:style': str,
+                    'enabled_fec_mode': str,
+                },
+                'ethernet-fec-statistics': {
+                    '@junos:style': str,
+                    'fec_ccw_count': str,
+                    'fec_ccw_error_rate': str,
+                    'fec_nccw_count': str,
+                    'fec_nccw_error_rate': str,
+                },
+                'ethernet-pcs-statistics': {
+                    '@junos:style': str,
+                    'bit-error-seconds': str,
+                    'errored-blocks-seconds': str,
+                },
+                'hardware-physical-address': str,
+                'if-config-flags': {
+                    'internal-flags': str,
+                    'iff-snmp-traps': bool,
+                    'iff-hardware-down': bool,
+                },
+                'if-auto-negotiation': str,
+                'if-device-flags': {
+                    'ifdf-present': bool,
+                    'ifdf-running': bool,
+                    'ifdf-loopback': bool,
+                    'ifdf-down': bool,
+                },
+                'if-flow-control': str,
+                'if-media-flags': {
+                    'ifmf-none': bool,
+                },
+                'if-remote-fault': str,
+                'if-type': str,
+                'ifd-specific-config-flags': {
+                    'internal-flags': str,
+                },
+                'interface-flapped': {
+                    '#text': str,
+                    '@junos:seconds': str,
+                },
+                'interface-transmit-statistics': str,
+                'l2pt-error': str,
+                'ld-pdu-error': str,
+                'link-level-type': str,
+                'link-type': str,
+                'link-mode': str,
+                'local-index': str,
+                'logical-interface': [{
+                    'address-family': [{
+                        'address-family-flags': {
+                            'ifff-is-primary': bool,
+                            'ifff-no-redirects': bool,
+                            'ifff-none': bool,
+                            'ifff-sendbcast-pkt-to-re': bool,
+                            'internal-flags': bool,
+                            'ifff-primary': bool,
+                            'ifff-receive-ttl-exceeded': bool,
+                            'ifff-receive-options': bool,
+                            'ifff-encapsulation': str,
+                        },
+                        'address-family-name': str,
+                        'interface-address': [{
+                            'ifa-broadcast': str,
+                            'ifa-destination': str,
+                            'ifa-flags': {
+                                'ifaf-current-preferred': bool,
+                                'ifaf-current-primary': bool,
+                                'ifaf-is-primary': bool,
+                                'ifaf-is-preferred': bool,
+                                'ifaf-kernel': bool,
+                                'ifaf-preferred': bool,
+                                'ifaf-primary': bool,
+                                'ifaf-is-default': bool,
+                                'ifaf-none': bool,
+                                'ifaf-dest-route-down': bool,
+                            },
+                            'ifa-local': str,
+                        }],
+                        'intf-curr-cnt': str,
+                        'intf-dropcnt': str,
+                        'intf-unresolved-cnt': str,
+                        'generation': str,
+                        'route-table': str,
+                        'max-local-cache': str,
+                        'maximum-labels': str,
+                        'mtu': str,
+                        'new-hold-limit': str,
+                    }],
+                    'encapsulation': str,
+                    'filter-information': str,
+                    'if-config-flags': {
+                        'iff-snmp-traps': bool,
+                        'iff-up': bool,
+                        'internal-flags': str,
+                    },
+                    'local-index': str,
+                    'logical-interface-bandwidth': str,
+                    'name': str,
+                    'policer-overhead': str,
+                    'snmp-index': str,
+                    'traffic-statistics': {
+                        '@junos:style': str,
+                        'input-packets': str,
+                        'input-bytes': str,
+                        'output-packets': str,
+                        'output-bytes': str,
+                        'ipv6-transit-statistics': {
+                            'input-bytes': str,
+                            'input-packets': str,
+                            'output-bytes': str,
+                            'output-packets': str,
+                        },
+                    },
+                    'transit-traffic-statistics': {
+                        'input-bps': str,
+                        'input-bytes': str,
+                        'input-packets': str,
+                        'input-pps': str,
+                        'ipv6-transit-statistics': {
+                            'input-bps': str,
+                            'input-bytes': str,
+                            'input-packets': str,
+                            'input-pps': str,
+                            'output-bps': str,
+                            'output-bytes': str,
+                            'output-packets': str,
+                            'output-pps': str,
+                        },
+                        'output-bps': str,
+                        'output-bytes': str,
+                        'output-packets': str,
+                        'output-pps': str,
+                    },
+                }],
+                'loopback': str,
+                'lsi-traffic-statistics': {
+                    '@junos:style': str,
+                    'input-bps': str,
+                    'input-bytes': str,
+                    'input-packets': str,
+                    'input-pps': str,
+                },
+                'mru': str,
+                'mtu': str,
+                'name': str,
+                'oper-status': str,
+                'pad-to-minimum-frame-size': str,
+                'physical-interface-cos-information': {
+                    'physical-interface-cos-hw-max-queues': str,
+                    'physical-interface-cos-use-max-queues': str,
+                },
+                'snmp-index': str,
+                'sonet-mode': str,
+                'source-filtering': str,
+                'speed': str,
+                'stp-traffic-statistics': {
+                    '@junos:style': str,
+                    'stp-input-bytes-dropped': str,
+                    'stp-input-packets-dropped': str,
+                    'stp-output-bytes-dropped': str,
+                    'stp-output-packets-dropped': str,
+                },
+                'traffic-statistics': {
+                    '@junos:style': str,
+                    'input-bps': str,
+                    'output-bytes': str,
+                    'input-bytes': str,
+                    'input-packets': str,
+                    'input-pps': str,
+                    'output-bps': str,
+                    'output-packets': str,
+                    'output-pps': str,
+                    'ipv6-transit-statistics': {
+                        'input-bps': str,
+                        'input-bytes': str,
+                        'input-packets': str,
+                        'input-pps': str,
+                        'output-bps': str,
+                        'output-bytes': str,
+                        'output-packets': str,
+                        'output-pps': str,
+                    },
+                },
+                'output-error-list': {
+                    'aged-packets': str,
+                    'carrier-transitions': str,
+                    'hs-link-crc-errors': str,
+                    'mtu-errors': str,
+                    'output-collisions': str,
+                    'output-drops': str,
+                    'output-errors': str,
+                    'output-fifo-errors': str,
+                    'output-resource-errors': str,
+                },
+                'ethernet-mac-statistics': {
+                    '@junos:style': str,
+                    'input-broadcasts': str,
+                    'input-bytes': str,
+                    'input-code-violations': str,
+                    'input-crc-errors': str,
+                    'input-fifo-errors': str,
+                    'input-fragment-frames': str,
+                    'input-jabber-frames': str,
+                    'input-mac-control-frames': str,
+                    'input-mac-pause-frames': str,
+                    'input-multicasts': str,
+                    'input-oversized-frames': str,
+                    'input-packets': str,
+                    'input-total-errors': str,
+                    'input-unicasts': str,
+                    'input-vlan-tagged-frames': str,
+                    'output-broadcasts': str,
+                    'output-bytes': str,
+                    'output-crc-errors': str,
+                    'output-fifo-errors': str,
+                    'output-mac-control-frames': str,
+                    'output-mac-pause-frames': str,
+                    'output-multicasts': str,
+                    'output-packets': str,
+                    'output-total-errors': str,
+                    'output-unicasts': str,
+                },
+                'input-error-list': {
+                    'framing-errors': str,
+                    'input-discards': str,
+                    'input-drops': str,
+                    'input-errors': str,
+                    'input-fifo-errors': str,
+                    'input-giants': str,
+                    'input-l2-channel-errors': str,
+                    'input-l2-mismatch-timeouts': str,
+                    'input-l3-incompletes': str,
+                    'input-resource-errors': str,
+                    'input-runts': str,
+                },
+                'transit-traffic-statistics': {
+                    'input-bps': str,
+                    'input-bytes': str,
+                    'input-packets': str,
+                    'input-pps': str,
+                    'ipv6-transit-statistics': {
+                        'input-bps': str,
+                        'input-bytes': str,
+                        'input-packets': str,
+                        'input-pps': str,
+                        'output-bps': str,
+                        'output-bytes': str,
+                        'output-packets': str,
+                        'output-pps': str,
+                    },
+                    'output-bps': str,
+                    'output-bytes': str,
+                    'output-packets': str,
+                    'output-pps': str,
+                },
+                'queue-counters': {
+                    '@junos:style': str,
+                    'interface-cos-short-summary': {
+                        'intf-cos-num-queues-in-use': str,
+                        'intf-cos-num-queues-supported': str,
+                    },
+                    'queue': [{
+                        'queue-counters-queued-packets': str,
+                        'queue-counters-total-drop-packets': str,
+                        'queue-counters-trans-packets': str,
+                        'queue-number': str,
+                    }],
+                },
+            }],
+        },
+    }
+
     def cli(self, output=None):
 
         if not output:
@@ -1780,6 +2081,40 @@ class ShowInterfaces(ShowInterfacesSchema):
 
         return ret_dict
 
+    def xml(self, output=None):
+        if not output:
+            out = self.device.execute(self.cli_command[0] + ' | display xml')
+        else:
+            out = output
+
+        return self._single_interface_address(
+            junos_display.parse_xml(out, self.xml_shape))
+
+    def json(self, output=None):
+        if not output:
+            out = self.device.execute(self.cli_command[0] + ' | display json')
+        else:
+            out = output
+
+        return self._single_interface_address(
+            junos_display.parse_json(out, self.xml_shape))
+
+    @staticmethod
+    def _single_interface_address(ret_dict):
+        '''A single interface-address is a dictionary as in the text output'''
+        for physical_interface_dict in ret_dict.get(
+                'interface-information', {}).get('physical-interface', []):
+            for logical_interface_dict in physical_interface_dict.get(
+                    'logical-interface', []):
+                for address_family_dict in logical_interface_dict.get(
+                        'address-family', []):
+                    interface_address = address_family_dict.get(
+                        'interface-address')
+                    if interface_address and len(interface_address) == 1:
+                        address_family_dict['interface-address'] = \
+                            interface_address[0]
+        return ret_dict
+
 class ShowInterfacesExtensive(ShowInterfaces):
     cli_command = ['show interfaces extensive',
         'show interfaces {interface} extensive']
@@ -1797,6 +2132,32 @@ class ShowInterfacesExtensive(ShowInterfaces):
         
         return super().cli(output=out)
 
+    def xml(self, interface=None, output=None):
+        if not output:
+            if interface:
+                out = self.device.execute(self.cli_command[1].format(
+                    interface=interface
+                ) + ' | display xml')
+            else:
+                out = self.device.execute(self.cli_command[0] + ' | display xml')
+        else:
+            out = output
+
+        return super().xml(output=out)
+
+    def json(self, interface=None, output=None):
+        if not output:
+            if interface:
+                out = self.device.execute(self.cli_command[1].format(
+                    interface=interface
+                ) + ' | display json')
+            else:
+                out = self.device.execute(self.cli_command[0] + ' | display json')
+        else:
+            out = output
+
+        return super().json(output=out)
+
 class ShowInterfacesExtensiveNoForwarding(ShowInterfacesExtensive):
     cli_command = ['show interfaces extensive no-forwarding']
     def cli(self, output=None):
@@ -11,6 +11,9 @@ from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import (Any,
         Optional, Use, Schema)
 
+# Parser Utils
+from genie.libs.parser.utils import log_tail
+
 
 class ShowLogFilenameSchema(MetaParser):
     """ Schema for:
@@ -18,7 +21,8 @@ class ShowLogFilenameSchema(MetaParser):
     """
 
     schema = {
-        "file-content": list
+        "file-content": list,
+        Optional("entries"): list
     }
 
 class ShowLogFilename(ShowLogFilenameSchema):
@@ -27,16 +31,44 @@ class ShowLogFilename(ShowLogFilenameSchema):
     """
     cli_command = 'show log {filename}'
 
-    def cli(self, output=None, filename=None):
+    # Mar  5 14:47:45  sr_hktGCS001 mgd[91373]: UI_COMMIT: User 'user' requested 'commit' operation (comment: none)
+    # Mar  5 14:47:49  sr_hktGCS001 jlaunchd: commit-batch (PID 92006) started
+    p_entry = re.compile(r'^(?P<timestamp>[A-Z][a-z]{2} +\d+ +'
+                         r'\d+:\d+:\d+(?:\.\d+)?) +(?P<hostname>\S+) +'
+                         r'(?P<facility>[^\s\[:]+)(?:\[\d+\])?: +'
+                         r'(?:(?P<mnemonic>[A-Z][A-Z0-9]*_[A-Z0-9_]+): +)?'
+                         r'(?P<message>.*)$')
+
+    def cli(self, output=None, filename=None, incremental=False):
+        """ parse the log file
+
+            Args:
+                output (`str`): output to parse instead of executing
+                filename (`str`): log file name
+                incremental (`bool`): only return the log lines added since
+                                      the previous incremental poll of this
+                                      device, split into 'entries'. The
+                                      process name is used as 'facility'.
+        """
+        cmd = self.cli_command.format(filename=filename)
         if not output:
-            out = self.device.execute(self.cli_command.format(filename=filename))
+            out = self.device.execute(cmd)
         else:
             out = output
 
         ret_dict = {}
 
         lines = out.splitlines()
-        if len(lines) > 1:
-            ret_dict['file-content'] = out.splitlines()[1:]
+        if incremental:
+            # Skip the command echo
+            log_lines = [line for line in map(str.strip, lines)
+                         if line and not line.startswith('show log')]
+            logs, entries = log_tail.tail(device=self.device, command=cmd,
+                                          lines=log_lines,
+                                          pattern=self.p_entry)
+            ret_dict['file-content'] = logs
+            ret_dict['entries'] = entries
+        elif len(lines) > 1:
+            ret_dict['file-content'] = lines[1:]
 
         return ret_dict
\ No newline at end of file
@@ -40,6 +40,10 @@ from pyats.utils.exceptions import SchemaError
 from genie.metaparser.util.schemaengine import (Any, Optional, Use,
                                                 Schema, Or)
 
+# Parser utils
+from genie.libs.parser.utils import junos_display
+from genie.libs.parser.utils.spec import Spec, Rule, Set
+
 
 class ShowOspfInterfaceBriefSchema(MetaParser):
     """ Schema for:
@@ -441,45 +445,57 @@ Parser for:
 class ShowOspfNeighbor(ShowOspfNeighborSchema):
     cli_command = 'show ospf neighbor'
 
+    # Elements of the '| display xml' and '| display json' outputs
+    xml_shape = {
+        'ospf-neighbor-information': {
+            'ospf-neighbor': [{
+                'neighbor-address': str,
+                'interface-name': str,
+                'ospf-neighbor-state': str,
+                'neighbor-id': str,
+                'neighbor-priority': str,
+                'activity-timer': str,
+            }],
+        },
+    }
+
+    # 10.189.5.94      ge-0/0/0.0             Full      10.189.5.253     128    32
+    p1 = (r'^(?P<neighbor>\S+) +(?P<interface>\S+) +'
+          r'(?P<state>\S+) +(?P<id>\S+) +(?P<pri>\d+) +(?P<dead>\d+)$')
+
+    spec = Spec(
+        Rule(p1,
+             Set(('ospf-neighbor-information', 'ospf-neighbor', '[]'),
+                 {'neighbor-address': 'neighbor',
+                  'interface-name': 'interface',
+                  'ospf-neighbor-state': 'state',
+                  'neighbor-id': 'id',
+                  'neighbor-priority': 'pri',
+                  'activity-timer': 'dead'})))
+
     def cli(self, output=None):
         if not output:
             out = self.device.execute(self.cli_command)
         else:
             out = output
 
-        ret_dict = {}
+        return self.spec.parse(out)
 
-        # 10.189.5.94      ge-0/0/0.0             Full      10.189.5.253     128    32
-        p1 = re.compile(
-            r'^(?P<neighbor>\S+) +(?P<interface>\S+) +'
-            r'(?P<state>\S+) +(?P<id>\S+) +(?P<pri>\d+) +(?P<dead>\d+)$')
+    def xml(self, output=None):
+        if not output:
+            out = self.device.execute(self.cli_command + ' | display xml')
+        else:
+            out = output
 
-        for line in out.splitlines():
-            line = line.strip()
+        return junos_display.parse_xml(out, self.xml_shape)
 
-            # 10.189.5.94      ge-0/0/0.0             Full      10.189.5.253     128    32
-            m = p1.match(line)
-            if m:
-                group = m.groupdict()
-                neighbor = group['neighbor']
-                interface = group['interface']
-                state = group['state']
-                _id = group['id']
-                pri = group['pri']
-                dead = group['dead']
-                neighbor_list = ret_dict.setdefault('ospf-neighbor-information', {}). \
-                                setdefault('ospf-neighbor', [])
-                new_neighbor = {
-                    'neighbor-address': neighbor,
-                    'interface-name': interface,
-                    'ospf-neighbor-state': state,
-                    'neighbor-id': _id,
-                    'neighbor-priority': pri,
-                    'activity-timer': dead
-                }
-                neighbor_list.append(new_neighbor)
-                continue
-        return ret_dict
+    def json(self, output=None):
+        if not output:
+            out = self.device.execute(self.cli_command + ' | display json')
+        else:
+            out = output
+
+        return junos_display.parse_json(out, self.xml_shape)
 
 class ShowOspfNeighborInstance(ShowOspfNeighbor):
     """ Parser for:
@@ -499,6 +515,30 @@ class ShowOspfNeighborInstance(ShowOspfNeighbor):
             output=' ' if not out else out
             )
 
+    def xml(self, instance_name, output=None):
+        if not output:
+            out = self.device.execute(self.cli_command.format(
+                                        instance_name=instance_name) +
+                                      ' | display xml')
+        else:
+            out = output
+
+        return super().xml(
+            output=' ' if not out else out
+            )
+
+    def json(self, instance_name, output=None):
+        if not output:
+            out = self.device.execute(self.cli_command.format(
+                                        instance_name=instance_name) +
+                                      ' | display json')
+        else:
+            out = output
+
+        return super().json(
+            output=' ' if not out else out
+            )
+
 
 class ShowOspfDatabaseSchema(MetaParser):
     '''
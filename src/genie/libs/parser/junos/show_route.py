@@ -29,6 +29,10 @@ import re
 from genie.metaparser import MetaParser
 from pyats.utils.exceptions import SchemaError
 from genie.metaparser.util.schemaengine import Any, Optional, Use, Schema
+
+# Parser utils
+from genie.libs.parser.utils import junos_display
+from genie.libs.parser.utils import budget
 '''
 Schema for:
     * show route table {table}
@@ -340,35 +344,122 @@ class ShowRoute(ShowRouteSchema):
                     'show route protocol {protocol} {ip_address}',
                     'show route protocol {protocol} table {table}']
 
+    # Elements of the '| display xml' and '| display json' outputs
+    xml_shape = {
+        'route-information': {
+            'route-table': [{
+                'active-route-count': str,
+                'destination-count': str,
+                'hidden-route-count': str,
+                'holddown-route-count': str,
+                'rt': [{
+                    '@junos:style': str,
+                    'rt-destination': str,
+                    'rt-entry': [{
+                        'active-tag': str,
+                        'age': {
+                            '#text': str,
+                            '@junos:seconds': str,
+                        },
+                        'as-path': str,
+                        'current-active': str,
+                        'last-active': str,
+                        'learned-from': str,
+                        'local-preference': str,
+                        'med': str,
+                        'metric': str,
+                        'metric2': str,
+                        'nh': [{
+                            'mpls-label': str,
+                            'selected-next-hop': str,
+                            'nh-local-interface': str,
+                            'nh-table': str,
+                            'to': str,
+                            'via': str,
+                        }],
+                        'nh-type': str,
+                        'preference': str,
+                        'preference2': str,
+                        'protocol-name': str,
+                        'rt-tag': str,
+                        'validation-state': str,
+                    }],
+                }],
+                'table-name': str,
+                'total-route-count': str,
+            }],
+        },
+    }
+
+    def _command(self, protocol=None, ip_address=None, table=None):
+        if protocol and table:
+            cmd = self.cli_command[4].format(
+                protocol=protocol,
+                table=table
+            )
+        elif ip_address and not protocol:
+            cmd = self.cli_command[1].format(
+                ip_address=ip_address
+            )
+        elif protocol and not ip_address:
+            cmd = self.cli_command[2].format(
+                protocol=protocol
+            )
+        elif ip_address and protocol:
+            cmd = self.cli_command[3].format(
+                ip_address=ip_address,
+                protocol=protocol
+            )
+        else:
+            cmd = self.cli_command[0]
+        return cmd
+
     def cli(self, protocol=None, ip_address=None, table=None, output=None):
         if not output:
-            if protocol and table:
-                cmd = self.cli_command[4].format(
-                    protocol=protocol,
-                    table=table
-                )
-            elif ip_address and not protocol:
-                cmd = self.cli_command[1].format(
-                    ip_address=ip_address
-                )
-            elif protocol and not ip_address:
-                cmd = self.cli_command[2].format(
-                    protocol=protocol
-                )
-            elif ip_address and protocol:
-                cmd = self.cli_command[3].format(
-                    ip_address=ip_address,
-                    protocol=protocol
-                )
-            else:
-                cmd = self.cli_command[0]
-
-            out = self.device.execute(cmd)
+            out = self.device.execute(self._command(
+                protocol=protocol, ip_address=ip_address, table=table))
         else:
             out = output
 
         ret_dict = {}
+        for route_table_dict, rt_dict in self._routes(out):
+            if rt_dict is None:
+                ret_dict.setdefault('route-information', {}). \
+                    setdefault('route-table', []).append(route_table_dict)
+            else:
+                route_table_dict.setdefault('rt', []).append(rt_dict)
+        return ret_dict
+
+    def parse_stream(self, protocol=None, ip_address=None, table=None,
+                     output=None):
+        '''Yield the routes one at a time as the lines are read, without
+           building the whole dictionary
+
+            Args:
+                protocol (`str`): protocol to execute the command for
+                ip_address (`str`): address to execute the command for
+                table (`str`): table to execute the command for
+                output (`str`): output to parse instead of executing, or
+                                an iterable of its lines such as a file
+
+            Returns:
+                iterator of (route_table, rt): route_table the dictionary
+                of the route table without its 'rt' list, rt one element
+                of that list as parse() returns it; rt is None once at the
+                start of each route table. Nothing is validated against
+                the schema
+        '''
+        if output is None:
+            output = self.device.execute(self._command(
+                protocol=protocol, ip_address=ip_address, table=table))
+        return self._routes(output)
+
+    def _routes(self, out):
+        '''(route_table, rt) of the lines of out, an rt is yielded once
+           the next route or route table starts'''
         rt_destination = None
+        # (route_table, rt) not yielded yet
+        pending = None
 
 
         # inet.0: 932 destinations, 1618 routes (932 active, 0 holddown, 0 hidden)
@@ -413,12 +504,15 @@ class ShowRoute(ShowRouteSchema):
         # 2001:db8:eb18:ca45::1/128
         pIP = re.compile(r'^(?P<rt_destination>[\w:\/]+)$')
 
-        for line in out.splitlines():
+        for line in budget.lines(out):
             line = line.strip()
 
             # inet.0: 932 destinations, 1618 routes (932 active, 0 holddown, 0 hidden)
             m = p1.match(line)
             if m:
+                if pending:
+                    yield pending
+                    pending = None
                 group = m.groupdict()
                 table_name = group['table_name']
                 destination_count = group['destination_count']
@@ -426,8 +520,6 @@ class ShowRoute(ShowRouteSchema):
                 active_route_count = group['active_route_count']
                 holddown = group['holddown']
                 hidden = group['hidden']
-                route_information_dict = ret_dict.setdefault('route-information', {})
-                route_table_list = route_information_dict.setdefault('route-table', [])
                 route_table_dict = {}
                 route_table_dict.update({'active-route-count': active_route_count})
                 route_table_dict.update({'destination-count': destination_count})
@@ -435,13 +527,15 @@ class ShowRoute(ShowRouteSchema):
                 route_table_dict.update({'holddown-route-count': holddown})
                 route_table_dict.update({'table-name': table_name})
                 route_table_dict.update({'total-route-count': total_route_count})
-                route_table_list.append(route_table_dict)
+                yield route_table_dict, None
                 continue
             
             # 10.169.14.240/32  *[Static/5] 5w2d 15:42:25
             # *[OSPF3/10] 3w1d 17:03:23, metric 5
             m = p2.match(line) 
             if m:
+                if pending:
+                    yield pending
                 group = m.groupdict()
                 if not rt_destination:
                     rt_destination = group['rt_destination']
@@ -456,9 +550,8 @@ class ShowRoute(ShowRouteSchema):
                 learned_from = group['learned_from']
                 local_preference = group['local_preference']
                 med = group['med']
-                rt_list = route_table_dict.setdefault('rt', [])
                 rt_dict = {}
-                rt_list.append(rt_dict)
+                pending = route_table_dict, rt_dict
                 rt_entry_dict = {}
                 if active_tag:
                     rt_entry_dict.update({'active-tag': active_tag})
@@ -536,6 +629,49 @@ class ShowRoute(ShowRouteSchema):
                 group = m.groupdict()
                 rt_destination = group['rt_destination']
                 continue
+
+        if pending:
+            yield pending
+
+    def xml(self, protocol=None, ip_address=None, table=None, output=None):
+        if not output:
+            out = self.device.execute(self._command(
+                protocol=protocol, ip_address=ip_address,
+                table=table) + ' | display xml')
+        else:
+            out = output
+
+        return self._split_rt_entries(
+            junos_display.parse_xml(out, self.xml_shape))
+
+    def json(self, protocol=None, ip_address=None, table=None, output=None):
+        if not output:
+            out = self.device.execute(self._command(
+                protocol=protocol, ip_address=ip_address,
+                table=table) + ' | display json')
+        else:
+            out = output
+
+        return self._split_rt_entries(
+            junos_display.parse_json(out, self.xml_shape))
+
+    @staticmethod
+    def _split_rt_entries(ret_dict):
+        '''One rt per rt-entry as the text output is parsed, the
+           rt-destination is only kept in the first rt of a destination'''
+        route_information_dict = ret_dict.get('route-information', {})
+        for route_table_dict in route_information_dict.get('route-table', []):
+            if 'rt' not in route_table_dict:
+                continue
+            rt_list = []
+            for rt_dict in route_table_dict['rt']:
+                for index, rt_entry_dict in enumerate(rt_dict.pop('rt-entry', [])):
+                    if index:
+                        rt_list.append({'rt-entry': rt_entry_dict})
+                    else:
+                        rt_dict['rt-entry'] = rt_entry_dict
+                        rt_list.append(rt_dict)
+            route_table_dict['rt'] = rt_list
         return ret_dict
 
 class ShowRouteProtocolNoMore(ShowRoute):
@@ -555,6 +691,37 @@ class ShowRouteProtocolNoMore(ShowRoute):
         return super().cli(protocol=protocol,
             ip_address=ip_address, output=out)
 
+    def xml(self, protocol, ip_address, output=None):
+        if not output:
+            cmd = self.cli_command.format(
+                    protocol=protocol,
+                    ip_address=ip_address)
+            out = self.device.execute(cmd + ' | display xml')
+        else:
+            out = output
+
+        return super().xml(protocol=protocol,
+            ip_address=ip_address, output=out)
+
+    def json(self, protocol, ip_address, output=None):
+        if not output:
+            cmd = self.cli_command.format(
+                    protocol=protocol,
+                    ip_address=ip_address)
+            out = self.device.execute(cmd + ' | display json')
+        else:
+            out = output
+
+        return super().json(protocol=protocol,
+            ip_address=ip_address, output=out)
+
+    def parse_stream(self, protocol, ip_address, output=None):
+        if output is None:
+            output = self.device.execute(self.cli_command.format(
+                protocol=protocol,
+                ip_address=ip_address))
+        return self._routes(output)
+
 class ShowRouteProtocolExtensiveSchema(MetaParser):
     """ Schema for:
             * show route protocol {protocol} extensive
@@ -844,33 +1011,191 @@ class ShowRouteProtocolExtensive(ShowRouteProtocolExtensiveSchema):
                     'show route {route} extensive',
                     'show route extensive',
                     'show route extensive {destination}']
+
+    # Elements of the '| display xml' and '| display json' outputs
+    xml_shape = {
+        'route-information': {
+            'route-table': [{
+                'active-route-count': str,
+                'destination-count': str,
+                'hidden-route-count': str,
+                'holddown-route-count': str,
+                'rt': [{
+                    '@junos:style': str,
+                    'rt-announced-count': str,
+                    'rt-destination': str,
+                    'rt-entry': [{
+                        'active-tag': str,
+                        'age': {
+                            '#text': str,
+                            '@junos:seconds': str,
+                        },
+                        'announce-bits': str,
+                        'announce-tasks': str,
+                        'as-path': str,
+                        'cluster-list': str,
+                        'bgp-path-attributes': {
+                            'attr-as-path-effective': {
+                                'aspath-effective-string': str,
+                                'attr-value': str,
+                            },
+                        },
+                        'current-active': str,
+                        'inactive-reason': str,
+                        'last-active': str,
+                        'local-as': str,
+                        'metric': str,
+                        'metric2': str,
+                        'nh': [{
+                            '@junos:indent': str,
+                            'label-element': str,
+                            'label-element-childcount': str,
+                            'label-element-lspid': str,
+                            'label-element-parent': str,
+                            'label-element-refcount': str,
+                            'label-ttl-action': str,
+                            'load-balance-label': str,
+                            'mpls-label': str,
+                            'nh-string': str,
+                            'selected-next-hop': str,
+                            'session': str,
+                            'to': str,
+                            'via': str,
+                            'weight': str,
+                        }],
+                        'nh-address': str,
+                        'nh-index': str,
+                        'nh-kernel-id': str,
+                        'nh-reference-count': str,
+                        'gateway': str,
+                        'nh-type': str,
+                        'preference': str,
+                        'preference2': str,
+                        'protocol-name': str,
+                        'protocol-nh': [{
+                            '@junos:indent': str,
+                            'forwarding-nh-count': str,
+                            'indirect-nh': str,
+                            'label-ttl-action': str,
+                            'load-balance-label': str,
+                            'metric': str,
+                            'mpls-label': str,
+                            'nh': [{
+                                '@junos:indent': str,
+                                'label-element': str,
+                                'label-element-childcount': str,
+                                'label-element-lspid': str,
+                                'label-element-parent': str,
+                                'label-element-refcount': str,
+                                'label-ttl-action': str,
+                                'load-balance-label': str,
+                                'mpls-label': str,
+                                'nh-string': str,
+                                'selected-next-hop': str,
+                                'session': str,
+                                'to': str,
+                                'via': str,
+                                'weight': str,
+                            }],
+                            'nh-index': str,
+                            'nh-type': str,
+                            'output': str,
+                            'to': str,
+                        }],
+                        'rt-entry-state': str,
+                        'rt-ospf-area': str,
+                        'rt-tag': str,
+                        'task-name': str,
+                        'validation-state': str,
+                    }],
+                    'rt-entry-count': {
+                        '#text': str,
+                        '@junos:format': str,
+                    },
+                    'rt-prefix-length': str,
+                    'rt-state': str,
+                    'tsi': {
+                        '#text': str,
+                        '@junos:indent': str,
+                    },
+                }],
+                'table-name': str,
+                'total-route-count': str,
+            }],
+        },
+    }
+
+    def _command(self, protocol=None, table=None, destination=None, route=None):
+        if protocol and table and destination:
+            cmd = self.cli_command[2].format(
+                protocol=protocol,
+                table=table,
+                destination=destination)
+        elif table and protocol:
+            cmd = self.cli_command[1].format(
+                protocol=protocol,
+                table=table)
+        elif protocol:
+            cmd = self.cli_command[0].format(
+                protocol=protocol)
+        elif route:
+            cmd = self.cli_command[3].format(
+                route=route)
+        elif destination:
+            cmd = self.cli_command[5].format(
+                destination=destination)
+        else:
+            cmd = self.cli_command[4]
+        return cmd
+
     def cli(self, protocol=None, table=None, destination=None, route=None, output=None):
         if not output:
-            if protocol and table and destination:
-                cmd = self.cli_command[2].format(
-                    protocol=protocol,
-                    table=table,
-                    destination=destination)
-            elif table and protocol:
-                cmd = self.cli_command[1].format(
-                    protocol=protocol,
-                    table=table)
-            elif protocol:
-                cmd = self.cli_command[0].format(
-                    protocol=protocol)
-            elif route:
-                cmd = self.cli_command[3].format(
-                    route=route)
-            elif destination:
-                cmd = self.cli_command[5].format(
-                    destination=destination)
-            else:
-                cmd = self.cli_command[4]
-            out = self.device.execute(cmd)
+            out = self.device.execute(self._command(
+                protocol=protocol, table=table, destination=destination,
+                route=route))
         else:
             out = output
 
         ret_dict = {}
+        for route_table_dict, rt_dict in self._routes(out):
+            if rt_dict is None:
+                ret_dict.setdefault('route-information', {}). \
+                    setdefault('route-table', []).append(route_table_dict)
+            else:
+                route_table_dict.setdefault('rt', []).append(rt_dict)
+        return ret_dict
+
+    def parse_stream(self, protocol=None, table=None, destination=None,
+                     route=None, output=None):
+        '''Yield the destinations one at a time as the lines are read,
+           without building the whole dictionary
+
+            Args:
+                protocol (`str`): protocol to execute the command for
+                table (`str`): table to execute the command for
+                destination (`str`): destination to execute the command for
+                route (`str`): route to execute the command for
+                output (`str`): output to parse instead of executing, or
+                                an iterable of its lines such as a file
+
+            Returns:
+                iterator of (route_table, rt): route_table the dictionary
+                of the route table without its 'rt' list, rt one element
+                of that list with its entries, as parse() returns it; rt
+                is None once at the start of each route table. Nothing is
+                validated against the schema
+        '''
+        if output is None:
+            output = self.device.execute(self._command(
+                protocol=protocol, table=table, destination=destination,
+                route=route))
+        return self._routes(output)
+
+    def _routes(self, out):
+        '''(route_table, rt) of the lines of out, an rt is yielded once
+           the next destination or route table starts'''
+        # (route_table, rt) not yielded yet
+        pending = None
         state_type = None
         forwarding_nh_count = None
         protocol_nh_found = None
@@ -1023,23 +1348,26 @@ class ShowRouteProtocolExtensive(ShowRouteProtocolExtensiveSchema):
         # Cluster list:  2.2.2.2 4.4.4.4
         p36 = re.compile(r'^Cluster +list: +(?P<cluster_list>[\S\s]+)$')
 
-        for line in out.splitlines():
+        for line in budget.lines(out):
             line = line.strip()
             # inet.0: 929 destinations, 1615 routes (929 active, 0 holddown, 0 hidden)
             m = p1.match(line)
             if m:
+                if pending:
+                    yield pending
+                    pending = None
                 group = m.groupdict()
-                route_table = ret_dict.setdefault('route-information', {}). \
-                    setdefault('route-table', [])
                 route_table_dict = {k.replace('_', '-'):
                     v for k, v in group.items() if v is not None}
-                route_table.append(route_table_dict)
+                yield route_table_dict, None
                 continue
 
             # 0.0.0.0/0 (1 entry, 1 announced)
             # 10.1.0.0/24 (2 entries, 1 announced)
             m = p2.match(line)
             if m:
+                if pending:
+                    yield pending
                 group = m.groupdict()
                 state_type = 'route_table'
                 rt_destination = group['rt_destination']
@@ -1047,8 +1375,8 @@ class ShowRouteProtocolExtensive(ShowRouteProtocolExtensiveSchema):
                 text = group['text']
                 announced = group['announced']
                 rt_prefix_length = group['rt_prefix_length']
-                rt_list = route_table_dict.setdefault('rt', [])
                 rt_dict = {}
+                pending = route_table_dict, rt_dict
                 rt_dict.update({'rt-announced-count' : announced})
                 rt_dict.update({'rt-destination' : rt_destination})
                 if rt_prefix_length:
@@ -1056,7 +1384,6 @@ class ShowRouteProtocolExtensive(ShowRouteProtocolExtensiveSchema):
                 rt_entry_count_dict = rt_dict.setdefault('rt-entry-count', {})
                 rt_entry_count_dict.update({'#text': text})
                 rt_entry_count_dict.update({'@junos:format': rt_format})
-                rt_list.append(rt_dict)
                 continue
 
             # State: <FlashAll>
@@ -1445,7 +1772,41 @@ class ShowRouteProtocolExtensive(ShowRouteProtocolExtensiveSchema):
                 group = m.groupdict()
                 rt_entry_dict.update({'cluster-list': group['cluster_list']})
                 continue
-        
+
+        if pending:
+            yield pending
+
+    def xml(self, protocol=None, table=None, destination=None, route=None, output=None):
+        if not output:
+            out = self.device.execute(self._command(
+                protocol=protocol, table=table, destination=destination,
+                route=route) + ' | display xml')
+        else:
+            out = output
+
+        return self._single_rt_entry(
+            junos_display.parse_xml(out, self.xml_shape))
+
+    def json(self, protocol=None, table=None, destination=None, route=None, output=None):
+        if not output:
+            out = self.device.execute(self._command(
+                protocol=protocol, table=table, destination=destination,
+                route=route) + ' | display json')
+        else:
+            out = output
+
+        return self._single_rt_entry(
+            junos_display.parse_json(out, self.xml_shape))
+
+    @staticmethod
+    def _single_rt_entry(ret_dict):
+        '''A single rt-entry is a dictionary as in the text output'''
+        route_information_dict = ret_dict.get('route-information', {})
+        for route_table_dict in route_information_dict.get('route-table', []):
+            for rt_dict in route_table_dict.get('rt', []):
+                rt_entry_list = rt_dict.get('rt-entry')
+                if rt_entry_list and len(rt_entry_list) == 1:
+                    rt_dict['rt-entry'] = rt_entry_list[0]
         return ret_dict
     
 class ShowRouteForwardingTableSummarySchema(MetaParser):
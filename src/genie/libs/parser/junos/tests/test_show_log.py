@@ -5,6 +5,7 @@ from pyats.topology import Device
 from pyats.topology import loader
 from genie.metaparser.util.exceptions import SchemaEmptyParserError
 from genie.libs.parser.junos.show_log import ShowLogFilename
+from genie.libs.parser.utils import log_tail
 
 
 class TestShowLogFilename(unittest.TestCase):
@@ -187,6 +188,44 @@ class TestShowLogFilename(unittest.TestCase):
         obj = ShowLogFilename(device=self.device)
         parsed_output = obj.parse(filename="messages")
         self.assertEqual(parsed_output, self.golden_parsed_output)
+    golden_output_2 = {
+        "execute.return_value": """
+        show log messages
+        Mar  5 14:47:45  sr_hktGCS001 mgd[91373]: UI_COMMIT: User 'user' requested 'commit' operation (comment: none)
+        """
+    }
+
+    golden_output_3 = {
+        "execute.return_value": """
+        show log messages
+        Mar  5 14:47:45  sr_hktGCS001 mgd[91373]: UI_COMMIT: User 'user' requested 'commit' operation (comment: none)
+        Mar  5 14:47:49  sr_hktGCS001 jlaunchd: commit-batch (PID 92006) started
+        """
+    }
+
+    golden_parsed_output_3 = {
+        "file-content": [
+            "Mar  5 14:47:49  sr_hktGCS001 jlaunchd: commit-batch (PID 92006) started",
+        ],
+        "entries": [
+            {"timestamp": "Mar  5 14:47:49",
+             "hostname": "sr_hktGCS001",
+             "facility": "jlaunchd",
+             "message": "commit-batch (PID 92006) started"},
+        ],
+    }
+
+    def test_golden_incremental(self):
+        log_tail.reset()
+        self.device = Mock(**self.golden_output_2)
+        obj = ShowLogFilename(device=self.device)
+        parsed_output = obj.parse(filename="messages", incremental=True)
+        self.assertEqual(parsed_output["entries"][0]["mnemonic"], "UI_COMMIT")
+
+        self.device.execute.return_value = \
+            self.golden_output_3["execute.return_value"]
+        parsed_output = obj.parse(filename="messages", incremental=True)
+        self.assertEqual(parsed_output, self.golden_parsed_output_3)
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -868,6 +868,82 @@ class TestShowOspfNeighbor(unittest.TestCase):
         }
     }
 
+    golden_output_xml = {
+        "execute.return_value": """
+        show ospf neighbor | display xml
+        <rpc-reply xmlns:junos="http://xml.juniper.net/junos/18.2R2/junos">
+            <ospf-neighbor-information xmlns="http://xml.juniper.net/junos/18.2R2/junos-routing">
+                <ospf-neighbor>
+                    <neighbor-address>10.189.5.94</neighbor-address>
+                    <interface-name>ge-0/0/0.0</interface-name>
+                    <ospf-neighbor-state>Full</ospf-neighbor-state>
+                    <neighbor-id>10.189.5.253</neighbor-id>
+                    <neighbor-priority>128</neighbor-priority>
+                    <activity-timer>32</activity-timer>
+                </ospf-neighbor>
+                <ospf-neighbor>
+                    <neighbor-address>10.169.14.121</neighbor-address>
+                    <interface-name>ge-0/0/1.0</interface-name>
+                    <ospf-neighbor-state>Full</ospf-neighbor-state>
+                    <neighbor-id>10.169.14.240</neighbor-id>
+                    <neighbor-priority>128</neighbor-priority>
+                    <activity-timer>33</activity-timer>
+                </ospf-neighbor>
+                <ospf-neighbor>
+                    <neighbor-address>10.19.198.26</neighbor-address>
+                    <interface-name>ge-0/0/2.0</interface-name>
+                    <ospf-neighbor-state>Full</ospf-neighbor-state>
+                    <neighbor-id>10.19.198.239</neighbor-id>
+                    <neighbor-priority>1</neighbor-priority>
+                    <activity-timer>33</activity-timer>
+                </ospf-neighbor>
+            </ospf-neighbor-information>
+            <cli>
+                <banner></banner>
+            </cli>
+        </rpc-reply>
+        """
+    }
+
+    golden_output_json = {
+        "execute.return_value": """
+        show ospf neighbor | display json
+        {
+            "ospf-neighbor-information" : [
+            {
+                "attributes" : {"xmlns" : "http://xml.juniper.net/junos/18.2R2/junos-routing"},
+                "ospf-neighbor" : [
+                {
+                    "neighbor-address" : [{"data" : "10.189.5.94"}],
+                    "interface-name" : [{"data" : "ge-0/0/0.0"}],
+                    "ospf-neighbor-state" : [{"data" : "Full"}],
+                    "neighbor-id" : [{"data" : "10.189.5.253"}],
+                    "neighbor-priority" : [{"data" : "128"}],
+                    "activity-timer" : [{"data" : "32"}]
+                },
+                {
+                    "neighbor-address" : [{"data" : "10.169.14.121"}],
+                    "interface-name" : [{"data" : "ge-0/0/1.0"}],
+                    "ospf-neighbor-state" : [{"data" : "Full"}],
+                    "neighbor-id" : [{"data" : "10.169.14.240"}],
+                    "neighbor-priority" : [{"data" : "128"}],
+                    "activity-timer" : [{"data" : "33"}]
+                },
+                {
+                    "neighbor-address" : [{"data" : "10.19.198.26"}],
+                    "interface-name" : [{"data" : "ge-0/0/2.0"}],
+                    "ospf-neighbor-state" : [{"data" : "Full"}],
+                    "neighbor-id" : [{"data" : "10.19.198.239"}],
+                    "neighbor-priority" : [{"data" : "1"}],
+                    "activity-timer" : [{"data" : "33"}]
+                }
+                ]
+            }
+            ]
+        }
+        """
+    }
+
     def test_empty(self):
         self.device = Mock(**self.empty_output)
         obj = ShowOspfNeighbor(device=self.device)
@@ -880,6 +956,28 @@ class TestShowOspfNeighbor(unittest.TestCase):
         parsed_output = obj.parse()
         self.assertEqual(parsed_output, self.golden_parsed_output)
 
+    def test_empty_xml(self):
+        self.device = Mock(**self.empty_output)
+        obj = ShowOspfNeighbor(device=self.device, context='xml')
+        with self.assertRaises(SchemaEmptyParserError):
+            obj.parse()
+
+    def test_golden_xml(self):
+        self.device = Mock(**self.golden_output_xml)
+        obj = ShowOspfNeighbor(device=self.device, context='xml')
+        parsed_output = obj.parse()
+        self.assertEqual(parsed_output, self.golden_parsed_output)
+        self.device.execute.assert_called_once_with(
+            'show ospf neighbor | display xml')
+
+    def test_golden_json(self):
+        self.device = Mock(**self.golden_output_json)
+        obj = ShowOspfNeighbor(device=self.device, context='json')
+        parsed_output = obj.parse()
+        self.assertEqual(parsed_output, self.golden_parsed_output)
+        self.device.execute.assert_called_once_with(
+            'show ospf neighbor | display json')
+
 
 class TestShowOspfDatabase(unittest.TestCase):
     """ Unit tests for:
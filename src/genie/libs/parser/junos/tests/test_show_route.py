@@ -56519,5 +56519,545 @@ class TestShowRouteTableLabelSwitchedName(unittest.TestCase):
         parsed_output = obj.parse(table="mpls.0", name='test_lsp_01')
         self.assertEqual(parsed_output, self.golden_parsed_output_1)
 
+
+class TestShowRouteDisplay(unittest.TestCase):
+    """ Unit test for:
+            * show route {ip_address} | display xml
+            * show route {ip_address} | display json
+    """
+
+    device = Device(name='aDevice')
+    maxDiff = None
+
+    empty_output = {'execute.return_value': ''}
+
+    golden_output_xml = {'execute.return_value': '''
+        show route 10.36.255.252/32 | display xml
+        <rpc-reply xmlns:junos="http://xml.juniper.net/junos/18.2R2/junos">
+            <route-information xmlns="http://xml.juniper.net/junos/18.2R2/junos-routing">
+                <!-- keepalive -->
+                <route-table>
+                    <table-name>inet.0</table-name>
+                    <destination-count>60</destination-count>
+                    <total-route-count>66</total-route-count>
+                    <active-route-count>60</active-route-count>
+                    <holddown-route-count>1</holddown-route-count>
+                    <hidden-route-count>0</hidden-route-count>
+                    <rt junos:style="brief">
+                        <rt-destination>10.36.255.252/32</rt-destination>
+                        <rt-entry>
+                            <active-tag>*</active-tag>
+                            <current-active/>
+                            <last-active/>
+                            <protocol-name>OSPF</protocol-name>
+                            <preference>10</preference>
+                            <preference2>10</preference2>
+                            <age junos:seconds="2933460">4w5d 22:51:00</age>
+                            <metric>1111</metric>
+                            <nh>
+                                <selected-next-hop/>
+                                <to>10.169.14.158</to>
+                                <via>ge-0/0/2.0</via>
+                            </nh>
+                        </rt-entry>
+                        <rt-entry>
+                            <protocol-name>BGP</protocol-name>
+                            <preference>170</preference>
+                            <age junos:seconds="16893194">27w6d 12:53:14</age>
+                            <med>16011</med>
+                            <local-preference>4294967285</local-preference>
+                            <learned-from>10.34.2.250</learned-from>
+                            <as-path>(65161) I</as-path>
+                            <validation-state>unverified</validation-state>
+                            <nh>
+                                <selected-next-hop/>
+                                <to>10.169.14.158</to>
+                                <via>ge-0/0/2.0</via>
+                            </nh>
+                        </rt-entry>
+                    </rt>
+                </route-table>
+                <route-table>
+                    <table-name>inet.3</table-name>
+                    <destination-count>27</destination-count>
+                    <total-route-count>27</total-route-count>
+                    <active-route-count>27</active-route-count>
+                    <holddown-route-count>0</holddown-route-count>
+                    <hidden-route-count>0</hidden-route-count>
+                </route-table>
+            </route-information>
+            <cli>
+                <banner></banner>
+            </cli>
+        </rpc-reply>
+        lab@vmx>
+    '''}
+
+    golden_output_json = {'execute.return_value': '''
+        show route 10.36.255.252/32 | display json
+        {
+            "route-information" : [
+            {
+                "attributes" : {"xmlns" : "http://xml.juniper.net/junos/18.2R2/junos-routing"},
+                "route-table" : [
+                {
+                    "table-name" : [{"data" : "inet.0"}],
+                    "destination-count" : [{"data" : "60"}],
+                    "total-route-count" : [{"data" : "66"}],
+                    "active-route-count" : [{"data" : "60"}],
+                    "holddown-route-count" : [{"data" : "1"}],
+                    "hidden-route-count" : [{"data" : "0"}],
+                    "rt" : [
+                    {
+                        "attributes" : {"junos:style" : "brief"},
+                        "rt-destination" : [{"data" : "10.36.255.252/32"}],
+                        "rt-entry" : [
+                        {
+                            "active-tag" : [{"data" : "*"}],
+                            "current-active" : [{"data" : [null]}],
+                            "last-active" : [{"data" : [null]}],
+                            "protocol-name" : [{"data" : "OSPF"}],
+                            "preference" : [{"data" : "10"}],
+                            "preference2" : [{"data" : "10"}],
+                            "age" : [{"data" : "4w5d 22:51:00", "attributes" : {"junos:seconds" : "2933460"}}],
+                            "metric" : [{"data" : "1111"}],
+                            "nh" : [
+                            {
+                                "selected-next-hop" : [{"data" : [null]}],
+                                "to" : [{"data" : "10.169.14.158"}],
+                                "via" : [{"data" : "ge-0/0/2.0"}]
+                            }
+                            ]
+                        },
+                        {
+                            "protocol-name" : [{"data" : "BGP"}],
+                            "preference" : [{"data" : "170"}],
+                            "age" : [{"data" : "27w6d 12:53:14", "attributes" : {"junos:seconds" : "16893194"}}],
+                            "med" : [{"data" : "16011"}],
+                            "local-preference" : [{"data" : "4294967285"}],
+                            "learned-from" : [{"data" : "10.34.2.250"}],
+                            "as-path" : [{"data" : "(65161) I"}],
+                            "validation-state" : [{"data" : "unverified"}],
+                            "nh" : [
+                            {
+                                "selected-next-hop" : [{"data" : [null]}],
+                                "to" : [{"data" : "10.169.14.158"}],
+                                "via" : [{"data" : "ge-0/0/2.0"}]
+                            }
+                            ]
+                        }
+                        ]
+                    }
+                    ]
+                },
+                {
+                    "table-name" : [{"data" : "inet.3"}],
+                    "destination-count" : [{"data" : "27"}],
+                    "total-route-count" : [{"data" : "27"}],
+                    "active-route-count" : [{"data" : "27"}],
+                    "holddown-route-count" : [{"data" : "0"}],
+                    "hidden-route-count" : [{"data" : "0"}]
+                }
+                ]
+            }
+            ]
+        }
+        lab@vmx>
+    '''}
+
+    golden_parsed_output = {
+        "route-information": {
+            "route-table": [
+                {
+                    "active-route-count": "60",
+                    "destination-count": "60",
+                    "hidden-route-count": "0",
+                    "holddown-route-count": "1",
+                    "rt": [
+                        {
+                            "@junos:style": "brief",
+                            "rt-destination": "10.36.255.252/32",
+                            "rt-entry": {
+                                "active-tag": "*",
+                                "age": {
+                                    "#text": "4w5d 22:51:00",
+                                    "@junos:seconds": "2933460"
+                                },
+                                "current-active": "",
+                                "last-active": "",
+                                "metric": "1111",
+                                "nh": [{
+                                    "selected-next-hop": "",
+                                    "to": "10.169.14.158",
+                                    "via": "ge-0/0/2.0"
+                                }],
+                                "preference": "10",
+                                "preference2": "10",
+                                "protocol-name": "OSPF"
+                            }
+                        },
+                        {
+                            "rt-entry": {
+                                "age": {
+                                    "#text": "27w6d 12:53:14",
+                                    "@junos:seconds": "16893194"
+                                },
+                                "as-path": "(65161) I",
+                                "learned-from": "10.34.2.250",
+                                "local-preference": "4294967285",
+                                "med": "16011",
+                                "nh": [{
+                                    "selected-next-hop": "",
+                                    "to": "10.169.14.158",
+                                    "via": "ge-0/0/2.0"
+                                }],
+                                "preference": "170",
+                                "protocol-name": "BGP",
+                                "validation-state": "unverified"
+                            }
+                        }
+                    ],
+                    "table-name": "inet.0",
+                    "total-route-count": "66"
+                },
+                {
+                    "active-route-count": "27",
+                    "destination-count": "27",
+                    "hidden-route-count": "0",
+                    "holddown-route-count": "0",
+                    "table-name": "inet.3",
+                    "total-route-count": "27"
+                }
+            ]
+        }
+    }
+
+    def test_empty_xml(self):
+        self.device = Mock(**self.empty_output)
+        obj = ShowRoute(device=self.device, context='xml')
+        with self.assertRaises(SchemaEmptyParserError):
+            parsed_output = obj.parse(ip_address='10.36.255.252/32')
+
+    def test_golden_xml(self):
+        self.device = Mock(**self.golden_output_xml)
+        obj = ShowRoute(device=self.device, context='xml')
+        parsed_output = obj.parse(ip_address='10.36.255.252/32')
+        self.assertEqual(parsed_output, self.golden_parsed_output)
+        self.device.execute.assert_called_once_with(
+            'show route 10.36.255.252/32 | display xml')
+
+    def test_golden_json(self):
+        self.device = Mock(**self.golden_output_json)
+        obj = ShowRoute(device=self.device, context='json')
+        parsed_output = obj.parse(ip_address='10.36.255.252/32')
+        self.assertEqual(parsed_output, self.golden_parsed_output)
+        self.device.execute.assert_called_once_with(
+            'show route 10.36.255.252/32 | display json')
+
+
+class TestShowRouteProtocolExtensiveDisplay(unittest.TestCase):
+    """ Unit test for:
+            * show route protocol {protocol} table {table} extensive {destination} | display xml
+            * show route protocol {protocol} table {table} extensive {destination} | display json
+    """
+
+    device = Device(name='aDevice')
+    maxDiff = None
+
+    empty_output = {'execute.return_value': ''}
+
+    golden_output_xml = {'execute.return_value': '''
+        show route protocol ospf table inet.0 extensive 10.169.196.241 | display xml
+        <rpc-reply xmlns:junos="http://xml.juniper.net/junos/18.2R2/junos">
+            <route-information xmlns="http://xml.juniper.net/junos/18.2R2/junos-routing">
+                <route-table>
+                    <table-name>inet.0</table-name>
+                    <destination-count>929</destination-count>
+                    <total-route-count>1615</total-route-count>
+                    <active-route-count>929</active-route-count>
+                    <holddown-route-count>0</holddown-route-count>
+                    <hidden-route-count>0</hidden-route-count>
+                    <rt junos:style="detail">
+                        <rt-destination>10.169.196.241</rt-destination>
+                        <rt-prefix-length>32</rt-prefix-length>
+                        <rt-entry-count junos:format="1 entry">1</rt-entry-count>
+                        <rt-announced-count>1</rt-announced-count>
+                        <rt-state>FlashAll</rt-state>
+                        <tsi junos:indent="0">
+        KRT in-kernel 10.169.196.241/32 -> {10.169.14.121}</tsi>
+                        <rt-entry>
+                            <active-tag>*</active-tag>
+                            <current-active/>
+                            <last-active/>
+                            <protocol-name>OSPF</protocol-name>
+                            <preference>10</preference>
+                            <preference2>10</preference2>
+                            <nh-type>Router</nh-type>
+                            <nh-index>613</nh-index>
+                            <nh-address>0xdfa7934</nh-address>
+                            <nh-reference-count>458</nh-reference-count>
+                            <nh>
+                                <nh-string>Next hop</nh-string>
+                                <to>10.169.14.121</to>
+                                <via>ge-0/0/1.0</via>
+                                <selected-next-hop/>
+                                <session>141</session>
+                                <weight>0x1</weight>
+                            </nh>
+                            <rt-entry-state>Active Int</rt-entry-state>
+                            <local-as>65171</local-as>
+                            <age junos:seconds="580981">6d 17:23:01</age>
+                            <metric>1201</metric>
+                            <validation-state>unverified</validation-state>
+                            <rt-ospf-area>0.0.0.8</rt-ospf-area>
+                            <task-name>OSPF</task-name>
+                            <announce-bits>2</announce-bits>
+                            <announce-tasks>0-KRT 7-Resolve tree 3</announce-tasks>
+                            <as-path>AS path: I</as-path>
+                            <bgp-path-attributes>
+                                <attr-as-path-effective>
+                                    <aspath-effective-string>AS path:</aspath-effective-string>
+                                    <attr-value>I</attr-value>
+                                </attr-as-path-effective>
+                            </bgp-path-attributes>
+                        </rt-entry>
+                    </rt>
+                </route-table>
+            </route-information>
+            <cli>
+                <banner></banner>
+            </cli>
+        </rpc-reply>
+    '''}
+
+    golden_output_json = {'execute.return_value': '''
+        show route protocol ospf table inet.0 extensive 10.169.196.241 | display json
+        {
+            "route-information" : [
+            {
+                "attributes" : {"xmlns" : "http://xml.juniper.net/junos/18.2R2/junos-routing"},
+                "route-table" : [
+                {
+                    "table-name" : [{"data" : "inet.0"}],
+                    "destination-count" : [{"data" : "929"}],
+                    "total-route-count" : [{"data" : "1615"}],
+                    "active-route-count" : [{"data" : "929"}],
+                    "holddown-route-count" : [{"data" : "0"}],
+                    "hidden-route-count" : [{"data" : "0"}],
+                    "rt" : [
+                    {
+                        "attributes" : {"junos:style" : "detail"},
+                        "rt-destination" : [{"data" : "10.169.196.241"}],
+                        "rt-prefix-length" : [{"data" : "32"}],
+                        "rt-entry-count" : [{"data" : "1", "attributes" : {"junos:format" : "1 entry"}}],
+                        "rt-announced-count" : [{"data" : "1"}],
+                        "rt-state" : [{"data" : "FlashAll"}],
+                        "tsi" : [{"data" : "KRT in-kernel 10.169.196.241/32 -> {10.169.14.121}", "attributes" : {"junos:indent" : "0"}}],
+                        "rt-entry" : [
+                        {
+                            "active-tag" : [{"data" : "*"}],
+                            "current-active" : [{"data" : [null]}],
+                            "last-active" : [{"data" : [null]}],
+                            "protocol-name" : [{"data" : "OSPF"}],
+                            "preference" : [{"data" : "10"}],
+                            "preference2" : [{"data" : "10"}],
+                            "nh-type" : [{"data" : "Router"}],
+                            "nh-index" : [{"data" : "613"}],
+                            "nh-address" : [{"data" : "0xdfa7934"}],
+                            "nh-reference-count" : [{"data" : "458"}],
+                            "nh" : [
+                            {
+                                "nh-string" : [{"data" : "Next hop"}],
+                                "to" : [{"data" : "10.169.14.121"}],
+                                "via" : [{"data" : "ge-0/0/1.0"}],
+                                "selected-next-hop" : [{"data" : [null]}],
+                                "session" : [{"data" : "141"}],
+                                "weight" : [{"data" : "0x1"}]
+                            }
+                            ],
+                            "rt-entry-state" : [{"data" : "Active Int"}],
+                            "local-as" : [{"data" : "65171"}],
+                            "age" : [{"data" : "6d 17:23:01", "attributes" : {"junos:seconds" : "580981"}}],
+                            "metric" : [{"data" : "1201"}],
+                            "validation-state" : [{"data" : "unverified"}],
+                            "rt-ospf-area" : [{"data" : "0.0.0.8"}],
+                            "task-name" : [{"data" : "OSPF"}],
+                            "announce-bits" : [{"data" : "2"}],
+                            "announce-tasks" : [{"data" : "0-KRT 7-Resolve tree 3"}],
+                            "as-path" : [{"data" : "AS path: I"}],
+                            "bgp-path-attributes" : [
+                            {
+                                "attr-as-path-effective" : [
+                                {
+                                    "aspath-effective-string" : [{"data" : "AS path:"}],
+                                    "attr-value" : [{"data" : "I"}]
+                                }
+                                ]
+                            }
+                            ]
+                        }
+                        ]
+                    }
+                    ]
+                }
+                ]
+            }
+            ]
+        }
+    '''}
+
+    golden_parsed_output = {
+        "route-information": {
+            "route-table": [{
+                "active-route-count": "929",
+                "destination-count": "929",
+                "hidden-route-count": "0",
+                "holddown-route-count": "0",
+                "rt": [{
+                    "@junos:style": "detail",
+                    "rt-announced-count": "1",
+                    "rt-destination": "10.169.196.241",
+                    "rt-entry": {
+                        "active-tag": "*",
+                        "age": {
+                            "#text": "6d 17:23:01",
+                            "@junos:seconds": "580981"
+                        },
+                        "announce-bits": "2",
+                        "announce-tasks": "0-KRT 7-Resolve tree 3",
+                        "as-path": "AS path: I",
+                        "bgp-path-attributes": {
+                            "attr-as-path-effective": {
+                                "aspath-effective-string": "AS path:",
+                                "attr-value": "I"
+                            }
+                        },
+                        "current-active": "",
+                        "last-active": "",
+                        "local-as": "65171",
+                        "metric": "1201",
+                        "nh": [{
+                            "nh-string": "Next hop",
+                            "selected-next-hop": "",
+                            "session": "141",
+                            "to": "10.169.14.121",
+                            "via": "ge-0/0/1.0",
+                            "weight": "0x1"
+                        }],
+                        "nh-address": "0xdfa7934",
+                        "nh-index": "613",
+                        "nh-reference-count": "458",
+                        "nh-type": "Router",
+                        "preference": "10",
+                        "preference2": "10",
+                        "protocol-name": "OSPF",
+                        "rt-entry-state": "Active Int",
+                        "rt-ospf-area": "0.0.0.8",
+                        "task-name": "OSPF",
+                        "validation-state": "unverified"
+                    },
+                    "rt-entry-count": {
+                        "#text": "1",
+                        "@junos:format": "1 entry"
+                    },
+                    "rt-prefix-length": "32",
+                    "rt-state": "FlashAll",
+                    "tsi": {
+                        "#text": "KRT in-kernel 10.169.196.241/32 -> {10.169.14.121}",
+                        "@junos:indent": "0"
+                    }
+                }],
+                "table-name": "inet.0",
+                "total-route-count": "1615"
+            }]
+        }
+    }
+
+    def test_empty_xml(self):
+        self.device = Mock(**self.empty_output)
+        obj = ShowRouteProtocolExtensive(device=self.device, context='xml')
+        with self.assertRaises(SchemaEmptyParserError):
+            parsed_output = obj.parse(protocol='ospf', table='inet.0',
+                                      destination='10.169.196.241')
+
+    def test_golden_xml(self):
+        self.device = Mock(**self.golden_output_xml)
+        obj = ShowRouteProtocolExtensive(device=self.device, context='xml')
+        parsed_output = obj.parse(protocol='ospf', table='inet.0',
+                                  destination='10.169.196.241')
+        self.assertEqual(parsed_output, self.golden_parsed_output)
+        self.device.execute.assert_called_once_with(
+            'show route protocol ospf table inet.0 extensive 10.169.196.241'
+            ' | display xml')
+
+    def test_golden_json(self):
+        self.device = Mock(**self.golden_output_json)
+        obj = ShowRouteProtocolExtensive(device=self.device, context='json')
+        parsed_output = obj.parse(protocol='ospf', table='inet.0',
+                                  destination='10.169.196.241')
+        self.assertEqual(parsed_output, self.golden_parsed_output)
+        self.device.execute.assert_called_once_with(
+            'show route protocol ospf table inet.0 extensive 10.169.196.241'
+            ' | display json')
+
+
+'''
+Unit test for the streaming parse of:
+    * show route protocol {protocol}
+    * show route protocol {protocol} extensive
+'''
+
+
+class TestShowRouteStream(unittest.TestCase):
+
+    maxDiff = None
+
+    @staticmethod
+    def _rebuild(records):
+        ret_dict = {}
+        for route_table_dict, rt_dict in records:
+            if rt_dict is None:
+                ret_dict.setdefault('route-information', {}). \
+                    setdefault('route-table', []).append(route_table_dict)
+            else:
+                route_table_dict.setdefault('rt', []).append(rt_dict)
+        return ret_dict
+
+    def test_golden(self):
+        obj = ShowRoute(device=Mock())
+        for number in ('', '_3', '_6'):
+            output = getattr(TestShowRoute, 'golden_output' + number)[
+                'execute.return_value']
+            # Lines with their ends, as read from a file
+            records = obj.parse_stream(output=output.splitlines(True))
+            self.assertEqual(self._rebuild(records), getattr(
+                TestShowRoute, 'golden_parsed_output' + number))
+
+    def test_golden_extensive(self):
+        obj = ShowRouteProtocolExtensive(device=Mock())
+        for number in ('', '_4', '_6'):
+            output = getattr(TestShowRouteProtocolExtensive,
+                             'golden_output' + number)['execute.return_value']
+            records = obj.parse_stream(output=iter(output.splitlines()))
+            self.assertEqual(self._rebuild(records), getattr(
+                TestShowRouteProtocolExtensive,
+                'golden_parsed_output' + number))
+
+    def test_one_record_at_a_time(self):
+        self.device = Mock(**TestShowRouteProtocolExtensive.golden_output_6)
+        obj = ShowRouteProtocolExtensive(device=self.device)
+        records = obj.parse_stream(protocol='bgp')
+        route_table_dict, rt_dict = next(records)
+        self.assertIsNone(rt_dict)
+        self.assertEqual(route_table_dict['table-name'], 'inet.0')
+        route_table_dict, rt_dict = next(records)
+        self.assertEqual(rt_dict['rt-destination'], '100.0.0.1/32')
+        # The route table does not hold the records yielded
+        self.assertNotIn('rt', route_table_dict)
+        self.assertEqual(list(records), [])
+        self.device.execute.assert_called_once_with(
+            'show route protocol bgp extensive')
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -11,7 +11,8 @@ import re
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
 
-from netaddr import IPAddress, IPNetwork
+# parser
+from genie.libs.parser.utils import ip
 
 # =======================================================
 # Schema for 'route'
@@ -283,10 +284,7 @@ class IpRouteShowTableAll(RouteSchema):
             if m:
 
                 group = m.groupdict()
-                destination = IPNetwork(group['destination'])
-                
-                mask = str(destination.netmask)
-                destination_addr = str(destination.ip)
+                destination_addr, mask = ip.prefix(group['destination'])
                 interface = group['device']
                 metric = int(group['metric'])
                 scope = group['scope']
@@ -306,10 +304,7 @@ class IpRouteShowTableAll(RouteSchema):
             if m:
 
                 group = m.groupdict()
-                destination = IPNetwork(group['destination'])
-                
-                mask = str(destination.netmask)
-                destination_addr = str(destination.ip)
+                destination_addr, mask = ip.prefix(group['destination'])
                 interface = group['device']
                 scope = group['scope']
                 proto = group['proto']
@@ -332,10 +327,7 @@ class IpRouteShowTableAll(RouteSchema):
             if m:
 
                 group = m.groupdict()
-                destination = IPNetwork(group['destination'])
-                
-                mask = str(destination.netmask)
-                destination_addr = str(destination.ip)
+                destination_addr, mask = ip.prefix(group['destination'])
                 interface = group['device']
                 scope = group['scope']
                 proto = group['proto']
@@ -357,10 +349,7 @@ class IpRouteShowTableAll(RouteSchema):
             if m:
 
                 group = m.groupdict()
-                destination = IPNetwork(group['destination'])
-                
-                mask = str(destination.netmask)
-                destination_addr = str(destination.ip)
+                destination_addr, mask = ip.prefix(group['destination'])
                 interface = group['device']
                 scope = group['scope']
                 proto = group['proto']
@@ -384,10 +373,7 @@ class IpRouteShowTableAll(RouteSchema):
             if m:
 
                 group = m.groupdict()
-                destination = IPNetwork(group['destination'])
-                
-                mask = str(destination.netmask)
-                destination_addr = str(destination.ip)
+                destination_addr, mask = ip.prefix(group['destination'])
                 interface = group['device']
                 scope = group['scope']
                 proto = group['proto']
@@ -413,10 +399,7 @@ class IpRouteShowTableAll(RouteSchema):
             if m:
 
                 group = m.groupdict()
-                destination = IPNetwork(group['destination'])
-                
-                mask = str(destination.netmask)
-                destination_addr = str(destination.ip)
+                destination_addr, mask = ip.prefix(group['destination'])
                 interface = group['device']
                 scope = group['scope']
                 proto = group['proto']
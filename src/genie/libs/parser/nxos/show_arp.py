@@ -12,7 +12,6 @@ import re
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional, Or, And,\
 										Default, Use
-from genie import parsergen
 from genie.libs.parser.utils.common import Common
 
 
@@ -63,6 +63,10 @@ from genie.libs.parser.yang.bgp_openconfig_yang import BgpOpenconfigYang
 
 # import parser utils
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.select import select_command
+from genie.libs.parser.utils.xml_stream import XmlRowStream
+from genie.libs.parser.utils import nxapi
+from genie.libs.parser.utils import bgp_paths
 
 
 # =====================================
@@ -806,261 +810,232 @@ class ShowBgpProcessVrfAll(ShowBgpProcessVrfAllSchema):
             out = output
 
         etree_dict = {}
-        # Remove junk characters returned by the device
-        out = out.replace("]]>]]>", "")
-        xml_output = ET.fromstring(out)
-
-        for item in xml_output:
-            for data in item:
-                for show in data:
-                    for bgp in show:
-                        for __XML__OPT_Cmd_show_ip_bgp_session_cmd_vrf in bgp:
-                            for process in __XML__OPT_Cmd_show_ip_bgp_session_cmd_vrf:
-                                for __XML__OPT_Cmd_show_bgp_process_cmd_vrf in process:
-                                    for __XML__OPT_Cmd_show_bgp_process_cmd___readonly__ in __XML__OPT_Cmd_show_bgp_process_cmd_vrf:
-                                        for key in __XML__OPT_Cmd_show_bgp_process_cmd___readonly__:
-                                            # Get key text
-                                            text = key.tag[key.tag.find('}')+1:]
-                                            # bgp_pid
-                                            if text == 'processid':
-                                                etree_dict['bgp_pid'] = int(key.text)
-                                            # bgp_protocol_started_reason
-                                            if text == 'protocolstartedreason':
-                                                etree_dict['bgp_protocol_started_reason'] = key.text
-                                            # bgp_tag
-                                            if text == 'protocoltag':
-                                                etree_dict['bgp_tag'] = key.text
-                                            # bgp_protocol_state
-                                            if text == 'protocolstate':
-                                                etree_dict['bgp_protocol_state'] = str(key.text).lower()
-                                            # bgp_isolate_mode
-                                            if text == 'isolatemode':
-                                                etree_dict['bgp_isolate_mode'] = key.text
-                                            # bgp_mmode
-                                            if text == 'mmode':
-                                                etree_dict['bgp_mmode'] = key.text
-                                            # bgp_memory_state
-                                            if text == 'memorystate':
-                                                etree_dict['bgp_memory_state'] = str(key.text).lower()
-                                            # bgp_performance_mode
-                                            if text == 'forwardingstatesaved':
-                                                if key.text == 'false':
-                                                    etree_dict['bgp_performance_mode'] = 'No'
-                                                else:
-                                                    etree_dict['bgp_performance_mode'] = 'Yes'
-                                            # bgp_asformat
-                                            if text == 'asformat':
-                                                etree_dict['bgp_asformat'] = key.text
-                                            if text == 'srgbmin':
-                                                srgbin = key.text
-                                            if text == 'srgbmax':
-                                                srgmax = key.text
-                                                try:
-                                                    etree_dict['segment_routing_global_block'] = srgbin + '-' + srgmax
-                                                except Exception:
-                                                    pass
-                                            # num_attr_entries
-                                            if text == 'attributeentries':
-                                                etree_dict['num_attr_entries'] = int(key.text)
-                                            # hwm_attr_entries
-                                            if text == 'hwmattributeentries':
-                                                etree_dict['hwm_attr_entries'] = int(key.text)
-                                            # bytes_used
-                                            if text == 'bytesused':
-                                                etree_dict['bytes_used'] = int(key.text)
-                                            # entries_pending_delete
-                                            if text == 'entriespendingdelete':
-                                                etree_dict['entries_pending_delete'] = int(key.text)
-                                            # hwm_entries_pending_delete
-                                            if text == 'hwmentriespendingdelete':
-                                                etree_dict['hwm_entries_pending_delete'] = int(key.text)
-                                            # bgp_paths_per_hwm_attr
-                                            if text == 'pathsperattribute':
-                                                etree_dict['bgp_paths_per_hwm_attr'] = int(key.text)
-                                            # bgp_as_path_entries
-                                            if text == 'aspathentries':
-                                                etree_dict['bgp_as_path_entries'] = int(key.text)
-                                            # bytes_used_as_path_entries
-                                            if text == 'aspathbytes':
-                                                etree_dict['bytes_used_as_path_entries'] = int(key.text)
-                                            
-                                            if text == 'TABLE_vrf':
-                                                for table_vrf in key:
-                                                    for row_vrf in table_vrf:
-                                                        vrf_tag = row_vrf.tag[row_vrf.tag.find('}')+1:]
-
-                                                        # vrf
-                                                        #   vrf_name
-                                                        if vrf_tag == 'vrf-name-out':
-                                                            vrf_name = row_vrf.text
-                                                            if 'vrf' not in etree_dict:
-                                                                etree_dict['vrf'] = {}
-                                                            if vrf_name not in etree_dict['vrf']:
-                                                                etree_dict['vrf'][vrf_name] = {}
-                                                                vrf_dict = etree_dict['vrf'][vrf_name]
-                                                        # vrf_id
-                                                        if vrf_tag == 'vrf-id':
-                                                            vrf_dict['vrf_id'] = row_vrf.text
-                                                        # vrf_state
-                                                        if vrf_tag == 'vrf-state':
-                                                            vrf_dict['vrf_state'] = str(row_vrf.text).lower()
-                                                        # router_id
-                                                        if vrf_tag == 'vrf-router-id':
-                                                            vrf_dict['router_id'] = row_vrf.text
-                                                        # conf_router_id
-                                                        if vrf_tag == 'vrf-cfgd-id':
-                                                            vrf_dict['conf_router_id'] = row_vrf.text
-                                                        # confed_id
-                                                        if vrf_tag == 'vrf-confed-id':
-                                                            vrf_dict['confed_id'] = int(row_vrf.text)
-                                                        # cluster_id
-                                                        if vrf_tag == 'vrf-cluster-id':
-                                                           vrf_dict['cluster_id'] = row_vrf.text
-                                                        # num_conf_peers
-                                                        if vrf_tag == 'vrf-peers':
-                                                            vrf_dict['num_conf_peers'] = int(row_vrf.text)
-                                                        # num_pending_conf_peers
-                                                        if vrf_tag == 'vrf-pending-peers':
-                                                            vrf_dict['num_pending_conf_peers'] = int(row_vrf.text)
-                                                        # num_established_peers
-                                                        if vrf_tag == 'vrf-est-peers':
-                                                            vrf_dict['num_established_peers'] = int(row_vrf.text)
-                                                            vrf_dict['vrf_rd'] = 'not configured'
-                                                        # vrf_rd
-                                                        if vrf_tag == 'vrf-rd':
-                                                            vrf_dict['vrf_rd'] = row_vrf.text
-
-                                                        if vrf_tag == 'TABLE_af':
-                                                            for table_af in row_vrf:
-                                                                for row_af in table_af:
-                                                                    af_tag = row_af.tag[row_af.tag.find('}')+1:]
-
-                                                                    # address_family
-                                                                    #   address_family_name
-                                                                    if af_tag == 'af-name':
-                                                                        address_family_name = str(row_af.text).lower()
-                                                                        if 'address_family' not in etree_dict['vrf'][vrf_name]:
-                                                                            etree_dict['vrf'][vrf_name]['address_family'] = {}
-                                                                        if address_family_name not in etree_dict['vrf'][vrf_name]['address_family']:
-                                                                            etree_dict['vrf'][vrf_name]['address_family'][address_family_name] = {}
-                                                                            af_dict = etree_dict['vrf'][vrf_name]['address_family'][address_family_name]
-                                                                        # Initialize empty lists
-                                                                        export_rt_list = ''
-                                                                        import_rt_list = ''
-                                                                    # table_id
-                                                                    if af_tag == 'af-table-id':
-                                                                        table_id = str(row_af.text)
-                                                                        if '0x' in table_id:
-                                                                            af_dict['table_id'] = table_id
-                                                                        else:
-                                                                            af_dict['table_id'] = '0x' + table_id
-                                                                    # table_state
-                                                                    if af_tag == 'af-state':
-                                                                        af_dict['table_state'] = str(row_af.text).lower()
-                                                                    # peers
-                                                                    if af_tag == 'af-num-peers':
-                                                                        peers = int(row_af.text)
-                                                                        if 'peers' not in af_dict:
-                                                                            af_dict['peers'] = {}
-                                                                        if peers not in af_dict['peers']:
-                                                                            af_dict['peers'][peers] = {}
-                                                                    # active_peers
-                                                                    if af_tag == 'af-num-active-peers':
-                                                                        af_dict['peers'][peers]['active_peers'] = int(row_af.text)
-                                                                    # routes
-                                                                    if af_tag == 'af-peer-routes':
-                                                                        af_dict['peers'][peers]['routes'] = int(row_af.text)
-                                                                    # paths
-                                                                    if af_tag == 'af-peer-paths':
-                                                                        af_dict['peers'][peers]['paths'] = int(row_af.text)
-                                                                    # networks
-                                                                    if af_tag == 'af-peer-networks':
-                                                                        af_dict['peers'][peers]['networks'] = int(row_af.text)
-                                                                    # aggregates
-                                                                    if af_tag == 'af-peer-aggregates':
-                                                                        af_dict['peers'][peers]['aggregates'] = int(row_af.text)
-                                                                    # route_reflector
-                                                                    if af_tag == 'af-rr':
-                                                                        if row_af.text == 'true':
-                                                                            af_dict['route_reflector'] = True
-                                                                    # next_hop_trigger_delay
-                                                                    #   critical
-                                                                    if af_tag == 'nexthop-trigger-delay-critical':
-                                                                        if 'next_hop_trigger_delay' not in af_dict:
-                                                                            af_dict['next_hop_trigger_delay'] = {}
-                                                                        af_dict['next_hop_trigger_delay']['critical'] = int(row_af.text)
-                                                                    # next_hop_trigger_delay
-                                                                    #   non_critical
-                                                                    if af_tag == 'nexthop-trigger-delay-non-critical':
-                                                                        af_dict['next_hop_trigger_delay']['non_critical'] = int(row_af.text)
-                                                                    # aggregate_label
-                                                                    if af_tag == 'af-aggregate-label':
-                                                                        af_dict['aggregate_label'] = row_af.text
-                                                                    # label_mode
-                                                                    if af_tag == 'af-label-mode':
-                                                                        af_dict['label_mode'] = row_af.text
-                                                                    # import_default_map
-                                                                    if af_tag == 'importdefault_map':
-                                                                        af_dict['import_default_map'] = row_af.text
-                                                                    # import_default_prefix_limit
-                                                                    if af_tag == 'importdefault_prefixlimit':
-                                                                        af_dict['import_default_prefix_limit'] = int(row_af.text)
-                                                                    # import_default_prefix_count
-                                                                    if af_tag == 'importdefault_prefixcount':
-                                                                        af_dict['import_default_prefix_count'] = int(row_af.text)
-                                                                    # export_default_map
-                                                                    if af_tag == 'exportdefault_map':
-                                                                        af_dict['export_default_map'] = row_af.text
-                                                                    # export_default_prefix_limit
-                                                                    if af_tag == 'exportdefault_prefixlimit':
-                                                                        af_dict['export_default_prefix_limit'] = int(row_af.text)
-                                                                    # export_default_prefix_count
-                                                                    if af_tag == 'exportdefault_prefixcount':
-                                                                        af_dict['export_default_prefix_count'] = int(row_af.text)
-
-                                                                    # TABLE_redist
-                                                                    #   ROW_redist
-                                                                    if af_tag == 'TABLE_redist':
-                                                                        for table_redist in row_af:
-                                                                            for row_redist in table_redist:
-                                                                                row_redist_tag = row_redist.tag[row_redist.tag.find('}')+1:]
-                                                                                # protocol
-                                                                                if row_redist_tag == 'protocol':
-                                                                                    protocol = row_redist.text
-                                                                                    if 'redistribution' not in af_dict:
-                                                                                        af_dict['redistribution'] = {}
-                                                                                    if protocol not in af_dict['redistribution']:
-                                                                                        af_dict['redistribution'][protocol] = {}
-                                                                                # route_map
-                                                                                if row_redist_tag == 'route-map':
-                                                                                    af_dict['redistribution'][protocol]['route_map'] = row_redist.text
-
-                                                                    # TABLE_evpn_export_rt
-                                                                    #   ROW_evpn_export_rt
-                                                                    if af_tag == 'TABLE_evpn_export_rt':
-                                                                        for table_evpn_export in row_af:
-                                                                            for row_export in table_evpn_export:
-                                                                                row_export_tag = row_export.tag[row_export.tag.find('}')+1:]
-                                                                                # export_rt_list
-                                                                                if row_export_tag == 'evpn-export-rt':
-                                                                                    export_rt_list = str(export_rt_list + ' ' + row_export.text).strip()
-                                                                                    af_dict['export_rt_list'] = export_rt_list
-                                                                    # TABLE_evpn_import_rt
-                                                                    #   ROW_evpn_import_rt
-                                                                    if af_tag == 'TABLE_evpn_import_rt':
-                                                                        for table_evpn_import in row_af:
-                                                                            for row_import in table_evpn_import:
-                                                                                row_import_tag = row_import.tag[row_import.tag.find('}')+1:]
-                                                                                # export_rt_list
-                                                                                if row_import_tag == 'evpn-import-rt':
-                                                                                    import_rt_list = str(import_rt_list + ' ' + row_import.text).strip()
-                                                                                    af_dict['import_rt_list'] = import_rt_list
-
-                                                                    # parsed all tags
-                                                                    continue
-                                                                                    
+        stream = XmlRowStream(out)
+
+        for name, row, parents in stream:
+
+            if name == 'ROW_vrf':
+                vrf_dict = self._xml_vrf_dict(etree_dict, row)
+                if vrf_dict is None:
+                    continue
+                # vrf_id
+                if 'vrf-id' in row:
+                    vrf_dict['vrf_id'] = row['vrf-id']
+                # vrf_state
+                if 'vrf-state' in row:
+                    vrf_dict['vrf_state'] = str(row['vrf-state']).lower()
+                # router_id
+                if 'vrf-router-id' in row:
+                    vrf_dict['router_id'] = row['vrf-router-id']
+                # conf_router_id
+                if 'vrf-cfgd-id' in row:
+                    vrf_dict['conf_router_id'] = row['vrf-cfgd-id']
+                # confed_id
+                if 'vrf-confed-id' in row:
+                    vrf_dict['confed_id'] = int(row['vrf-confed-id'])
+                # cluster_id
+                if 'vrf-cluster-id' in row:
+                    vrf_dict['cluster_id'] = row['vrf-cluster-id']
+                # num_conf_peers
+                if 'vrf-peers' in row:
+                    vrf_dict['num_conf_peers'] = int(row['vrf-peers'])
+                # num_pending_conf_peers
+                if 'vrf-pending-peers' in row:
+                    vrf_dict['num_pending_conf_peers'] = int(row['vrf-pending-peers'])
+                # num_established_peers
+                if 'vrf-est-peers' in row:
+                    vrf_dict['num_established_peers'] = int(row['vrf-est-peers'])
+                    vrf_dict['vrf_rd'] = 'not configured'
+                # vrf_rd
+                if 'vrf-rd' in row:
+                    vrf_dict['vrf_rd'] = row['vrf-rd']
+
+            elif name == 'ROW_af' and parents:
+                af_dict = self._xml_af_dict(etree_dict, parents[-1], row)
+                if af_dict is None:
+                    continue
+                # table_id
+                if 'af-table-id' in row:
+                    table_id = str(row['af-table-id'])
+                    if '0x' in table_id:
+                        af_dict['table_id'] = table_id
+                    else:
+                        af_dict['table_id'] = '0x' + table_id
+                # table_state
+                if 'af-state' in row:
+                    af_dict['table_state'] = str(row['af-state']).lower()
+                # peers
+                if 'af-num-peers' in row:
+                    peers = int(row['af-num-peers'])
+                    if 'peers' not in af_dict:
+                        af_dict['peers'] = {}
+                    if peers not in af_dict['peers']:
+                        af_dict['peers'][peers] = {}
+                    peers_dict = af_dict['peers'][peers]
+                    # active_peers
+                    if 'af-num-active-peers' in row:
+                        peers_dict['active_peers'] = int(row['af-num-active-peers'])
+                    # routes
+                    if 'af-peer-routes' in row:
+                        peers_dict['routes'] = int(row['af-peer-routes'])
+                    # paths
+                    if 'af-peer-paths' in row:
+                        peers_dict['paths'] = int(row['af-peer-paths'])
+                    # networks
+                    if 'af-peer-networks' in row:
+                        peers_dict['networks'] = int(row['af-peer-networks'])
+                    # aggregates
+                    if 'af-peer-aggregates' in row:
+                        peers_dict['aggregates'] = int(row['af-peer-aggregates'])
+                # route_reflector
+                if row.get('af-rr') == 'true':
+                    af_dict['route_reflector'] = True
+                # next_hop_trigger_delay
+                #   critical
+                if 'nexthop-trigger-delay-critical' in row:
+                    if 'next_hop_trigger_delay' not in af_dict:
+                        af_dict['next_hop_trigger_delay'] = {}
+                    af_dict['next_hop_trigger_delay']['critical'] = \
+                        int(row['nexthop-trigger-delay-critical'])
+                # next_hop_trigger_delay
+                #   non_critical
+                if 'nexthop-trigger-delay-non-critical' in row:
+                    af_dict['next_hop_trigger_delay']['non_critical'] = \
+                        int(row['nexthop-trigger-delay-non-critical'])
+                # aggregate_label
+                if 'af-aggregate-label' in row:
+                    af_dict['aggregate_label'] = row['af-aggregate-label']
+                # label_mode
+                if 'af-label-mode' in row:
+                    af_dict['label_mode'] = row['af-label-mode']
+                # import_default_map
+                if 'importdefault_map' in row:
+                    af_dict['import_default_map'] = row['importdefault_map']
+                # import_default_prefix_limit
+                if 'importdefault_prefixlimit' in row:
+                    af_dict['import_default_prefix_limit'] = \
+                        int(row['importdefault_prefixlimit'])
+                # import_default_prefix_count
+                if 'importdefault_prefixcount' in row:
+                    af_dict['import_default_prefix_count'] = \
+                        int(row['importdefault_prefixcount'])
+                # export_default_map
+                if 'exportdefault_map' in row:
+                    af_dict['export_default_map'] = row['exportdefault_map']
+                # export_default_prefix_limit
+                if 'exportdefault_prefixlimit' in row:
+                    af_dict['export_default_prefix_limit'] = \
+                        int(row['exportdefault_prefixlimit'])
+                # export_default_prefix_count
+                if 'exportdefault_prefixcount' in row:
+                    af_dict['export_default_prefix_count'] = \
+                        int(row['exportdefault_prefixcount'])
+
+            # TABLE_redist
+            #   ROW_redist
+            elif name == 'ROW_redist' and len(parents) > 1:
+                af_dict = self._xml_af_dict(etree_dict, parents[-2], parents[-1])
+                if af_dict is None or 'protocol' not in row:
+                    continue
+                # protocol
+                protocol = row['protocol']
+                if 'redistribution' not in af_dict:
+                    af_dict['redistribution'] = {}
+                if protocol not in af_dict['redistribution']:
+                    af_dict['redistribution'][protocol] = {}
+                # route_map
+                if 'route-map' in row:
+                    af_dict['redistribution'][protocol]['route_map'] = row['route-map']
+
+            # TABLE_evpn_export_rt
+            #   ROW_evpn_export_rt
+            # TABLE_evpn_import_rt
+            #   ROW_evpn_import_rt
+            elif name in ('ROW_evpn_export_rt', 'ROW_evpn_import_rt') and \
+                    len(parents) > 1:
+                af_dict = self._xml_af_dict(etree_dict, parents[-2], parents[-1])
+                if af_dict is None:
+                    continue
+                for tag, key in (('evpn-export-rt', 'export_rt_list'),
+                                 ('evpn-import-rt', 'import_rt_list')):
+                    if tag in row:
+                        af_dict[key] = str(af_dict.get(key, '') + ' ' +
+                                           row[tag]).strip()
+
+        # Process attributes, outside of the vrf table
+        top = stream.top
+        # bgp_pid
+        if 'processid' in top:
+            etree_dict['bgp_pid'] = int(top['processid'])
+        # bgp_protocol_started_reason
+        if 'protocolstartedreason' in top:
+            etree_dict['bgp_protocol_started_reason'] = top['protocolstartedreason']
+        # bgp_tag
+        if 'protocoltag' in top:
+            etree_dict['bgp_tag'] = top['protocoltag']
+        # bgp_protocol_state
+        if 'protocolstate' in top:
+            etree_dict['bgp_protocol_state'] = str(top['protocolstate']).lower()
+        # bgp_isolate_mode
+        if 'isolatemode' in top:
+            etree_dict['bgp_isolate_mode'] = top['isolatemode']
+        # bgp_mmode
+        if 'mmode' in top:
+            etree_dict['bgp_mmode'] = top['mmode']
+        # bgp_memory_state
+        if 'memorystate' in top:
+            etree_dict['bgp_memory_state'] = str(top['memorystate']).lower()
+        # bgp_performance_mode
+        if 'forwardingstatesaved' in top:
+            if top['forwardingstatesaved'] == 'false':
+                etree_dict['bgp_performance_mode'] = 'No'
+            else:
+                etree_dict['bgp_performance_mode'] = 'Yes'
+        # bgp_asformat
+        if 'asformat' in top:
+            etree_dict['bgp_asformat'] = top['asformat']
+        if 'srgbmin' in top and 'srgbmax' in top:
+            try:
+                etree_dict['segment_routing_global_block'] = \
+                    top['srgbmin'] + '-' + top['srgbmax']
+            except Exception:
+                pass
+        for key, tag in (('num_attr_entries', 'attributeentries'),
+                         ('hwm_attr_entries', 'hwmattributeentries'),
+                         ('bytes_used', 'bytesused'),
+                         ('entries_pending_delete', 'entriespendingdelete'),
+                         ('hwm_entries_pending_delete', 'hwmentriespendingdelete'),
+                         ('bgp_paths_per_hwm_attr', 'pathsperattribute'),
+                         ('bgp_as_path_entries', 'aspathentries'),
+                         ('bytes_used_as_path_entries', 'aspathbytes')):
+            if tag in top:
+                etree_dict[key] = int(top[tag])
+
         return etree_dict
 
+    @staticmethod
+    def _xml_vrf_dict(etree_dict, vrf_row):
+        '''return the vrf dictionary of a ROW_vrf, None without vrf name'''
+        # vrf
+        #   vrf_name
+        vrf_name = vrf_row.get('vrf-name-out')
+        if vrf_name is None:
+            return None
+        return etree_dict.setdefault('vrf', {}).setdefault(vrf_name, {})
+
+    @classmethod
+    def _xml_af_dict(cls, etree_dict, vrf_row, af_row):
+        '''return the address family dictionary of a ROW_af, None without
+           vrf or address family name'''
+        vrf_dict = cls._xml_vrf_dict(etree_dict, vrf_row)
+        # address_family
+        #   address_family_name
+        if vrf_dict is None or 'af-name' not in af_row:
+            return None
+        address_family_name = str(af_row['af-name']).lower()
+        return vrf_dict.setdefault('address_family', {}).\
+            setdefault(address_family_name, {})
+
     def yang(self, vrf=''):
         # Initialize empty dictionary
         map_dict = {}
@@ -2340,6 +2315,9 @@ class ShowBgpVrfAllNeighbors(ShowBgpVrfAllNeighborsSchema):
     """Parser for:
         show bgp vrf <vrf> all neighbors
         parser class - implements detail parsing mechanisms for cli and yang output.
+
+        select (`dict`) narrows the executed command on 'vrf',
+        'address_family' and 'neighbor', e.g. select={'neighbor': '10.16.2.2'}
         """
     cli_command = ['show bgp vrf {vrf} {address_family} neighbors',
                    'show bgp vrf {vrf} {address_family} neighbors {neighbor}',
@@ -2365,9 +2343,15 @@ class ShowBgpVrfAllNeighbors(ShowBgpVrfAllNeighborsSchema):
       'tbl_ver',
       'msg_rcvd']
 
-    def cli(self, vrf='all', address_family='all', neighbor='', output=None):
+    def cli(self, vrf='all', address_family='all', neighbor='', output=None,
+            select=None):
         if output is None:
-            if neighbor:
+            if select:
+                # Only execute the variant narrowed on the selection
+                out = self.device.execute(select_command(
+                    self.cli_command, select, unset='all', vrf=vrf,
+                    address_family=address_family, neighbor=neighbor or None))
+            elif neighbor:
                 out = self.device.execute(self.cli_command[1].format(vrf=vrf,
                                                               address_family=address_family,
                                                               neighbor=neighbor))
@@ -3519,13 +3503,17 @@ class ShowBgpVrfAllAllSummarySchema(MetaParser):
 # Parser for 'show bgp vrf <WORD> all summary'
 # =========================================
 class ShowBgpVrfAllAllSummary(ShowBgpVrfAllAllSummarySchema):
-    """Parser for show bgp vrf <WORD> all summary"""
+    """Parser for show bgp vrf <WORD> all summary
+
+       select (`dict`) narrows the executed command on 'vrf' and
+       'address_family', e.g. select={'vrf': 'VRF1'}"""
 
     cli_command = [ 'show bgp vrf all all summary',
                     'show bgp vrf {vrf} all summary',
                     'show bgp vrf {vrf} {address_family} summary']
 
     xml_command = 'show bgp vrf {vrf} all summary | xml'
+    json_command = 'show bgp vrf {vrf} {address_family} summary | json'
     exclude = [
       'tbl_ver',
       'up_down',
@@ -3541,9 +3529,14 @@ class ShowBgpVrfAllAllSummary(ShowBgpVrfAllAllSummarySchema):
       'total_entries',
       'as_path_entries']
 
-    def cli(self, vrf='all', address_family='all', output=None):
+    def cli(self, vrf='all', address_family='all', output=None, select=None):
         if output is None:
-            if address_family == 'all':
+            if select:
+                # Only execute the variant narrowed on the selection
+                out = self.device.execute(select_command(
+                    self.cli_command, select, unset='all', vrf=vrf,
+                    address_family=address_family))
+            elif address_family == 'all':
                 if vrf == 'all':
                     out = self.device.execute(self.cli_command[0])
 
@@ -3841,310 +3834,214 @@ class ShowBgpVrfAllAllSummary(ShowBgpVrfAllAllSummarySchema):
 
         out = self.device.execute(self.xml_command.format(vrf=vrf))
 
-        etree_dict = {}
+        # Stream the rows, comparing the command of the reply
+        stream = XmlRowStream(out, command=self.cli_command[2].format(
+            vrf=vrf, address_family=address_family))
 
-        # Remove junk characters returned by the device
-        out = out.replace("]]>]]>", "")
-        root = ET.fromstring(out)
+        return self._rows_dict(stream)
 
-        # top table root
-        show_root = Common.retrieve_xml_child(root=root, key='show')
-        # get xml namespace
-        # {http://www.cisco.com/nxos:7.0.3.I7.1.:bgp}
-        try:
-            m = re.compile(r'(?P<name>\{[\S]+\})').match(show_root.tag)
-            namespace = m.groupdict()['name']
-        except Exception:
-            return etree_dict
+    def json(self, vrf='all', address_family='all', output=None):
+        if output is None:
+            out = self.device.execute(self.json_command.format(
+                vrf=vrf, address_family=address_family))
+        else:
+            out = output
 
-        # compare cli command
-        Common.compose_compare_command(root=root, namespace=namespace,
-                                       expect_command=self.cli_command[2].format(vrf=vrf,
-                                                                              address_family=address_family))
+        # Same ROW_ tables as the '| xml' output
+        return self._rows_dict(nxapi.iter_rows(nxapi.loads(out)))
 
-        # find Vrf root
-        root = Common.retrieve_xml_child(root=root, key='TABLE_vrf')
+    @classmethod
+    def _rows_dict(cls, rows):
+        '''build the parsed output from the (name, row, parents) tuples of
+           the ROW_ tables of a '| xml' or '| json' output'''
+        etree_dict = {}
 
-        if not root:
-            return etree_dict
+        # Neighbors of a ROW_saf are consecutive rows, only the attributes
+        # of the current ROW_saf are kept. The row itself is referenced and
+        # compared by identity: ids of released rows are reused.
+        saf_row = None
+        af, af_dict = None, None
+
+        # -----   loop neighbors  -----
+        for name, nei_root, parents in rows:
+            if name != 'ROW_neighbor' or len(parents) < 3:
+                continue
+            vrf_tree, _, saf_root = parents[-3:]
 
-        # -----   loop vrf  -----
-        for vrf_tree in root.findall('{}ROW_vrf'.format(namespace)):
             # vrf
-            try:
-                vrf = vrf_tree.find('{}vrf-name-out'.format(namespace)).text
-            except Exception:
+            vrf = vrf_tree.get('vrf-name-out')
+            if vrf is None:
                 break
 
-            # <vrf-router-id>10.106.0.6</vrf-router-id>
-            try:
-                route_identifier = vrf_tree.find('{}vrf-router-id'.format(namespace)).text
-            except Exception:
-                route_identifier = None
-
-            # <vrf-local-as>333</vrf-local-as>
-            try:
-                local_as = vrf_tree.find('{}vrf-local-as'.format(namespace)).text
-            except Exception:
-                local_as = None
+            # address_family
+            if saf_root is not saf_row:
+                saf_row = saf_root
+                af, af_dict = cls._xml_af_dict(vrf_tree, saf_root)
+            if af is None:
+                continue
 
-            # Address family table
-            af_tree = vrf_tree.find('{}TABLE_af'.format(namespace))
-            if not af_tree:
+            # neighbor
+            nei = nei_root.get('neighborid')
+            if nei is None:
                 continue
-            for af_root in af_tree.findall('{}ROW_af'.format(namespace)):
-                # Address family table
-                saf_tree = af_root.find('{}TABLE_saf'.format(namespace))
-                if not saf_tree:
-                    continue
-                # -----   loop address_family  -----
-                for saf_root in saf_tree.findall('{}ROW_saf'.format(namespace)):
-                    # neighbor
-                    try:
-                        af = saf_root.find('{}af-name'.format(namespace)).text
-                        af = af.lower()
-                        # initial af dictionary
-                        af_dict = {}
-                        if route_identifier:
-                            af_dict['route_identifier'] = route_identifier
-                        if local_as:
-                            af_dict['local_as'] = int(local_as)
-                    except Exception:
-                        continue
 
-                    # <tableversion>7</tableversion>
-                    try:
-                        af_dict['bgp_table_version'] = int(
-                            saf_root.find('{}tableversion'.format(namespace)).text)
-                    except Exception:
-                        # for valide entry, table version should be there
-                        continue
+            if 'vrf' not in etree_dict:
+                etree_dict['vrf'] = {}
+            if vrf not in etree_dict['vrf']:
+                etree_dict['vrf'][vrf] = {}
 
-                    # <configuredpeers>3</configuredpeers>
-                    af_dict['config_peers'] = \
-                        int(saf_root.find('{}configuredpeers'.format(namespace)).text)
-                        
-                    # <capablepeers>2</capablepeers>
-                    af_dict['capable_peers'] = \
-                        int(saf_root.find('{}capablepeers'.format(namespace)).text)
+            if 'neighbor' not in etree_dict['vrf'][vrf]:
+                etree_dict['vrf'][vrf]['neighbor'] = {}
+            if nei not in etree_dict['vrf'][vrf]['neighbor']:
+                etree_dict['vrf'][vrf]['neighbor'][nei] = {}
 
-                    # <totalnetworks>5</totalnetworks>
-                    try:
-                        total_prefix_entries = \
-                            int(saf_root.find('{}totalnetworks'.format(namespace)).text)
-                        if 'prefixes' not in af_dict:
-                            af_dict['prefixes'] = {}
-                        af_dict['prefixes']['total_entries'] = total_prefix_entries
-                    except Exception:
-                        pass
-                        
-                    # <totalpaths>10</totalpaths>
-                    try:
-                        total_path_entries = \
-                            int(saf_root.find('{}totalpaths'.format(namespace)).text)
-                        if 'path' not in af_dict:
-                            af_dict['path'] = {}
-                        af_dict['path']['total_entries'] = total_path_entries
-                    except Exception:
-                        pass
-                        
-                    # <memoryused>1820</memoryused>
-                    try:
-                        memory_usage = \
-                            int(saf_root.find('{}memoryused'.format(namespace)).text)
-                        af_dict['path']['memory_usage'] = memory_usage
-                        af_dict['prefixes']['memory_usage'] = memory_usage
-                    except Exception:
-                        pass
+            if 'address_family' not in etree_dict['vrf'][vrf]['neighbor'][nei]:
+                etree_dict['vrf'][vrf]['neighbor'][nei]['address_family'] = {}
 
-                    try:
-                        # <numberattrs>1</numberattrs>
-                        entries_1 = \
-                            saf_root.find('{}numberattrs'.format(namespace)).text
-                            
-                        # <bytesattrs>160</bytesattrs>
-                        entries_2 = \
-                            saf_root.find('{}bytesattrs'.format(namespace)).text
+            if af not in etree_dict['vrf'][vrf]['neighbor'][nei]['address_family']:
+                etree_dict['vrf'][vrf]['neighbor'][nei]['address_family'][af] = {}
 
-                        af_dict['attribute_entries'] = '[{0}/{1}]'.format(entries_1, entries_2)
-                    except Exception:
-                        pass
-                        
-                    try:
-                        # <numberpaths>1</numberpaths>
-                        entries_1 = \
-                            saf_root.find('{}numberpaths'.format(namespace)).text
+            sub_dict = etree_dict['vrf'][vrf]['neighbor'][nei]['address_family'][af]
 
-                        # <bytespaths>34</bytespaths>
-                        entries_2 = \
-                            saf_root.find('{}bytespaths'.format(namespace)).text
+            #  ---   AF attributes -------
+            # copy the nested 'prefixes' and 'path' dictionaries
+            sub_dict.update({key: dict(value) if isinstance(value, dict)
+                             else value for key, value in af_dict.items()})
 
-                        af_dict['as_path_entries'] = '[{0}/{1}]'.format(entries_1, entries_2)
-                    except Exception:
-                        pass
-                        
-                    try:
-                        # <numbercommunities>0</numbercommunities>
-                        entries_1 = \
-                            saf_root.find('{}numbercommunities'.format(namespace)).text
+            #  ---   Neighbors attributes -------
+            # <neighborversion>4</neighborversion>
+            sub_dict['neighbor_table_version'] = int(nei_root['neighborversion'])
 
-                        # <bytescommunities>0</bytescommunities>
-                        entries_2 = \
-                            saf_root.find('{}bytescommunities'.format(namespace)).text
+            # <msgrecvd>5471</msgrecvd>
+            sub_dict['msg_rcvd'] = int(nei_root['msgrecvd'])
 
-                        af_dict['community_entries'] = '[{0}/{1}]'.format(entries_1, entries_2)
-                    except Exception:
-                        pass
-                        
-                    try:
-                        # <numberclusterlist>0</numberclusterlist>
-                        entries_1 = \
-                            saf_root.find('{}numberclusterlist'.format(namespace)).text
+            # <msgsent>5459</msgsent>
+            sub_dict['msg_sent'] = int(nei_root['msgsent'])
 
-                        # <bytesclusterlist>0</bytesclusterlist>
-                        entries_2 = \
-                            saf_root.find('{}bytesclusterlist'.format(namespace)).text
+            # <neighbortableversion>7</neighbortableversion>
+            sub_dict['tbl_ver'] = int(nei_root['neighbortableversion'])
 
-                        af_dict['clusterlist_entries'] = '[{0}/{1}]'.format(entries_1, entries_2)
-                    except Exception:
-                        pass
+            # <inq>0</inq>
+            sub_dict['inq'] = int(nei_root['inq'])
 
-                    # <dampening>Enabled</dampening>
-                    dampening = saf_root.find('{}dampening'.format(namespace)).text.lower()
-                    if 'enabled' in dampening or 'true' in dampening:
-                        af_dict['dampening'] = True
+            # <outq>0</outq>
+            sub_dict['outq'] = int(nei_root['outq'])
 
-                    # <historypaths>0</historypaths>
-                    try:
-                        af_dict['history_paths'] = int(saf_root.find('{}historypaths'.format(namespace)).text)
-                    except Exception:
-                        pass
+            # <neighboras>333</neighboras>
+            sub_dict['as'] = int(nei_root['neighboras'])
 
-                    # <dampenedpaths>0</dampenedpaths>
-                    try:
-                        af_dict['dampened_paths'] = int(saf_root.find('{}dampenedpaths'.format(namespace)).text)
-                    except Exception:
-                        pass
+            # <time>3d18h</time>
+            sub_dict['up_down'] = nei_root['time']
 
-                    # <softreconfigrecvdpaths>10</softreconfigrecvdpaths>
-                    try:
-                        af_dict['soft_reconfig_recvd_paths'] = int(
-                                saf_root.find('{}softreconfigrecvdpaths'.format(namespace)).text)
-                    except Exception:
-                        pass
-                        
-                    # <softreconfigidenticalpaths>10</softreconfigidenticalpaths>
-                    try:
-                        af_dict['soft_reconfig_identical_paths'] = int(
-                                saf_root.find('{}softreconfigidenticalpaths'.format(namespace)).text)
-                    except Exception:
-                        pass
+            # <state>Established</state>
+            state = nei_root['state'].lower()
 
-                    # <softreconfigcombopaths>0</softreconfigcombopaths>
-                    try:
-                        af_dict['soft_reconfig_combo_paths'] = int(
-                                saf_root.find('{}softreconfigcombopaths'.format(namespace)).text)
-                    except Exception:
-                        pass
+            # <prefixreceived>5</prefixreceived>
+            prefix_received = nei_root['prefixreceived']
 
-                    # <softreconfigfilteredrecvd>0</softreconfigfilteredrecvd>
-                    try:
-                        af_dict['soft_reconfig_filtered_recvd'] = int(
-                                saf_root.find('{}softreconfigfilteredrecvd'.format(namespace)).text)
-                    except Exception:
-                        pass
-                        
-                    # <softreconfigbytes>0</softreconfigbytes>
-                    try:
-                        af_dict['soft_reconfig_bytes'] = int(
-                                saf_root.find('{}softreconfigbytes'.format(namespace)).text)
-                    except Exception:
-                        pass
-                        
-                     # Neighbor table
-                    nei_tree = saf_root.find('{}TABLE_neighbor'.format(namespace))
-                    if not nei_tree:
-                        continue
-
-                    # -----   loop neighbors  -----
-                    for nei_root in nei_tree.findall('{}ROW_neighbor'.format(namespace)):
-                        # neighbor
-                        try:
-                            nei = nei_root.find('{}neighborid'.format(namespace)).text
-                        except Exception:
-                            continue
+            if 'established' in state:
+                sub_dict['state'] = state
+                sub_dict['prefix_received'] = prefix_received
+                sub_dict['state_pfxrcd'] = prefix_received
+            else:
+                sub_dict['state'] = state
+                sub_dict['state_pfxrcd'] = state
 
-                        if 'vrf' not in etree_dict:
-                            etree_dict['vrf'] = {}
-                        if vrf not in etree_dict['vrf']:
-                            etree_dict['vrf'][vrf] = {}
+        return etree_dict
 
-                        if 'neighbor' not in etree_dict['vrf'][vrf]:
-                            etree_dict['vrf'][vrf]['neighbor'] = {}
-                        if nei not in etree_dict['vrf'][vrf]['neighbor']:
-                            etree_dict['vrf'][vrf]['neighbor'][nei] = {}
+    @staticmethod
+    def _xml_af_dict(vrf_tree, saf_root):
+        '''return the address family name and the attributes shared by the
+           neighbors of a ROW_saf, (None, None) for an invalid entry'''
+        try:
+            af = saf_root['af-name'].lower()
+        except (KeyError, AttributeError):
+            return None, None
 
-                        if 'address_family' not in etree_dict['vrf'][vrf]['neighbor'][nei]:
-                            etree_dict['vrf'][vrf]['neighbor'][nei]['address_family'] = {}
+        # initial af dictionary
+        af_dict = {}
+        # <vrf-router-id>10.106.0.6</vrf-router-id>
+        if vrf_tree.get('vrf-router-id'):
+            af_dict['route_identifier'] = vrf_tree['vrf-router-id']
+        # <vrf-local-as>333</vrf-local-as>
+        if vrf_tree.get('vrf-local-as'):
+            af_dict['local_as'] = int(vrf_tree['vrf-local-as'])
+
+        # <tableversion>7</tableversion>
+        try:
+            af_dict['bgp_table_version'] = int(saf_root['tableversion'])
+        except (KeyError, TypeError, ValueError):
+            # for valide entry, table version should be there
+            return None, None
 
-                        if af not in etree_dict['vrf'][vrf]['neighbor'][nei]['address_family']:
-                            etree_dict['vrf'][vrf]['neighbor'][nei]['address_family'][af] = {}
-                    
-                        sub_dict = etree_dict['vrf'][vrf]['neighbor'][nei]['address_family'][af]
+        # <configuredpeers>3</configuredpeers>
+        af_dict['config_peers'] = int(saf_root['configuredpeers'])
 
-                        #  ---   AF attributes -------
-                        update_dict = deepcopy(af_dict)
-                        sub_dict.update(update_dict)
+        # <capablepeers>2</capablepeers>
+        af_dict['capable_peers'] = int(saf_root['capablepeers'])
 
-                        #  ---   Neighbors attributes -------
-                        # <neighborversion>4</neighborversion>
-                        sub_dict['neighbor_table_version'] = int(
-                            nei_root.find('{}neighborversion'.format(namespace)).text)
+        # <totalnetworks>5</totalnetworks>
+        try:
+            af_dict['prefixes'] = {
+                'total_entries': int(saf_root['totalnetworks'])}
+        except (KeyError, TypeError, ValueError):
+            pass
 
-                        # <msgrecvd>5471</msgrecvd>
-                        sub_dict['msg_rcvd'] = int(
-                            nei_root.find('{}msgrecvd'.format(namespace)).text)
-                        
-                        # <msgsent>5459</msgsent>
-                        sub_dict['msg_sent'] = int(
-                            nei_root.find('{}msgsent'.format(namespace)).text)
-                        
-                        # <neighbortableversion>7</neighbortableversion>
-                        sub_dict['tbl_ver'] = int(
-                            nei_root.find('{}neighbortableversion'.format(namespace)).text)
-                        
-                        # <inq>0</inq>
-                        sub_dict['inq'] = int(
-                            nei_root.find('{}inq'.format(namespace)).text)
-                        
-                        # <outq>0</outq>
-                        sub_dict['outq'] = int(
-                            nei_root.find('{}outq'.format(namespace)).text)
-                        
-                        # <neighboras>333</neighboras>
-                        sub_dict['as'] = int(
-                            nei_root.find('{}neighboras'.format(namespace)).text)
-                        
-                        # <time>3d18h</time>
-                        sub_dict['up_down'] = \
-                            nei_root.find('{}time'.format(namespace)).text
-                        
-                        # <state>Established</state>
-                        state = nei_root.find('{}state'.format(namespace)).text.lower()
+        # <totalpaths>10</totalpaths>
+        try:
+            af_dict['path'] = {'total_entries': int(saf_root['totalpaths'])}
+        except (KeyError, TypeError, ValueError):
+            pass
 
-                        # <prefixreceived>5</prefixreceived>
-                        prefix_received = \
-                            nei_root.find('{}prefixreceived'.format(namespace)).text
+        # <memoryused>1820</memoryused>
+        try:
+            memory_usage = int(saf_root['memoryused'])
+            af_dict['path']['memory_usage'] = memory_usage
+            af_dict['prefixes']['memory_usage'] = memory_usage
+        except (KeyError, TypeError, ValueError):
+            pass
+
+        # <numberattrs>1</numberattrs>     <bytesattrs>160</bytesattrs>
+        # <numberpaths>1</numberpaths>     <bytespaths>34</bytespaths>
+        # <numbercommunities>0</numbercommunities>
+        # <bytescommunities>0</bytescommunities>
+        # <numberclusterlist>0</numberclusterlist>
+        # <bytesclusterlist>0</bytesclusterlist>
+        for key, number, size in (
+                ('attribute_entries', 'numberattrs', 'bytesattrs'),
+                ('as_path_entries', 'numberpaths', 'bytespaths'),
+                ('community_entries', 'numbercommunities', 'bytescommunities'),
+                ('clusterlist_entries', 'numberclusterlist', 'bytesclusterlist')):
+            if number in saf_root and size in saf_root:
+                af_dict[key] = '[{0}/{1}]'.format(saf_root[number],
+                                                  saf_root[size])
+
+        # <dampening>Enabled</dampening>
+        dampening = saf_root['dampening'].lower()
+        if 'enabled' in dampening or 'true' in dampening:
+            af_dict['dampening'] = True
+
+        # <historypaths>0</historypaths>
+        # <dampenedpaths>0</dampenedpaths>
+        # <softreconfigrecvdpaths>10</softreconfigrecvdpaths>
+        # <softreconfigidenticalpaths>10</softreconfigidenticalpaths>
+        # <softreconfigcombopaths>0</softreconfigcombopaths>
+        # <softreconfigfilteredrecvd>0</softreconfigfilteredrecvd>
+        # <softreconfigbytes>0</softreconfigbytes>
+        for key, tag in (
+                ('history_paths', 'historypaths'),
+                ('dampened_paths', 'dampenedpaths'),
+                ('soft_reconfig_recvd_paths', 'softreconfigrecvdpaths'),
+                ('soft_reconfig_identical_paths', 'softreconfigidenticalpaths'),
+                ('soft_reconfig_combo_paths', 'softreconfigcombopaths'),
+                ('soft_reconfig_filtered_recvd', 'softreconfigfilteredrecvd'),
+                ('soft_reconfig_bytes', 'softreconfigbytes')):
+            try:
+                af_dict[key] = int(saf_root[tag])
+            except (KeyError, TypeError, ValueError):
+                pass
 
-                        if 'established' in state:
-                            sub_dict['state'] = state
-                            sub_dict['prefix_received'] = prefix_received
-                            sub_dict['state_pfxrcd'] = prefix_received
-                        else:
-                            sub_dict['state'] = state
-                            sub_dict['state_pfxrcd'] = state
-                
-        return etree_dict
+        return af, af_dict
 
 
 # ==================================================
@@ -10332,12 +10229,16 @@ class ShowBgpL2vpnEvpnRouteTypeSchema(MetaParser):
 # ====================================================
 #  Parser for show bgp l2vpn evpn route-type
 # ====================================================
-class ShowBgpL2vpnEvpnRouteType(ShowBgpL2vpnEvpnRouteTypeSchema):
+class ShowBgpL2vpnEvpnRouteType(ShowBgpL2vpnEvpnRouteTypeSchema,
+                                bgp_paths.SharedAttributes):
     """parser for:
         show bgp l2vpn evpn route-type <1>
         show bgp l2vpn evpn route-type <2>
         show bgp l2vpn evpn route-type <3>
-        show bgp l2vpn evpn route-type <4>"""
+        show bgp l2vpn evpn route-type <4>
+
+    parse_attributes() stores the extended communities of the paths once,
+    see bgp_paths."""
     cli_command = 'show bgp l2vpn evpn route-type {route_type}'
     exclude = [
       'prefixversion',
@@ -10508,7 +10409,8 @@ class ShowBgpL2vpnEvpnRouteType(ShowBgpL2vpnEvpnRouteTypeSchema):
             m = p12.match(line)
             if m:
                 group = m.groupdict()
-                path_dict.update({k: v.split( ) for k, v in group.items()})
+                path_dict['extcommunity'] = self._attribute(
+                    'ext_community', group['extcommunity'].split())
                 continue
 
             m = p13.match(line)
@@ -11560,11 +11462,15 @@ class ShowBgpIpMvpnSaadDetailSchema(MetaParser):
 # ===========================================================
 #  Parser for show bgp ipv4 mvpn sa-ad detail vrf <vrf>
 # ===========================================================
-class ShowBgpIpMvpnSaadDetail(ShowBgpIpMvpnSaadDetailSchema):
+class ShowBgpIpMvpnSaadDetail(ShowBgpIpMvpnSaadDetailSchema,
+                              bgp_paths.SharedAttributes):
     """parser for:
         show bgp ipv4 mvpn sa-ad detail
         show bgp ipv4 mvpn sa-ad detail vrf <vrf>
-        show bgp ipv4 mvpn sa-ad detail vrf all"""
+        show bgp ipv4 mvpn sa-ad detail vrf all
+
+    parse_attributes() stores the extended communities of the paths once,
+    see bgp_paths."""
     cli_command = ['show bgp ipv4 mvpn sa-ad detail vrf {vrf}','show bgp ipv4 mvpn sa-ad detail']
     exclude = [
       'prefixversion', 
@@ -11745,7 +11651,8 @@ class ShowBgpIpMvpnSaadDetail(ShowBgpIpMvpnSaadDetailSchema):
             m = p12.match(line)
             if m:
                 group = m.groupdict()
-                path_dict.update({k: sorted(v.split( )) for k, v in group.items()})
+                path_dict['extcommunity'] = self._attribute(
+                    'ext_community', sorted(group['extcommunity'].split()))
                 continue
 
             m = p13.match(line)
@@ -28,6 +28,7 @@ from genie.metaparser.util.schemaengine import Schema, \
                                          Default, \
                                          Use
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils import nxapi
 
 class ShowMacAddressTableBaseSchema(MetaParser):
     """Schema for:
@@ -127,6 +128,47 @@ class ShowMacAddressTableBase(ShowMacAddressTableBaseSchema):
                 
         return ret_dict
 
+    def json(self, out):
+
+        # initial return dictionary
+        ret_dict = {}
+
+        # {"TABLE_mac_address": {"ROW_mac_address": [{
+        #   "disp_mac_addr": "0000.01ff.9191", "disp_type": "* ",
+        #   "disp_vlan": "1001", "disp_is_static": "disabled",
+        #   "disp_age": "0", "disp_is_secure": "disabled",
+        #   "disp_is_ntfy": "disabled", "disp_port": "Ethernet1/11"}, ...]}}
+        for row in nxapi.rows(nxapi.loads(out), 'mac_address'):
+            vlan = str(row['disp_vlan'])
+            vlan_dict = ret_dict.setdefault('mac_table', {})\
+            .setdefault('vlans', {}).setdefault(vlan, {})
+            vlan_dict.update({'vlan': vlan})
+            mac_address = str(row['disp_mac_addr'])
+            mac_dict = vlan_dict.setdefault('mac_addresses', {})\
+            .setdefault(mac_address, {})
+            mac_dict.update({'mac_address': mac_address})
+            entry = str(row.get('disp_type', '')).strip()
+            if entry:
+                mac_dict.update({'entry': entry})
+            port = str(row.get('disp_port', '')).strip()
+            if port.lower() == 'drop':
+                intf_dict = mac_dict.setdefault('drop', {})
+                intf_dict.update({'drop': True})
+            else:
+                converted_port = Common.convert_intf_name(port)
+                intf_dict = mac_dict.setdefault('interfaces', {})\
+                .setdefault(converted_port, {})
+                intf_dict.update({'interface': converted_port})
+            intf_dict.update({'mac_type': 'static' if nxapi.flag(
+                row.get('disp_is_static')) else 'dynamic'})
+            intf_dict.update({'age': str(row['disp_age'])})
+            mac_dict.update({'secure': 'T' if nxapi.flag(
+                row.get('disp_is_secure')) else 'F'})
+            mac_dict.update({'ntfy': 'T' if nxapi.flag(
+                row.get('disp_is_ntfy')) else 'F'})
+
+        return ret_dict
+
 
 class ShowMacAddressTableVni(ShowMacAddressTableBase, ShowMacAddressTableBaseSchema):
     """Parser for:
@@ -171,27 +213,30 @@ class ShowMacAddressTable(ShowMacAddressTableBase, ShowMacAddressTableBaseSchema
         'show mac address-table address {address} interface {interface} vlan {vlan}'
     ]
 
+    def _command(self, address=None, interface=None, vlan=None):
+        if address and interface and vlan:
+            cmd = self.cli_command[7].format(address=address, interface=interface, vlan=vlan)
+        elif address and interface:
+            cmd = self.cli_command[6].format(address=address, interface=interface)
+        elif address and vlan:
+            cmd = self.cli_command[5].format(address=address, vlan=vlan)
+        elif address:
+            cmd = self.cli_command[4].format(address=address)
+        elif interface and vlan:
+            cmd = self.cli_command[3].format(interface=interface, vlan=vlan)
+        elif interface:
+            cmd = self.cli_command[2].format(interface=interface)
+        elif vlan:
+            cmd = self.cli_command[1].format(vlan=vlan)
+        else:
+            cmd = self.cli_command[0]
+        return cmd
+
     def cli(self, address=None, interface=None, vlan=None, output=None):
 
         if output is None:
-            if address and interface and vlan:
-                cmd = self.cli_command[7].format(address=address, interface=interface, vlan=vlan)
-            elif address and interface:
-                cmd = self.cli_command[6].format(address=address, interface=interface)
-            elif address and vlan:
-                cmd = self.cli_command[5].format(address=address, vlan=vlan)
-            elif address:
-                cmd = self.cli_command[4].format(address=address)
-            elif interface and vlan:
-                cmd = self.cli_command[3].format(interface=interface, vlan=vlan)
-            elif interface:
-                cmd = self.cli_command[2].format(interface=interface)
-            elif vlan:
-                cmd = self.cli_command[1].format(vlan=vlan)
-            else:
-                cmd = self.cli_command[0]
-
-            out = self.device.execute(cmd)
+            out = self.device.execute(self._command(
+                address=address, interface=interface, vlan=vlan))
         else:
             out = output
 
@@ -205,6 +250,19 @@ class ShowMacAddressTable(ShowMacAddressTableBase, ShowMacAddressTableBaseSchema
 
         return ret_dict
 
+    def json(self, address=None, interface=None, vlan=None, output=None):
+
+        if output is None:
+            out = self.device.execute(self._command(
+                address=address, interface=interface, vlan=vlan) + ' | json')
+        else:
+            out = output
+
+        # get return dictionary
+        ret_dict = super().json(out)
+
+        return ret_dict
+
 
 class ShowMacAddressTableAgingTimeSchema(MetaParser):
     """Schema for show mac address-table aging-time"""
@@ -24,6 +24,8 @@ from genie.metaparser.util.schemaengine import Schema, Any, Optional
                                          
 # import parser utils
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.lazy import LazyRecords
+from genie.libs.parser.utils import nxapi
 
 
 # ===========================
@@ -187,6 +189,106 @@ class ShowInterface(ShowInterfaceSchema):
       'in_crc_errors',
       'reliability']
 
+    # Interface header lines, also used to index the records in parse_lazy
+    # Ethernet2/1.10 is down (Administratively down)
+    # Vlan1 is down (Administratively down), line protocol is down, autostate enabled
+    # Vlan200 is down (VLAN/BD is down), line protocol is down, autostate enabled
+    # Vlan23 is administratively down (Administratively down), line protocol is down, autostate enabled
+    # Ethernet2/2 is up
+    # Ethernet1/10 is down (Link not connected)
+    # Ethernet1/1 is down (DCX-No ACK in 100 PDUs)
+    p1 = re.compile(r'^(?P<interface>\S+)\s*is\s*(?P<link_state>(down|up))?'
+                    r'(administratively\s+(?P<admin_1>(down|up)))?\s*'
+                    r'(\(Administratively\s*(?P<admin_2>(down|up))\))?'
+                    r'(\(VLAN\/BD\s+is+\s+(down|up)\))?'
+                    r'(,\s*line\s+protocol\s+is\s+(?P<line_protocol>\w+))?'
+                    r'(,\s+autostate\s+(?P<autostate>\S+))?'
+                    r'(\(Link\s+not\s+connected\))?'
+                    r'(\(SFP\s+not\s+inserted\))?'
+                    r'(\(suspended\(.*\)\))?'
+                    r'(\(\S+ErrDisabled\))?'
+                    r'(\(.*ACK.*\))?$')
+
+    # '| json' keys of ROW_interface -> (key, type) of the interface
+    json_leaves = {
+        'admin_state': ('admin_state', str),
+        'eth_hw_desc': ('types', str),
+        'eth_hw_addr': ('mac_address', str),
+        'eth_bia_addr': ('phys_address', str),
+        'desc': ('description', str),
+        'eth_mtu': ('mtu', int),
+        'eth_bw': ('bandwidth', int),
+        'eth_dly': ('delay', int),
+        'medium': ('medium', str),
+        'eth_mode': ('port_mode', str),
+        'eth_duplex': ('duplex_mode', str),
+        'eth_media': ('media_type', str),
+        'eth_beacon': ('beacon', str),
+        'eth_mdix': ('auto_mdix', str),
+        'eth_swt_monitor': ('switchport_monitor', str),
+        'eth_ethertype': ('ethertype', str),
+        'eth_eee_state': ('efficient_ethernet', str),
+        'eth_link_flapped': ('last_link_flapped', str),
+        'eth_reset_cntr': ('interface_reset', int),
+        'svi_line_proto': ('line_protocol', str),
+        'svi_mac': ('mac_address', str),
+        'svi_desc': ('description', str),
+        'svi_mtu': ('mtu', int),
+        'svi_bw': ('bandwidth', int),
+        'svi_delay': ('delay', int),
+    }
+
+    # '| json' keys of ROW_interface -> key of the counters
+    json_counters = {
+        'eth_inucast': 'in_unicast_pkts',
+        'eth_inmcast': 'in_multicast_pkts',
+        'eth_inbcast': 'in_broadcast_pkts',
+        'eth_inpkts': 'in_pkts',
+        'eth_inbytes': 'in_octets',
+        'eth_jumbo_inpkts': 'in_jumbo_packets',
+        'eth_storm_supp': 'in_storm_suppression_packets',
+        'eth_runts': 'in_runts',
+        'eth_giants': 'in_oversize_frame',
+        'eth_crc': 'in_crc_errors',
+        'eth_nobuf': 'in_no_buffer',
+        'eth_inerr': 'in_errors',
+        'eth_frame': 'in_short_frame',
+        'eth_overrun': 'in_overrun',
+        'eth_underrun': 'in_underrun',
+        'eth_ignored': 'in_ignored',
+        'eth_watchdog': 'in_watchdog',
+        'eth_bad_eth': 'in_bad_etype_drop',
+        'eth_bad_proto': 'in_unknown_protos',
+        'eth_in_ifdown_drops': 'in_if_down_drop',
+        'eth_dribble': 'in_with_dribble',
+        'eth_indiscard': 'in_discard',
+        'eth_inpause': 'in_mac_pause_frames',
+        'eth_outucast': 'out_unicast_pkts',
+        'eth_outmcast': 'out_multicast_pkts',
+        'eth_outbcast': 'out_broadcast_pkts',
+        'eth_outpkts': 'out_pkts',
+        'eth_outbytes': 'out_octets',
+        'eth_jumbo_outpkts': 'out_jumbo_packets',
+        'eth_outerr': 'out_errors',
+        'eth_coll': 'out_collision',
+        'eth_deferred': 'out_deferred',
+        'eth_latecoll': 'out_late_collision',
+        'eth_lostcarrier': 'out_lost_carrier',
+        'eth_nocarrier': 'out_no_carrier',
+        'eth_babbles': 'out_babble',
+        'eth_outdiscard': 'out_discard',
+        'eth_outpause': 'out_mac_pause_frames',
+    }
+
+    # '| json' keys of ROW_interface -> key of the counters rate
+    json_rates = {
+        'eth_load_interval1_rx': 'load_interval',
+        'eth_inrate1_bits': 'in_rate',
+        'eth_inrate1_pkts': 'in_rate_pkts',
+        'eth_outrate1_bits': 'out_rate',
+        'eth_outrate1_pkts': 'out_rate_pkts',
+    }
+
     def cli(self, interface="", output=None):
         if output is None:
             if interface:
@@ -197,24 +299,7 @@ class ShowInterface(ShowInterfaceSchema):
         else:
             out = output
 
-        # Ethernet2/1.10 is down (Administratively down)
-        # Vlan1 is down (Administratively down), line protocol is down, autostate enabled
-        # Vlan200 is down (VLAN/BD is down), line protocol is down, autostate enabled
-        # Vlan23 is administratively down (Administratively down), line protocol is down, autostate enabled
-        # Ethernet2/2 is up
-        # Ethernet1/10 is down (Link not connected)
-        # Ethernet1/1 is down (DCX-No ACK in 100 PDUs)
-        p1 = re.compile(r'^(?P<interface>\S+)\s*is\s*(?P<link_state>(down|up))?'
-                        r'(administratively\s+(?P<admin_1>(down|up)))?\s*'
-                        r'(\(Administratively\s*(?P<admin_2>(down|up))\))?'
-                        r'(\(VLAN\/BD\s+is+\s+(down|up)\))?'
-                        r'(,\s*line\s+protocol\s+is\s+(?P<line_protocol>\w+))?'
-                        r'(,\s+autostate\s+(?P<autostate>\S+))?'
-                        r'(\(Link\s+not\s+connected\))?'
-                        r'(\(SFP\s+not\s+inserted\))?'
-                        r'(\(suspended\(.*\)\))?'
-                        r'(\(\S+ErrDisabled\))?'
-                        r'(\(.*ACK.*\))?$')
+        p1 = self.p1
 
         # admin state is up
         # admin state is up,
@@ -1051,6 +1136,128 @@ class ShowInterface(ShowInterfaceSchema):
 
         return interface_dict
 
+    def json(self, interface="", output=None):
+        if output is None:
+            if interface:
+                cmd = self.cli_command[1].format(interface=interface)
+            else:
+                cmd = self.cli_command[0]
+            out = self.device.execute(cmd + ' | json')
+        else:
+            out = output
+
+        interface_dict = {}
+
+        # {"TABLE_interface": {"ROW_interface": [{"interface": "Ethernet1/1",
+        #   "state": "up", "admin_state": "up", "share_state": "Dedicated",
+        #   "eth_bundle": "302", "eth_hw_desc": "1000/10000 Ethernet",
+        #   "eth_mtu": "1500", "eth_reliability": "255", ...}, ...]}}
+        for row in nxapi.rows(nxapi.loads(out), 'interface'):
+            interface = row['interface']
+            intf_dict = interface_dict.setdefault(interface, {})
+            intf_dict['port_channel'] = {'port_channel_member': False}
+
+            state = row.get('state')
+            if state:
+                intf_dict['link_state'] = state
+                intf_dict['oper_status'] = state
+            admin_state = row.get('admin_state', row.get('svi_admin_state'))
+            intf_dict['enabled'] = admin_state == 'up'
+            if str(row.get('share_state', '')).lower() == 'dedicated':
+                intf_dict['dedicated_interface'] = True
+
+            for key, (name, kind) in self.json_leaves.items():
+                if key in row:
+                    intf_dict[name] = kind(row[key])
+            if 'line_protocol' in intf_dict and 'oper_status' not in intf_dict:
+                intf_dict['oper_status'] = intf_dict['line_protocol']
+
+            # reliability 255/255, txload 1/255, rxload 1/255
+            for key, name in (('eth_reliability', 'reliability'),
+                              ('eth_txload', 'txload'),
+                              ('eth_rxload', 'rxload')):
+                if key in row:
+                    intf_dict[name] = '{}/255'.format(row[key])
+
+            # Internet Address is 10.4.4.4/24
+            ip = row.get('eth_ip_addr', row.get('svi_ip_addr'))
+            prefix_length = row.get('eth_ip_mask', row.get('svi_ip_mask'))
+            if ip and prefix_length is not None:
+                address = '{}/{}'.format(ip, prefix_length)
+                intf_dict.setdefault('ipv4', {})[address] = {
+                    'ip': ip, 'prefix_length': str(prefix_length)}
+
+            if row.get('encapsulation'):
+                encapsulation = row['encapsulation'].lower()
+                intf_dict['encapsulations'] = {'encapsulation': encapsulation.\
+                    replace("802.1q virtual lan", "dot1q")}
+
+            # full-duplex, 1000 Mb/s
+            if row.get('eth_speed'):
+                intf_dict['port_speed'] = str(row['eth_speed']).split()[0]
+            if 'eth_autoneg' in row:
+                intf_dict['auto_negotiate'] = nxapi.flag(row['eth_autoneg'])
+            if 'eth_in_flowctrl' in row or 'eth_out_flowctrl' in row:
+                intf_dict['flow_control'] = {
+                    'receive': nxapi.flag(row.get('eth_in_flowctrl')),
+                    'send': nxapi.flag(row.get('eth_out_flowctrl'))}
+
+            # Belongs to Po302
+            if row.get('eth_bundle'):
+                intf_dict['port_channel']['port_channel_member'] = True
+                intf_dict['port_channel']['port_channel_int'] = \
+                    Common.convert_intf_name('Po{}'.format(row['eth_bundle']))
+            # Members in this channel: Eth1/15, Eth1/16
+            if row.get('eth_members'):
+                intf_dict['port_channel']['port_channel_member'] = True
+                intf_dict['port_channel']['port_channel_member_intfs'] = \
+                    [Common.convert_intf_name(item) for item in
+                     str(row['eth_members']).split(',')]
+
+            counters = {}
+            for key, name in self.json_counters.items():
+                if key in row:
+                    counters[name] = int(row[key])
+            rate = {name: int(row[key])
+                    for key, name in self.json_rates.items() if key in row}
+            if rate:
+                counters['rate'] = rate
+            if counters:
+                if 'eth_inucast' in row:
+                    counters['rx'] = True
+                if 'eth_outucast' in row:
+                    counters['tx'] = True
+                if row.get('eth_clear_counters'):
+                    counters['last_clear'] = row['eth_clear_counters']
+                intf_dict['counters'] = counters
+
+        return interface_dict
+
+    def parse_lazy(self, interface='', output=None):
+        '''Index the interface blocks of the output once and only parse
+           the block of an interface when it is accessed
+
+            Args:
+                interface (`str`): interface to execute the command for
+                output (`str`): output to parse instead of executing
+
+            Returns:
+                LazyRecords, read-only mapping of interface name to the
+                same record as parse() returns
+        '''
+        if output is None:
+            if interface:
+                cmd = self.cli_command[1].format(interface=interface)
+            else:
+                cmd = self.cli_command[0]
+            output = self.device.execute(cmd)
+
+        # Tabs are replaced before matching in cli
+        return LazyRecords(output=output.replace('\t', '    '),
+                           parse=lambda text: self.cli(output=text),
+                           headers=(self.p1,),
+                           validate=Schema(self.schema).validate)
+
 
 # ===================================
 # Schema for 'show interface vrf all'
@@ -12,6 +12,9 @@ import re
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
 
+# Parser Utils
+from genie.libs.parser.utils import log_tail
+
 
 # ==============================================
 # Schema for:
@@ -27,6 +30,7 @@ class ShowLoggingLogfileSchema(MetaParser):
 
     schema = {
         'logs': list,
+        Optional('entries'): list,
         }
 
 
@@ -45,16 +49,33 @@ class ShowLoggingLogfile(ShowLoggingLogfileSchema):
     cli_command = ['show logging logfile | include {include}',
                    'show logging logfile',
                    ]
-    exclude = ['logs']
-
-    def cli(self, include='', output=None):
+    exclude = ['logs', 'entries']
+
+    # 2019 May 22 16:20:45 ha01-n7010-01 %ACLLOG-5-ACLLOG_FLOW_INTERVAL: Src IP: 172.30.10.100, Dst IP: 10.135.15.2
+    p_entry = re.compile(r'^(?P<timestamp>\d{4} +[A-Z][a-z]{2} +\d+ +'
+                         r'\d+:\d+:\d+(?:\.\d+)?) +'
+                         r'(?:(?P<hostname>[^%\s]\S*) +)?'
+                         r'(?:%(?P<facility>[\w-]+?)-(?P<severity>\d)-'
+                         r'(?P<mnemonic>[\w-]+): +)?(?P<message>.*)$')
+
+    def cli(self, include='', output=None, incremental=False):
+        '''parse the logfile
+
+            Args:
+                include (`str`): filter passed to '| include'
+                output (`str`): output to parse instead of executing
+                incremental (`bool`): only return the log lines added since
+                                      the previous incremental poll of this
+                                      device, split into 'entries'
+        '''
+
+        # Build the command
+        if include:
+            cmd = self.cli_command[0].format(include=include)
+        else:
+            cmd = self.cli_command[1]
 
         if output is None:
-            # Build the command
-            if include:
-                cmd = self.cli_command[0].format(include=include)
-            else:
-                cmd = self.cli_command[1]
             # Execute the command
             out = self.device.execute(cmd)
         else:
@@ -70,7 +91,14 @@ class ShowLoggingLogfile(ShowLoggingLogfileSchema):
             # Add line to 'logs'
             if line and 'show logging logfile' not in line:
                 log_lines.append(line)
-                parsed_dict['logs'] = log_lines
-                continue
+
+        if incremental:
+            logs, entries = log_tail.tail(device=self.device, command=cmd,
+                                          lines=log_lines,
+                                          pattern=self.p_entry)
+            parsed_dict['logs'] = logs
+            parsed_dict['entries'] = entries
+        elif log_lines:
+            parsed_dict['logs'] = log_lines
 
         return parsed_dict
@@ -25,12 +25,12 @@ NXOS parsers for the following show commands:
 
 # Python
 import re
-from netaddr import IPNetwork
 
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils import ip
 
 
 # ======================================
@@ -2976,7 +2976,7 @@ class ShowIpOspfDatabaseDetailParser(MetaParser):
             m = p10.match(line)
             if m:
                 dummy = '{}/{}'.format('0.0.0.0', m.groupdict()['net_mask'])
-                db_dict['network_mask'] = str(IPNetwork(dummy).netmask)
+                db_dict['network_mask'] = ip.prefix(dummy)[1]
                 continue
 
             # Metric Type: 2 (Larger than any link state path)
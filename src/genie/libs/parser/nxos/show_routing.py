@@ -51,6 +51,8 @@ from genie.metaparser.util.schemaengine import Schema, Any, Optional, Or, And,\
                                          
 # import parser utils
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.select import select_command
+from genie.libs.parser.utils import nxapi
 
 # =================================
 # Parser for 'show routing vrf all'
@@ -952,6 +954,152 @@ class ShowIpRoute(ShowIpRouteSchema):
                     
         return result_dict
 
+    def json(self, route=None, protocol=None, vrf=None, interface=None, output=None):
+
+        if output is None:
+            # Same command variant as cli
+            cmd = select_command(self.cli_command, {}, route=route,
+                                 protocol=protocol, vrf=vrf,
+                                 interface=interface)
+            out = self.device.execute(cmd + ' | json')
+        else:
+            out = output
+
+        result_dict = {}
+
+        # {"TABLE_vrf": {"ROW_vrf": [{"vrf-name-out": "default",
+        #   "TABLE_addrf": {"ROW_addrf": {"addrf": "ipv4",
+        #    "TABLE_prefix": {"ROW_prefix": [{"ipprefix": "10.4.1.1/32",
+        #     "ucast-nhops": "2", "mcast-nhops": "0", "attached": "false",
+        #     "TABLE_path": {"ROW_path": [{"ipnexthop": "10.1.3.1",
+        #      "ifname": "Eth1/2", "uptime": "P1DT1H", "pref": "110",
+        #      "metric": "41", "clientname": "ospf-1", "type": "intra",
+        #      "ubest": "true"}, ...]}}, ...]}}}}, ...]}}
+        for vrf_row in nxapi.rows(nxapi.loads(out), 'vrf'):
+            vrf = vrf_row['vrf-name-out']
+            for af_row in nxapi.rows(vrf_row, 'addrf'):
+                af = af_row.get('addrf', 'ipv4')
+                routes_dict = result_dict.setdefault('vrf', {}).\
+                    setdefault(vrf, {}).setdefault('address_family', {}).\
+                    setdefault(af, {}).setdefault('routes', {})
+
+                for prefix_row in nxapi.rows(af_row, 'prefix'):
+                    route = prefix_row['ipprefix']
+                    route_dict = routes_dict.setdefault(route, {})
+                    route_dict.update({'route': route})
+                    route_dict.update({'active': True})
+
+                    if 'ucast-nhops' in prefix_row:
+                        route_dict.update({'ubest': int(prefix_row['ucast-nhops'])})
+                    if 'mcast-nhops' in prefix_row:
+                        route_dict.update({'mbest': int(prefix_row['mcast-nhops'])})
+                    if nxapi.flag(prefix_row.get('attached')):
+                        route_dict.update({'attached': True})
+
+                    for index, path_row in enumerate(
+                            nxapi.rows(prefix_row, 'path'), start=1):
+                        self._json_path(route_dict, index, path_row)
+
+        return result_dict
+
+    @staticmethod
+    def _json_path(route_dict, index, path_row):
+        '''add a ROW_path of the json output to a route'''
+        if nxapi.flag(path_row.get('ubest')):
+            cast = 'best_ucast_nexthop'
+        elif nxapi.flag(path_row.get('mbest')):
+            cast = 'best_mcast_nexthop'
+        else:
+            cast = None
+
+        rp = int(path_row['pref']) if 'pref' in path_row else None
+        metric = int(path_row['metric']) if 'metric' in path_row else None
+
+        source_protocol = process_id = ''
+        if path_row.get('clientname'):
+            source_protocol, _, process_id = \
+                str(path_row['clientname']).partition('-')
+        source_protocol_status = path_row.get('type', '')
+        interface = ''
+        if path_row.get('ifname'):
+            interface = Common.convert_intf_name(path_row['ifname'])
+        updated = str(path_row['uptime']) if 'uptime' in path_row else ''
+        next_hop = path_row.get('ipnexthop', '')
+
+        if nxapi.flag(path_row.get('hidden')):
+            route_dict.update({'hidden': True})
+
+        if cast:
+            if metric is not None:
+                route_dict.update({'metric': metric})
+            if rp is not None:
+                route_dict.update({'route_preference': rp})
+
+        if process_id:
+            route_dict.update({'process_id': process_id})
+
+        if path_row.get('tag'):
+            route_dict.update({'tag': int(path_row['tag'])})
+
+        next_hop_dict = route_dict.setdefault('next_hop', {})
+
+        if not next_hop:
+            interface_dict = next_hop_dict.setdefault('outgoing_interface', {}).setdefault(interface, {})
+
+            if interface:
+                interface_dict.update({'outgoing_interface': interface})
+
+            if updated:
+                interface_dict.update({'updated': updated})
+            return
+
+        index_dict = next_hop_dict.setdefault('next_hop_list', {}).setdefault(index, {})
+        index_dict.update({'index': index})
+        index_dict.update({'next_hop': next_hop})
+        if source_protocol:
+            route_dict.update({'source_protocol': source_protocol})
+            index_dict.update({'source_protocol': source_protocol})
+
+        if source_protocol_status:
+            route_dict.update({'source_protocol_status': source_protocol_status})
+            index_dict.update({'source_protocol_status': source_protocol_status})
+
+        if cast:
+            index_dict.update({cast: True})
+
+        if updated:
+            index_dict.update({'updated': updated})
+
+        if interface:
+            index_dict.update({'outgoing_interface': interface})
+
+        if path_row.get('nhvrfname'):
+            index_dict.update({'next_hop_vrf': path_row['nhvrfname']})
+
+        if metric is not None:
+            index_dict['metric'] = metric
+
+        if rp is not None:
+            index_dict['route_preference'] = rp
+
+        if path_row.get('segid'):
+            index_dict['segid'] = int(path_row['segid'])
+
+        if path_row.get('tunnelid'):
+            index_dict['tunnelid'] = path_row['tunnelid']
+
+        if path_row.get('encap'):
+            index_dict['encap'] = path_row['encap'].lower()
+
+        if nxapi.flag(path_row.get('mpls-vpn')):
+            index_dict['mpls_vpn'] = True
+        elif nxapi.flag(path_row.get('mpls')):
+            index_dict['mpls'] = True
+        elif nxapi.flag(path_row.get('evpn')):
+            index_dict['evpn'] = True
+        elif nxapi.flag(path_row.get('stale')):
+            index_dict['stale'] = True
+
 
 # ====================================================
 #  parser for:
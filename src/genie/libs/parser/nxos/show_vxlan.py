@@ -27,6 +27,8 @@ from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
 
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils import nxapi
+from genie.libs.parser.utils.spec import Spec, Rule, Set
 
 
 class ShowL2routeEvpnImetAllDetailSchema(MetaParser):
@@ -136,9 +138,27 @@ class ShowNvePeers(ShowNvePeersSchema):
        show nve peers"""
 
     cli_command = 'show nve peers'
+    json_command = 'show nve peers | json'
     exclude = [
         'uptime']
 
+    # Interface Peer-IP          State LearnType Uptime   Router-Mac
+    # nve1      192.168.16.1      Up    CP        01:15:09 n/a
+    # nve1      192.168.106.1        Up    CP        00:03:05 5e00.00ff.0209
+    # nve1      2001:db8:646:a2bb:0:abcd:1234:3                  Up    CP        21:47:20 5254.00ff.3162
+    # nve1      2001:db8:646:a2bb:0:abcd:1234:5                  Up    CP        21:47:20 5254.00ff.3a82
+    p1 = (r'^\s*(?P<nve_name>[\w\/]+) +(?P<peer_ip>[\w\.\:]+) +(?P<peer_state>[\w]+)'
+          r' +(?P<learn_type>[\w]+) +(?P<uptime>[\w\:]+) +(?P<router_mac>[\w\.\/]+)$')
+
+    spec = Spec(
+        Rule(p1,
+             Set(('{nve_name}',), {'nve_name': 'nve_name'}),
+             Set(('{nve_name}', 'peer_ip', '{peer_ip}'),
+                 {'learn_type': 'learn_type',
+                  'uptime': 'uptime',
+                  'router_mac': 'router_mac',
+                  'peer_state': ('peer_state', str.lower)})))
+
     def cli(self, output=None):
         # excute command to get output
         if output is None:
@@ -146,38 +166,30 @@ class ShowNvePeers(ShowNvePeersSchema):
         else:
             out = output
 
-        result_dict = {}
-        # Interface Peer-IP          State LearnType Uptime   Router-Mac
-        # nve1      192.168.16.1      Up    CP        01:15:09 n/a
-        # nve1      192.168.106.1        Up    CP        00:03:05 5e00.00ff.0209
-        # nve1      2001:db8:646:a2bb:0:abcd:1234:3                  Up    CP        21:47:20 5254.00ff.3162   
-        # nve1      2001:db8:646:a2bb:0:abcd:1234:5                  Up    CP        21:47:20 5254.00ff.3a82   
-
-        p1 = re.compile(r'^\s*(?P<nve_name>[\w\/]+) +(?P<peer_ip>[\w\.\:]+) +(?P<peer_state>[\w]+)'
-                        ' +(?P<learn_type>[\w]+) +(?P<uptime>[\w\:]+) +(?P<router_mac>[\w\.\/]+)$')
+        return self.spec.parse(out)
 
-        for line in out.splitlines():
-            if line:
-                line = line.rstrip()
-            else:
-                continue
-
-            m = p1.match(line)
-            if m:
-                group = m.groupdict()
-                nve_name = group.pop('nve_name')
-                peer_ip = group.pop('peer_ip')
-                nve_dict = result_dict.setdefault(nve_name,{})
-                nve_dict.update({'nve_name': nve_name})
-
-                peer_dict = nve_dict.setdefault('peer_ip',{}).setdefault(peer_ip,{})
-
-                peer_dict.update({'learn_type': group.pop('learn_type')})
-                peer_dict.update({'uptime': group.pop('uptime')})
-                peer_dict.update({'router_mac': group.pop('router_mac')})
-                peer_dict.update({'peer_state': group.pop('peer_state').lower()})
+    def json(self, output=None):
+        if output is None:
+            out = self.device.execute(self.json_command)
+        else:
+            out = output
 
-                continue
+        result_dict = {}
+        # {"TABLE_nve_peers": {"ROW_nve_peers": [{"if-name": "nve1",
+        #   "peer-ip": "192.168.16.1", "peer-state": "Up", "learn-type": "CP",
+        #   "uptime": "01:15:09", "router-mac": "n/a"}, ...]}}
+        for row in nxapi.rows(nxapi.loads(out), 'nve_peers'):
+            nve_name = row['if-name']
+            nve_dict = result_dict.setdefault(nve_name, {})
+            nve_dict.update({'nve_name': nve_name})
+
+            peer_dict = nve_dict.setdefault('peer_ip', {}).\
+                setdefault(row['peer-ip'], {})
+
+            peer_dict.update({'learn_type': row['learn-type']})
+            peer_dict.update({'uptime': str(row['uptime'])})
+            peer_dict.update({'router_mac': row['router-mac']})
+            peer_dict.update({'peer_state': row['peer-state'].lower()})
 
         return result_dict
 
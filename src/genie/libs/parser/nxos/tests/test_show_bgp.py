@@ -1,7 +1,8 @@
 
 # Python
+import json
 import unittest
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 import xml.etree.ElementTree as ET
 
 # ATS
@@ -43,6 +44,9 @@ from genie.libs.parser.nxos.show_bgp import ShowBgpProcessVrfAll,\
                                  ShowBgpL2vpnEvpnNeighborsAdvertisedRoutes, \
                                  ShowBgpVrfIpv4Unicast
 
+# parser utils
+from genie.libs.parser.utils import nxapi
+
 # =========================================
 #  Unit test for 'show bgp process vrf all'
 # =========================================
@@ -8970,6 +8974,28 @@ BGP neighbor is 10.186.0.4, remote AS 1, ibgp link, fabric-internal, Peer index
         parsed_output = obj.parse(vrf='default')
         self.assertEqual(parsed_output,self.golden_parsed_output4)
 
+    def test_show_bgp_vrf_all_all_neighbors_select(self):
+        self.maxDiff = None
+        # Device output of the narrower command: the 10.186.0.3 block only
+        output = self.golden_output4['execute.return_value']
+        blocks = output.split('BGP neighbor is ')
+        self.device = Mock(**{'execute.return_value':
+                              'BGP neighbor is ' + blocks[1]})
+        obj = ShowBgpVrfAllNeighbors(device=self.device)
+        parsed_output = obj.parse(select={'neighbor': '10.186.0.3'})
+        self.device.execute.assert_called_once_with(
+            'show bgp vrf all all neighbors 10.186.0.3')
+        self.assertEqual(parsed_output, {'neighbor': {
+            '10.186.0.3': self.golden_parsed_output4['neighbor'][
+                '10.186.0.3']}})
+
+    def test_show_bgp_vrf_all_all_neighbors_select_conflict(self):
+        self.device = Mock(**self.golden_output4)
+        obj = ShowBgpVrfAllNeighbors(device=self.device)
+        with self.assertRaises(ValueError):
+            obj.parse(vrf='default', select={'vrf': 'VRF1'})
+        self.assertFalse(self.device.execute.called)
+
     def test_show_bgp_vrf_default_all_neighbors_empty(self):
         self.device = Mock(**self.empty_output)
         obj = ShowBgpVrfAllNeighbors(device=self.device)
@@ -13445,6 +13471,29 @@ class test_show_bgp_vrf_all_all_summary(unittest.TestCase):
         parsed_output = obj.parse()
         self.assertEqual(parsed_output,self.golden_parsed_output3)
 
+    def test_show_bgp_vrf_all_all_summary_select(self):
+        self.maxDiff = None
+        # Device output of the narrower command: the vpn1 blocks only
+        output = self.golden_output3['execute.return_value']
+        blocks = output.split('BGP summary information for ')
+        vrf_output = ''.join('BGP summary information for ' + block
+                             for block in blocks[1:]
+                             if block.startswith('VRF vpn1,'))
+        self.device = Mock(**{'execute.return_value': vrf_output})
+        obj = ShowBgpVrfAllAllSummary(device=self.device)
+        parsed_output = obj.parse(select={'vrf': 'vpn1'})
+        self.device.execute.assert_called_once_with(
+            'show bgp vrf vpn1 all summary')
+        self.assertEqual(parsed_output, {'vrf': {
+            'vpn1': self.golden_parsed_output3['vrf']['vpn1']}})
+
+    def test_show_bgp_vrf_all_all_summary_select_unsupported(self):
+        self.device = Mock(**self.golden_output3)
+        obj = ShowBgpVrfAllAllSummary(device=self.device)
+        with self.assertRaises(ValueError):
+            obj.parse(select={'neighbor': '10.106.103.1'})
+        self.assertFalse(self.device.execute.called)
+
     def test_show_bgp_vrf_all_all_summary_empty(self):
         self.device = Mock(**self.empty_output)
         obj = ShowBgpVrfAllAllSummary(device=self.device)
@@ -13750,6 +13799,192 @@ class test_show_bgp_vrf_all_all_summary_xml(unittest.TestCase):
         parsed_output = obj.parse(vrf='all')
         self.assertEqual(parsed_output,self.golden_parsed_output)
 
+    def test_golden_xml_small_chunks(self):
+        self.maxDiff = None
+        # Rows of the earlier chunks are released while later ones are
+        # read, a new ROW_saf must not be taken for a released one
+        output = self.golden_output['execute.return_value']
+        start = output.index('<ROW_vrf>')
+        end = output.index('</ROW_vrf>') + len('</ROW_vrf>')
+        vrfs = ['VRF{}'.format(index) for index in range(8)]
+        output = output[:start] + ''.join(
+            output[start:end].replace('<vrf-name-out>default<',
+                                      '<vrf-name-out>{}<'.format(vrf))
+            for vrf in vrfs) + output[end:]
+        self.device = Mock(**{'execute.return_value': output})
+        obj = ShowBgpVrfAllAllSummary(device=self.device, context='xml')
+        with patch('genie.libs.parser.utils.xml_stream.CHUNK_SIZE', 16):
+            parsed_output = obj.parse(vrf='all')
+        self.assertEqual(parsed_output, {'vrf': {
+            vrf: self.golden_parsed_output['vrf']['default']
+            for vrf in vrfs}})
+
+
+class test_show_bgp_vrf_all_all_summary_json(unittest.TestCase):
+
+    '''Unit test for show bgp vrf <WORD> all summary - JSON'''
+
+    device = Device(name='aDevice')
+    golden_parsed_output = test_show_bgp_vrf_all_all_summary_xml.golden_parsed_output
+
+    golden_output = {'execute.return_value': '''
+    {
+      "TABLE_vrf": {
+        "ROW_vrf": {
+          "vrf-name-out": "default",
+          "vrf-router-id": "10.1.1.1",
+          "vrf-local-as": "100",
+          "TABLE_af": {
+            "ROW_af": [
+              {
+                "af-id": "1",
+                "TABLE_saf": {
+                  "ROW_saf": {
+                    "safi": "1",
+                    "af-name": "IPv4 Unicast",
+                    "tableversion": "69",
+                    "configuredpeers": "2",
+                    "capablepeers": "2",
+                    "totalnetworks": "12",
+                    "totalpaths": "12",
+                    "memoryused": "2832",
+                    "numberattrs": "4",
+                    "bytesattrs": "640",
+                    "numberpaths": "2",
+                    "bytespaths": "16",
+                    "numbercommunities": "0",
+                    "bytescommunities": "0",
+                    "numberclusterlist": "0",
+                    "bytesclusterlist": "0",
+                    "dampening": "true",
+                    "historypaths": "0",
+                    "dampenedpaths": "0",
+                    "TABLE_neighbor": {
+                      "ROW_neighbor": [
+                        {
+                          "neighborid": "10.51.1.101",
+                          "neighborversion": "4",
+                          "msgrecvd": "6822",
+                          "msgsent": "4549",
+                          "neighbortableversion": "69",
+                          "inq": "0",
+                          "outq": "0",
+                          "neighboras": "300",
+                          "time": "P1DT13H53M14S",
+                          "state": "Established",
+                          "prefixreceived": "5"
+                        },
+                        {
+                          "neighborid": "192.168.4.1",
+                          "neighborversion": "4",
+                          "msgrecvd": "6829",
+                          "msgsent": "13639",
+                          "neighbortableversion": "69",
+                          "inq": "0",
+                          "outq": "0",
+                          "neighboras": "100",
+                          "time": "PT22H20M50S",
+                          "state": "Established",
+                          "prefixreceived": "5"
+                        }
+                      ]
+                    }
+                  }
+                }
+              },
+              {
+                "af-id": "2",
+                "TABLE_saf": {
+                  "ROW_saf": {
+                    "safi": "1",
+                    "af-name": "IPv6 Unicast",
+                    "tableversion": 34,
+                    "configuredpeers": 2,
+                    "capablepeers": 2,
+                    "totalnetworks": 10,
+                    "totalpaths": 10,
+                    "memoryused": 2480,
+                    "numberattrs": 2,
+                    "bytesattrs": 320,
+                    "numberpaths": 2,
+                    "bytespaths": 16,
+                    "numbercommunities": 0,
+                    "bytescommunities": 0,
+                    "numberclusterlist": 0,
+                    "bytesclusterlist": 0,
+                    "dampening": "false",
+                    "TABLE_neighbor": {
+                      "ROW_neighbor": [
+                        {
+                          "neighborid": "2001:db8:1900:1::1:101",
+                          "neighborversion": 4,
+                          "msgrecvd": 4549,
+                          "msgsent": 4549,
+                          "neighbortableversion": 34,
+                          "inq": 0,
+                          "outq": 0,
+                          "neighboras": 300,
+                          "time": "P1DT13H53M16S",
+                          "state": "Established",
+                          "prefixreceived": 5
+                        },
+                        {
+                          "neighborid": "2001:db8:4:1::1:1",
+                          "neighborversion": 4,
+                          "msgrecvd": 6826,
+                          "msgsent": 2733,
+                          "neighbortableversion": 34,
+                          "inq": 0,
+                          "outq": 0,
+                          "neighboras": 100,
+                          "time": "P1DT13H53M53S",
+                          "state": "Established",
+                          "prefixreceived": 5
+                        }
+                      ]
+                    }
+                  }
+                }
+              }
+            ]
+          }
+        }
+      }
+    }
+    ]]>]]>
+    '''}
+
+    def test_golden_json(self):
+        self.maxDiff = None
+        self.device = Mock(**self.golden_output)
+        obj = ShowBgpVrfAllAllSummary(device=self.device, context='json')
+        parsed_output = obj.parse(vrf='all')
+        self.assertEqual(parsed_output,self.golden_parsed_output)
+        self.device.execute.assert_called_once_with(
+            'show bgp vrf all all summary | json')
+
+    def test_golden_json_output(self):
+        self.maxDiff = None
+        obj = ShowBgpVrfAllAllSummary(device=self.device, context='json')
+        parsed_output = obj.parse(
+            output=self.golden_output['execute.return_value'])
+        self.assertEqual(parsed_output,self.golden_parsed_output)
+
+    def test_golden_json_many_vrfs(self):
+        self.maxDiff = None
+        # Rows of a vrf are released once the next one is read, a new
+        # ROW_saf must not be taken for a released one
+        data = nxapi.loads(self.golden_output['execute.return_value'])
+        row = data['TABLE_vrf']['ROW_vrf']
+        vrfs = ['VRF{}'.format(index) for index in range(8)]
+        data['TABLE_vrf']['ROW_vrf'] = [dict(row, **{'vrf-name-out': vrf})
+                                        for vrf in vrfs]
+        obj = ShowBgpVrfAllAllSummary(device=self.device, context='json')
+        parsed_output = obj.parse(output=json.dumps(data))
+        self.assertEqual(parsed_output, {'vrf': {
+            vrf: self.golden_parsed_output['vrf']['default']
+            for vrf in vrfs}})
+
 
 # ==================================================================
 #  Unit test for 'show bgp process vrf all all dampening parameters'
@@ -1022,6 +1022,119 @@ class test_show_mac_address_table(unittest.TestCase):
         parsed_output = obj.parse()
         self.assertEqual(parsed_output, self.golden_parsed_output_2)
 
+    golden_output_json = {'execute.return_value': '''
+    {
+      "TABLE_mac_address": {
+        "ROW_mac_address": [
+          {
+            "disp_mac_addr": "aaaa.bbff.8888",
+            "disp_type": "* ",
+            "disp_vlan": "10",
+            "disp_is_static": "enabled",
+            "disp_age": "-",
+            "disp_is_secure": "disabled",
+            "disp_is_ntfy": "disabled",
+            "disp_port": "Ethernet1/2"
+          },
+          {
+            "disp_mac_addr": "aaaa.bbff.8888",
+            "disp_type": "* ",
+            "disp_vlan": "20",
+            "disp_is_static": "enabled",
+            "disp_age": "-",
+            "disp_is_secure": "disabled",
+            "disp_is_ntfy": "disabled",
+            "disp_port": "Drop"
+          },
+          {
+            "disp_mac_addr": "000f.53ff.e5a5",
+            "disp_type": "* ",
+            "disp_vlan": "390",
+            "disp_is_static": "disabled",
+            "disp_age": "0",
+            "disp_is_secure": "disabled",
+            "disp_is_ntfy": "disabled",
+            "disp_port": "Po113"
+          }
+        ]
+      }
+    }
+    '''}
+
+    golden_parsed_output_json = {
+        'mac_table': {
+            'vlans': {
+                '10': {
+                    'mac_addresses': {
+                        'aaaa.bbff.8888': {
+                            'entry': '*',
+                            'interfaces': {
+                                'Ethernet1/2': {
+                                    'age': '-',
+                                    'interface': 'Ethernet1/2',
+                                    'mac_type': 'static',
+                                },
+                            },
+                            'mac_address': 'aaaa.bbff.8888',
+                            'ntfy': 'F',
+                            'secure': 'F',
+                        },
+                    },
+                    'vlan': '10',
+                },
+                '20': {
+                    'mac_addresses': {
+                        'aaaa.bbff.8888': {
+                            'drop': {
+                                'age': '-',
+                                'drop': True,
+                                'mac_type': 'static',
+                            },
+                            'entry': '*',
+                            'mac_address': 'aaaa.bbff.8888',
+                            'ntfy': 'F',
+                            'secure': 'F',
+                        },
+                    },
+                    'vlan': '20',
+                },
+                '390': {
+                    'mac_addresses': {
+                        '000f.53ff.e5a5': {
+                            'entry': '*',
+                            'interfaces': {
+                                'Port-channel113': {
+                                    'age': '0',
+                                    'interface': 'Port-channel113',
+                                    'mac_type': 'dynamic',
+                                },
+                            },
+                            'mac_address': '000f.53ff.e5a5',
+                            'ntfy': 'F',
+                            'secure': 'F',
+                        },
+                    },
+                    'vlan': '390',
+                },
+            },
+        },
+    }
+
+    def test_golden_json(self):
+        self.maxDiff = None
+        self.device = Mock(**self.golden_output_json)
+        obj = ShowMacAddressTable(device=self.device, context='json')
+        parsed_output = obj.parse()
+        self.assertEqual(parsed_output, self.golden_parsed_output_json)
+        self.device.execute.assert_called_once_with(
+            'show mac address-table | json')
+
+    def test_empty_json(self):
+        self.device = Mock(**self.empty_output)
+        obj = ShowMacAddressTable(device=self.device, context='json')
+        with self.assertRaises(SchemaEmptyParserError):
+            parsed_output = obj.parse()
+
 
 class test_show_mac_address_table_limit(unittest.TestCase):
     device = Device(name='aDevice')
@@ -1253,6 +1253,124 @@ class TestShowInterface(unittest.TestCase):
         self.maxDiff = None
         self.assertEqual(parsed_output, self.golden_parsed_output_5)
 
+    def test_golden_lazy(self):
+        self.maxDiff = None
+        for output, expected in [
+                (self.golden_output1, self.golden_parsed_output1),
+                (self.golden_output2, self.golden_parsed_output2),
+                (self.golden_output3, self.golden_parsed_output3),
+                (self.golden_output_4, self.golden_parsed_output_4),
+                (self.golden_output_5, self.golden_parsed_output_5)]:
+            self.device = Mock(**output)
+            interface_obj = ShowInterface(device=self.device)
+            parsed_output = interface_obj.parse_lazy()
+            name = list(expected)[0]
+            self.assertEqual(parsed_output[name], expected[name])
+            self.assertEqual(parsed_output.parsed(), [name])
+            self.assertEqual(dict(parsed_output), expected)
+
+    golden_output_json = {'execute.return_value': '''
+    {
+      "TABLE_interface": {
+        "ROW_interface": {
+          "interface": "Ethernet1/1",
+          "state": "up",
+          "admin_state": "up",
+          "share_state": "Dedicated",
+          "eth_bundle": "302",
+          "eth_hw_desc": "1000/10000 Ethernet",
+          "eth_hw_addr": "80e0.1dff.6bb6",
+          "eth_bia_addr": "80e0.1dff.6bb6",
+          "desc": "<< GENIE GIG 0/0/1 >>",
+          "eth_mtu": "1500",
+          "eth_bw": 1000000,
+          "eth_dly": 10,
+          "eth_reliability": "255",
+          "eth_txload": "1",
+          "eth_rxload": "4",
+          "encapsulation": "ARPA",
+          "medium": "broadcast",
+          "eth_mode": "access",
+          "eth_duplex": "full",
+          "eth_speed": "1000 Mb/s",
+          "eth_media": "1G",
+          "eth_beacon": "off",
+          "eth_autoneg": "on",
+          "eth_in_flowctrl": "off",
+          "eth_out_flowctrl": "off",
+          "eth_mdix": "off",
+          "eth_ratemode": "dedicated",
+          "eth_swt_monitor": "off",
+          "eth_ethertype": "0x8100",
+          "eth_eee_state": "n/a",
+          "eth_link_flapped": "3d22h",
+          "eth_clear_counters": "never",
+          "eth_reset_cntr": 9,
+          "eth_load_interval1_rx": 30,
+          "eth_inrate1_bits": "17542088",
+          "eth_inrate1_pkts": "1904",
+          "eth_load_interval1_tx": "30",
+          "eth_outrate1_bits": "1575520",
+          "eth_outrate1_pkts": "477",
+          "eth_inucast": 525266408025,
+          "eth_inmcast": 128283847,
+          "eth_inbcast": 14,
+          "eth_inpkts": 525394691886,
+          "eth_inbytes": 157262428316065,
+          "eth_jumbo_inpkts": "0",
+          "eth_storm_supp": "0",
+          "eth_runts": 0,
+          "eth_giants": 0,
+          "eth_crc": "0",
+          "eth_nobuf": 0,
+          "eth_inerr": "0",
+          "eth_frame": "0",
+          "eth_overrun": "0",
+          "eth_underrun": "0",
+          "eth_ignored": "0",
+          "eth_watchdog": "0",
+          "eth_bad_eth": "0",
+          "eth_bad_proto": "0",
+          "eth_in_ifdown_drops": "0",
+          "eth_dribble": "0",
+          "eth_indiscard": "0",
+          "eth_inpause": "0",
+          "eth_outucast": 568365811507,
+          "eth_outmcast": 103573671,
+          "eth_outbcast": 10009,
+          "eth_outpkts": 568469395187,
+          "eth_outbytes": 604413238507323,
+          "eth_jumbo_outpkts": "0",
+          "eth_outerr": "0",
+          "eth_coll": "0",
+          "eth_deferred": "0",
+          "eth_latecoll": "0",
+          "eth_lostcarrier": "0",
+          "eth_nocarrier": "0",
+          "eth_babbles": "0",
+          "eth_outdiscard": "1535",
+          "eth_outpause": "0"
+        }
+      }
+    }
+    '''}
+
+    def test_golden_json(self):
+        self.maxDiff = None
+        self.device = Mock(**self.golden_output_json)
+        interface_obj = ShowInterface(device=self.device, context='json')
+        parsed_output = interface_obj.parse(interface='Ethernet1/1')
+        self.assertEqual(parsed_output, {
+            'Ethernet1/1': self.golden_parsed_output_4['Ethernet1/1']})
+        self.device.execute.assert_called_once_with(
+            'show interface Ethernet1/1 | json')
+
+    def test_empty_json(self):
+        self.device1 = Mock(**self.empty_output)
+        interface_obj = ShowInterface(device=self.device1, context='json')
+        with self.assertRaises(SchemaEmptyParserError):
+            parsed_output = interface_obj.parse()
+
 # #############################################################################
 # # Unittest For Show Ip Interface Vrf All
 # #############################################################################
@@ -11,6 +11,7 @@ from genie.metaparser.util.exceptions import SchemaEmptyParserError
 
 # Parser
 from genie.libs.parser.nxos.show_logging import ShowLoggingLogfile
+from genie.libs.parser.utils import log_tail
 
 
 # ==============================================
@@ -54,6 +55,44 @@ class test_show_logging(unittest.TestCase):
         parsed_output = obj.parse(include='acl')
         self.assertEqual(parsed_output, self.golden_parsed_output_1)
 
+    golden_output_2 = {'execute.return_value': '''
+        show logging logfile
+        2019 May 22 16:20:45 ha01-n7010-01 %ACLLOG-5-ACLLOG_FLOW_INTERVAL: Src IP: 172.30.10.100, Hit-count: 600
+        '''}
+
+    golden_output_3 = {'execute.return_value': '''
+        show logging logfile
+        2019 May 22 16:20:45 ha01-n7010-01 %ACLLOG-5-ACLLOG_FLOW_INTERVAL: Src IP: 172.30.10.100, Hit-count: 600
+        2019 May 22 16:20:50 ha01-n7010-01 %ACLLOG-5-ACLLOG_FLOW_INTERVAL: Src IP: 172.30.10.100, Hit-count: 500
+        '''}
+
+    golden_parsed_output_3 = {
+        'logs': [
+            '2019 May 22 16:20:50 ha01-n7010-01 %ACLLOG-5-ACLLOG_FLOW_INTERVAL: Src IP: 172.30.10.100, Hit-count: 500',
+            ],
+        'entries': [
+            {'timestamp': '2019 May 22 16:20:50',
+             'hostname': 'ha01-n7010-01',
+             'facility': 'ACLLOG',
+             'severity': 5,
+             'mnemonic': 'ACLLOG_FLOW_INTERVAL',
+             'message': 'Src IP: 172.30.10.100, Hit-count: 500'},
+            ],
+        }
+
+    def test_show_logging_incremental(self):
+        self.maxDiff = None
+        log_tail.reset()
+        self.device = Mock(**self.golden_output_2)
+        obj = ShowLoggingLogfile(device=self.device)
+        parsed_output = obj.parse(incremental=True)
+        self.assertEqual(len(parsed_output['logs']), 1)
+
+        self.device.execute.return_value = \
+            self.golden_output_3['execute.return_value']
+        parsed_output = obj.parse(incremental=True)
+        self.assertEqual(parsed_output, self.golden_parsed_output_3)
+
 
 if __name__ == '__main__':
     unittest.main()
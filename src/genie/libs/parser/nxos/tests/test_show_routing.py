@@ -3252,6 +3252,77 @@ class test_show_ip_route(unittest.TestCase):
         parsed_output = obj.parse()
         self.assertEqual(parsed_output, self.golden_parsed_output_00)
 
+    golden_output_json = {'execute.return_value': '''
+    {
+      "TABLE_vrf": {
+        "ROW_vrf": {
+          "vrf-name-out": "default",
+          "TABLE_addrf": {
+            "ROW_addrf": {
+              "addrf": "ipv4",
+              "TABLE_prefix": {
+                "ROW_prefix": {
+                  "ipprefix": "10.12.120.0/24",
+                  "ucast-nhops": "2",
+                  "mcast-nhops": "0",
+                  "attached": "false",
+                  "TABLE_path": {
+                    "ROW_path": [
+                      {
+                        "ipnexthop": "10.13.120.1",
+                        "ifname": "Eth1/2.120",
+                        "uptime": "2w0d",
+                        "pref": "120",
+                        "metric": "2",
+                        "clientname": "rip-1",
+                        "type": "rip",
+                        "ubest": "true"
+                      },
+                      {
+                        "ipnexthop": "10.23.120.2",
+                        "ifname": "Eth1/1.120",
+                        "uptime": "2w0d",
+                        "pref": "120",
+                        "metric": "2",
+                        "clientname": "rip-1",
+                        "type": "rip",
+                        "ubest": "true"
+                      }
+                    ]
+                  }
+                }
+              }
+            }
+          }
+        }
+      }
+    }
+    '''}
+
+    def test_show_ip_route_json(self):
+        self.maxDiff = None
+        self.device = Mock(**self.golden_output_json)
+        obj = ShowIpRoute(device=self.device, context='json')
+        parsed_output = obj.parse(route='10.12.120.0/24',
+                                  protocol='rip',
+                                  vrf='default')
+        self.assertEqual(parsed_output, self.golden_parsed_output_6)
+        self.device.execute.assert_called_once_with(
+            'show ip route 10.12.120.0/24 rip vrf default | json')
+
+    def test_show_ip_route_json_default_command(self):
+        self.device = Mock(**self.golden_output_json)
+        obj = ShowIpRoute(device=self.device, context='json')
+        obj.parse()
+        self.device.execute.assert_called_once_with(
+            'show ip route vrf all | json')
+
+    def test_empty_json(self):
+        self.device = Mock(**self.empty_output)
+        obj = ShowIpRoute(device=self.device, context='json')
+        with self.assertRaises(SchemaEmptyParserError):
+            parsed_output = obj.parse()
+
 
 # ============================================
 # unit test for 'show ipv6 route'
@@ -176,6 +176,61 @@ class TestShowNvePeers(unittest.TestCase):
         with self.assertRaises(SchemaEmptyParserError):
             parsed_output = obj.parse()
 
+    golden_output_json = {'execute.return_value': '''
+    {
+      "TABLE_nve_peers": {
+        "ROW_nve_peers": [
+          {
+            "if-name": "nve1",
+            "peer-ip": "192.168.16.1",
+            "peer-state": "Up",
+            "learn-type": "CP",
+            "uptime": "01:15:09",
+            "router-mac": "n/a"
+          },
+          {
+            "if-name": "nve1",
+            "peer-ip": "192.168.106.1",
+            "peer-state": "Up",
+            "learn-type": "CP",
+            "uptime": "00:03:05",
+            "router-mac": "5e00.00ff.0209"
+          },
+          {
+            "if-name": "nve1",
+            "peer-ip": "2001:db8:646:a2bb:0:abcd:1234:3",
+            "peer-state": "Up",
+            "learn-type": "CP",
+            "uptime": "05:34:40",
+            "router-mac": "5254.00ff.3050"
+          },
+          {
+            "if-name": "nve1",
+            "peer-ip": "2001:db8:646:a2bb:0:abcd:1234:5",
+            "peer-state": "Up",
+            "learn-type": "CP",
+            "uptime": "05:35:40",
+            "router-mac": "5254.00ff.52c7"
+          }
+        ]
+      }
+    }
+    '''}
+
+    def test_show_nve_golden_json(self):
+        self.maxDiff = None
+        self.device = Mock(**self.golden_output_json)
+        obj = ShowNvePeers(device=self.device, context='json')
+        parsed_output = obj.parse()
+        self.assertEqual(parsed_output, self.golden_parsed_output)
+        self.device.execute.assert_called_once_with('show nve peers | json')
+
+    def test_show_nve_empty_json(self):
+        self.device = Mock(**self.empty_output)
+        obj = ShowNvePeers(device=self.device, context='json')
+        with self.assertRaises(SchemaEmptyParserError):
+            parsed_output = obj.parse()
+
 
 # ==========================================
 #  Unit test for 'show nve vni summary'
@@ -0,0 +1,404 @@
+'''Parser throughput benchmark over the golden outputs
+
+The golden outputs of the unit tests are the corpus of the benchmark:
+
+  * folder based tests: tests/<os>/<Class>/cli/equal/<name>_output.txt,
+    with the parse() arguments in <name>_arguments.json
+  * unittest based tests: src/genie/libs/parser/<os>/tests/test_*.py. Their
+    golden_output dictionaries are not tied to a parser or to arguments, so
+    the tests are run once with the parsers recording each successful
+    parse(): parser class, arguments and output of the mocked device.
+
+Each fixture is parsed with parse(output=...) on a mocked device, after
+warmup runs, `repeat` times; the fastest run is kept. The peak allocation
+is measured on a separate run as tracemalloc slows parsing down.
+
+Results are per parser class:
+
+    {'iosxe.ShowVersion': {'fixtures': 3,
+                           'lines': 180,
+                           'us_per_parse': 412.3,
+                           'lines_per_sec': 145507.3,
+                           'peak_kib': 96.1}}
+
+and can be compared with a baseline file to flag regressions.
+
+example:
+
+    $ python -m genie.libs.parser.utils.benchmark --os iosxe \\
+          --parser ShowVersion --output current.json \\
+          --baseline baseline.json --threshold 0.2
+'''
+
+# python
+import os
+import re
+import sys
+import json
+import glob
+import time
+import inspect
+import logging
+import argparse
+import platform
+import importlib
+import tracemalloc
+import unittest
+from collections import namedtuple
+from unittest.mock import Mock
+
+# Metaparser
+from genie.metaparser import MetaParser
+
+log = logging.getLogger(__name__)
+
+# src/genie/libs/parser
+PARSER_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Folder of the folder based tests, tests/ of the repository
+FOLDER_ROOT = os.path.join(PARSER_ROOT, *[os.pardir] * 4, 'tests')
+
+# Folders of src/genie/libs/parser which are not operating systems
+NOT_OS = ('utils', 'template', 'yang', '__pycache__')
+
+# Slow down, in ratio of the baseline, flagged as a regression
+THRESHOLD = 0.2
+
+Fixture = namedtuple('Fixture', 'parser arguments output source context')
+Fixture.__new__.__defaults__ = ('cli',)
+Fixture.__doc__ = '''Golden output of a parser
+
+    parser (`class`): parser class
+    arguments (`dict`): parse() arguments, output excluded
+    output (`str`): device output
+    source (`str`): file the fixture comes from
+    context (`str`): parser context, 'cli' by default
+'''
+
+
+def operating_systems(root=PARSER_ROOT):
+    '''return the sorted operating system folders of the parsers'''
+    return sorted(name for name in os.listdir(root)
+                  if name not in NOT_OS and
+                  os.path.isdir(os.path.join(root, name)))
+
+
+def parser_key(parser, context='cli'):
+    '''return '<os>.<Class>' of a parser class, '<os>.<Class>[<context>]'
+       for another context than cli'''
+    # genie.libs.parser.<os>.<module>
+    key = '{}.{}'.format(parser.__module__.split('.')[3], parser.__name__)
+    if context != 'cli':
+        key += '[{}]'.format(context)
+    return key
+
+
+def os_parsers(os_name, root=PARSER_ROOT):
+    '''return {name: class} of the parser classes of an operating system
+
+        Modules which cannot be imported are logged and skipped.
+    '''
+    parsers = {}
+    for path in sorted(glob.glob(os.path.join(root, os_name, '*.py'))):
+        module_name = os.path.basename(path)[:-len('.py')]
+        if module_name == '__init__':
+            continue
+        try:
+            module = importlib.import_module(
+                'genie.libs.parser.{}.{}'.format(os_name, module_name))
+        except Exception as e:
+            log.warning('Cannot import %s: %s', path, e)
+            continue
+        for name, value in vars(module).items():
+            if inspect.isclass(value) and issubclass(value, MetaParser) \
+                    and value.__module__ == module.__name__ \
+                    and hasattr(value, 'cli'):
+                parsers[name] = value
+    return parsers
+
+
+def folder_fixtures(os_names=None, root=None):
+    '''yield the Fixture of the folder based tests
+
+        Args:
+            os_names (`list`): operating systems, all by default
+            root (`str`): folder of the folder based tests, FOLDER_ROOT by
+                          default
+    '''
+    root = root or FOLDER_ROOT
+    for os_name in os_names or operating_systems():
+        outputs = sorted(glob.glob(os.path.join(
+            root, os_name, '*', 'cli', 'equal', '*_output.txt')))
+        if not outputs:
+            continue
+        parsers = os_parsers(os_name)
+        for path in outputs:
+            class_name = path.split(os.sep)[-4]
+            try:
+                parser = parsers[class_name]
+            except KeyError:
+                log.warning('No parser %s for %s', class_name, path)
+                continue
+            with open(path) as f:
+                output = f.read()
+            arguments = {}
+            arguments_path = path[:-len('_output.txt')] + '_arguments.json'
+            if os.path.exists(arguments_path):
+                with open(arguments_path) as f:
+                    arguments = json.load(f)
+            yield Fixture(parser, arguments, output, path)
+
+
+def golden_fixtures(os_names=None, pattern='test_*.py', root=PARSER_ROOT):
+    '''yield the Fixture recorded while running the unittest based tests
+
+        Only the parse() calls returning a result on a device with a
+        single output (execute.return_value) are recorded; duplicates are
+        yielded once.
+
+        Args:
+            os_names (`list`): operating systems, all by default
+            pattern (`str`): glob of the test modules
+            root (`str`): src/genie/libs/parser
+    '''
+    seen = set()
+    for os_name in os_names or operating_systems(root):
+        for path in sorted(glob.glob(os.path.join(root, os_name, 'tests',
+                                                  pattern))):
+            module_name = 'genie.libs.parser.{}.tests.{}'.format(
+                os_name, os.path.basename(path)[:-len('.py')])
+            try:
+                module = importlib.import_module(module_name)
+            except Exception as e:
+                log.warning('Cannot import %s: %s', path, e)
+                continue
+            for fixture in _record(module, path):
+                key = (fixture.parser, fixture.context,
+                       json.dumps(fixture.arguments, sort_keys=True,
+                                  default=str),
+                       fixture.output)
+                if key not in seen:
+                    seen.add(key)
+                    yield fixture
+
+
+def _record(module, source):
+    '''return the Fixture of the parse() calls of the tests of a module'''
+    parsers = [value for value in vars(module).values()
+               if inspect.isclass(value) and issubclass(value, MetaParser)
+               and value is not MetaParser]
+    # Resolved before patching, a subclass must not call the patched
+    # parse of its parent
+    originals = {parser: (parser.__dict__.get('parse'), parser.parse)
+                 for parser in parsers}
+    fixtures = []
+
+    def patched(original):
+        def parse(self, *args, **kwargs):
+            result = original(self, *args, **kwargs)
+            output = kwargs.pop('output', None)
+            if output is None:
+                execute = getattr(self.device, 'execute', None)
+                if isinstance(execute, Mock) and execute.side_effect is None:
+                    output = execute.return_value
+            if result and isinstance(output, str) and not args:
+                context = getattr(self, 'context', 'cli')
+                if isinstance(context, list):
+                    context = context[0]
+                fixtures.append(Fixture(type(self), kwargs, output, source,
+                                        context))
+            return result
+        return parse
+
+    for parser, (_, original) in originals.items():
+        parser.parse = patched(original)
+    try:
+        suite = unittest.defaultTestLoader.loadTestsFromModule(module)
+        suite.run(unittest.TestResult())
+    finally:
+        for parser, (own, _) in originals.items():
+            if own is None:
+                del parser.parse
+            else:
+                parser.parse = own
+    return fixtures
+
+
+def measure(fixture, warmup=1, repeat=5, memory=True):
+    '''return the timing of the parse of a fixture
+
+        Returns:
+            {'seconds': fastest parse, 'peak': peak allocation in bytes or
+             None}
+
+        Raises:
+            Exception raised by the parser
+    '''
+    device = Mock(**{'execute.return_value': fixture.output})
+    kwargs = dict(fixture.arguments, output=fixture.output)
+
+    context = fixture.context
+
+    for _ in range(warmup):
+        fixture.parser(device=device, context=context).parse(**kwargs)
+
+    best = None
+    for _ in range(repeat):
+        parser = fixture.parser(device=device, context=context)
+        start = time.perf_counter()
+        parser.parse(**kwargs)
+        elapsed = time.perf_counter() - start
+        if best is None or elapsed < best:
+            best = elapsed
+
+    peak = None
+    if memory and not tracemalloc.is_tracing():
+        parser = fixture.parser(device=device, context=context)
+        tracemalloc.start()
+        try:
+            parser.parse(**kwargs)
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    return {'seconds': best, 'peak': peak}
+
+
+def run(fixtures, warmup=1, repeat=5, memory=True):
+    '''return the results of the benchmark of fixtures
+
+        Returns:
+            {'meta': {...},
+             'results': {'<os>.<Class>': {...}},
+             'errors': [{'parser': ..., 'source': ..., 'error': ...}]}
+    '''
+    totals = {}
+    errors = []
+    for fixture in fixtures:
+        key = parser_key(fixture.parser, fixture.context)
+        try:
+            timing = measure(fixture, warmup=warmup, repeat=repeat,
+                             memory=memory)
+        except Exception as e:
+            errors.append({'parser': key, 'source': fixture.source,
+                           'error': '{}: {}'.format(type(e).__name__, e)})
+            continue
+        total = totals.setdefault(key, {'fixtures': 0, 'lines': 0,
+                                        'seconds': 0.0, 'peak': None})
+        total['fixtures'] += 1
+        total['lines'] += fixture.output.count('\n') + 1
+        total['seconds'] += timing['seconds']
+        if timing['peak'] is not None:
+            total['peak'] = max(total['peak'] or 0, timing['peak'])
+
+    results = {}
+    for key, total in sorted(totals.items()):
+        seconds = total['seconds']
+        results[key] = {
+            'fixtures': total['fixtures'],
+            'lines': total['lines'],
+            'us_per_parse': round(seconds / total['fixtures'] * 1e6, 1),
+            'lines_per_sec': round(total['lines'] / seconds, 1)
+                             if seconds else None,
+            'peak_kib': round(total['peak'] / 1024, 1)
+                        if total['peak'] is not None else None,
+        }
+
+    return {'meta': {'python': platform.python_version(),
+                     'platform': platform.platform(),
+                     'date': time.strftime('%Y-%m-%dT%H:%M:%S'),
+                     'warmup': warmup,
+                     'repeat': repeat},
+            'results': results,
+            'errors': errors}
+
+
+def compare(results, baseline, threshold=THRESHOLD):
+    '''return the regressions of results against a baseline
+
+        A parser regresses when its us_per_parse is above the baseline by
+        more than threshold, a ratio: 0.2 flags parsers 20% slower. Parsers
+        missing from either side are not compared.
+
+        Returns:
+            list of {'parser', 'baseline_us', 'current_us', 'ratio'},
+            worst first
+    '''
+    regressions = []
+    current = results.get('results', results)
+    previous = baseline.get('results', baseline)
+    for key, result in current.items():
+        try:
+            before = previous[key]['us_per_parse']
+        except KeyError:
+            continue
+        after = result['us_per_parse']
+        if before and after > before * (1 + threshold):
+            regressions.append({'parser': key,
+                                'baseline_us': before,
+                                'current_us': after,
+                                'ratio': round(after / before, 2)})
+    return sorted(regressions, key=lambda item: -item['ratio'])
+
+
+def main(argv=None):
+    '''Command line entry, returns 1 when regressions are found'''
+    args = argparse.ArgumentParser(
+        description='Benchmark the parsers over their golden outputs')
+    args.add_argument('--os', nargs='*', dest='os_names',
+                      help='operating systems, all by default')
+    args.add_argument('--parser', default=None,
+                      help='regular expression searched in <os>.<Class>')
+    args.add_argument('--source', choices=('all', 'folder', 'unittest'),
+                      default='all', help='golden outputs to use')
+    args.add_argument('--warmup', type=int, default=1)
+    args.add_argument('--repeat', type=int, default=5)
+    args.add_argument('--no-memory', action='store_true',
+                      help='skip the peak allocation measure')
+    args.add_argument('--output', default=None,
+                      help='json file to store the results in')
+    args.add_argument('--baseline', default=None,
+                      help='json file of previous results to compare with')
+    args.add_argument('--threshold', type=float, default=THRESHOLD,
+                      help='slow down ratio flagged as regression')
+    args = args.parse_args(argv)
+
+    fixtures = []
+    if args.source in ('all', 'folder'):
+        fixtures.extend(folder_fixtures(args.os_names))
+    if args.source in ('all', 'unittest'):
+        fixtures.extend(golden_fixtures(args.os_names))
+    if args.parser:
+        pattern = re.compile(args.parser)
+        fixtures = [fixture for fixture in fixtures
+                    if pattern.search(parser_key(fixture.parser,
+                                                 fixture.context))]
+
+    results = run(fixtures, warmup=args.warmup, repeat=args.repeat,
+                  memory=not args.no_memory)
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+
+    print('{:<60} {:>8} {:>12} {:>14} {:>10}'.format(
+        'parser', 'fixtures', 'us/parse', 'lines/sec', 'peak KiB'))
+    for key, result in results['results'].items():
+        print('{:<60} {:>8} {:>12} {:>14} {:>10}'.format(
+            key, result['fixtures'], result['us_per_parse'],
+            result['lines_per_sec'] or '-', result['peak_kib'] or '-'))
+    for error in results['errors']:
+        print('error: {parser} {source}: {error}'.format(**error))
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, threshold=args.threshold)
+        for regression in regressions:
+            print('regression: {parser} {baseline_us}us -> {current_us}us '
+                  '(x{ratio})'.format(**regression))
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,564 @@
+'''Path records and compact storage of BGP route tables
+
+The BGP table parsers build a nested dictionary per prefix and path:
+
+    {'instance': {'default': {'vrf': {'default': {'address_family': {
+        'vpnv4 unicast RD 200:1': {'prefix': {'10.1.1.0/24': {'index': {
+            1: {'next_hop': '10.186.5.5', 'path': '200 33299 51178', ...}}}}}}}}}}}
+
+With several full tables across instances and VRFs, the dictionaries of
+the paths are most of the memory, although a few hundred next hops and a
+few thousand AS paths are shared by all of them. The parsers give two
+other forms of the same result:
+
+  * parse_stream() yields a BgpPath record per path as the lines are read,
+    the table attributes (router identifier, versions...) go to an
+    optional `tables` dictionary, the parsed dictionary without the paths.
+
+  * parse_compact() returns CompactPaths: the next hops, AS paths and
+    communities are stored once in Values tables, each path is a row of
+    integer ids in arrays.
+
+example:
+
+    >>> parser = ShowBgpInstanceAllAll(device=device)
+    >>> for path in parser.parse_stream(vrf_type='vrf'):
+    ...     export(path.vrf, path.prefix, path.path['next_hop'])
+
+    >>> compact = parser.parse_compact(vrf_type='vrf')
+    >>> compact.values['path'].values[:3]
+    [None, '200 33299 51178 47751 {27016}', '300 33299 51178 47751 {27016}']
+
+The BGP detail parsers print the AS path, communities and extended
+communities of each path, a few thousand distinct sets in a full table.
+Their parse_attributes() stores each set once in AttributeSets, like the
+attribute cache of a BGP RIB, all the paths holding it reference it, and
+can expose them as tuples of ints:
+
+    >>> parser = ShowBgpAllDetail(device=device)
+    >>> parsed, attributes = parser.parse_attributes(as_tuples=True)
+    >>> attributes.values['as_path'].values[1]
+    (65000, 65201, 4400004007, 1234, 5678)
+
+The memory of cli() against parse_compact() on a synthetic full table,
+and of cli() against parse_attributes() on a synthetic detail output, is
+compared with:
+
+    $ python -m genie.libs.parser.utils.bgp_paths --prefixes 1000000 \\
+          --detail-prefixes 100000
+'''
+
+# python
+import sys
+import time
+import array
+import argparse
+from collections import namedtuple
+
+# Prefixes of the synthetic table of the benchmark
+PREFIXES = 1000000
+
+# Distinct next hops and AS paths of the synthetic table
+NEXT_HOPS = 200
+AS_PATHS = 5000
+
+# Prefixes and distinct community sets of the synthetic detail output
+DETAIL_PREFIXES = 100000
+COMMUNITIES = 1000
+
+BgpPath = namedtuple('BgpPath', 'instance vrf address_family prefix index '
+                                'path')
+BgpPath.__doc__ = '''Path of a BGP route table
+
+    instance (`str`): BGP instance
+    vrf (`str`): vrf
+    address_family (`str`): address family key of the parsed dictionary,
+                            with its route distinguisher
+    prefix (`str`): network
+    index (`int`): index of the path within the prefix, from 1
+    path (`dict`): keys of the path in the parsed dictionary: next_hop,
+                   status_codes, metric, locprf, weight, path...
+'''
+
+# Keys of the path dictionary stored in their own Values table
+COLUMNS = ('next_hop', 'path', 'community')
+
+
+def add_path(table, key, prefix, index, path):
+    '''store path in table[key][prefix]['index'][index] as the parsers do,
+    a path already stored at the same index is updated'''
+    paths = table.setdefault(key, {}).setdefault(prefix, {}).\
+                  setdefault('index', {})
+    if index in paths:
+        paths[index].update(path)
+    else:
+        paths[index] = path
+
+
+class Values(object):
+    '''Table of distinct values referenced by integer ids
+
+        Id 0 is None. A value is stored once however many paths use it.
+
+        Attributes:
+            values (`list`): value of each id
+    '''
+
+    def __init__(self):
+        self.values = [None]
+        self._ids = {None: 0}
+
+    def id(self, value):
+        '''return the id of value, added to the table when new'''
+        try:
+            return self._ids[value]
+        except KeyError:
+            self._ids[value] = len(self.values)
+            self.values.append(value)
+            return self._ids[value]
+
+    def __getitem__(self, id):
+        return self.values[id]
+
+    def __len__(self):
+        return len(self.values) - 1
+
+
+class CompactPaths(object):
+    '''Paths of BGP route tables as rows of ids into Values tables
+
+        Each path is a row of the columns: table (instance, vrf, address
+        family), prefix, index, one id per COLUMNS key and the id of the
+        set of its other keys (status codes, metric, weight...). Iterating
+        yields the BgpPath records back, with path dictionaries equal to
+        the parsed ones.
+
+        Args:
+            records (`iterable`): BgpPath records to store
+            tables (`dict`): parsed dictionary without the paths
+            key (`str`): key of the prefixes in the address family
+                         dictionary: 'prefix', 'received', 'advertised'...
+
+        Attributes:
+            values (`dict`): Values table of each COLUMNS key, 'table'
+                             and 'attributes'
+            tables (`dict`): parsed dictionary without the paths
+    '''
+
+    def __init__(self, records=(), tables=None, key='prefix'):
+        self.tables = tables if tables is not None else {}
+        self.key = key
+        self.values = {name: Values()
+                       for name in COLUMNS + ('table', 'attributes')}
+        self._prefixes = []
+        # 32 bits ids, one array per column
+        self._columns = {name: array.array('i')
+                         for name in COLUMNS + ('table', 'attributes',
+                                                'index')}
+        for record in records:
+            self.add(record)
+
+    def add(self, record):
+        '''store a BgpPath record'''
+        path = dict(record.path)
+        columns = self._columns
+        columns['table'].append(self.values['table'].id(
+            (record.instance, record.vrf, record.address_family)))
+        columns['index'].append(record.index)
+        for name in COLUMNS:
+            columns[name].append(self.values[name].id(path.pop(name, None)))
+        columns['attributes'].append(self.values['attributes'].id(
+            tuple(sorted(path.items()))))
+        # Consecutive paths of a prefix share its string
+        prefix = record.prefix
+        if self._prefixes and self._prefixes[-1] == prefix:
+            prefix = self._prefixes[-1]
+        self._prefixes.append(prefix)
+
+    def __len__(self):
+        return len(self._prefixes)
+
+    def __iter__(self):
+        values = {name: table.values for name, table in self.values.items()}
+        columns = [self._columns[name] for name in COLUMNS]
+        for row, prefix in enumerate(self._prefixes):
+            path = dict(values['attributes'][
+                self._columns['attributes'][row]])
+            for name, column in zip(COLUMNS, columns):
+                value = values[name][column[row]]
+                if value is not None:
+                    path[name] = value
+            yield BgpPath(*values['table'][self._columns['table'][row]],
+                          prefix=prefix, index=self._columns['index'][row],
+                          path=path)
+
+    def to_dict(self):
+        '''return the parsed dictionary with the paths, as cli() returns
+        it; the dictionaries of the tables are copied'''
+        parsed = _copy_tables(self.tables)
+        for record in self:
+            table = parsed['instance'][record.instance]['vrf'][record.vrf]
+            table = table['address_family'][record.address_family]
+            add_path(table, self.key, record.prefix, record.index,
+                     record.path)
+        return parsed
+
+
+def _copy_tables(tables):
+    return {key: _copy_tables(value) if isinstance(value, dict) else value
+            for key, value in tables.items()}
+
+
+# Attributes of the paths of the BGP detail parsers stored in AttributeSets
+ATTRIBUTES = ('as_path', 'community', 'ext_community')
+
+# Well-known communities, RFC 1997 and RFC 8326
+WELL_KNOWN_COMMUNITIES = {
+    'gshut': 0xFFFF0000,
+    'accept-own': 0xFFFF0001,
+    'no-export': 0xFFFFFF01,
+    'no-advertise': 0xFFFFFF02,
+    'local-as': 0xFFFFFF03,
+    'no-export-subconfed': 0xFFFFFF03,
+    'no-peer': 0xFFFFFF04,
+}
+
+
+def _asn(token):
+    '''return the AS number of token, asplain or asdot'''
+    high, _, low = token.rpartition('.')
+    return int(high) << 16 | int(low) if high else int(low)
+
+
+def as_path_tuple(as_path):
+    '''return the AS path string as a tuple of AS numbers
+
+        An AS set {1 2} or {1,2} is a nested tuple, the parentheses of
+        confederation segments are dropped, 'Local' and 'NONE' are the
+        empty path and a token that is not an AS number is kept as is.
+
+        >>> as_path_tuple('200 33299 51178 47751 {27016}')
+        (200, 33299, 51178, 47751, (27016,))
+    '''
+    path = []
+    as_set = None
+    for token in as_path.replace(',', ' ').split():
+        if token in ('Local', 'NONE'):
+            continue
+        if token.startswith('{'):
+            as_set = []
+            token = token[1:]
+        closed = token.endswith('}')
+        token = token.rstrip('}').strip('()')
+        if token:
+            try:
+                token = _asn(token)
+            except ValueError:
+                pass
+            (path if as_set is None else as_set).append(token)
+        if closed and as_set is not None:
+            path.append(tuple(as_set))
+            as_set = None
+    return tuple(path)
+
+
+def community_tuple(communities):
+    '''return the communities, a string or a list, as a tuple of 32 bits
+    values; a community that is neither AS:value nor well-known is kept
+    as is
+
+        >>> community_tuple('65100:101 no-export')
+        (4266393701, 4294967041)
+    '''
+    if isinstance(communities, str):
+        communities = communities.split()
+    values = []
+    for community in communities:
+        asn, _, value = community.partition(':')
+        try:
+            values.append(int(asn) << 16 | int(value))
+        except ValueError:
+            values.append(WELL_KNOWN_COMMUNITIES.get(community.lower(),
+                                                     community))
+    return tuple(values)
+
+
+def ext_community_tuple(ext_communities):
+    '''return the extended communities, a string or a list, as a tuple of
+    strings'''
+    if isinstance(ext_communities, str):
+        ext_communities = ext_communities.split()
+    return tuple(ext_communities)
+
+
+class AttributeSets(object):
+    '''Attribute cache of the BGP detail parsers
+
+        Like the attribute cache of a BGP RIB, each distinct AS path,
+        community and extended community set is stored once in a Values
+        table and every path holding it references the same object, so
+        a full table holds a few thousand of them instead of one per path.
+        A list value is shared too: do not modify it in place.
+
+        Args:
+            as_tuples (`bool`): expose the attributes as tuples instead of
+                                the parsed strings and lists: AS numbers
+                                (as_path_tuple), 32 bits communities
+                                (community_tuple) and extended community
+                                strings
+
+        Attributes:
+            values (`dict`): Values table of each ATTRIBUTES name
+    '''
+
+    TUPLES = {'as_path': as_path_tuple,
+              'community': community_tuple,
+              'ext_community': ext_community_tuple}
+
+    def __init__(self, as_tuples=False):
+        self.as_tuples = as_tuples
+        self.values = {name: Values() for name in ATTRIBUTES}
+        # Parsed value, or tuple of a list, to the stored value
+        self._cache = {name: {} for name in ATTRIBUTES}
+
+    def get(self, name, value):
+        '''return the stored value of the attribute name equal to value,
+        added to the table when new'''
+        key = tuple(value) if isinstance(value, list) else value
+        cache = self._cache[name]
+        try:
+            return cache[key]
+        except KeyError:
+            pass
+        values = self.values[name]
+        stored = self.TUPLES[name](value) if self.as_tuples else key
+        stored = values[values.id(stored)]
+        if isinstance(value, list) and not self.as_tuples:
+            # The table holds a tuple, the paths share the first list
+            stored = value
+        cache[key] = stored
+        return stored
+
+    def __len__(self):
+        return sum(len(values) for values in self.values.values())
+
+
+class SharedAttributes(object):
+    '''Parser mixin of parse_attributes(), cli() with the AS paths and
+    communities of the paths stored once in an AttributeSets'''
+
+    # AttributeSets of the running parse_attributes(), None for cli()
+    attributes = None
+
+    def parse_attributes(self, attributes=None, as_tuples=False, **kwargs):
+        '''return (parsed dictionary, attributes) of cli(**kwargs) with the
+        attributes of the paths taken from attributes, a new AttributeSets
+        when None; an AttributeSets given again is shared by both parses
+
+            The dictionary is the one of cli(), unless as_tuples, where the
+            attributes are tuples (see AttributeSets) and the dictionary no
+            longer matches the schema.
+        '''
+        if attributes is None:
+            attributes = AttributeSets(as_tuples=as_tuples)
+        self.attributes = attributes
+        try:
+            return self.cli(**kwargs), attributes
+        finally:
+            del self.attributes
+
+    def _attribute(self, name, value):
+        '''return value, or its stored value in parse_attributes()'''
+        if self.attributes is None:
+            return value
+        return self.attributes.get(name, value)
+
+
+def deep_size(obj, seen=None):
+    '''return the bytes of obj and of the objects it holds, dictionaries,
+    sequences, Values, CompactPaths and AttributeSets; an object held
+    twice is counted once'''
+    if seen is None:
+        seen = set()
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(deep_size(key, seen) + deep_size(value, seen)
+                    for key, value in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(deep_size(item, seen) for item in obj)
+    elif isinstance(obj, (Values, CompactPaths, AttributeSets)):
+        size += deep_size(vars(obj), seen)
+    return size
+
+
+def synthetic(prefixes=PREFIXES, next_hops=NEXT_HOPS, as_paths=AS_PATHS,
+              vrfs=4):
+    '''return a 'show bgp instance all vrf all' output of prefixes prefixes
+    spread over vrfs VRFs, two paths each'''
+    lines = ["BGP instance 0: 'default'",
+             '=========================',
+             '',
+             'Address Family: VPNv4 Unicast',
+             '-----------------------------',
+             '',
+             'BGP router identifier 10.4.1.1, local AS number 100',
+             'BGP table state: Active',
+             'Table ID: 0x0   RD version: 0',
+             'BGP main routing table version 43',
+             '',
+             '   Network            Next Hop            Metric LocPrf Weight '
+             'Path']
+    per_vrf = -(-prefixes // vrfs)
+    for vrf in range(vrfs):
+        lines.append('Route Distinguisher: 200:{vrf} (default for vrf '
+                     'VRF{vrf})'.format(vrf=vrf + 1))
+        for number in range(vrf * per_vrf, min(prefixes, (vrf + 1) * per_vrf)):
+            prefix = '{}.{}.{}.0/24'.format((number >> 16) + 1,
+                                            number >> 8 & 255, number & 255)
+            origin = number % as_paths
+            as_path = '{} {} {}'.format(100 + origin % 7,
+                                        64512 + origin // 7, origin)
+            lines.append('*>i{:<17}{:<24}2219    100      0 {} i'.format(
+                prefix, '10.64.{}.{}'.format(number % next_hops // 250,
+                                             number % next_hops % 250 + 1),
+                as_path))
+            lines.append('* i{:<17}{:<24}2219    100      0 {} i'.format(
+                '', '10.65.0.{}'.format(number % 7 + 1), as_path))
+    lines.extend(['', 'Processed {} prefixes, {} paths'.format(
+        prefixes, 2 * prefixes)])
+    return '\n'.join(lines)
+
+
+def synthetic_detail(prefixes=DETAIL_PREFIXES, as_paths=AS_PATHS,
+                     communities=COMMUNITIES):
+    '''return a 'show bgp all detail' output of prefixes IPv4 prefixes, two
+    paths each'''
+    lines = ['For address family: IPv4 Unicast', '']
+    for number in range(prefixes):
+        origin = number % as_paths
+        as_path = '{} {} {} {}'.format(65000 + origin % 7, 4400000000 + origin,
+                                       64512 + origin % 1000, origin)
+        community = number % communities
+        lines.extend([
+            'BGP routing table entry for {}.{}.{}.0/24, version {}'.format(
+                (number >> 16) + 1, number >> 8 & 255, number & 255,
+                number + 1),
+            '  Paths: (2 available, best #1, table default)',
+            '  Not advertised to any peer'])
+        for path, best in ((1, ', best'), (2, '')):
+            lines.extend([
+                '  Refresh Epoch 1',
+                '  {}'.format(as_path),
+                '    10.64.{0}.{1} from 10.64.{0}.{1} (10.64.{0}.{1})'.format(
+                    path, number % 250 + 1),
+                '      Origin IGP, localpref 100, valid, '
+                'external{}'.format(best),
+                '      Community: 65100:{} 65100:{} 65200:{} no-export'.format(
+                    community % 10, community // 10 % 10, community),
+                '      Extended Community: RT:65000:{}'.format(number % 4),
+                '      rx pathid: 0, tx pathid: 0'])
+    return '\n'.join(lines)
+
+
+def benchmark(prefixes=PREFIXES):
+    '''return the time and the deep size of the dictionary of cli() and of
+    the CompactPaths of parse_compact() on a synthetic table
+
+        Returns:
+            {'cli': {'seconds', 'bytes'}, 'compact': {'seconds', 'bytes'},
+             'paths': paths of the table}
+    '''
+    # The parsers import this module
+    from genie.libs.parser.iosxr.show_bgp import ShowBgpInstanceAllAll
+
+    output = synthetic(prefixes)
+    parser = ShowBgpInstanceAllAll(device=None)
+    report = {}
+
+    start = time.perf_counter()
+    parsed = parser.cli(vrf_type='all', output=output)
+    report['cli'] = {'seconds': time.perf_counter() - start,
+                     'bytes': deep_size(parsed)}
+    del parsed
+
+    start = time.perf_counter()
+    compact = parser.parse_compact(vrf_type='all', output=output)
+    report['compact'] = {'seconds': time.perf_counter() - start,
+                         'bytes': deep_size(compact)}
+    report['paths'] = len(compact)
+    return report
+
+
+def benchmark_attributes(prefixes=DETAIL_PREFIXES):
+    '''return the time and the deep size of the dictionary of cli() and of
+    parse_attributes(), with its AttributeSets, on a synthetic iosxe
+    'show bgp all detail'
+
+        Returns:
+            {'cli': {'seconds', 'bytes'}, 'attributes': {...},
+             'tuples': {...} for as_tuples, 'paths': paths of the output,
+             'sets': distinct AS paths and communities}
+    '''
+    # The parsers import this module
+    from genie.libs.parser.iosxe.show_bgp import ShowBgpAllDetail
+
+    output = synthetic_detail(prefixes)
+    parser = ShowBgpAllDetail(device=None)
+    report = {'paths': 2 * prefixes}
+
+    start = time.perf_counter()
+    parsed = parser.cli(output=output)
+    report['cli'] = {'seconds': time.perf_counter() - start,
+                     'bytes': deep_size(parsed)}
+    del parsed
+
+    for mode, as_tuples in (('attributes', False), ('tuples', True)):
+        start = time.perf_counter()
+        parsed = parser.parse_attributes(output=output, as_tuples=as_tuples)
+        report[mode] = {'seconds': time.perf_counter() - start,
+                        'bytes': deep_size(parsed)}
+        report['sets'] = len(parsed[1])
+        del parsed
+    return report
+
+
+def _print(report, modes):
+    print('{} paths'.format(report['paths']))
+    for mode in modes:
+        print('{:>10} {:>8.2f}s {:>10.1f} MiB {:>6.0f} bytes/path'.format(
+            mode, report[mode]['seconds'], report[mode]['bytes'] / 2 ** 20,
+            report[mode]['bytes'] / report['paths']))
+    for mode in modes[1:]:
+        print('{} reduction x{:.1f}'.format(
+            mode, report[modes[0]]['bytes'] / report[mode]['bytes']))
+
+
+def main(argv=None):
+    '''Command line entry: memory of cli() against parse_compact() and
+    parse_attributes()'''
+    args = argparse.ArgumentParser(
+        description='Memory of the parsed dictionary against the compact '
+                    'paths of a large show bgp instance all vrf all and '
+                    'the attribute sets of a large show bgp all detail')
+    args.add_argument('--prefixes', type=int, default=PREFIXES,
+                      help='prefixes of the synthetic table, two paths '
+                           'each, 0 to skip it')
+    args.add_argument('--detail-prefixes', type=int, default=DETAIL_PREFIXES,
+                      help='prefixes of the synthetic detail output, two '
+                           'paths each, 0 to skip it')
+    args = args.parse_args(argv)
+
+    if args.prefixes:
+        _print(benchmark(args.prefixes), ('cli', 'compact'))
+    if args.detail_prefixes:
+        report = benchmark_attributes(args.detail_prefixes)
+        _print(report, ('cli', 'attributes', 'tuples'))
+        print('{} distinct AS paths and communities'.format(report['sets']))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,149 @@
+'''Time budget of a parse
+
+A pathological output can keep a parser in its line loop for minutes. A
+budget bounds the time spent parsing, the time spent executing the command
+on the device is not counted:
+
+    >>> with budget(5):
+    ...     parsed = ShowBgpAll(device=device).parse()
+
+or
+
+    >>> parsed = parse(ShowBgpAll(device=device), timeout=5)
+
+Parsers supporting it iterate their output with lines(), which checks the
+budget every CHECK_EVERY lines. Once the budget is spent, ParseTimeout is
+raised with the dictionary built so far and the number of the line reached:
+
+    >>> try:
+    ...     parsed = parse(ShowBgpAll(device=device), timeout=5)
+    ... except ParseTimeout as e:
+    ...     parsed = e.parsed
+
+Budgets are per thread, a nested budget cannot extend the budget it is
+nested in. Without a budget, lines() is output.splitlines().
+
+lines() also takes an iterable of lines, such as an open file or a socket
+reader, which is read one line at a time. Parsers with a parse_stream()
+method yield their records as the lines are read, so a collector of a
+large output given as a file only holds one record at a time:
+
+    >>> parser = ShowRouteProtocolExtensive(device=device)
+    >>> with open('show_route_protocol_bgp_extensive.txt') as f:
+    ...     for route_table, rt in parser.parse_stream(output=f):
+    ...         if rt is not None:
+    ...             export(route_table['table-name'], rt)
+'''
+
+# python
+import time
+import threading
+import contextlib
+
+# Lines yielded between two checks of the budget
+CHECK_EVERY = 16
+
+_local = threading.local()
+
+
+class ParseTimeout(TimeoutError):
+    '''The parse budget is spent
+
+        Attributes:
+            parsed (`dict`): dictionary built when the budget was spent, not
+                             validated against the schema
+            line (`int`): number of the lines parsed before the budget was
+                          spent
+            timeout (`float`): budget in seconds
+    '''
+
+    def __init__(self, parsed, line, timeout):
+        super().__init__('Parse budget of {}s spent at line {}'.format(
+            timeout, line))
+        self.parsed = parsed
+        self.line = line
+        self.timeout = timeout
+
+
+class Budget(object):
+    '''Seconds of parsing allowed, consumed by the lines() loops'''
+
+    def __init__(self, timeout):
+        self.timeout = timeout
+        self.spent = 0.0
+
+
+def current():
+    '''return the Budget of the thread, None without budget'''
+    budgets = getattr(_local, 'budgets', None)
+    return budgets[-1] if budgets else None
+
+
+@contextlib.contextmanager
+def budget(timeout):
+    '''bound the parse time within the context to timeout seconds
+
+        A timeout of None does not bound the parse time, unless the context
+        is nested in a budget.
+    '''
+    if timeout is None:
+        yield current()
+        return
+    budgets = getattr(_local, 'budgets', None)
+    if budgets is None:
+        budgets = _local.budgets = []
+    outer = budgets[-1] if budgets else None
+    if outer is not None:
+        timeout = min(timeout, outer.timeout - outer.spent)
+    inner = Budget(timeout)
+    budgets.append(inner)
+    try:
+        yield inner
+    finally:
+        budgets.pop()
+        if outer is not None:
+            outer.spent += inner.spent
+
+
+def parse(parser, timeout=None, **kwargs):
+    '''return parser.parse(**kwargs) parsed within timeout seconds
+
+        Raises:
+            ParseTimeout: the budget is spent
+    '''
+    with budget(timeout):
+        return parser.parse(**kwargs)
+
+
+def _checked(output, parsed, every, current_budget):
+    start = time.perf_counter()
+    number = 0
+    try:
+        if isinstance(output, str):
+            output = output.splitlines()
+        for number, line in enumerate(output, 1):
+            if not number % every and current_budget.spent + \
+                    time.perf_counter() - start > current_budget.timeout:
+                raise ParseTimeout(parsed, number - 1,
+                                   current_budget.timeout)
+            yield line
+    finally:
+        current_budget.spent += time.perf_counter() - start
+
+
+def lines(output, parsed=None, every=CHECK_EVERY):
+    '''return the lines of output, checked against the budget of the thread
+
+        Args:
+            output (`str`): device output, or an iterable of lines read one
+                            at a time, their line ends kept
+            parsed (`dict`): dictionary being built, carried by ParseTimeout
+            every (`int`): lines between two checks of the budget
+
+        Raises:
+            ParseTimeout: while iterating, when the budget is spent
+    '''
+    current_budget = current()
+    if current_budget is None:
+        return output.splitlines() if isinstance(output, str) else output
+    return _checked(output, parsed, every, current_budget)
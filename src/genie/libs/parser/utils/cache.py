@@ -0,0 +1,255 @@
+'''On-disk cache of parsed results
+
+Reprocessing archived outputs parses the same outputs again and again. A
+ParseCache stores the parsed result of an output in a directory, the next
+parse of the same output returns it without running the parser:
+
+    >>> cache = ParseCache('/tmp/parsed')
+    >>> parsed = cache.parse(ShowBgpAll(device=device), output=output)
+
+The cache is opt-in, only parses given an output are cached. An entry is
+keyed by the parser class, the package version, the parse arguments, the
+output and the content of the parser modules: editing the module of the
+parser, or of a parser it inherits from (ios parsers subclassing iosxe
+ones), invalidates the entries of its parsers. Entries are stored in the binary
+form of utils.serialize, the least recently used ones are evicted once the
+cache is larger than max_size bytes.
+
+The size of a cache is shown, or the cache cleared, with:
+
+    $ python -m genie.libs.parser.utils.cache /tmp/parsed [--clear]
+'''
+
+# python
+import os
+import sys
+import argparse
+import tempfile
+
+# Parser
+from genie.libs.parser import __version__
+from genie.libs.parser.utils import serialize
+
+# Default bound of the cache size in bytes
+MAX_SIZE = 256 * 1024 * 1024
+
+# Fraction of max_size kept by an eviction, evicting some room ahead
+# instead of a single entry at every store
+LOW_WATER = 0.9
+
+# Suffix of the entry files, the temporary files being written have none
+SUFFIX = '.bin'
+
+# Package of the parser modules whose content is part of the keys
+PACKAGE = 'genie.libs.parser'
+
+# path -> ((mtime, size), digest) of the parser modules
+_module_digests = {}
+
+
+def module_digest(module_name):
+    '''return the digest of the source of a module, None if unknown
+
+        The digest is memoized until the modification time or size of the
+        file changes.
+    '''
+    path = getattr(sys.modules.get(module_name), '__file__', None)
+    if not path:
+        return None
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    signature = (stat.st_mtime_ns, stat.st_size)
+    memo = _module_digests.get(path)
+    if memo and memo[0] == signature:
+        return memo[1]
+    with open(path, 'rb') as f:
+        digest = serialize.digest(f.read())
+    _module_digests[path] = (signature, digest)
+    return digest
+
+
+def parser_modules(cls):
+    '''return the modules a parser class depends on
+
+        The module of the class comes first, followed by the modules of the
+        classes it inherits from which are part of the parser package, in
+        method resolution order.
+    '''
+    modules = [cls.__module__]
+    for base in cls.__mro__[1:]:
+        name = base.__module__
+        if name not in modules and (name == PACKAGE or
+                                    name.startswith(PACKAGE + '.')):
+            modules.append(name)
+    return modules
+
+
+class ParseCache(object):
+    '''Directory of parsed results with size-bounded LRU eviction
+
+        Args:
+            directory (`str`): directory of the entries, created if needed
+            max_size (`int`): bound of the size of the entries in bytes.
+                              Default 256MB
+
+        Attributes:
+            hits (`int`): parses answered from the cache
+            misses (`int`): parses which ran the parser
+    '''
+
+    def __init__(self, directory, max_size=MAX_SIZE):
+        self.directory = directory
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(directory, exist_ok=True)
+        self._size = sum(size for _, _, size in self._entries())
+
+    @property
+    def size(self):
+        '''size of the entries in bytes'''
+        return self._size
+
+    def _entries(self):
+        '''yield (path, mtime, size) of the entries'''
+        for sub in os.scandir(self.directory):
+            if not sub.is_dir():
+                continue
+            for entry in os.scandir(sub.path):
+                if entry.name.endswith(SUFFIX):
+                    try:
+                        stat = entry.stat()
+                    except OSError:
+                        continue
+                    yield entry.path, stat.st_mtime_ns, stat.st_size
+
+    def _path(self, key):
+        return os.path.join(self.directory, key[:2], key + SUFFIX)
+
+    def key(self, parser, output, **kwargs):
+        '''return the key of the parse of output by parser'''
+        cls = type(parser)
+        return serialize.digest([
+            '{}.{}'.format(cls.__module__, cls.__qualname__),
+            __version__,
+            [(name, module_digest(name)) for name in parser_modules(cls)],
+            getattr(parser, 'context', None),
+            kwargs,
+            output], default=repr)
+
+    def get(self, key):
+        '''return the result stored under key, None if not cached'''
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+        except OSError:
+            return None
+        try:
+            result = serialize.unpack(data)
+        except ValueError:
+            # Truncated by a crash or a full disk
+            self._remove(path, len(data))
+            return None
+        try:
+            # Most recently used
+            os.utime(path)
+        except OSError:
+            pass
+        return result
+
+    def put(self, key, result):
+        '''store result under key, False if result cannot be packed'''
+        try:
+            data = serialize.pack(result)
+        except (TypeError, ValueError):
+            return False
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        try:
+            previous = os.path.getsize(path)
+        except OSError:
+            previous = 0
+        fd, temporary = tempfile.mkstemp(dir=os.path.dirname(path))
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            # Readers see the whole entry or none
+            os.replace(temporary, path)
+        except BaseException:
+            os.unlink(temporary)
+            raise
+        self._size += len(data) - previous
+        if self._size > self.max_size:
+            self.evict()
+        return True
+
+    def _remove(self, path, size):
+        try:
+            os.unlink(path)
+        except OSError:
+            return
+        self._size -= size
+
+    def evict(self, max_size=None):
+        '''remove the least recently used entries down to LOW_WATER of
+        max_size, return the number of entries removed'''
+        if max_size is None:
+            max_size = self.max_size
+        # Other processes may share the directory, size it again
+        entries = sorted(self._entries(), key=lambda entry: entry[1])
+        self._size = sum(size for _, _, size in entries)
+        low_water = int(max_size * LOW_WATER)
+        removed = 0
+        for path, _, size in entries:
+            if self._size <= low_water:
+                break
+            self._remove(path, size)
+            removed += 1
+        return removed
+
+    def clear(self):
+        '''remove every entry, return the number of entries removed'''
+        return self.evict(max_size=0)
+
+    def parse(self, parser, output=None, **kwargs):
+        '''return parser.parse(output=output, **kwargs), from the cache if
+        the output was parsed before
+
+            Without output the device is executed, nothing is cached.
+        '''
+        if output is None:
+            return parser.parse(**kwargs)
+        key = self.key(parser, output, **kwargs)
+        result = self.get(key)
+        if result is not None:
+            self.hits += 1
+            return result
+        self.misses += 1
+        result = parser.parse(output=output, **kwargs)
+        self.put(key, result)
+        return result
+
+
+def main(argv=None):
+    '''Command line entry: size of a cache directory, or clear it'''
+    args = argparse.ArgumentParser(
+        description='Size of a parse cache directory')
+    args.add_argument('directory', help='cache directory')
+    args.add_argument('--clear', action='store_true',
+                      help='remove every entry')
+    args = args.parse_args(argv)
+
+    cache = ParseCache(args.directory)
+    if args.clear:
+        print('{} entries removed'.format(cache.clear()))
+    else:
+        entries = sum(1 for _ in cache._entries())
+        print('{} entries, {} bytes'.format(entries, cache.size))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
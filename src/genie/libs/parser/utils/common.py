@@ -12,6 +12,7 @@ import math
 
 from genie.libs import parser
 from genie.abstract import Lookup
+from genie.libs.parser.utils import interface_name
 
 log = logging.getLogger(__name__)
 
@@ -49,19 +50,30 @@ def get_parser_commands(device, data=parser_data):
     return commands
 
 def format_output(parser_data, tab=2):
-    '''Format the parsed output in an aligned intended structure'''
+    '''Format the parsed output in an aligned intended structure
+
+    For display; utils.serialize is much faster to persist parsed outputs.
+    None is returned for None.
+    '''
 
-    s = ['{\n']
     if parser_data is None:
         return parser_data
+    s = []
+    _format_output(parser_data, tab, s)
+    return ''.join(s)
+
+def _format_output(parser_data, tab, s):
+    '''append the formatted dictionary to s, joined once by format_output'''
+    s.append('{\n')
+    indent = '  '*tab
     for k,v in sorted(parser_data.items()):
+        s.append('%s%r: ' % (indent, k))
         if isinstance(v, dict):
-            v = format_output(v, tab+2)
+            _format_output(v, tab+2, s)
         else:
-            v = repr(v)
-        s.append('%s%r: %s,\n' % ('  '*tab, k, v))
+            s.append(repr(v))
+        s.append(',\n')
     s.append('%s}' % ('  '*(tab-2)))
-    return ''.join(s)
 
 def get_parser_exclude(command, device):
     try:
@@ -496,53 +508,8 @@ class Common():
                 >>> convert_intf_name(intf='Eth2/1')
         '''
 
-        # Please add more when face other type of interface
-        convert = {'Eth': 'Ethernet',
-                   'Lo': 'Loopback',
-                   'Fa': 'FastEthernet',
-                   'Fas': 'FastEthernet',
-                   'Po': 'Port-channel',
-                   'PO': 'Port-channel',
-                   'Null': 'Null',
-                   'Gi': 'GigabitEthernet',
-                   'Gig': 'GigabitEthernet',
-                   'GE': 'GigabitEthernet',
-                   'Te': 'TenGigabitEthernet',
-                   'Ten': 'TenGigabitEthernet',
-                   'Tw': 'TwoGigabitEthernet',
-                   'Two': 'TwoGigabitEthernet',
-                   'Twe': 'TwentyFiveGigE',
-                   'mgmt': 'mgmt',
-                   'Vl': 'Vlan',
-                   'Tu': 'Tunnel',
-                   'Fe': '',
-                   'Hs': 'HSSI',
-                   'AT': 'ATM',
-                   'Et': 'Ethernet',
-                   'BD': 'BDI',
-                   'Se': 'Serial',
-                   'Fo': 'FortyGigabitEthernet',
-                   'For': 'FortyGigabitEthernet',
-                   'Hu': 'HundredGigE',
-                   'Hun': 'HundredGigE',
-                   'vl': 'vasileft',
-                   'vr': 'vasiright',
-                   'BE': 'Bundle-Ether'
-                   }
-        m = re.search('([a-zA-Z]+)', intf) 
-        m1 = re.search('([\d\/\.]+)', intf)
-        if hasattr(m, 'group') and hasattr(m1, 'group'):
-            int_type = m.group(0)
-            int_port = m1.group(0)
-            if int_type in convert.keys():
-                return(convert[int_type] + int_port)
-            else:
-                # Unifying interface names
-                converted_intf = intf[0].capitalize()+intf[1:].replace(
-                    ' ','').replace('ethernet', 'Ethernet')
-                return(converted_intf)
-        else:
-            return(intf)
+        # Please add more in utils.interface_name
+        return interface_name.normalize(intf)
 
 
     @classmethod
@@ -0,0 +1,277 @@
+'''Counter deltas and rates between two parses of the same parser
+
+Parsers already flag their volatile keys in `exclude`. Among those, the
+integer leaves of the schema are monotonic counters (in_octets, in_pkts,
+in_crc_errors, ...). This module finds the counter paths of a parser class
+from its schema once, then only visits those paths of two parsed outputs to
+compute deltas and rates, detecting counter wraparound and counter resets
+(`last_clear` or device uptime going backwards).
+
+The values of all paths are gathered in flat columns and the deltas are
+computed in one pass over the columns, only the negative deltas being
+revisited for wrap/reset handling.
+
+example:
+
+    >>> before = ShowInterfaces(device=dev).parse()
+    >>> after = ShowInterfaces(device=dev).parse()
+    >>> counter_deltas(ShowInterfaces, before, after, interval=30)
+    >>> {'deltas': {('GigabitEthernet1', 'counters', 'in_octets'): 12000, ...},
+         'rates': {('GigabitEthernet1', 'counters', 'in_octets'): 400.0, ...},
+         'resets': [],
+         'wraps': []}
+'''
+
+# python
+import re
+
+# parser utils
+from .exclude import get_exclude_matcher
+
+# Excluded integer keys which are gauges (instant values), not counters
+GAUGE_KEYS = re.compile(r'.*(rate|load|size|reliability|max|bandwidth).*')
+
+# Sibling key holding the time since counters were cleared
+LAST_CLEAR = 'last_clear'
+
+WRAP_32 = 2 ** 32
+WRAP_64 = 2 ** 64
+
+# Wildcard level of a path template, for Any() and regex schema keys
+ANY = None
+
+# 1d02h, 2w3d, 1y2w, 3d04h
+DURATION_UNITS = re.compile(r'(\d+)([ywdhms])')
+UNIT_SECONDS = {'y': 31536000, 'w': 604800, 'd': 86400,
+                'h': 3600, 'm': 60, 's': 1}
+
+# parser class -> tuple of path templates
+_templates = {}
+
+
+def duration_to_seconds(value):
+    '''Convert a 'last clear' or uptime duration into seconds
+
+        Args:
+            value (`str`): duration as printed by the device
+
+        Returns:
+            int seconds, or None for 'never' and unknown formats
+
+        example:
+
+            >>> duration_to_seconds('1d02h')
+            >>> 93600
+            >>> duration_to_seconds('00:00:05')
+            >>> 5
+    '''
+    if not isinstance(value, str) or value == 'never':
+        return None
+    value = value.strip()
+    if ':' in value:
+        try:
+            seconds = 0
+            for part in value.split(':'):
+                seconds = seconds * 60 + int(part)
+            return seconds
+        except ValueError:
+            return None
+    units = DURATION_UNITS.findall(value)
+    if not units:
+        return None
+    return sum(int(number) * UNIT_SECONDS[unit] for number, unit in units)
+
+
+def _schema_key(key):
+    '''return the name of a schema key, ANY for wildcard keys'''
+    if isinstance(key, str):
+        return key
+    name = getattr(key, 'schema', None)
+    if isinstance(name, str):
+        return name
+    return ANY
+
+
+def _walk_schema(schema, matcher, prefix, templates):
+    for key, value in schema.items():
+        name = _schema_key(key)
+        path = prefix + (name,)
+        if isinstance(value, dict):
+            _walk_schema(value, matcher, path, templates)
+        elif value is int and name is not ANY and matcher(name) and \
+                not GAUGE_KEYS.match(name):
+            templates.append(path)
+
+
+def _walk_data(data, matcher, prefix, templates):
+    for key, value in data.items():
+        if isinstance(value, dict):
+            _walk_data(value, matcher, prefix + (key,), templates)
+        elif isinstance(value, int) and not isinstance(value, bool) and \
+                matcher(key) and not GAUGE_KEYS.match(str(key)):
+            templates.append(prefix + (key,))
+
+
+def counter_templates(parser, sample=None):
+    '''return the counter path templates of a parser class
+
+        Templates are derived from the schema and cached per class. ANY
+        (None) marks a level of the path where every key is visited. When
+        the schema cannot be walked (validators), the concrete paths of
+        `sample` are used instead and not cached.
+
+        Args:
+            parser (`class`): parser class, or instance
+            sample (`dict`): parsed output used when the schema has no
+                             usable counter paths
+
+        Returns:
+            tuple of path templates
+    '''
+    cls = parser if isinstance(parser, type) else type(parser)
+    try:
+        return _templates[cls]
+    except KeyError:
+        pass
+
+    matcher = get_exclude_matcher(cls)
+    templates = []
+    schema = getattr(cls, 'schema', None)
+    if isinstance(schema, dict):
+        _walk_schema(schema, matcher, (), templates)
+
+    if templates:
+        templates = _templates[cls] = tuple(templates)
+        return templates
+
+    templates = []
+    if sample:
+        _walk_data(sample, matcher, (), templates)
+    return tuple(templates)
+
+
+def _expand(data, template, index=0, prefix=()):
+    '''yield (path, value) of every concrete path matching a template'''
+    if index == len(template):
+        yield prefix, data
+        return
+    if not isinstance(data, dict):
+        return
+    key = template[index]
+    if key is ANY:
+        for name, value in data.items():
+            yield from _expand(value, template, index + 1, prefix + (name,))
+    elif key in data:
+        yield from _expand(data[key], template, index + 1, prefix + (key,))
+
+
+def _lookup(data, path):
+    for key in path:
+        try:
+            data = data[key]
+        except (KeyError, TypeError):
+            return None
+    return data
+
+
+def _cleared(before, after, parent):
+    '''Check if counters under parent were cleared between the two parses'''
+    old = _lookup(before, parent + (LAST_CLEAR,))
+    new = _lookup(after, parent + (LAST_CLEAR,))
+    if old is None or new is None or old == new:
+        return False
+    old_seconds = duration_to_seconds(old)
+    new_seconds = duration_to_seconds(new)
+    if new_seconds is None:
+        return False
+    return old_seconds is None or new_seconds < old_seconds
+
+
+def counter_deltas(parser, before, after, interval=None, uptime=None):
+    '''Compute counter deltas and rates between two parsed outputs
+
+        Only the integer keys listed in the parser `exclude` are visited.
+        Counters of a dictionary whose `last_clear` went backwards, or all
+        counters when `uptime` shows a reload, are resets: the delta is the
+        new value. Otherwise a counter lower than its previous value is:
+
+          * a 64-bit wrap, when the previous value did not fit 32 bits and
+            the wrapped delta is below half the 64-bit range;
+          * a 32-bit wrap, when the previous value fit 32 bits and the
+            wrapped delta is below half the 32-bit range;
+          * a reset otherwise.
+
+        Args:
+            parser (`class`): parser class both outputs were parsed with
+            before (`dict`): earlier parsed output
+            after (`dict`): later parsed output
+            interval (`float`): seconds between both parses, enables rates
+            uptime (`tuple`): device uptime in seconds (before, after)
+
+        Returns:
+            dict with 'deltas' and 'rates' ({path: value}) and the 'resets'
+            and 'wraps' lists of paths. Paths only present in one of the
+            outputs are skipped.
+    '''
+    reloaded = bool(uptime) and uptime[1] < uptime[0]
+
+    # Gather columns
+    paths = []
+    old_values = []
+    new_values = []
+    for template in counter_templates(parser, sample=after):
+        for path, value in _expand(after, template):
+            if not isinstance(value, int):
+                continue
+            old = _lookup(before, path)
+            if not isinstance(old, int):
+                continue
+            paths.append(path)
+            old_values.append(old)
+            new_values.append(value)
+
+    deltas = [new - old for new, old in zip(new_values, old_values)]
+
+    # Reset detection is done once per dictionary holding counters
+    cleared = {}
+    for path in paths:
+        parent = path[:-1]
+        if parent not in cleared:
+            cleared[parent] = reloaded or _cleared(before, after, parent)
+    any_cleared = any(cleared.values())
+
+    # Only revisit negative deltas and cleared dictionaries
+    resets = []
+    wraps = []
+    for index, delta in enumerate(deltas):
+        if delta >= 0 and not any_cleared:
+            continue
+        path = paths[index]
+        new = new_values[index]
+        old = old_values[index]
+        if cleared[path[:-1]]:
+            deltas[index] = new
+            resets.append(path)
+        elif delta >= 0:
+            continue
+        elif old >= WRAP_32:
+            if new + WRAP_64 - old <= WRAP_64 // 2:
+                deltas[index] = new + WRAP_64 - old
+                wraps.append(path)
+            else:
+                deltas[index] = new
+                resets.append(path)
+        elif new + WRAP_32 - old <= WRAP_32 // 2:
+            deltas[index] = new + WRAP_32 - old
+            wraps.append(path)
+        else:
+            deltas[index] = new
+            resets.append(path)
+
+    ret_dict = {'deltas': dict(zip(paths, deltas)),
+                'resets': resets,
+                'wraps': wraps}
+    if interval:
+        ret_dict['rates'] = {path: delta / interval
+                             for path, delta in zip(paths, deltas)}
+    return ret_dict
@@ -0,0 +1,247 @@
+'''Structural diff of parsed outputs honoring parser `exclude` lists
+
+Change verification compares pre/post snapshots of the same parsers. Most of
+those trees are identical apart from the volatile keys listed in the parser
+`exclude`. This module computes a digest of every dictionary/list of a tree,
+ignoring excluded keys, so that identical subtrees are skipped with a single
+comparison and only the differing branches are walked.
+
+Digests are kept in a DigestCache, which should be reused when the same
+snapshot is compared several times (one pre snapshot against many post
+snapshots). The cache keeps the most recently used digests only, so the
+post snapshots it has seen are released once they are no longer compared.
+One-off comparisons only rely on equality of subtrees, which must also hold
+for the types of the values: 1, 1.0 and True are different values.
+
+example:
+
+    >>> from genie.libs.parser.utils.diff import diff
+    >>> diff(pre, post, exclude=ShowIpRoute)
+    >>> {'added': {('vrf', 'default', ...): {...}},
+         'removed': {},
+         'changed': {('vrf', 'default', ..., 'metric'): (1, 2)}}
+'''
+
+# python
+import hashlib
+from collections import OrderedDict
+
+# parser utils
+from .exclude import get_exclude_matcher
+from .serialize import canonical
+
+# Default number of containers a DigestCache keeps a digest of
+MAXSIZE = 262144
+
+
+class DigestCache(object):
+    '''Digest of the containers of parsed outputs, ignoring excluded keys
+
+        Containers are cached by identity, a reference to each container is
+        kept so the identity stays valid while it is cached. Once `maxsize`
+        containers are cached, the least recently used ones are dropped
+        together with their reference. Two subtrees with the same digest
+        are considered identical. A digest is the SHA-256 of the canonical
+        binary form of utils.serialize, which tags the type of every value,
+        the nested containers being replaced by their own digest.
+
+        Computing the digest of a tree costs about one plain walk of it,
+        so it only pays off when the tree is compared more than once. With
+        `compute` disabled, only digests already in the cache are used and
+        differing subtrees are walked.
+
+        Args:
+            exclude (`list`): parser class, or `exclude` list of key names
+                              and regular expressions
+            compute (`bool`): compute digests of compared subtrees.
+                              Default to True
+            maxsize (`int`): number of containers to keep a digest of.
+                             Default to MAXSIZE
+    '''
+
+    def __init__(self, exclude=None, compute=True, maxsize=MAXSIZE):
+        self.matcher = get_exclude_matcher(exclude or [])
+        self.compute = compute
+        self.maxsize = maxsize
+        # id -> (container, digest), least recently used first
+        self._digests = OrderedDict()
+        # key set -> excluded keys of that key set; records of a table
+        # share the same key sets
+        self._excluded = {}
+
+    def __len__(self):
+        return len(self._digests)
+
+    def clear(self):
+        '''Drop all digests and the references to the cached containers,
+           e.g. once the reused snapshot is no longer compared'''
+        self._digests.clear()
+        self._excluded.clear()
+
+    def excluded(self, node):
+        '''return the excluded keys of a dictionary'''
+        matcher = self.matcher
+        if matcher.patterns is None:
+            return matcher.keys.intersection(node)
+
+        keyset = frozenset(node)
+        try:
+            return self._excluded[keyset]
+        except KeyError:
+            pass
+        excluded = frozenset(key for key in keyset if matcher(key))
+        if len(self._excluded) < 65536:
+            self._excluded[keyset] = excluded
+        return excluded
+
+    def same(self, old, new):
+        '''Check if two containers are identical, ignoring excluded keys'''
+        digests = self._digests
+        if id(old) in digests and id(new) in digests:
+            digests.move_to_end(id(old))
+            digests.move_to_end(id(new))
+            return digests[id(old)][1] == digests[id(new)][1]
+        # Plain equality runs in C and catches subtrees without any change,
+        # the types are then checked as it takes 1 == 1.0 == True
+        if old == new and equal(old, new):
+            return True
+        if self.compute:
+            return self.digest(old) == self.digest(new)
+        return False
+
+    def digest(self, node):
+        '''return the digest of a parsed value'''
+        if isinstance(node, dict):
+            cached = self._cached(node)
+            if cached is not None:
+                return cached
+            excluded = self.excluded(node)
+            digest = self.digest
+            data = {key: digest(item) if isinstance(item, (dict, list))
+                    else item for key, item in node.items()
+                    if key not in excluded}
+        elif isinstance(node, list):
+            cached = self._cached(node)
+            if cached is not None:
+                return cached
+            digest = self.digest
+            data = [digest(item) if isinstance(item, (dict, list)) else item
+                    for item in node]
+        else:
+            return hashlib.sha256(canonical(node, _tagged_repr)).digest()
+
+        value = hashlib.sha256(canonical(data, _tagged_repr)).digest()
+        digests = self._digests
+        digests[id(node)] = (node, value)
+        if len(digests) > self.maxsize:
+            digests.popitem(last=False)
+        return value
+
+    def _cached(self, node):
+        '''return the cached digest of a container, or None'''
+        try:
+            value = self._digests[id(node)][1]
+        except KeyError:
+            return None
+        self._digests.move_to_end(id(node))
+        return value
+
+
+def _tagged_repr(value):
+    '''serializable form of the values utils.serialize does not support'''
+    return ['{}.{}'.format(type(value).__module__, type(value).__qualname__),
+            repr(value)]
+
+
+def equal(old, new):
+    '''Check if two parsed values are equal, values of different types
+       being different, unlike == which takes 1 == 1.0 == True'''
+    if type(old) is not type(new):
+        return False
+    if isinstance(old, dict):
+        return old.keys() == new.keys() and all(
+            equal(value, new[key]) for key, value in old.items())
+    if isinstance(old, list):
+        return len(old) == len(new) and all(map(equal, old, new))
+    return old == new
+
+
+def diff(before, after, exclude=None, cache=None):
+    '''Compare two parsed outputs
+
+        Excluded keys are ignored at every level of the trees. Lists are
+        compared index by index.
+
+        Args:
+            before (`dict`): earlier parsed output
+            after (`dict`): later parsed output
+            exclude (`list`): parser class, or `exclude` list of key names
+                              and regular expressions
+            cache (`DigestCache`): digests to reuse across calls, its
+                                   exclude list is used when given.
+                                   Pass one when a snapshot is compared
+                                   several times.
+
+        Returns:
+            dict with
+                'added': {path: value} only found in after
+                'removed': {path: value} only found in before
+                'changed': {path: (old value, new value)}
+            where path is the tuple of keys (or list indexes) from the root
+    '''
+    if cache is None:
+        # One-off comparison, digests would not be reused
+        cache = DigestCache(exclude, compute=False)
+
+    result = {'added': {}, 'removed': {}, 'changed': {}}
+    _compare(before, after, (), cache, result)
+    return result
+
+
+def _compare(old, new, path, cache, result):
+    if old is new:
+        return
+
+    if isinstance(old, dict) and isinstance(new, dict):
+        if not cache.same(old, new):
+            _diff_dict(old, new, path, cache, result)
+    elif isinstance(old, list) and isinstance(new, list):
+        if not cache.same(old, new):
+            _diff_list(old, new, path, cache, result)
+    elif type(old) is not type(new) or old != new:
+        result['changed'][path] = (old, new)
+
+
+def _diff_dict(old, new, path, cache, result):
+    excluded = cache.excluded(old) | cache.excluded(new)
+    removed = result['removed']
+    added = result['added']
+
+    for key in old.keys() - new.keys() - excluded:
+        removed[path + (key,)] = old[key]
+
+    for key, value in new.items():
+        if key in excluded:
+            continue
+        try:
+            old_value = old[key]
+        except KeyError:
+            added[path + (key,)] = value
+            continue
+        # Most leaves did not change, skip them without a call
+        if old_value is value or (old_value == value and
+                                  type(old_value) is type(value) and
+                                  not isinstance(value, (dict, list))):
+            continue
+        _compare(old_value, value, path + (key,), cache, result)
+
+
+def _diff_list(old, new, path, cache, result):
+    for index, (old_value, value) in enumerate(zip(old, new)):
+        _compare(old_value, value, path + (index,), cache, result)
+
+    for index in range(len(new), len(old)):
+        result['removed'][path + (index,)] = old[index]
+
+    for index in range(len(old), len(new)):
+        result['added'][path + (index,)] = new[index]
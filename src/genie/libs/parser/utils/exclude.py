@@ -0,0 +1,92 @@
+'''Compiled matchers for parser `exclude` lists
+
+Parser classes declare the keys of their schema holding volatile values
+(counters, timers, ...) in the `exclude` class attribute. Entries are either
+plain key names ('in_octets') or regular expressions ('(Tunnel.*)').
+This module compiles such a list once per parser class so that checking a
+key is a set lookup, only falling back to the regular expressions for keys
+which are not plain names.
+'''
+
+# python
+import re
+
+# Plain key names, everything else is handled as a regular expression
+PLAIN_KEY = re.compile(r'^[\w\-\.: ]+$')
+
+
+class ExcludeMatcher(object):
+    '''Match dictionary keys against a parser `exclude` list
+
+        Args:
+            exclude (`list`): key names and/or regular expressions
+
+        example:
+
+            >>> matcher = ExcludeMatcher(['in_octets', '(Tunnel.*)'])
+            >>> matcher('in_octets')
+            >>> True
+            >>> matcher('Tunnel10')
+            >>> True
+    '''
+
+    __slots__ = ('keys', 'patterns', '_cache')
+
+    def __init__(self, exclude=None):
+        self.keys = set()
+        patterns = []
+        for item in exclude or []:
+            if PLAIN_KEY.match(item):
+                self.keys.add(item)
+            else:
+                patterns.append(item)
+        self.patterns = re.compile('|'.join('(?:{})'.format(p)
+                                            for p in patterns)) \
+            if patterns else None
+        # Result of the regular expressions per key, keys repeat a lot
+        # across records (interface names, counter names)
+        self._cache = {}
+
+    def __call__(self, key):
+        if key in self.keys:
+            return True
+        if self.patterns is None:
+            return False
+        try:
+            return self._cache[key]
+        except KeyError:
+            pass
+        except TypeError:
+            # unhashable keys are never excluded
+            return False
+        matched = self.patterns.fullmatch(str(key)) is not None
+        if len(self._cache) < 65536:
+            self._cache[key] = matched
+        return matched
+
+    def __bool__(self):
+        return bool(self.keys) or self.patterns is not None
+
+
+# parser class -> ExcludeMatcher
+_matchers = {}
+
+
+def get_exclude_matcher(parser):
+    '''return the compiled `exclude` matcher of a parser class
+
+        Args:
+            parser (`class`): parser class or instance, or an exclude list
+
+        Returns:
+            ExcludeMatcher object, cached per parser class
+    '''
+    if isinstance(parser, (list, tuple, set)):
+        return ExcludeMatcher(parser)
+
+    cls = parser if isinstance(parser, type) else type(parser)
+    try:
+        return _matchers[cls]
+    except KeyError:
+        matcher = _matchers[cls] = ExcludeMatcher(getattr(cls, 'exclude', []))
+        return matcher
@@ -0,0 +1,255 @@
+'''Cache of the static facts of the devices
+
+ShowVersion, ShowInventory, ShowPlatform and ShowModule are parsed many
+times per device and job, although their results only change when the
+device reloads or its hardware changes. StaticFacts keeps their parsed
+results per device, a repeated parse returns a copy of the result without
+running the command or the parser:
+
+    >>> facts = StaticFacts()
+    >>> version = facts.parse(device, ShowVersion)
+    >>> facts.parse(device, ShowInventory)
+
+The results of a device are dropped when it reloads. The uptime of the
+device is read when its first result is stored, then again on the first
+parse once revalidate seconds have passed. The device reloaded when its
+uptime grew less than the time elapsed since the previous reading, its boot
+time moved. The uptime is read with:
+
+  * 'ios', 'iosxe', 'iosxr', 'nxos': ShowVersion, its fresh result is
+    stored too
+  * 'junos': ShowSystemUptime
+
+Results of devices of other OSes are kept until flushed. flush() drops the
+results of a device, or of all the devices, after a hardware change.
+
+The parsers calling each other and the scripts share the cache of the
+module functions parse() and flush().
+'''
+
+# python
+import re
+import copy
+import time
+import weakref
+import importlib
+
+# Default seconds between two readings of the uptime of a device
+REVALIDATE = 300
+
+# Seconds the boot time may move between two readings without a reload:
+# the uptimes are printed to the minute
+SLACK = 120
+
+# Static facts of each OS, in the order warm() parses them
+STATIC = {
+    'ios': ('ios.show_platform', ('ShowVersion', 'ShowInventory',
+                                  'ShowPlatform', 'ShowModule')),
+    'iosxe': ('iosxe.show_platform', ('ShowVersion', 'ShowInventory',
+                                      'ShowPlatform', 'ShowModule')),
+    'iosxr': ('iosxr.show_platform', ('ShowVersion', 'ShowInventory',
+                                      'ShowPlatform')),
+    'nxos': ('nxos.show_platform', ('ShowVersion', 'ShowInventory',
+                                    'ShowModule')),
+    'junos': ('junos.show_chassis', ('ShowChassisHardware',
+                                     'ShowChassisFpc')),
+}
+
+# 2 years, 3 weeks, 1 day, 4 hours, 27 minutes
+_CISCO = re.compile(r'(\d+) +(year|week|day|hour|minute|second)s?')
+
+# Seconds of the units of the Cisco uptimes
+_UNITS = {'year': 365 * 86400, 'week': 7 * 86400, 'day': 86400,
+          'hour': 3600, 'minute': 60, 'second': 1}
+
+# 29w6d 23:14, 11:03:05
+_JUNOS = re.compile(r'^(?:(\d+)w)?(?:(\d+)d)? *(\d+):(\d+)(?::(\d+))?$')
+
+
+def cisco_uptime(text):
+    '''return the seconds of an IOS, IOS-XE, IOS-XR or NX-OS uptime
+
+        Raises:
+            ValueError: text is not an uptime
+    '''
+    units = _CISCO.findall(text)
+    if not units:
+        raise ValueError('{!r} is not an uptime'.format(text))
+    return sum(int(count) * _UNITS[unit] for count, unit in units)
+
+
+def junos_uptime(text):
+    '''return the seconds of a Junos uptime, '29w6d 23:14' or '11:03:05'
+
+        Raises:
+            ValueError: text is not an uptime
+    '''
+    m = _JUNOS.match(text.strip())
+    if not m:
+        raise ValueError('{!r} is not an uptime'.format(text))
+    weeks, days, first, second, third = m.groups()
+    if third is None:
+        # hours:minutes
+        hours, minutes, seconds = first, second, 0
+    else:
+        hours, minutes, seconds = first, second, third
+    return (int(weeks or 0) * 604800 + int(days or 0) * 86400 +
+            int(hours) * 3600 + int(minutes) * 60 + int(seconds))
+
+
+def _nxos(parsed):
+    uptime = parsed['platform']['kernel_uptime']
+    return (uptime.get('days', 0) * 86400 + uptime.get('hours', 0) * 3600 +
+            uptime.get('minutes', 0) * 60 + uptime.get('seconds', 0))
+
+
+# os -> (module, parser, function returning the uptime of its result)
+UPTIME = {
+    'ios': ('ios.show_platform', 'ShowVersion',
+            lambda parsed: cisco_uptime(parsed['version']['uptime'])),
+    'iosxe': ('iosxe.show_platform', 'ShowVersion',
+              lambda parsed: cisco_uptime(parsed['version']['uptime'])),
+    'iosxr': ('iosxr.show_platform', 'ShowVersion',
+              lambda parsed: cisco_uptime(parsed['uptime'])),
+    'nxos': ('nxos.show_platform', 'ShowVersion', _nxos),
+    'junos': ('junos.show_system', 'ShowSystemUptime',
+              lambda parsed: junos_uptime(
+                  parsed['system-uptime-information']['system-booted-time']
+                  ['time-length']['#text'])),
+}
+
+
+def _parser(module, name):
+    '''return the parser class name of module, relative to the package'''
+    return getattr(importlib.import_module(
+        'genie.libs.parser.' + module), name)
+
+
+class _Device(object):
+    '''Cached results and boot time of a device'''
+
+    def __init__(self):
+        # (parser, arguments) -> parsed result
+        self.results = {}
+        # Estimated boot time, monotonic clock; None before the first reading
+        self.boot = None
+        # Monotonic time of the last reading of the uptime
+        self.checked = None
+
+
+class StaticFacts(object):
+    '''Parsed static facts per device, dropped on reload
+
+        Args:
+            revalidate (`int`): seconds between two readings of the uptime
+                                of a device. Default 300, None never
+                                reads it again
+
+        Attributes:
+            hits (`int`): parses answered from the cache
+            misses (`int`): parses which ran the parser
+            reloads (`int`): reloads detected
+    '''
+
+    def __init__(self, revalidate=REVALIDATE):
+        self.revalidate = revalidate
+        self.hits = 0
+        self.misses = 0
+        self.reloads = 0
+        self._devices = weakref.WeakKeyDictionary()
+
+    @staticmethod
+    def key(parser, **kwargs):
+        '''return the key of the result of parser with the arguments'''
+        return (parser.__module__, parser.__qualname__,
+                repr(sorted(kwargs.items())))
+
+    def _state(self, device):
+        state = self._devices.get(device)
+        if state is None:
+            state = self._devices[device] = _Device()
+        return state
+
+    def _read_uptime(self, device, state):
+        '''read the uptime of device, drop its results if it reloaded.
+        The device reloaded as well when the uptime cannot be read'''
+        now = state.checked = time.monotonic()
+        os = getattr(device, 'os', None)
+        if os not in UPTIME:
+            return
+        module, name, seconds = UPTIME[os]
+        parser = _parser(module, name)
+        try:
+            parsed = parser(device=device).parse()
+            boot = now - seconds(parsed)
+        except Exception:
+            parsed, boot = None, None
+        if boot is None or (state.boot is not None and
+                            boot - state.boot > SLACK):
+            if state.results:
+                self.reloads += 1
+            state.results.clear()
+            state.boot = boot
+        elif state.boot is None:
+            # The first estimate is kept, the next ones move by the rounding
+            state.boot = boot
+        if parsed is not None and name in STATIC[os][1]:
+            state.results[self.key(parser)] = parsed
+
+    def parse(self, device, parser, **kwargs):
+        '''return a copy of the parsed result of parser on device, parsed
+        on the first call
+
+            Args:
+                device (`Device`): device of the parser
+                parser (`class`): parser class of a static fact
+                kwargs: arguments of parse()
+        '''
+        state = self._state(device)
+        if state.checked is None or (
+                self.revalidate is not None and
+                time.monotonic() - state.checked >= self.revalidate):
+            self._read_uptime(device, state)
+        key = self.key(parser, **kwargs)
+        result = state.results.get(key)
+        if result is not None:
+            self.hits += 1
+        else:
+            self.misses += 1
+            result = state.results[key] = parser(device=device).parse(
+                **kwargs)
+        return copy.deepcopy(result)
+
+    def warm(self, device):
+        '''parse the static facts of the OS of device, return the names of
+        the parsers which failed'''
+        module, names = STATIC.get(getattr(device, 'os', None), (None, ()))
+        failed = []
+        for name in names:
+            try:
+                self.parse(device, _parser(module, name))
+            except Exception:
+                failed.append(name)
+        return failed
+
+    def flush(self, device=None):
+        '''drop the results of device, of all the devices when None'''
+        if device is None:
+            self._devices.clear()
+        else:
+            self._devices.pop(device, None)
+
+
+# Cache shared by the module functions
+FACTS = StaticFacts()
+
+
+def parse(device, parser, **kwargs):
+    '''return FACTS.parse(device, parser, **kwargs)'''
+    return FACTS.parse(device, parser, **kwargs)
+
+
+def flush(device=None):
+    '''drop the results of device from FACTS, of all the devices when
+    None'''
+    FACTS.flush(device)
@@ -0,0 +1,166 @@
+'''Interface name normalization
+
+Parsers convert the short interface names of the outputs ('Gi0/1',
+'Eth2/1', 'Po10') to the full names of the standard ('GigabitEthernet0/1').
+Tabular outputs do it once per line, often for the same few names, so the
+conversion is memoized and the patterns compiled once.
+
+The abbreviations are looked up in the table of the OS:
+
+  * None, 'ios', 'iosxe': the historical table and rules of
+    Common.convert_intf_name(). The type is the first run of letters of the
+    name and the port the first run of digits, '/' and '.'; a known type is
+    replaced by its full name followed by the port, otherwise the name is
+    capitalized and its spaces removed
+  * 'iosxr': IOS-XR names ('Te' is 'TenGigE', 'BE' 'Bundle-Ether')
+  * 'nxos': NX-OS names ('Po' is 'port-channel', 'Lo' 'loopback')
+  * 'junos': names are returned unchanged, Junos prints full names
+
+On IOS-XR and NX-OS the name is the leading letters, the type, followed by
+a digit; a known type is replaced by its full name and the rest of the name
+is kept ('Mg0/RP0/CPU0/0'). Other names are returned unchanged, the outputs
+already print full names in lower or mixed case.
+
+example:
+
+    >>> normalize('Gi0/1')
+    'GigabitEthernet0/1'
+    >>> normalize('Te0/0/0/1', os='iosxr')
+    'TenGigE0/0/0/1'
+    >>> normalize_many(['Eth1/1', 'Po10'], os='nxos')
+    ['Ethernet1/1', 'port-channel10']
+'''
+
+# python
+import re
+import functools
+
+# Names memoized, per OS; a 5k port chassis fits
+MEMO_SIZE = 8192
+
+# Please add more when face other type of interface
+COMMON = {
+    'Eth': 'Ethernet',
+    'Lo': 'Loopback',
+    'Fa': 'FastEthernet',
+    'Fas': 'FastEthernet',
+    'Po': 'Port-channel',
+    'PO': 'Port-channel',
+    'Null': 'Null',
+    'Gi': 'GigabitEthernet',
+    'Gig': 'GigabitEthernet',
+    'GE': 'GigabitEthernet',
+    'Te': 'TenGigabitEthernet',
+    'Ten': 'TenGigabitEthernet',
+    'Tw': 'TwoGigabitEthernet',
+    'Two': 'TwoGigabitEthernet',
+    'Twe': 'TwentyFiveGigE',
+    'mgmt': 'mgmt',
+    'Vl': 'Vlan',
+    'Tu': 'Tunnel',
+    'Fe': '',
+    'Hs': 'HSSI',
+    'AT': 'ATM',
+    'Et': 'Ethernet',
+    'BD': 'BDI',
+    'Se': 'Serial',
+    'Fo': 'FortyGigabitEthernet',
+    'For': 'FortyGigabitEthernet',
+    'Hu': 'HundredGigE',
+    'Hun': 'HundredGigE',
+    'vl': 'vasileft',
+    'vr': 'vasiright',
+    'BE': 'Bundle-Ether',
+}
+
+IOSXR = {
+    'BE': 'Bundle-Ether',
+    'BV': 'BVI',
+    'Gi': 'GigabitEthernet',
+    'Te': 'TenGigE',
+    'Tf': 'TwentyFiveGigE',
+    'TF': 'TwentyFiveGigE',
+    'Fo': 'FortyGigE',
+    'Fi': 'FiftyGigE',
+    'Hu': 'HundredGigE',
+    'FH': 'FourHundredGigE',
+    'Lo': 'Loopback',
+    'Mg': 'MgmtEth',
+    'Nu': 'Null',
+    'tt': 'tunnel-te',
+    'ti': 'tunnel-ip',
+}
+
+NXOS = {
+    'Eth': 'Ethernet',
+    'Et': 'Ethernet',
+    'Po': 'port-channel',
+    'Lo': 'loopback',
+    'Vl': 'Vlan',
+    'Tu': 'Tunnel',
+    'mgmt': 'mgmt',
+    'Nve': 'nve',
+}
+
+# os -> (abbreviations, unknown types capitalized), None: name unchanged
+TABLES = {
+    None: (COMMON, True),
+    'ios': (COMMON, True),
+    'iosxe': (COMMON, True),
+    'iosxr': (IOSXR, False),
+    'nxos': (NXOS, False),
+    'junos': None,
+}
+
+_TYPE = re.compile(r'[a-zA-Z]+')
+_PORT = re.compile(r'[\d/.]+')
+_NAME = re.compile(r'([a-zA-Z]+) ?(\d.*)$')
+
+
+@functools.lru_cache(maxsize=MEMO_SIZE)
+def _normalize(intf, os):
+    table = TABLES[os]
+    if table is None:
+        return intf
+    abbreviations, unify = table
+    if not unify:
+        m = _NAME.match(intf)
+        if not m:
+            return intf
+        full = abbreviations.get(m.group(1))
+        return intf if full is None else full + m.group(2)
+    m = _TYPE.search(intf)
+    m1 = _PORT.search(intf)
+    if not m or not m1:
+        return intf
+    full = abbreviations.get(m.group(0))
+    if full is not None:
+        return full + m1.group(0)
+    # Unifying interface names
+    return intf[0].capitalize() + intf[1:].replace(
+        ' ', '').replace('ethernet', 'Ethernet')
+
+
+def normalize(intf, os=None):
+    '''return the full interface name of intf
+
+        Args:
+            intf (`str`): interface name, short or full
+            os (`str`): OS of the output, key of TABLES. Default None, the
+                        table of Common.convert_intf_name()
+
+        Raises:
+            KeyError: os has no table
+    '''
+    return _normalize(intf, os)
+
+
+def normalize_many(names, os=None):
+    '''return the list of the full names of names, tabular outputs'''
+    function = _normalize
+    return [function(intf, os) for intf in names]
+
+
+def cache_clear():
+    '''empty the memo, after changing a table'''
+    _normalize.cache_clear()
@@ -0,0 +1,141 @@
+'''IP address and prefix values
+
+Parsers normalize the addresses of the outputs: OSPF areas printed as
+integers are converted to their dotted form, routes printed as prefixes are
+split into address and netmask. Building netaddr objects for each line
+costs more than the parse of the line, these helpers work on strings with
+the socket and struct modules and memoize the values met again and again
+(areas, netmasks, the prefixes of a routing table).
+
+IPv4 addresses are read as inet_aton() reads them, like netaddr: '1' is
+'0.0.0.1'. Invalid values raise ValueError.
+
+example:
+
+    >>> area('1')
+    '0.0.0.1'
+    >>> prefix('169.254.0.0/16')
+    ('169.254.0.0', '255.255.0.0')
+    >>> netmask(24)
+    '255.255.255.0'
+    >>> to_int('10.0.0.1'), from_int(167772161)
+    (167772161, '10.0.0.1')
+'''
+
+# python
+import socket
+import struct
+import functools
+import ipaddress
+
+# Areas and netmasks memoized
+MEMO_SIZE = 1024
+
+# Prefixes memoized, the routes seen again by the next parses
+PREFIX_MEMO_SIZE = 4096
+
+_IPV4_MAX = 0xffffffff
+_IPV6_MAX = (1 << 128) - 1
+
+
+def _aton(address):
+    '''return the packed form of an IPv4 address, read by inet_aton()'''
+    try:
+        return socket.inet_aton(address)
+    except (OSError, TypeError):
+        raise ValueError('Invalid IPv4 address {!r}'.format(address))
+
+
+@functools.lru_cache(maxsize=MEMO_SIZE)
+def area(value):
+    '''return the dotted decimal form of an OSPF area
+
+        Args:
+            value (`str`, `int`): area, '0', 0 or '0.0.0.0'
+    '''
+    return socket.inet_ntoa(_aton(str(value)))
+
+
+@functools.lru_cache(maxsize=MEMO_SIZE)
+def netmask(length, version=4):
+    '''return the netmask of a prefix length
+
+        Args:
+            length (`int`, `str`): prefix length
+            version (`int`): 4 or 6. Default 4
+    '''
+    bits = 32 if version == 4 else 128
+    try:
+        length = int(length)
+    except ValueError:
+        raise ValueError('Invalid prefix length {!r}'.format(length))
+    if not 0 <= length <= bits:
+        raise ValueError('Invalid prefix length {!r}'.format(length))
+    mask = ((1 << bits) - 1) ^ ((1 << (bits - length)) - 1)
+    if version == 4:
+        return socket.inet_ntoa(struct.pack('>I', mask))
+    return str(ipaddress.IPv6Address(mask))
+
+
+@functools.lru_cache(maxsize=MEMO_SIZE)
+def prefix_length(mask):
+    '''return the prefix length of an IPv4 netmask, '255.255.255.0': 24'''
+    value = struct.unpack('>I', _aton(mask))[0]
+    length = bin(value).count('1')
+    if value != _IPV4_MAX ^ (_IPV4_MAX >> length):
+        raise ValueError('Invalid netmask {!r}'.format(mask))
+    return length
+
+
+@functools.lru_cache(maxsize=PREFIX_MEMO_SIZE)
+def prefix(value):
+    '''return (address, netmask) of a prefix
+
+        Args:
+            value (`str`): 'address/length' or 'address/netmask', an
+                           address alone is a host prefix
+
+        example:
+
+            >>> prefix('2001:db8::1/64')
+            ('2001:db8::1', 'ffff:ffff:ffff:ffff::')
+    '''
+    address, _, length = value.partition('/')
+    if ':' in address:
+        try:
+            interface = ipaddress.IPv6Interface(value)
+        except ValueError:
+            raise ValueError('Invalid prefix {!r}'.format(value))
+        return str(interface.ip), str(interface.netmask)
+    address = socket.inet_ntoa(_aton(address))
+    if not length:
+        return address, netmask(32)
+    if '.' in length:
+        return address, netmask(prefix_length(length))
+    return address, netmask(length)
+
+
+def to_int(address):
+    '''return the integer of an IPv4 or IPv6 address'''
+    if ':' in address:
+        try:
+            return int(ipaddress.IPv6Address(address))
+        except ValueError:
+            raise ValueError('Invalid IPv6 address {!r}'.format(address))
+    return struct.unpack('>I', _aton(address))[0]
+
+
+def from_int(value, version=4):
+    '''return the address of an integer
+
+        Args:
+            value (`int`): address
+            version (`int`): 4 or 6. Default 4
+    '''
+    if version == 4:
+        if not 0 <= value <= _IPV4_MAX:
+            raise ValueError('Invalid IPv4 address {!r}'.format(value))
+        return socket.inet_ntoa(struct.pack('>I', value))
+    if not 0 <= value <= _IPV6_MAX:
+        raise ValueError('Invalid IPv6 address {!r}'.format(value))
+    return str(ipaddress.IPv6Address(value))
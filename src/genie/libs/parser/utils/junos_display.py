@@ -0,0 +1,214 @@
+'''Reader of Junos '| display xml' and '| display json' outputs
+
+Junos parsers use the tag names of the structured output as schema keys:
+
+    <route-information xmlns="http://xml.juniper.net/junos/18.2R1/junos-routing">
+        <route-table>
+            <table-name>inet.0</table-name>
+            <rt junos:style="brief">
+                <rt-destination>0.0.0.0/0</rt-destination>
+                <rt-entry>
+                    <active-tag>*</active-tag>
+                    <age junos:seconds="2085898">3w3d 03:24:58</age>
+                    ...
+
+is parsed into
+
+    {'route-information': {
+        'route-table': [{
+            'table-name': 'inet.0',
+            'rt': [{
+                '@junos:style': 'brief',
+                'rt-destination': '0.0.0.0/0',
+                'rt-entry': [{
+                    'active-tag': '*',
+                    'age': {'#text': '3w3d 03:24:58',
+                            '@junos:seconds': '2085898'},
+                    ...
+
+The elements to keep are given by a shape, a nested structure mirroring
+the schema of the parser:
+
+    * a dictionary: element with children, attributes ('@junos:style') and
+      text ('#text') are listed with the children
+    * a list holding one shape: element repeated in its parent, always
+      parsed into a list even when there is a single one
+    * str: leaf element, its text. Empty elements give ''
+    * bool: flag element such as <our-entry/>, True when present
+
+Elements and attributes which are not in the shape are skipped, so the
+result fits the schema of the parser whatever the release adds to the
+output.
+
+The xml output is fed to expat chunk by chunk and the result is built from
+the parser callbacks directly, no element tree is built. Namespaces are not
+processed, attributes keep the prefix of the output ('@junos:seconds').
+'''
+
+# python
+import json
+from xml.parsers import expat
+
+# Characters fed to the parser at once
+CHUNK_SIZE = 65536
+
+# Closing tag of the reply
+REPLY_END = '</rpc-reply>'
+
+
+def parse_xml(output, shape, chunk_size=CHUNK_SIZE):
+    '''return the dictionary of a '| display xml' output
+
+        Args:
+            output (`str`): device output
+            shape (`dict`): elements to keep, children of <rpc-reply>
+            chunk_size (`int`): characters fed to the parser at once
+
+        Returns:
+            dictionary of the kept elements, empty when the output has no
+            xml
+
+        Raises:
+            xml.parsers.expat.ExpatError: output is not valid xml
+    '''
+    start = output.find('<')
+    if start == -1:
+        return {}
+    # Skip the command echoed back and the prompt after the reply
+    end = output.rfind(REPLY_END)
+    end = end + len(REPLY_END) if end != -1 else output.rfind('>') + 1
+
+    result = {}
+    # (shape, dictionary) of the elements being read, (None, leaf) for a
+    # leaf element. The first element, <rpc-reply>, is the root.
+    stack = []
+    # Depth within an element which is not in the shape
+    skip = [0]
+    # Text since the last start or end of element
+    text = []
+
+    # Called once per element, closures are used over methods as they
+    # save the attribute lookups
+    def start_element(name, attrs):
+        if skip[0]:
+            skip[0] += 1
+            return
+        if not stack:
+            stack.append((shape, result))
+            return
+        parent_shape, parent = stack[-1]
+        try:
+            child = parent_shape[name]
+        except (KeyError, TypeError):
+            # Not in the shape, or child of a leaf
+            skip[0] = 1
+            return
+        repeated = child.__class__ is list
+        if repeated:
+            child = child[0]
+
+        if child.__class__ is dict:
+            value = {}
+            for key, attr in attrs.items():
+                key = '@' + key
+                if key in child:
+                    value[key] = attr
+            if repeated:
+                parent.setdefault(name, []).append(value)
+            else:
+                parent[name] = value
+            stack.append((child, value))
+        else:
+            # Leaf, the value is set at the end of the element
+            stack.append((None, (name, child, repeated)))
+        text.clear()
+
+    def end_element(name):
+        if skip[0]:
+            skip[0] -= 1
+            return
+        element_shape, value = stack.pop()
+        if element_shape is None:
+            name, kind, repeated = value
+            value = True if kind is bool else ''.join(text).strip()
+            parent = stack[-1][1]
+            if repeated:
+                parent.setdefault(name, []).append(value)
+            else:
+                parent[name] = value
+        elif '#text' in element_shape:
+            element_text = ''.join(text).strip()
+            if element_text:
+                value['#text'] = element_text
+        text.clear()
+
+    parser = expat.ParserCreate()
+    parser.buffer_text = True
+    parser.StartElementHandler = start_element
+    parser.EndElementHandler = end_element
+    parser.CharacterDataHandler = text.append
+    for index in range(start, end, chunk_size):
+        parser.Parse(output[index:min(index + chunk_size, end)], False)
+    parser.Parse('', True)
+    return result
+
+
+def parse_json(output, shape):
+    '''return the dictionary of a '| display json' output
+
+        Junos gives every element as a list of objects holding the
+        children, 'data' for the text and 'attributes':
+
+            {"route-table": [{"table-name": [{"data": "inet.0"}], ...}]}
+
+        Args:
+            output (`str`): device output
+            shape (`dict`): elements to keep, same shape as parse_xml
+
+        Returns:
+            dictionary of the kept elements, empty when the output has no
+            json
+
+        Raises:
+            ValueError: output is not valid json
+    '''
+    start = output.find('{')
+    if start == -1:
+        return {}
+    end = output.rfind('}') + 1
+    return _from_json(json.loads(output[start:end]), shape)
+
+
+def _from_json(node, shape):
+    result = {}
+    for key, value in node.items():
+        if key == 'attributes':
+            for name, text in value.items():
+                if '@' + name in shape:
+                    result['@' + name] = str(text)
+            continue
+        if key == 'data':
+            if '#text' in shape and value not in (None, [None]):
+                result['#text'] = str(value)
+            continue
+        try:
+            child = shape[key]
+        except KeyError:
+            continue
+        if not isinstance(value, list):
+            value = [value]
+
+        if isinstance(child, list):
+            result[key] = [_json_value(item, child[0]) for item in value]
+        else:
+            result[key] = _json_value(value[-1], child)
+    return result
+
+
+def _json_value(node, shape):
+    if isinstance(shape, dict):
+        return _from_json(node, shape)
+    if shape is bool:
+        return True
+    text = node.get('data') if isinstance(node, dict) else node
+    return '' if text in (None, [None]) else str(text)
@@ -0,0 +1,157 @@
+'''Lazy parsed results for record based outputs
+
+Outputs such as 'show interfaces' are a sequence of independent record
+blocks, each starting with a header line. When only a few records are
+needed, parsing every block is wasted work. LazyRecords scans the output
+once to index the record boundaries, then parses the block of a record the
+first time it is accessed. It behaves like a read-only dictionary of the
+parsed records.
+
+Some records are completed by other blocks (members of a port-channel,
+unnumbered interfaces); those links are declared so the related blocks are
+parsed together, giving the same record as a full parse.
+
+example:
+
+    >>> records = ShowInterfaces(device=device).parse_lazy(output=output)
+    >>> records['GigabitEthernet1']['mtu']
+    >>> 1500
+'''
+
+# python
+import bisect
+from collections.abc import Mapping
+
+# Substring of the lines which may be a record header: '<name> is ...'
+HEADER_MARKER = ' is '
+
+
+class LazyRecords(Mapping):
+    '''Read-only mapping parsing record blocks on first access
+
+        Args:
+            output (`str`): device output
+            parse (`callable`): parse(text) returning the dictionary of the
+                                records found in text
+            headers (`list`): compiled patterns matching a stripped header
+                              line, the record name is the `key` group
+            key (`str`): group name of the record name. Default 'interface'
+            marker (`str`): substring of the lines worth trying the
+                            headers on, located with str.find which is much
+                            faster than scanning the output with a regex.
+                            Default ' is '
+            links (`callable`): links(records) yielding (name, dependency)
+                                tuples: the block of dependency is needed to
+                                build the record of name
+            validate (`callable`): validate({name: record}) called once per
+                                   parsed record, schema validation
+    '''
+
+    def __init__(self, output, parse, headers, key='interface',
+                 marker=HEADER_MARKER, links=None, validate=None):
+        self.output = output
+        self._parse = parse
+        self._validate = validate
+        self._records = {}
+        # name -> (start, end) offsets of the block in output
+        self._blocks = {}
+        self._starts = []
+        self._names = []
+        # name -> names of the blocks completing the record
+        self._dependencies = {}
+
+        for start, line in self.lines_containing(marker):
+            for header in headers:
+                m = header.match(line)
+                if m:
+                    self._starts.append(start)
+                    self._names.append(m.group(key))
+                    break
+
+        # Close the blocks
+        ends = self._starts[1:] + [len(output)]
+        for name, start, end in zip(self._names, self._starts, ends):
+            if name not in self._blocks:
+                self._blocks[name] = []
+            self._blocks[name].append((start, end))
+
+        if links:
+            for name, dependency in links(self):
+                if name != dependency:
+                    self._dependencies.setdefault(name, set()).add(dependency)
+
+    def lines_containing(self, marker):
+        '''yield (offset, stripped line) of the lines containing marker'''
+        output = self.output
+        find = output.find
+        index = find(marker)
+        while index != -1:
+            start = output.rfind('\n', 0, index) + 1
+            end = find('\n', index)
+            if end == -1:
+                end = len(output)
+            yield start, output[start:end].strip()
+            index = find(marker, end)
+
+    def owner(self, position):
+        '''return the name of the record whose block holds an offset'''
+        index = bisect.bisect_right(self._starts, position) - 1
+        if index < 0:
+            return None
+        return self._names[index]
+
+    def block(self, name):
+        '''return the raw text of the block(s) of a record'''
+        return ''.join(self.output[start:end]
+                       for start, end in self._blocks.get(name, []))
+
+    def _related(self, name):
+        '''return the record and its dependencies, transitively'''
+        related = {name}
+        pending = [name]
+        while pending:
+            for dependency in self._dependencies.get(pending.pop(), ()):
+                if dependency not in related:
+                    related.add(dependency)
+                    pending.append(dependency)
+        return related
+
+    def __getitem__(self, name):
+        try:
+            return self._records[name]
+        except KeyError:
+            pass
+        if name not in self._blocks and name not in self._dependencies:
+            raise KeyError(name)
+
+        # Parse the blocks in output order, as a full parse would
+        spans = sorted(span for related in self._related(name)
+                       for span in self._blocks.get(related, []))
+        parsed = self._parse(''.join(self.output[start:end]
+                                     for start, end in spans))
+        record = parsed[name]
+        if self._validate:
+            self._validate({name: record})
+        self._records[name] = record
+        return record
+
+    def __iter__(self):
+        yield from self._blocks
+        for name in self._dependencies:
+            if name not in self._blocks:
+                yield name
+
+    def __len__(self):
+        return len(self._blocks) + sum(1 for name in self._dependencies
+                                       if name not in self._blocks)
+
+    def __contains__(self, name):
+        return name in self._blocks or name in self._dependencies
+
+    def parsed(self):
+        '''return the names of the records parsed so far'''
+        return list(self._records)
+
+    def to_dict(self):
+        '''Parse the whole output at once and return a plain dictionary'''
+        return self._parse(self.output)
@@ -0,0 +1,263 @@
+'''Incremental tailing of device log buffers
+
+Log parsers such as iosxe 'show logging', nxos 'show logging logfile' and
+junos 'show log {filename}' return the whole buffer on every call. Pollers
+that run those commands periodically only care about the lines logged since
+the previous poll. This module keeps a per-device high-water mark (sequence
+number, timestamp, buffer position and hashes of the last lines returned) so
+that only the new lines have to be split into structured entries.
+
+example:
+
+    >>> obj = ShowLogging(device=device)
+    >>> obj.parse(incremental=True)   # first poll returns the full buffer
+    >>> obj.parse(incremental=True)   # next polls only return new entries
+'''
+
+# python
+import re
+import threading
+
+# Month name to number, used to build comparable timestamp keys
+MONTHS = {'Jan': 1, 'Feb': 2, 'Mar': 3, 'Apr': 4, 'May': 5, 'Jun': 6,
+          'Jul': 7, 'Aug': 8, 'Sep': 9, 'Oct': 10, 'Nov': 11, 'Dec': 12}
+
+# Number of returned lines hashed into the mark, so that a repeated line
+# is not mistaken for the last returned one
+CONTEXT_LINES = 4
+
+# 2019 May 22 16:20:45
+# Jun  5 05:09:30.838
+# Mar  5 00:45:00
+TIMESTAMP_KEY = re.compile(r'^(?:(?P<year>\d{4}) +)?(?P<month>[A-Z][a-z]{2}) +'
+                           r'(?P<day>\d+)(?: +(?P<year2>\d{4}))? +'
+                           r'(?P<hour>\d+):(?P<time>\d+:\d+(?:\.\d+)?)')
+
+
+class HighWaterMark(object):
+    '''Position of the last log line returned to the caller
+
+        Args:
+            line_hash (`int`): hash of the last returned line
+            sequence (`int`): sequence number of that line, if any
+            timestamp (`tuple`): comparable timestamp key of that line, if any
+            position (`int`): index of that line in the buffer, if known
+            context (`tuple`): hashes of the last returned lines, oldest
+                               first and ending with line_hash
+    '''
+
+    __slots__ = ('line_hash', 'sequence', 'timestamp', 'position', 'context')
+
+    def __init__(self, line_hash, sequence=None, timestamp=None,
+                 position=None, context=None):
+        self.line_hash = line_hash
+        self.sequence = sequence
+        self.timestamp = timestamp
+        self.position = position
+        self.context = context or (line_hash,)
+
+    def __repr__(self):
+        return '{c}(line_hash={h}, sequence={s}, timestamp={t}, ' \
+               'position={p})'.format(
+                   c=self.__class__.__name__, h=self.line_hash,
+                   s=self.sequence, t=self.timestamp, p=self.position)
+
+
+# (device name, command) -> HighWaterMark
+_marks = {}
+_lock = threading.Lock()
+
+
+def _device_key(device):
+    '''return the key used to store the mark of a device'''
+    name = getattr(device, 'name', None)
+    return name if isinstance(name, str) else id(device)
+
+
+def get_mark(device, command):
+    '''return the current high-water mark for a device and command
+
+        Args:
+            device (`Device`): device the log was collected from
+            command (`str`): command used to collect the log
+
+        Returns:
+            HighWaterMark or None when the log was never polled
+    '''
+    return _marks.get((_device_key(device), command))
+
+
+def reset(device=None, command=None):
+    '''Forget high-water marks, so next poll returns the full buffer
+
+        Args:
+            device (`Device`): only forget marks of this device
+            command (`str`): only forget marks of this command
+
+        Returns:
+            None
+    '''
+    with _lock:
+        if device is None and command is None:
+            _marks.clear()
+            return
+        key = _device_key(device) if device is not None else None
+        for dev, cmd in list(_marks):
+            if key is not None and dev != key:
+                continue
+            if command is not None and cmd != command:
+                continue
+            del _marks[(dev, cmd)]
+
+
+def timestamp_key(timestamp):
+    '''Convert a log timestamp into a tuple that sorts chronologically
+
+        Args:
+            timestamp (`str`): timestamp as printed by the device
+
+        Returns:
+            tuple (year, month, day, hour, rest of time) or None
+
+        example:
+
+            >>> timestamp_key('Jun  5 05:09:30.838 EST')
+            >>> (0, 6, 5, 5, '09:30.838')
+    '''
+    if not timestamp:
+        return None
+    m = TIMESTAMP_KEY.match(timestamp.lstrip('*.'))
+    if not m:
+        return None
+    group = m.groupdict()
+    year = group['year'] or group['year2'] or 0
+    return (int(year), MONTHS.get(group['month'], 0), int(group['day']),
+            int(group['hour']), group['time'])
+
+
+def split_entry(line, pattern):
+    '''Split a log line into structured fields with a single regex match
+
+        Args:
+            line (`str`): log line
+            pattern (`re.Pattern`): compiled pattern exposing any of the
+                                    named groups sequence, timestamp,
+                                    hostname, facility, severity, mnemonic
+                                    and message
+
+        Returns:
+            dict of the fields found in the line. Lines which do not match
+            the pattern only have a 'message'.
+    '''
+    m = pattern.match(line)
+    if not m:
+        return {'message': line}
+
+    entry = {}
+    for key, value in m.groupdict().items():
+        if value is None:
+            continue
+        if key in ('sequence', 'severity'):
+            value = int(value)
+        entry[key] = value
+    entry.setdefault('message', '')
+    return entry
+
+
+def tail(device, command, lines, pattern):
+    '''Return only the log lines added since the previous call
+
+        The buffer only grows at the end and loses lines at the front, so
+        the last returned line can only be found at or before the position
+        recorded in the mark. The buffer is scanned backwards from that
+        position for the hashes of the last returned lines, which keeps a
+        later copy of a repeated line from being taken as the mark. When
+        that line is gone (buffer wrapped or cleared), the sequence number
+        then the timestamp of the mark are used to keep only the newer
+        lines; if neither is available the full buffer is returned.
+
+        Args:
+            device (`Device`): device the log was collected from
+            command (`str`): command used to collect the log
+            lines (`list`): stripped, non-empty log lines in buffer order
+            pattern (`re.Pattern`): pattern used by split_entry
+
+        Returns:
+            tuple (new lines, structured entries of those lines)
+    '''
+    key = (_device_key(device), command)
+    mark = _marks.get(key)
+    start = 0
+
+    if mark is not None:
+        start = _find_mark(lines, mark)
+        if start is not None:
+            start += 1
+
+    new_lines = lines[start:] if start is not None else []
+    entries = [split_entry(line, pattern) for line in new_lines]
+    position = len(lines) - 1
+
+    if start is None:
+        # Last returned line was rotated out of the buffer
+        # Continuation lines follow the verdict of the line they belong to
+        new_lines = []
+        keep = True
+        for index, line in enumerate(lines):
+            entry = split_entry(line, pattern)
+            newer = _is_newer(entry, mark)
+            if newer is not None:
+                keep = newer
+            if keep:
+                new_lines.append(line)
+                entries.append(entry)
+                position = index
+
+    if new_lines:
+        last = entries[-1]
+        context = tuple(hash(line) for line in
+                        lines[max(position - CONTEXT_LINES + 1, 0):
+                              position + 1])
+        with _lock:
+            _marks[key] = HighWaterMark(
+                line_hash=context[-1],
+                sequence=last.get('sequence'),
+                timestamp=timestamp_key(last.get('timestamp')),
+                position=position,
+                context=context)
+
+    return new_lines, entries
+
+
+def _find_mark(lines, mark):
+    '''Return the index of the last returned line in the buffer, or None
+
+       Lines before the start of the buffer are not compared, so a mark
+       whose first context lines were rotated out is still found'''
+    context = mark.context
+    first = len(lines) - 1
+    if mark.position is not None:
+        first = min(mark.position, first)
+
+    for index in range(first, -1, -1):
+        if hash(lines[index]) != mark.line_hash:
+            continue
+        offset = index - len(context) + 1
+        if all(hash(lines[offset + i]) == value
+               for i, value in enumerate(context) if offset + i >= 0):
+            return index
+    return None
+
+
+def _is_newer(entry, mark):
+    '''Check if an entry is newer than the mark without the line hash,
+       None when the entry has nothing to compare with'''
+    sequence = entry.get('sequence')
+    if sequence is not None and mark.sequence is not None:
+        return sequence > mark.sequence
+
+    timestamp = timestamp_key(entry.get('timestamp'))
+    if timestamp is not None and mark.timestamp is not None:
+        return timestamp > mark.timestamp
+
+    return None
@@ -0,0 +1,115 @@
+'''Reader of NX-OS '| json' outputs
+
+NX-OS '| json' outputs are the data of the NX-API reply, made of
+TABLE_<name>/ROW_<name> tables. A table holding a single row gives the row
+as a dictionary, a table holding several rows gives a list:
+
+    {"TABLE_vrf": {
+        "ROW_vrf": {
+            "vrf-name-out": "default",
+            "TABLE_af": {
+                "ROW_af": [{"af-id": "1", ...}, {"af-id": "2", ...}]
+            }
+        }
+    }}
+
+Parsers read those tables directly instead of matching the cli output with
+regular expressions, which is the bulk of the work on large tables.
+
+example:
+
+    >>> data = loads(output)
+    >>> for vrf_row in rows(data, 'vrf'):
+    ...     for af_row in rows(vrf_row, 'af'):
+    ...         ...
+'''
+
+# python
+import json
+
+# Junk characters returned by the device after the reply
+JUNK = ']]>]]>'
+
+
+def loads(output):
+    '''return the data of a '| json' output
+
+        Junk characters and any text before the data, such as the
+        command echoed back, are skipped. An output without data, the
+        device sends nothing for an empty table, gives an empty dictionary.
+
+        Raises:
+            ValueError: output is not valid json
+    '''
+    start = output.find('{')
+    if start == -1:
+        return {}
+    end = output.rfind(JUNK)
+    if end < start:
+        end = len(output)
+    return json.loads(output[start:end])
+
+
+def rows(data, table):
+    '''return the list of the rows of a table
+
+        Args:
+            data (`dict`): dictionary holding TABLE_<table>
+            table (`str`): table name, e.g. 'vrf'
+
+        Returns:
+            list of the ROW_<table> dictionaries, empty when the table is
+            missing
+    '''
+    try:
+        row = data['TABLE_' + table]['ROW_' + table]
+    except (KeyError, TypeError):
+        return []
+    if isinstance(row, list):
+        return row
+    return [row]
+
+
+def flag(value):
+    '''return the boolean of a flag of the output
+
+        Flags are given as 'true'/'false', 'enabled'/'disabled', 'on'/'off'
+        or json booleans depending on the command and the release.
+    '''
+    return str(value).lower() in ('true', 'enabled', 'yes', 'on', 't', '1')
+
+
+def iter_rows(data):
+    '''Iterate over every row of the data, as XmlRowStream does
+
+        Yields (name, row, parents) for each ROW_ dictionary, nested rows
+        before their parent row:
+
+          * name is the row key ('ROW_vrf')
+          * row is the dictionary {key: text} of the leaves of the row,
+            values are converted to str as in the '| xml' output
+          * parents is the list of the leaf dictionaries of the enclosing
+            rows, outermost first
+
+        Parsers reading the rows of a XmlRowStream can read these rows with
+        the same code.
+    '''
+    yield from _walk(data, [])
+
+
+def _walk(data, parents):
+    for key, value in data.items():
+        if not key.startswith('TABLE_') or not isinstance(value, dict):
+            continue
+        for name, row_value in value.items():
+            if not name.startswith('ROW_'):
+                continue
+            if not isinstance(row_value, list):
+                row_value = [row_value]
+            for row in row_value:
+                if not isinstance(row, dict):
+                    continue
+                leaves = {leaf: str(text) for leaf, text in row.items()
+                          if not isinstance(text, (dict, list))}
+                yield from _walk(row, parents + [leaves])
+                yield name, leaves, parents
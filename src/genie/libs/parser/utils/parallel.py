@@ -0,0 +1,235 @@
+'''Parallel parsing of large outputs
+
+Some outputs are long runs of independent blocks, one per neighbor or
+session, parsed by the same loop. Above a size, such an output is cut at
+block boundaries into a chunk per process, the chunks are parsed by the
+loop in a pool of processes and their results merged in order:
+
+    >>> chunks = split(lines, starts, workers=4)
+    >>> results = run(parse_chunk, [(text, state) for text, state in chunks])
+    >>> parsed = {}
+    >>> for result in results:
+    ...     merge(parsed, result)
+
+The speedup of the parse of a synthetic 'show bgp all neighbors' by the
+iosxe parsers is measured with:
+
+    $ python -m genie.libs.parser.utils.parallel --neighbors 6000 -w 1 2 4
+
+merge() gives the result of the sequential loop when the loop only builds
+its dictionaries with setdefault() and assigns values: the keys of a later
+chunk extend the dictionaries of the earlier ones and replace their other
+values.
+'''
+
+# python
+import os
+import sys
+import time
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+
+# Neighbors of the synthetic output of the benchmark, about 480k lines
+NEIGHBORS = 6000
+
+
+def workers(count=None):
+    '''return the number of processes, count or one per CPU'''
+    return count or os.cpu_count() or 1
+
+
+def split(lines, starts, count):
+    '''return [(first, last)] line ranges of at most count chunks of
+    about the same number of lines, cut at the block starts
+
+        Args:
+            lines (`list`): lines of the output
+            starts (`list`): indexes of the first lines of the blocks, in
+                             order
+            count (`int`): number of chunks
+    '''
+    if not starts:
+        return [(0, len(lines))]
+    # The lines before the first block go with it
+    bounds = [0]
+    size = len(lines) / count
+    for start in starts[1:]:
+        if start - bounds[-1] >= size:
+            bounds.append(start)
+    bounds.append(len(lines))
+    return list(zip(bounds[:-1], bounds[1:]))
+
+
+def merge(into, other):
+    '''merge the dictionary other into the dictionary into, recursively;
+    the other values replace those of into'''
+    for key, value in other.items():
+        current = into.get(key)
+        if isinstance(value, dict) and isinstance(current, dict):
+            merge(current, value)
+        else:
+            into[key] = value
+    return into
+
+
+def run(function, jobs, count=None):
+    '''return [function(*job) for job in jobs], computed by a pool of count
+    processes. Default one per CPU; jobs run in this process when count
+    or the number of jobs is 1
+
+        Raises:
+            Exception: raised by function, or by the pool
+    '''
+    count = min(workers(count), len(jobs))
+    if count <= 1:
+        return [function(*job) for job in jobs]
+    with ProcessPoolExecutor(max_workers=count) as pool:
+        futures = [pool.submit(function, *job) for job in jobs]
+        return [future.result() for future in futures]
+
+
+# Neighbor of the synthetic 'show bgp all neighbors' of the benchmark
+NEIGHBOR = '''\
+BGP neighbor is {address},  remote AS 100, internal link
+  BGP version 4, remote router ID {address}
+  BGP state = Established, up for 01:10:35
+  Last read 00:00:04, last write 00:00:09, hold time is 180, keepalive interval is 60 seconds
+  Neighbor sessions:
+    1 active, is not multisession capable (disabled)
+  Neighbor capabilities:
+    Route refresh: advertised and received(new)
+    Four-octets ASN Capability: advertised and received
+    Address family VPNv4 Unicast: advertised and received
+    Address family VPNv6 Unicast: advertised and received
+    Graceful Restart Capability: received
+      Remote Restart timer is 120 seconds
+      Address families advertised by peer:
+        VPNv4 Unicast (was not preserved, VPNv6 Unicast (was not preserved
+    Enhanced Refresh Capability: advertised
+    Multisession Capability:
+    Stateful switchover support enabled: NO for session 1
+  Message statistics:
+    InQ depth is 0
+    OutQ depth is 0
+
+                         Sent       Rcvd
+    Opens:                  1          1
+    Notifications:          0          0
+    Updates:               11          6
+    Keepalives:            75         74
+    Route Refresh:          0          0
+    Total:                 87         81
+  Default minimum time between advertisement runs is 0 seconds
+
+  Address tracking is enabled, the RIB does have a route to {address}
+  Connections established 1; dropped 0
+  Last reset never
+  Transport(tcp) path-mtu-discovery is enabled
+  Graceful-Restart is disabled
+Connection state is ESTAB, I/O status: 1, unread input bytes: 0
+Connection is ECN Disabled, Mininum incoming TTL 0, Outgoing TTL 255
+Local host: 10.64.4.4, Local port: 35281
+Foreign host: {address}, Foreign port: 179
+Connection tableid (VRF): 0
+Maximum output segment queue size: 50
+
+Enqueued packets for retransmit: 0, input: 0  mis-ordered: 0 (0 bytes)
+
+Event Timers (current time is 0x530449):
+Timer          Starts    Wakeups            Next
+Retrans            86          0             0x0
+TimeWait            0          0             0x0
+AckHold            80         72             0x0
+SendWnd             0          0             0x0
+KeepAlive           0          0             0x0
+GiveUp              0          0             0x0
+PmtuAger            1          1             0x0
+DeadWait            0          0             0x0
+Linger              0          0             0x0
+ProcessQ            0          0             0x0
+
+iss:   55023811  snduna:   55027115  sndnxt:   55027115
+irs:  109992783  rcvnxt:  109995158
+
+sndwnd:  16616  scale:      0  maxrcvwnd:  16384
+rcvwnd:  16327  scale:      0  delrcvwnd:     57
+
+SRTT: 1000 ms, RTTO: 1003 ms, RTV: 3 ms, KRTT: 0 ms
+minRTT: 4 ms, maxRTT: 1000 ms, ACK hold: 200 ms
+uptime: 4236258 ms, Sent idletime: 4349 ms, Receive idletime: 4549 ms
+Status Flags: active open
+Option Flags: nagle, path mtu capable
+IP Precedence value : 6
+
+Datagrams (max data segment is 536 bytes):
+Rcvd: 164 (out of order: 0), with data: 80, total data bytes: 2374
+Sent: 166 (retransmit: 0, fastretransmit: 0, partialack: 0, Second Congestion: 0), with data: 87, total data bytes: 3303
+
+ Packets received in fast path: 0, fast processed: 0, slow path: 0
+ fast lock acquisition failures: 0, slow path: 0
+TCP Semaphore      0x1286E7EC  FREE
+
+'''
+
+
+def synthetic(neighbors=NEIGHBORS):
+    '''return a 'show bgp all neighbors' output of neighbors neighbors'''
+    blocks = ['For address family: VPNv4 Unicast']
+    for number in range(neighbors):
+        blocks.append(NEIGHBOR.format(address='10.{}.{}.2'.format(
+            number // 256 % 256, number % 256)))
+    return '\n'.join(blocks)
+
+
+def benchmark(neighbors=NEIGHBORS, counts=(1, 2, 4), repeat=1):
+    '''return {processes: seconds} of the parse of a synthetic output of
+    neighbors neighbors by iosxe ShowBgpAllNeighbors'''
+    # The parsers import this module
+    from genie.libs.parser.iosxe.show_bgp import ShowBgpAllNeighbors
+
+    output = synthetic(neighbors)
+    parser = ShowBgpAllNeighbors(device=None)
+    parser.parallel_lines = 0
+    report = {}
+    expected = None
+    for count in counts:
+        parser.parallel_workers = count
+        best = None
+        for _ in range(repeat):
+            start = time.perf_counter()
+            parsed = parser.cli(output=output)
+            spent = time.perf_counter() - start
+            best = spent if best is None else min(best, spent)
+        if expected is None:
+            expected = parsed
+        elif parsed != expected:
+            raise AssertionError('{} processes parsed another result'.format(
+                count))
+        report[count] = best
+    return report
+
+
+def main(argv=None):
+    '''Command line entry: parse time per number of processes'''
+    args = argparse.ArgumentParser(
+        description='Parse time of a large show bgp all neighbors per '
+                    'number of processes')
+    args.add_argument('--neighbors', type=int, default=NEIGHBORS,
+                      help='neighbors of the synthetic output')
+    args.add_argument('-w', '--workers', type=int, nargs='+',
+                      default=[1, 2, 4], help='numbers of processes')
+    args.add_argument('--repeat', type=int, default=1,
+                      help='runs per number of processes, the fastest is '
+                           'kept')
+    args = args.parse_args(argv)
+
+    report = benchmark(args.neighbors, args.workers, args.repeat)
+    base = report[args.workers[0]]
+    for count, spent in report.items():
+        print('{:>3} processes {:>8.2f}s  x{:.2f}'.format(
+            count, spent, base / spent))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,507 @@
+'''Longest prefix match index of parsed routing and CEF tables
+
+Reachability checks look up the route of a destination in a parsed
+'show ip route' or 'show ip cef'. Scanning all the route keys for the
+longest match costs a full pass of the table per destination. build_index()
+turns a parsed result into a PrefixIndex: one binary radix trie per VRF
+and address family, whose nodes are rows of arrays, and looks the
+destinations up in a walk of at most one node per prefix length.
+
+Supported results:
+
+    * iosxe ShowIpRoute, nxos ShowIpRoute:
+      {'vrf': {vrf: {'address_family': {af: {'routes': {prefix: route}}}}}}
+    * iosxe ShowIpCef:
+      {'vrf': {vrf: {'address_family': {af: {'prefix': {prefix: route}}}}}}
+    * junos ShowRoute: {'route-information': {'route-table': [
+      {'table-name': 'VRF1.inet.0', 'rt': [{'rt-destination': prefix}]}]}}
+      the VRF of 'inet.0' and 'inet6.0' is 'default', of 'VRF1.inet.0'
+      'VRF1', other inet tables keep their name ('inet.3')
+
+The routes are the dictionaries of the parsed result, not copies.
+
+example:
+
+    >>> index = build_index(ShowIpRoute(device=device).parse())
+    >>> index.lookup('10.4.1.1')
+    ('10.4.0.0/16', {'route': '10.4.0.0/16', 'source_protocol': 'ospf', ...})
+    >>> index.lookup_many(['10.4.1.1', '192.168.0.1'], vrf='VRF1')
+    [('10.4.1.0/24', {...}), None]
+    >>> changes(index, build_index(ShowIpRoute(device=device).parse()),
+    ...         exclude=ShowIpRoute)
+    {'added': {('default', '10.5.0.0/16'): {...}}, 'removed': {},
+     'changed': {}}
+
+The build and the lookups of a synthetic table are measured, against a
+scan of the route keys, with:
+
+    $ python -m genie.libs.parser.utils.radix --prefixes 1000000 \\
+          --lookups 100000
+'''
+
+# python
+import re
+import sys
+import time
+import array
+import random
+import argparse
+
+# parser utils
+from . import ip
+from .diff import DigestCache, equal
+
+# Prefixes and destinations of the benchmark
+PREFIXES = 1000000
+LOOKUPS = 100000
+
+# Destinations looked up by scanning the route keys in the benchmark
+SCAN_LOOKUPS = 20
+
+BITS = {4: 32, 6: 128}
+
+# junos tables indexed: [vrf.]inet[6].number
+JUNOS_TABLE = re.compile(r'^(?:(?P<vrf>.+)\.)?inet6?\.(?P<number>\d+)$')
+
+
+def parse_prefix(prefix):
+    '''return (version, network, length) of a prefix string, the network
+    as an integer without its host bits; an address alone is a host
+    prefix
+
+        >>> parse_prefix('10.1.1.1/24')
+        (4, 167837952, 24)
+    '''
+    address, _, length = prefix.partition('/')
+    version = 6 if ':' in address else 4
+    bits = BITS[version]
+    value = ip.to_int(address)
+    if not length:
+        return version, value, bits
+    try:
+        length = int(length)
+    except ValueError:
+        raise ValueError('Invalid prefix {!r}'.format(prefix))
+    if not 0 <= length <= bits:
+        raise ValueError('Invalid prefix {!r}'.format(prefix))
+    host = bits - length
+    return version, value >> host << host, length
+
+
+class RadixTrie(object):
+    '''Path compressed binary trie of the prefixes of one address family
+
+        Node 0 is the root, the /0 prefix. Each node is a row of arrays:
+        network, length, child of the bit 0 and of the bit 1 after the
+        length (0 for none) and entry (-1 for a node without prefix, which
+        only joins two branches). A node is created per prefix and at most
+        one joining node per prefix.
+
+        Args:
+            version (`int`): 4 or 6. Default 4
+
+        Attributes:
+            prefixes (`list`): prefix string of each entry
+            routes (`list`): route of each entry
+    '''
+
+    def __init__(self, version=4):
+        self.version = version
+        self.bits = BITS[version]
+        # IPv6 networks do not fit in an array
+        self._network = array.array('I', [0]) if version == 4 else [0]
+        self._length = array.array('B', [0])
+        self._child = (array.array('i', [0]), array.array('i', [0]))
+        self._entry = array.array('i', [-1])
+        self.prefixes = []
+        self.routes = []
+
+    def __len__(self):
+        return len(self.prefixes)
+
+    @property
+    def nbytes(self):
+        '''bytes of the nodes and of the lists of the entries, not of the
+        prefix strings and routes they reference'''
+        size = sum(sys.getsizeof(column) for column in
+                   (self._length, self._entry) + self._child)
+        size += sys.getsizeof(self.prefixes) + sys.getsizeof(self.routes)
+        size += sys.getsizeof(self._network)
+        if self.version == 6:
+            size += sum(sys.getsizeof(network) for network in self._network)
+        return size
+
+    def _node(self, network, length, entry):
+        self._network.append(network)
+        self._length.append(length)
+        self._child[0].append(0)
+        self._child[1].append(0)
+        self._entry.append(entry)
+        return len(self._entry) - 1
+
+    def insert(self, network, length, prefix, route):
+        '''store route for the network/length prefix, replacing the route
+        of the same prefix
+
+            Args:
+                network (`int`): network without host bits
+                length (`int`): prefix length
+                prefix (`str`): prefix string returned by the lookups
+                route: value returned by the lookups
+        '''
+        bits = self.bits
+        networks, lengths, entries = self._network, self._length, \
+            self._entry
+        node = 0
+        while True:
+            node_length = lengths[node]
+            if node_length == length:
+                if entries[node] < 0:
+                    entries[node] = len(self.prefixes)
+                    self.prefixes.append(prefix)
+                    self.routes.append(route)
+                else:
+                    self.prefixes[entries[node]] = prefix
+                    self.routes[entries[node]] = route
+                return
+            branch = self._child[network >> (bits - 1 - node_length) & 1]
+            child = branch[node]
+            if not child:
+                branch[node] = self._node(network, length, len(self.prefixes))
+                self.prefixes.append(prefix)
+                self.routes.append(route)
+                return
+
+            child_network, child_length = networks[child], lengths[child]
+            common = min(length, child_length,
+                         bits - (network ^ child_network).bit_length())
+            if common == child_length:
+                node = child
+                continue
+
+            # The new prefix, or a joining node, takes the place of child
+            if common == length:
+                parent = self._node(network, length, len(self.prefixes))
+                self.prefixes.append(prefix)
+                self.routes.append(route)
+            else:
+                host = bits - common
+                parent = self._node(network >> host << host, common, -1)
+                self._child[network >> (host - 1) & 1][parent] = \
+                    self._node(network, length, len(self.prefixes))
+                self.prefixes.append(prefix)
+                self.routes.append(route)
+            self._child[child_network >> (bits - 1 - common) & 1][parent] = \
+                child
+            branch[node] = parent
+            return
+
+    def lookup(self, address):
+        '''return the entry of the longest prefix holding address, an
+        integer, or -1'''
+        return self._lookup(address, self.bits, self._network, self._length,
+                            self._child[0], self._child[1], self._entry)
+
+    @staticmethod
+    def _lookup(address, bits, networks, lengths, zeros, ones, entries):
+        node = 0
+        best = entries[0]
+        while True:
+            length = lengths[node]
+            if length == bits:
+                return best
+            if address >> (bits - 1 - length) & 1:
+                child = ones[node]
+            else:
+                child = zeros[node]
+            if not child:
+                return best
+            if (address ^ networks[child]) >> (bits - lengths[child]):
+                return best
+            node = child
+            if entries[node] >= 0:
+                best = entries[node]
+
+    def lookup_many(self, addresses):
+        '''return the entry of the longest prefix holding each address, an
+        integer, -1 for none'''
+        lookup = self._lookup
+        columns = (self.bits, self._network, self._length, self._child[0],
+                   self._child[1], self._entry)
+        return [lookup(address, *columns) for address in addresses]
+
+    def items(self):
+        '''yield (network, length, prefix, route) of the entries ordered by
+        network then length'''
+        networks, lengths, entries = self._network, self._length, \
+            self._entry
+        zeros, ones = self._child
+        stack = [0]
+        while stack:
+            node = stack.pop()
+            entry = entries[node]
+            if entry >= 0:
+                yield (networks[node], lengths[node], self.prefixes[entry],
+                       self.routes[entry])
+            if ones[node]:
+                stack.append(ones[node])
+            if zeros[node]:
+                stack.append(zeros[node])
+
+
+class PrefixIndex(object):
+    '''RadixTrie of each VRF and address family of a parsed result
+
+        Attributes:
+            tries (`dict`): RadixTrie of each (vrf, version)
+    '''
+
+    def __init__(self):
+        self.tries = {}
+
+    def __len__(self):
+        return sum(len(trie) for trie in self.tries.values())
+
+    @property
+    def nbytes(self):
+        return sum(trie.nbytes for trie in self.tries.values())
+
+    def add(self, vrf, prefix, route):
+        '''index route under its prefix string in vrf'''
+        version, network, length = parse_prefix(prefix)
+        try:
+            trie = self.tries[vrf, version]
+        except KeyError:
+            trie = self.tries[vrf, version] = RadixTrie(version)
+        trie.insert(network, length, prefix, route)
+
+    def lookup(self, address, vrf='default'):
+        '''return (prefix, route) of the longest prefix of vrf holding
+        address, None without match'''
+        return self.lookup_many([address], vrf=vrf)[0]
+
+    def lookup_many(self, addresses, vrf='default'):
+        '''return (prefix, route) of the longest prefix of vrf holding each
+        address, None without match
+
+            The addresses are strings, IPv4 and IPv6 mixed, each address
+            family is looked up in one batch.
+        '''
+        results = [None] * len(addresses)
+        batches = {4: ([], []), 6: ([], [])}
+        for position, address in enumerate(addresses):
+            batch = batches[6 if ':' in address else 4]
+            batch[0].append(position)
+            batch[1].append(ip.to_int(address))
+        for version, (positions, values) in batches.items():
+            trie = self.tries.get((vrf, version))
+            if trie is None or not values:
+                continue
+            prefixes, routes = trie.prefixes, trie.routes
+            for position, entry in zip(positions, trie.lookup_many(values)):
+                if entry >= 0:
+                    results[position] = (prefixes[entry], routes[entry])
+        return results
+
+
+def _routes(parsed):
+    '''yield (vrf, prefix, route) of a parsed route or CEF table'''
+    if 'route-information' in parsed:
+        tables = parsed['route-information'].get('route-table', [])
+        if isinstance(tables, dict):
+            tables = [tables]
+        for table in tables:
+            m = JUNOS_TABLE.match(table.get('table-name', ''))
+            if not m:
+                continue
+            if m.group('number') == '0':
+                vrf = m.group('vrf') or 'default'
+            else:
+                vrf = table['table-name'].replace('inet6.', 'inet.')
+            routes = table.get('rt', [])
+            if isinstance(routes, dict):
+                routes = [routes]
+            for route in routes:
+                if 'rt-destination' in route:
+                    yield vrf, route['rt-destination'], route
+        return
+
+    for vrf, vrf_dict in parsed.get('vrf', {}).items():
+        for af_dict in vrf_dict.get('address_family', {}).values():
+            routes = af_dict.get('routes') or af_dict.get('prefix') or {}
+            for prefix, route in routes.items():
+                yield vrf, prefix, route
+
+
+def build_index(parsed, index=None):
+    '''return the PrefixIndex of a parsed route or CEF table
+
+        Keys that are not prefixes ('default', MPLS labels) are skipped.
+
+        Args:
+            parsed (`dict`): result of iosxe ShowIpRoute or ShowIpCef,
+                             nxos ShowIpRoute or junos ShowRoute
+            index (`PrefixIndex`): index to add the routes to, a new one
+                                   when None
+    '''
+    if index is None:
+        index = PrefixIndex()
+    for vrf, prefix, route in _routes(parsed):
+        try:
+            index.add(vrf, prefix, route)
+        except ValueError:
+            continue
+    return index
+
+
+def _changes(before, after, key, same, result):
+    '''merge the entries of two RadixTrie, both ordered by network then
+    length'''
+    after = after.items()
+    new = next(after, None)
+    for old in before.items():
+        while new is not None and new[:2] < old[:2]:
+            result['added'][key(new[2])] = new[3]
+            new = next(after, None)
+        if new is None or new[:2] != old[:2]:
+            result['removed'][key(old[2])] = old[3]
+            continue
+        if old[3] is not new[3] and not same(old[3], new[3]):
+            result['changed'][key(new[2])] = (old[3], new[3])
+        new = next(after, None)
+    while new is not None:
+        result['added'][key(new[2])] = new[3]
+        new = next(after, None)
+
+
+def changes(before, after, exclude=None):
+    '''Compare the routes of two PrefixIndex, or of two RadixTrie
+
+        The tries are walked side by side in prefix order. Routes are
+        compared as utils.diff does, ignoring the excluded keys.
+
+        Args:
+            before (`PrefixIndex`): earlier index
+            after (`PrefixIndex`): later index
+            exclude (`list`): parser class, or `exclude` list of key names
+                              and regular expressions
+
+        Returns:
+            dict with
+                'added': {key: route} only found in after
+                'removed': {key: route} only found in before
+                'changed': {key: (old route, new route)}
+            where key is (vrf, prefix), or prefix for RadixTrie
+    '''
+    # Each route is compared once, only the digests of the routes being
+    # compared are worth keeping
+    same = DigestCache(exclude, maxsize=1024).same if exclude else equal
+    result = {'added': {}, 'removed': {}, 'changed': {}}
+    if isinstance(before, RadixTrie):
+        _changes(before, after, lambda prefix: prefix, same, result)
+        return result
+
+    for vrf, version in sorted(set(before.tries) | set(after.tries)):
+        empty = RadixTrie(version)
+        _changes(before.tries.get((vrf, version), empty),
+                 after.tries.get((vrf, version), empty),
+                 lambda prefix: (vrf, prefix), same, result)
+    return result
+
+
+def synthetic(prefixes=PREFIXES, seed=0):
+    '''return an iosxe ShowIpRoute result of prefixes IPv4 routes of
+    lengths 8 to 32, mostly /24'''
+    rand = random.Random(seed)
+    lengths = [24] * 12 + list(range(8, 33))
+    routes = {}
+    while len(routes) < prefixes:
+        length = rand.choice(lengths)
+        host = 32 - length
+        network = rand.getrandbits(32) >> host << host
+        prefix = '{}/{}'.format(ip.from_int(network), length)
+        routes[prefix] = {'route': prefix, 'active': True,
+                          'source_protocol': 'bgp',
+                          'source_protocol_codes': 'B'}
+    return {'vrf': {'default': {'address_family': {'ipv4': {
+        'routes': routes}}}}}
+
+
+def _scan(routes, address):
+    '''return the longest prefix of routes, a list of (network, length,
+    prefix), holding address; the scan of the route keys the index
+    replaces'''
+    best = None
+    for network, length, prefix in routes:
+        if address >> (32 - length) == network >> (32 - length) and \
+                (best is None or length > best[1]):
+            best = (network, length, prefix)
+    return best and best[2]
+
+
+def benchmark(prefixes=PREFIXES, lookups=LOOKUPS, scans=SCAN_LOOKUPS):
+    '''return the times of the build of the index of a synthetic table, of
+    the batch lookup of destinations and of the scan of the route keys
+
+        The scan of all the keys, the lookup the index replaces, runs for
+        scans destinations only, its results are checked against the
+        index.
+
+        Returns:
+            {'prefixes', 'lookups', 'build_seconds', 'lookup_seconds',
+             'scan_seconds' per destination, 'nbytes', 'matched'}
+    '''
+    parsed = synthetic(prefixes)
+    rand = random.Random(1)
+    destinations = [ip.from_int(rand.getrandbits(32))
+                    for _ in range(lookups)]
+
+    start = time.perf_counter()
+    index = build_index(parsed)
+    build = time.perf_counter() - start
+
+    start = time.perf_counter()
+    results = index.lookup_many(destinations)
+    lookup = time.perf_counter() - start
+
+    routes = [parse_prefix(prefix)[1:] + (prefix,) for prefix in
+              parsed['vrf']['default']['address_family']['ipv4']['routes']]
+    start = time.perf_counter()
+    for destination, result in zip(destinations[:scans], results):
+        if _scan(routes, ip.to_int(destination)) != (result and result[0]):
+            raise AssertionError('{} matched {} by the index'.format(
+                destination, result and result[0]))
+    scan = (time.perf_counter() - start) / max(1, min(scans, lookups))
+
+    return {'prefixes': len(index), 'lookups': lookups,
+            'build_seconds': build, 'lookup_seconds': lookup,
+            'scan_seconds': scan, 'nbytes': index.nbytes,
+            'matched': sum(1 for result in results if result)}
+
+
+def main(argv=None):
+    '''Command line entry: index build and lookups of a large table'''
+    args = argparse.ArgumentParser(
+        description='Build and longest prefix match lookups of the radix '
+                    'index of a large routing table')
+    args.add_argument('--prefixes', type=int, default=PREFIXES,
+                      help='routes of the synthetic table')
+    args.add_argument('--lookups', type=int, default=LOOKUPS,
+                      help='destinations looked up in one batch')
+    args.add_argument('--scans', type=int, default=SCAN_LOOKUPS,
+                      help='destinations looked up by scanning the routes')
+    args = args.parse_args(argv)
+
+    report = benchmark(args.prefixes, args.lookups, args.scans)
+    print('{prefixes} prefixes indexed in {build_seconds:.2f}s, '
+          '{nbytes} bytes of nodes'.format(**report))
+    print('{lookups} lookups in {lookup_seconds:.2f}s, {matched} '
+          'matched'.format(**report))
+    print('index {:.2f} us per lookup, scan of the routes {:.0f} us per '
+          'lookup'.format(report['lookup_seconds'] / report['lookups'] * 1e6,
+                          report['scan_seconds'] * 1e6))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,343 @@
+'''Catastrophic backtracking audit of the parser patterns
+
+The patterns are extracted from the sources of the parser modules, as most
+of them are compiled within the cli() methods: every re.compile(),
+re.match(), re.search() and re.fullmatch() call with a literal expression.
+
+Each pattern is matched against adversarial lines of growing length: the
+literal prefix of the pattern followed by a repeated unit (spaces, words,
+digits, separators) and a character no pattern expects. The growth
+exponent of the match time over the line length is the log-log slope of
+the timings, 1 for a linear pattern, 2 for a quadratic one. Patterns above
+SUPERLINEAR are reported, worst first.
+
+The matches run in a worker process: an exponential pattern cannot be
+interrupted within re, the worker is killed after `timeout` seconds and
+the pattern reported as timed out.
+
+example:
+
+    $ python -m genie.libs.parser.utils.regex_audit --os iosxe \\
+          --module show_bgp --output audit.json
+'''
+
+# python
+import os
+import re
+import ast
+import sys
+import json
+import glob
+import time
+import argparse
+import multiprocessing
+from collections import namedtuple
+
+try:
+    from re import _parser as sre_parse
+except ImportError:
+    import sre_parse
+
+# Parser
+from genie.libs.parser.utils.benchmark import PARSER_ROOT, operating_systems
+from genie.libs.parser.utils.scale import growth
+
+# Growth exponent of the match time over the line length flagged
+SUPERLINEAR = 1.5
+
+# Match time under which the growth is timing noise, in seconds
+NOISE = 0.0005
+
+# Line lengths, in pump units, of the adversarial lines
+SIZES = (64, 256, 1024)
+
+# Match time after which a pump is not grown further, in seconds
+BUDGET = 0.05
+
+# Seconds given to the worker per pattern
+TIMEOUT = 10
+
+# Repeated units of the adversarial lines
+UNITS = (' ', '\t', 'a', 's', '1', '.', ':', '/', '-', ',', '*', 'a ', '1 ',
+         's ', ' 1', '1.', 'a:', 'a-', '1,')
+
+# Ends of the adversarial lines, failing most patterns at the last character
+ENDS = ('!', '\x00', '')
+
+Pattern = namedtuple('Pattern', 'label expression flags')
+Pattern.__doc__ = '''Pattern extracted from a parser module
+
+    label (`str`): '<os>/<module>.py:<line> <name>'
+    expression (`str`): regular expression
+    flags (`int`): re flags
+'''
+
+_FUNCTIONS = ('compile', 'match', 'search', 'fullmatch')
+
+
+def _literal(node):
+    '''return the str of a literal expression node, None otherwise'''
+    if isinstance(node, ast.Constant) and isinstance(node.value, str):
+        return node.value
+    if isinstance(node, ast.BinOp) and isinstance(node.op, ast.Add):
+        left, right = _literal(node.left), _literal(node.right)
+        if left is not None and right is not None:
+            return left + right
+    return None
+
+
+def _flags(node):
+    '''return the re flags of a flags node, None when not literal'''
+    if node is None:
+        return 0
+    if isinstance(node, ast.Attribute) and isinstance(node.value, ast.Name) \
+            and node.value.id == 're' and hasattr(re, node.attr):
+        return int(getattr(re, node.attr))
+    if isinstance(node, ast.BinOp) and isinstance(node.op, ast.BitOr):
+        left, right = _flags(node.left), _flags(node.right)
+        if left is not None and right is not None:
+            return left | right
+    if isinstance(node, ast.Constant) and isinstance(node.value, int):
+        return node.value
+    return None
+
+
+def extract(path, root=PARSER_ROOT):
+    '''return the Patterns of a python source file'''
+    with open(path) as f:
+        tree = ast.parse(f.read(), path)
+    source = os.path.relpath(path, root)
+
+    names = {}
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Assign) and len(node.targets) == 1:
+            target = node.targets[0]
+            name = getattr(target, 'id', getattr(target, 'attr', None))
+            if name:
+                names[id(node.value)] = name
+
+    patterns = []
+    for node in ast.walk(tree):
+        if not (isinstance(node, ast.Call) and node.args and
+                isinstance(node.func, ast.Attribute) and
+                isinstance(node.func.value, ast.Name) and
+                node.func.value.id == 're' and
+                node.func.attr in _FUNCTIONS):
+            continue
+        expression = _literal(node.args[0])
+        if expression is None:
+            continue
+        flags_node = None
+        if node.func.attr == 'compile' and len(node.args) > 1:
+            flags_node = node.args[1]
+        elif node.func.attr != 'compile' and len(node.args) > 2:
+            flags_node = node.args[2]
+        for keyword in node.keywords:
+            if keyword.arg == 'flags':
+                flags_node = keyword.value
+        flags = _flags(flags_node)
+        if flags is None:
+            flags = 0
+        if node.func.attr == 'compile':
+            name = names.get(id(node), '')
+        else:
+            name = 're.{}'.format(node.func.attr)
+        label = '{}:{} {}'.format(source, node.lineno, name).rstrip()
+        patterns.append(Pattern(label, expression, flags))
+    return patterns
+
+
+def os_patterns(os_names=None, module=None, root=PARSER_ROOT):
+    '''return the Patterns of the parser modules
+
+        Args:
+            os_names (`list`): operating systems, all by default
+            module (`str`): expression searched in the module names
+    '''
+    patterns = []
+    for os_name in os_names or operating_systems(root):
+        for path in sorted(glob.glob(os.path.join(root, os_name, '*.py'))):
+            if module and not re.search(module, os.path.basename(path)):
+                continue
+            try:
+                patterns.extend(extract(path, root))
+            except SyntaxError as e:
+                print('error: {}: {}'.format(path, e), file=sys.stderr)
+    return patterns
+
+
+def prefix(expression, flags=0):
+    '''return the literal text a pattern starts with, after the anchors'''
+    try:
+        parsed = sre_parse.parse(expression, flags)
+    except Exception:
+        return ''
+    text = []
+    for op, value in parsed:
+        name = str(op)
+        if name == 'AT':
+            continue
+        if name == 'LITERAL':
+            text.append(chr(value))
+            continue
+        break
+    return ''.join(text)
+
+
+def lines(expression, flags=0, size=SIZES[0]):
+    '''yield (unit, end, line) adversarial lines of `size` units'''
+    start = prefix(expression, flags)
+    for unit in UNITS:
+        for end in ENDS:
+            yield unit, end, start + unit * size + end
+
+
+def _time(compiled, line, repeat=3, budget=BUDGET):
+    '''return the best match time of a line, a match over budget is not
+    repeated'''
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        compiled.match(line)
+        elapsed = time.perf_counter() - start
+        if best is None or elapsed < best:
+            best = elapsed
+        if elapsed > budget:
+            break
+    return best
+
+
+def audit_pattern(pattern, sizes=SIZES, budget=BUDGET):
+    '''return the growth of the match time of a pattern
+
+        Returns:
+            {'label', 'expression', 'growth', 'seconds', 'line'}, growth
+            the worst exponent over the adversarial lines, seconds the
+            longest match time, line the worst line '<unit> x <size> <end>'
+            or {'label', 'expression', 'error'} when the pattern does not
+            compile
+    '''
+    result = {'label': pattern.label, 'expression': pattern.expression}
+    try:
+        compiled = re.compile(pattern.expression, pattern.flags)
+    except (re.error, ValueError) as e:
+        result['error'] = str(e)
+        return result
+
+    worst = None
+    start = prefix(pattern.expression, pattern.flags)
+    for unit in UNITS:
+        for end in ENDS:
+            points = []
+            for size in sizes:
+                seconds = _time(compiled, start + unit * size + end,
+                                budget=budget)
+                points.append((size, seconds))
+                if seconds > budget:
+                    break
+            seconds = max(point[1] for point in points)
+            exponent = growth(points) if seconds > NOISE else 0
+            if exponent is None:
+                # Over budget at the first size
+                exponent = float('inf')
+            if worst is None or (exponent, seconds) > worst[:2]:
+                worst = (exponent, seconds, '{!r} x {} {!r}'.format(
+                    unit, points[-1][0], end))
+    result.update(growth=round(worst[0], 2), seconds=round(worst[1], 6),
+                  line=worst[2])
+    return result
+
+
+def _worker(connection, sizes, budget):
+    while True:
+        pattern = connection.recv()
+        if pattern is None:
+            return
+        connection.send(audit_pattern(Pattern(*pattern), sizes, budget))
+
+
+def audit(patterns, sizes=SIZES, budget=BUDGET, timeout=TIMEOUT,
+          threshold=SUPERLINEAR):
+    '''audit patterns in a worker process
+
+        Returns:
+            {'patterns': number of patterns audited,
+             'superlinear': results above threshold or timed out, worst
+                            first,
+             'errors': results of the patterns which do not compile}
+    '''
+    superlinear = []
+    errors = []
+    worker = connection = None
+    try:
+        for pattern in patterns:
+            if worker is None:
+                connection, child = multiprocessing.Pipe()
+                worker = multiprocessing.Process(
+                    target=_worker, args=(child, sizes, budget), daemon=True)
+                worker.start()
+            connection.send(tuple(pattern))
+            if not connection.poll(timeout):
+                worker.kill()
+                worker.join()
+                worker = None
+                superlinear.append({'label': pattern.label,
+                                    'expression': pattern.expression,
+                                    'growth': float('inf'),
+                                    'seconds': None,
+                                    'line': None,
+                                    'timeout': True})
+                continue
+            result = connection.recv()
+            if 'error' in result:
+                errors.append(result)
+            elif result['growth'] > threshold:
+                superlinear.append(result)
+    finally:
+        if worker is not None:
+            connection.send(None)
+            worker.join()
+    superlinear.sort(key=lambda result: (-result['growth'],
+                                         -(result['seconds'] or 0)))
+    return {'patterns': len(patterns), 'superlinear': superlinear,
+            'errors': errors}
+
+
+def main(argv=None):
+    '''Command line entry, returns 1 when superlinear patterns are found'''
+    args = argparse.ArgumentParser(
+        description='Report the parser patterns with superlinear match time')
+    args.add_argument('--os', nargs='*', dest='os_names',
+                      help='operating systems, all by default')
+    args.add_argument('--module', default=None,
+                      help='regular expression searched in the module names')
+    args.add_argument('--threshold', type=float, default=SUPERLINEAR,
+                      help='growth exponent flagged')
+    args.add_argument('--timeout', type=float, default=TIMEOUT,
+                      help='seconds per pattern')
+    args.add_argument('--output', default=None,
+                      help='json file to store the report in')
+    args = args.parse_args(argv)
+
+    report = audit(os_patterns(args.os_names, args.module),
+                   timeout=args.timeout, threshold=args.threshold)
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+
+    print('{} patterns, {} superlinear'.format(report['patterns'],
+                                               len(report['superlinear'])))
+    for result in report['superlinear']:
+        if result.get('timeout'):
+            print('{:<60} timeout'.format(result['label']))
+        else:
+            print('{:<60} x^{:<6} {:>10.4f}s  {}'.format(
+                result['label'], result['growth'], result['seconds'],
+                result['line']))
+    for result in report['errors']:
+        print('error: {label}: {error}'.format(**result))
+    return 1 if report['superlinear'] else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,432 @@
+'''Regular expression instrumentation of the parsers
+
+Records, per parser class and per pattern, the match attempts, the
+successful matches and the time spent in the pattern, to find the patterns
+worth optimising and the patterns never hit by the golden outputs.
+
+Instrumentation is opt-in with the instrument() context manager:
+
+    with instrument() as stats:
+        ShowInterfaces(device=device).parse()
+    print(stats.table())
+
+Within the context:
+
+  * re.compile() and the re module functions called from the functions of
+    the parser modules return instrumented patterns, labelled with the
+    compile site: 'show_interface.py:1234 p2'. Module and class level
+    compiles run by an import within the context are left alone, and
+    instrumented patterns still held by the parser modules and classes
+    are restored on exit
+  * compiled patterns held by the parser classes and modules already
+    imported (class level 'p1 = re.compile(...)') are instrumented in
+    place, labelled 'ShowInterfaces.p1', and restored on exit
+  * the match functions of the class level Spec of the parsers are
+    instrumented the same way, labelled with the class attribute holding
+    the pattern: 'ShowArp.p1'
+  * MetaParser.parse() tracks the parser being run, pattern calls are
+    counted for the innermost parser being parsed
+
+Timing adds a few hundred nanoseconds per pattern call: compare the
+recorded times between patterns, not with uninstrumented runs. The
+instrumentation is process wide and not thread safe.
+
+example:
+
+    $ python -m genie.libs.parser.utils.regex_stats --os iosxe \\
+          --parser ShowInterfaces --unmatched
+'''
+
+# python
+import os
+import re
+import sys
+import json
+import time
+import inspect
+import argparse
+import linecache
+import contextlib
+from unittest.mock import Mock
+
+# Metaparser
+from genie.metaparser import MetaParser
+
+# Parser
+from genie.libs.parser.utils.spec import Spec
+from genie.libs.parser.utils.benchmark import (parser_key, folder_fixtures,
+                                               golden_fixtures)
+
+# Modules whose patterns are instrumented
+PACKAGE = 'genie.libs.parser.'
+
+# Modules of the package which are not parsers
+NOT_PARSER = ('genie.libs.parser.utils', )
+
+# Parser key of the calls made outside of a parse()
+NO_PARSER = '-'
+
+_FUNCTIONS = ('match', 'search', 'fullmatch', 'findall', 'finditer', 'sub',
+              'subn', 'split')
+
+# Code names of the comprehensions, run in a frame of their own
+_COMPREHENSIONS = ('<listcomp>', '<dictcomp>', '<setcomp>', '<genexpr>')
+
+# Whether the result of a pattern call is a match
+_MATCHED = {
+    'match': lambda result: result is not None,
+    'search': lambda result: result is not None,
+    'fullmatch': lambda result: result is not None,
+    'findall': bool,
+    'finditer': bool,
+    'subn': lambda result: result[1] > 0,
+    'split': lambda result: len(result) > 1,
+}
+
+_ASSIGNMENT = re.compile(r'^\s*(?:self\.)?(?P<name>\w+)\s*=\s*re\.')
+
+
+class RegexStats(object):
+    '''Counters of the instrumented patterns
+
+    counters: {(parser, pattern): [attempts, matches, seconds]}
+    '''
+
+    def __init__(self):
+        self.counters = {}
+        self.patterns = {}
+        self.compiled = set()
+        self.parsers = [NO_PARSER]
+        self.runs = set()
+
+    def register(self, label, pattern, parser=None):
+        '''keep the expression of a pattern label and its parser, the
+        parser being run by default'''
+        self.patterns.setdefault(label, pattern)
+        self.compiled.add((parser or self.parsers[-1], label))
+
+    def record(self, label, matched, seconds):
+        key = (self.parsers[-1], label)
+        counter = self.counters.get(key)
+        if counter is None:
+            counter = self.counters[key] = [0, 0, 0.0]
+        counter[0] += 1
+        if matched:
+            counter[1] += 1
+        counter[2] += seconds
+
+    def results(self):
+        '''return the counters, most time consuming first
+
+            Returns:
+                list of {'parser', 'pattern', 'attempts', 'matches',
+                         'seconds', 'expression'}
+        '''
+        results = [{'parser': parser,
+                    'pattern': label,
+                    'attempts': attempts,
+                    'matches': matches,
+                    'seconds': round(seconds, 6),
+                    'expression': self.patterns.get(label)}
+                   for (parser, label), (attempts, matches, seconds)
+                   in self.counters.items()]
+        results.sort(key=lambda result: (-result['seconds'],
+                                         result['parser'], result['pattern']))
+        return results
+
+    def unmatched(self):
+        '''return the (parser, pattern) which never matched, for the
+        parsers which were run
+
+        Patterns compiled or held by the parser class but never attempted
+        are included.
+        '''
+        matched = {key for key, counter in self.counters.items()
+                   if counter[1]}
+        candidates = set(self.counters).union(
+            key for key in self.compiled if key[0] in self.runs)
+        return sorted(key for key in candidates if key not in matched)
+
+    def to_dict(self):
+        return {'results': self.results(),
+                'unmatched': [{'parser': parser, 'pattern': label}
+                              for parser, label in self.unmatched()]}
+
+    def table(self, limit=None):
+        '''return the counters as a text table'''
+        lines = ['{:<40} {:<40} {:>10} {:>10} {:>10}'.format(
+            'parser', 'pattern', 'attempts', 'matches', 'ms')]
+        for result in self.results()[:limit]:
+            lines.append('{:<40} {:<40} {:>10} {:>10} {:>10.3f}'.format(
+                result['parser'], result['pattern'], result['attempts'],
+                result['matches'], result['seconds'] * 1000))
+        return '\n'.join(lines)
+
+
+class _Pattern(object):
+    '''Compiled pattern recording its calls'''
+
+    __slots__ = ('_pattern', '_label', '_stats')
+
+    def __init__(self, pattern, label, stats, parser=None):
+        self._pattern = pattern
+        self._label = label
+        self._stats = stats
+        stats.register(label, pattern.pattern, parser)
+
+    def __getattr__(self, name):
+        return getattr(self._pattern, name)
+
+    def __repr__(self):
+        return repr(self._pattern)
+
+    def _call(self, method, args, kwargs):
+        start = time.perf_counter()
+        result = getattr(self._pattern, method)(*args, **kwargs)
+        if method == 'finditer':
+            result = list(result)
+        seconds = time.perf_counter() - start
+        self._stats.record(self._label, _MATCHED[method](result), seconds)
+        return iter(result) if method == 'finditer' else result
+
+    def match(self, *args, **kwargs):
+        return self._call('match', args, kwargs)
+
+    def search(self, *args, **kwargs):
+        return self._call('search', args, kwargs)
+
+    def fullmatch(self, *args, **kwargs):
+        return self._call('fullmatch', args, kwargs)
+
+    def findall(self, *args, **kwargs):
+        return self._call('findall', args, kwargs)
+
+    def finditer(self, *args, **kwargs):
+        return self._call('finditer', args, kwargs)
+
+    def sub(self, *args, **kwargs):
+        return self._call('subn', args, kwargs)[0]
+
+    def subn(self, *args, **kwargs):
+        return self._call('subn', args, kwargs)
+
+    def split(self, *args, **kwargs):
+        return self._call('split', args, kwargs)
+
+
+def _parser_frame(depth):
+    '''return the caller frame when it is a parser module, else None'''
+    frame = sys._getframe(depth + 1)
+    module = frame.f_globals.get('__name__', '')
+    if not module.startswith(PACKAGE) or module.startswith(NOT_PARSER) \
+            or '.tests.' in module:
+        return None
+    return frame
+
+
+def _in_function(frame):
+    '''Check if a frame runs a function, not the body of a module or of a
+    class being imported'''
+    while frame.f_code.co_name in _COMPREHENSIONS:
+        frame = frame.f_back
+    return bool(frame.f_code.co_flags & inspect.CO_NEWLOCALS)
+
+
+def _site(frame):
+    '''return the label of a compile site: 'show_interface.py:1234 p2' '''
+    filename = frame.f_code.co_filename
+    line = linecache.getline(filename, frame.f_lineno)
+    match = _ASSIGNMENT.match(line)
+    label = '{}:{}'.format(os.path.basename(filename), frame.f_lineno)
+    if match:
+        label = '{} {}'.format(label, match.group('name'))
+    return label
+
+
+def _spec_label(owner, compiled, name):
+    '''return the label of a match function of the Spec of owner'''
+    for attr, value in vars(owner).items():
+        if value == compiled.pattern:
+            return '{}.{}'.format(owner.__name__, attr)
+    return '{}.spec {}'.format(owner.__name__, name)
+
+
+def _parser_objects():
+    '''yield (owner, name, value) of the patterns and parse methods of the
+    imported parser modules'''
+    for module_name, module in list(sys.modules.items()):
+        if module is None or not module_name.startswith(PACKAGE) or \
+                module_name.startswith(NOT_PARSER) or '.tests.' in module_name:
+            continue
+        for name, value in list(vars(module).items()):
+            if isinstance(value, re.Pattern):
+                yield module, name, value
+            elif isinstance(value, type) and \
+                    value.__module__ == module_name:
+                for attr, attr_value in list(vars(value).items()):
+                    if isinstance(attr_value, (re.Pattern, Spec)) or (
+                            attr == 'parse' and
+                            issubclass(value, MetaParser) and
+                            inspect.isfunction(attr_value)):
+                        yield value, attr, attr_value
+
+
+def _instrumented(stats):
+    '''yield (owner, name, value) of the patterns of stats held by the
+    parser modules and their classes'''
+    for module_name, module in list(sys.modules.items()):
+        if module is None or not module_name.startswith(PACKAGE) or \
+                module_name.startswith(NOT_PARSER) or '.tests.' in module_name:
+            continue
+        for name, value in list(vars(module).items()):
+            if isinstance(value, _Pattern) and value._stats is stats:
+                yield module, name, value
+            elif isinstance(value, type) and \
+                    value.__module__ == module_name:
+                for attr, attr_value in list(vars(value).items()):
+                    if isinstance(attr_value, _Pattern) and \
+                            attr_value._stats is stats:
+                        yield value, attr, attr_value
+
+
+@contextlib.contextmanager
+def instrument():
+    '''instrument the parser patterns, yields the RegexStats'''
+    stats = RegexStats()
+    originals = {name: getattr(re, name) for name in ('compile',) + _FUNCTIONS}
+    restore = []
+
+    def compile_(pattern, flags=0):
+        compiled = originals['compile'](pattern, flags)
+        frame = _parser_frame(1)
+        if frame is None or not _in_function(frame):
+            return compiled
+        return _Pattern(compiled, _site(frame), stats)
+
+    def function(name):
+        # re.sub() through re.subn() to count the substitutions
+        method = 'subn' if name == 'sub' else name
+
+        def call(pattern, *args, **kwargs):
+            frame = _parser_frame(1)
+            if frame is None:
+                return originals[name](pattern, *args, **kwargs)
+            label = '{}:{} re.{}'.format(
+                os.path.basename(frame.f_code.co_filename), frame.f_lineno,
+                name)
+            stats.register(label, getattr(pattern, 'pattern', pattern))
+            start = time.perf_counter()
+            result = originals[method](pattern, *args, **kwargs)
+            if method == 'finditer':
+                result = list(result)
+            stats.record(label, _MATCHED[method](result),
+                         time.perf_counter() - start)
+            if method == 'finditer':
+                return iter(result)
+            return result[0] if name == 'sub' else result
+        return call
+
+    def tracked(method):
+        def parse(self, *args, **kwargs):
+            key = parser_key(type(self))
+            stats.runs.add(key)
+            stats.parsers.append(key)
+            try:
+                return method(self, *args, **kwargs)
+            finally:
+                stats.parsers.pop()
+        return parse
+
+    try:
+        for owner, name, value in _parser_objects():
+            if name == 'parse':
+                setattr(owner, name, tracked(value))
+            elif isinstance(value, Spec):
+                for match, compiled in value.matchers.items():
+                    value.namespace[match] = _Pattern(
+                        compiled, _spec_label(owner, compiled, match), stats,
+                        parser_key(owner)).match
+            elif isinstance(owner, type):
+                setattr(owner, name, _Pattern(
+                    value, '{}.{}'.format(owner.__name__, name), stats,
+                    parser_key(owner)
+                    if issubclass(owner, MetaParser) else None))
+            else:
+                setattr(owner, name, _Pattern(
+                    value, '{}.{}'.format(owner.__name__.split('.')[-1],
+                                          name), stats))
+            restore.append((owner, name, value))
+        restore.append((MetaParser, 'parse', MetaParser.__dict__['parse']))
+        MetaParser.parse = tracked(MetaParser.__dict__['parse'])
+        re.compile = compile_
+        for name in _FUNCTIONS:
+            setattr(re, name, function(name))
+        yield stats
+    finally:
+        for name, value in originals.items():
+            setattr(re, name, value)
+        for owner, name, value in reversed(restore):
+            if isinstance(value, Spec):
+                for match, compiled in value.matchers.items():
+                    value.namespace[match] = compiled.match
+            else:
+                setattr(owner, name, value)
+        # Compiled by a function while a parser module was imported
+        for owner, name, value in list(_instrumented(stats)):
+            setattr(owner, name, value._pattern)
+
+
+def main(argv=None):
+    '''Command line entry: instrument the parse of the golden outputs'''
+    args = argparse.ArgumentParser(
+        description='Pattern attempts, matches and time of the parsers over '
+                    'their golden outputs')
+    args.add_argument('--os', nargs='*', dest='os_names',
+                      help='operating systems, all by default')
+    args.add_argument('--parser', default=None,
+                      help='regular expression searched in <os>.<Class>')
+    args.add_argument('--source', choices=('all', 'folder', 'unittest'),
+                      default='all', help='golden outputs to use')
+    args.add_argument('--limit', type=int, default=None,
+                      help='number of patterns to print')
+    args.add_argument('--unmatched', action='store_true',
+                      help='print the patterns which never matched')
+    args.add_argument('--output', default=None,
+                      help='json file to store the counters in')
+    args = args.parse_args(argv)
+
+    fixtures = []
+    if args.source in ('all', 'folder'):
+        fixtures.extend(folder_fixtures(args.os_names))
+    if args.source in ('all', 'unittest'):
+        fixtures.extend(golden_fixtures(args.os_names))
+    if args.parser:
+        pattern = re.compile(args.parser)
+        fixtures = [fixture for fixture in fixtures
+                    if pattern.search(parser_key(fixture.parser,
+                                                 fixture.context))]
+
+    with instrument() as stats:
+        for fixture in fixtures:
+            device = Mock(**{'execute.return_value': fixture.output})
+            try:
+                fixture.parser(device=device, context=fixture.context).parse(
+                    **dict(fixture.arguments, output=fixture.output))
+            except Exception as e:
+                print('error: {} {}: {}'.format(
+                    parser_key(fixture.parser, fixture.context),
+                    fixture.source, e))
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(stats.to_dict(), f, indent=2, sort_keys=True)
+    print(stats.table(limit=args.limit))
+    if args.unmatched:
+        print('\nnever matched:')
+        for parser, label in stats.unmatched():
+            print('  {:<40} {}'.format(parser, label))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,455 @@
+'''Synthetic scale outputs for the scaling benchmarks
+
+The golden outputs hold a handful of records: a few routes, interfaces or
+MAC entries. scale() replicates the record blocks of a golden output up to
+an arbitrary number of records, so the parse time and the peak allocation
+can be measured against the record count and superlinear parsers caught.
+
+A record is a line matching the `start` expression of the parser profile
+and the continuation lines below it: lines indented deeper than the record
+line, or matching the optional `continuation` expression. Records are
+replicated within their own section, a run of records, so multi section
+outputs (address families, routing tables) keep their shape.
+
+Each copy of a record gets fresh keys, consistent within the copy:
+
+  * IPv4 addresses keep their last octet, their /24 is mapped to an unused
+    /24. 0.0.0.0, masks and multicast addresses are kept.
+  * IPv6 addresses keep their interface id, their /64 is mapped to an
+    unused /64 of 2001:db8::/32. Link local addresses are kept.
+  * MAC addresses are mapped to unused locally administered addresses, in
+    the notation of the original.
+  * Interface names keep their type and slot, their last number is mapped
+    past the highest number of the output.
+
+Values followed by column padding, after an optional port or prefix length,
+keep the column alignment of the table.
+
+example:
+
+    $ python -m genie.libs.parser.utils.scale --parser iosxe.ShowIpRoute \\
+          --input show_ip_route.txt --records 100000 > scaled.txt
+
+    $ python -m genie.libs.parser.utils.scale --parser iosxe.ShowIpRoute \\
+          --input show_ip_route.txt --sweep 1000 10000 100000
+'''
+
+# python
+import re
+import sys
+import math
+import argparse
+import ipaddress
+import itertools
+from collections import namedtuple
+
+# Parser
+from genie.libs.parser.utils.benchmark import Fixture, measure, os_parsers
+
+# Growth exponent of the parse time over the record count flagged as
+# superlinear; 1 is linear
+SUPERLINEAR = 1.2
+
+Profile = namedtuple('Profile', 'start continuation')
+Profile.__new__.__defaults__ = (None,)
+Profile.__doc__ = '''Record layout of a parser output
+
+    start (`str`): expression matching the first line of a record
+    continuation (`str`): expression matching continuation lines indented
+                          like the record line, None when all the
+                          continuation lines are indented deeper
+'''
+
+_IPV4 = r'\d{1,3}(?:\.\d{1,3}){3}'
+_MAC = r'[0-9a-fA-F]{4}\.[0-9a-fA-F]{4}\.[0-9a-fA-F]{4}'
+
+# BGP table: status codes then the network column
+_BGP_CODES = r'sdhrSmbfxactiIVNe*>='
+_BGP = Profile(
+    start=r'^\s*[{codes}][{codes} ]{{0,4}}\s{{0,4}}{ipv4}'.format(
+        codes=_BGP_CODES, ipv4=_IPV4),
+    # Next paths of a network, the network column is empty
+    continuation=r'^\s*[{codes}][{codes} ]{{0,4}}\s{{5,}}\S'.format(
+        codes=_BGP_CODES))
+
+# Routing table with route codes: 'C        10.4.1.1 is directly connected'
+_IOS_ROUTE = Profile(
+    start=r'^\s*[A-Za-z*+%][A-Za-z0-9*+% ]{{0,7}}\s+{ipv4}'.format(
+        ipv4=_IPV4))
+
+# 'GigabitEthernet1 is up, line protocol is up'
+_IOS_INTERFACE = Profile(
+    start=r'^\s*[A-Za-z][\w\-/.:]* is (?:up|down|administratively down|'
+          r'deleted)')
+
+# '* 10  aaaa.bbbb.cccc  static ...' or '  10  aaaa.bbbb.cccc  DYNAMIC ...'
+_MAC_TABLE = Profile(start=r'^\s*(?:\S+\s+)?\S+\s+{mac}\s'.format(mac=_MAC))
+
+# 'udp  10.5.5.1:1025  192.0.2.1:4000  ---  ---', '---' for unset columns
+_NAT = Profile(start=r'^\s*\S+\s+(?:{ipv4}\S*|---)\s'.format(ipv4=_IPV4))
+
+PROFILES = {
+    'ios.ShowBgpAll': _BGP,
+    'iosxe.ShowBgpAll': _BGP,
+    'ios.ShowIpRoute': _IOS_ROUTE,
+    'iosxe.ShowIpRoute': _IOS_ROUTE,
+    'nxos.ShowIpRoute': Profile(
+        start=r'^\s*[\da-fA-F:.]+/\d+, ubest/mbest:'),
+    'ios.ShowInterfaces': _IOS_INTERFACE,
+    'iosxe.ShowInterfaces': _IOS_INTERFACE,
+    'ios.ShowMacAddressTable': _MAC_TABLE,
+    'iosxe.ShowMacAddressTable': _MAC_TABLE,
+    'nxos.ShowMacAddressTable': _MAC_TABLE,
+    'ios.ShowIpNatTranslations': _NAT,
+    'iosxe.ShowIpNatTranslations': _NAT,
+    'junos.ShowRoute': Profile(
+        start=r'^\s*[\da-fA-F:.]+/\d+\s+[*+\- ]?\['),
+}
+
+_INTERFACE_TYPES = (
+    'TwentyFiveGigE', 'FortyGigabitEthernet', 'TenGigabitEthernet',
+    'GigabitEthernet', 'HundredGigE', 'FastEthernet', 'Ethernet',
+    'Port-channel', 'Loopback', 'Tunnel', 'Serial', 'Vlan', 'BDI',
+    'Eth', 'Gi', 'Te', 'Fa', 'Po', 'Lo', 'Tu', 'Se', 'Vl',
+    'ge-', 'xe-', 'et-', 'ae', 'lo', 'irb')
+
+_VALUES = re.compile(
+    r'(?:(?P<mac>(?<![\w.:])(?:{mac}|[0-9a-fA-F]{{2}}([:-])[0-9a-fA-F]{{2}}'
+    r'(?:\2[0-9a-fA-F]{{2}}){{4}})(?![\w.:]))'
+    r'|(?P<ipv4>(?<![\w.]){ipv4}(?![\w]|\.\d))'
+    r'|(?P<ipv6>(?<![\w:.])[0-9a-fA-F]{{0,4}}(?::[0-9a-fA-F]{{0,4}}){{2,7}}'
+    r'(?![\w:.]))'
+    r'|(?P<interface>\b(?P<type>{types})(?P<path>(?:\d+/)*)(?P<number>\d+)'
+    r'(?P<sub>[.:]\d+)?\b))'
+    r'(?P<tail>(?:[:/]\d+)?)(?P<pad> *)'.format(
+        mac=_MAC, ipv4=_IPV4,
+        types='|'.join(re.escape(name) for name in _INTERFACE_TYPES)))
+
+
+def profile(parser):
+    '''return the Profile of a parser
+
+        Args:
+            parser (`str` or `class`): '<os>.<Class>' or parser class
+
+        Raises:
+            KeyError when the parser has no profile
+    '''
+    if not isinstance(parser, str):
+        parser = '{}.{}'.format(parser.__module__.split('.')[-2],
+                                parser.__name__)
+    return PROFILES[parser]
+
+
+def sections(output, start, continuation=None):
+    '''split an output in text and record runs
+
+        Returns:
+            list of str, text between the runs, and lists of records, each
+            record a list of lines
+    '''
+    start = re.compile(start)
+    continuation = re.compile(continuation) if continuation else None
+
+    parts = []
+    text = []
+    run = None
+    indent = 0
+    for line in output.splitlines(keepends=True):
+        if start.match(line):
+            if run is None:
+                parts.append(''.join(text))
+                text = []
+                run = []
+            run.append([line])
+            indent = len(line) - len(line.lstrip())
+            continue
+        if run is not None and line.strip() and (
+                len(line) - len(line.lstrip()) > indent or
+                (continuation and continuation.match(line))):
+            run[-1].append(line)
+            continue
+        if run is not None:
+            parts.append(run)
+            run = None
+        text.append(line)
+    if run is not None:
+        parts.append(run)
+    parts.append(''.join(text))
+    return parts
+
+
+class _Keys(object):
+    '''Fresh keys for the copies of the records
+
+    Keys are allocated past the keys of the original output, a copy gets the
+    same replacement for the same original value.
+    '''
+
+    def __init__(self, output):
+        self.nets = set()
+        self.nets6 = set()
+        self.macs = set()
+        self.numbers = {}
+        for match in _VALUES.finditer(output):
+            if match.group('ipv4'):
+                self.nets.add(match.group('ipv4').rsplit('.', 1)[0])
+            elif match.group('ipv6'):
+                address = _ipv6(match.group('ipv6'))
+                if address:
+                    self.nets6.add(int(address) >> 64)
+            elif match.group('mac'):
+                self.macs.add(_mac_int(match.group('mac')))
+            elif match.group('interface'):
+                key = match.group('type'), match.group('path')
+                self.numbers[key] = max(self.numbers.get(key, 0),
+                                        int(match.group('number')))
+        self._nets = self._free_nets()
+        self._nets6 = (net for net in itertools.count((0x20010db8 << 32) + 1)
+                       if net not in self.nets6)
+        self._macs = (mac for mac in itertools.count(0x020000000001)
+                      if mac not in self.macs)
+        self.copies = {}
+
+    def _free_nets(self):
+        for first in range(11, 224):
+            if first == 127:
+                continue
+            for second in range(256):
+                for third in range(256):
+                    net = '{}.{}.{}'.format(first, second, third)
+                    if net not in self.nets:
+                        yield net
+        raise ValueError('out of IPv4 /24 networks')
+
+    def copy(self, index):
+        '''return the replacement mapping of copy `index`'''
+        if index not in self.copies:
+            self.copies[index] = {}
+        return self.copies[index]
+
+    def ipv4(self, mapping, value):
+        net, host = value.rsplit('.', 1)
+        first = int(net.split('.', 1)[0])
+        if first == 0 or first >= 224:
+            return value
+        if ('ipv4', net) not in mapping:
+            mapping['ipv4', net] = next(self._nets)
+        return '{}.{}'.format(mapping['ipv4', net], host)
+
+    def ipv6(self, mapping, value):
+        address = _ipv6(value)
+        if address is None or address.is_link_local or \
+                address.is_unspecified or address.is_loopback:
+            return value
+        net = int(address) >> 64
+        if ('ipv6', net) not in mapping:
+            mapping['ipv6', net] = next(self._nets6)
+        new = ipaddress.IPv6Address((mapping['ipv6', net] << 64) |
+                                    (int(address) & (2 ** 64 - 1)))
+        new = str(new)
+        return new.upper() if value.isupper() else new
+
+    def mac(self, mapping, value):
+        old = _mac_int(value)
+        if old in (0, 2 ** 48 - 1):
+            return value
+        if ('mac', old) not in mapping:
+            mapping['mac', old] = next(self._macs)
+        digits = '{:012x}'.format(mapping['mac', old])
+        if any(c in 'ABCDEF' for c in value):
+            digits = digits.upper()
+        if '.' in value:
+            return '.'.join(digits[i:i + 4] for i in range(0, 12, 4))
+        return value[2].join(digits[i:i + 2] for i in range(0, 12, 2))
+
+    def interface(self, mapping, match):
+        key = match.group('type'), match.group('path')
+        number = int(match.group('number'))
+        if ('interface', key, number) not in mapping:
+            self.numbers[key] = self.numbers.get(key, 0) + 1
+            mapping['interface', key, number] = self.numbers[key]
+        return '{}{}{}{}'.format(match.group('type'), match.group('path'),
+                                 mapping['interface', key, number],
+                                 match.group('sub') or '')
+
+
+def _ipv6(value):
+    try:
+        return ipaddress.IPv6Address(value)
+    except ValueError:
+        return None
+
+
+def _mac_int(value):
+    return int(re.sub(r'[.:-]', '', value), 16)
+
+
+def _vary(text, keys, mapping):
+    '''return text with the keys replaced from mapping'''
+    def replace(match):
+        for kind in ('mac', 'ipv4', 'ipv6', 'interface'):
+            if match.group(kind):
+                break
+        value = match.group(kind)
+        if kind == 'interface':
+            new = keys.interface(mapping, match)
+        else:
+            new = getattr(keys, kind)(mapping, value)
+        pad = match.group('pad')
+        if pad:
+            # Keep the next column in place, at least one space apart
+            pad = ' ' * max(1, len(pad) + len(value) - len(new))
+        return new + match.group('tail') + pad
+    return _VALUES.sub(replace, text)
+
+
+def scale(output, records, start=None, continuation=None, parser=None):
+    '''return output with its records replicated to `records` records
+
+        Args:
+            output (`str`): golden output
+            records (`int`): number of records of the scaled output
+            start (`str`): expression matching the first line of a record
+            continuation (`str`): expression matching continuation lines
+            parser (`str` or `class`): parser of the output, its profile is
+                                       used when start is not given
+
+        Raises:
+            ValueError when the output has no record
+    '''
+    if start is None:
+        start, continuation = profile(parser)
+    parts = sections(output, start, continuation)
+    runs = [part for part in parts if isinstance(part, list)]
+    total = sum(len(run) for run in runs)
+    if not total:
+        raise ValueError('no record found in the output')
+
+    # Records of each run, in proportion of the run size
+    quotas = [len(run) * records // total for run in runs]
+    quotas[-1] += records - sum(quotas)
+
+    keys = _Keys(output)
+    scaled = []
+    quotas = iter(quotas)
+    for part in parts:
+        if not isinstance(part, list):
+            scaled.append(part)
+            continue
+        quota = next(quotas)
+        for index in range(quota):
+            copy, record = divmod(index, len(part))
+            text = ''.join(part[record])
+            if copy:
+                text = _vary(text, keys, keys.copy(copy))
+            scaled.append(text)
+    return ''.join(scaled)
+
+
+def growth(points):
+    '''return the growth exponent of y over x, log-log least squares
+
+        Args:
+            points (`list`): (x, y) pairs, x and y positive
+    '''
+    logs = [(math.log(x), math.log(y)) for x, y in points if x > 0 and y > 0]
+    if len(logs) < 2:
+        return None
+    mean_x = sum(x for x, _ in logs) / len(logs)
+    mean_y = sum(y for _, y in logs) / len(logs)
+    var = sum((x - mean_x) ** 2 for x, _ in logs)
+    if not var:
+        return None
+    return sum((x - mean_x) * (y - mean_y) for x, y in logs) / var
+
+
+def sweep(parser, output, counts, arguments=None, context='cli', start=None,
+          continuation=None, warmup=0, repeat=3, memory=True):
+    '''measure the parse of output scaled to each record count
+
+        Returns:
+            {'points': [{'records', 'lines', 'seconds', 'peak_kib'}],
+             'time_growth': exponent of the parse time over the records,
+             'memory_growth': exponent of the peak allocation}
+    '''
+    if start is None:
+        start, continuation = profile(parser)
+    points = []
+    for count in counts:
+        scaled = scale(output, count, start, continuation)
+        result = measure(Fixture(parser, arguments or {}, scaled,
+                                 'scale:{}'.format(count), context),
+                         warmup=warmup, repeat=repeat, memory=memory)
+        points.append({
+            'records': count,
+            'lines': scaled.count('\n') + 1,
+            'seconds': result['seconds'],
+            'peak_kib': round(result['peak'] / 1024, 1)
+            if result['peak'] else None})
+    memory_growth = growth([(point['records'], point['peak_kib'])
+                            for point in points if point['peak_kib']])
+    return {'points': points,
+            'time_growth': growth([(point['records'], point['seconds'])
+                                   for point in points]),
+            'memory_growth': memory_growth}
+
+
+def load_parser(key):
+    '''return the parser class of '<os>.<Class>'
+
+        Raises:
+            KeyError when the parser is not found
+    '''
+    os_name, name = key.split('.', 1)
+    return os_parsers(os_name)[name]
+
+
+def main(argv=None):
+    '''Command line entry, returns 1 when the parse grows superlinearly'''
+    args = argparse.ArgumentParser(
+        description='Scale a golden output and measure the parse against '
+                    'the record count')
+    args.add_argument('--parser', required=True, help='<os>.<Class>')
+    args.add_argument('--input', required=True, help='golden output file')
+    args.add_argument('--records', type=int, default=None,
+                      help='write the output scaled to this many records')
+    args.add_argument('--sweep', type=int, nargs='*', default=None,
+                      help='record counts to measure the parse at')
+    args.add_argument('--start', default=None,
+                      help='record start expression, the parser profile '
+                           'by default')
+    args.add_argument('--continuation', default=None)
+    args.add_argument('--repeat', type=int, default=3)
+    args.add_argument('--no-memory', action='store_true')
+    args = args.parse_args(argv)
+
+    with open(args.input) as f:
+        output = f.read()
+    start, continuation = args.start, args.continuation
+    if start is None:
+        start, continuation = profile(args.parser)
+
+    if args.records is not None:
+        sys.stdout.write(scale(output, args.records, start, continuation))
+    if not args.sweep:
+        return 0
+
+    result = sweep(load_parser(args.parser), output, args.sweep,
+                   start=start, continuation=continuation,
+                   repeat=args.repeat, memory=not args.no_memory)
+    print('{:>10} {:>10} {:>12} {:>10}'.format(
+        'records', 'lines', 'seconds', 'peak KiB'))
+    for point in result['points']:
+        print('{records:>10} {lines:>10} {seconds:>12.6f} '
+              '{peak:>10}'.format(peak=point['peak_kib'] or '-', **point))
+    print('time growth: {}'.format(result['time_growth']))
+    print('memory growth: {}'.format(result['memory_growth']))
+    if result['time_growth'] and result['time_growth'] > SUPERLINEAR:
+        print('superlinear parse time')
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,111 @@
+'''Push a selection down to the device command
+
+Broad parsers ('show bgp vrf all all summary', 'show bgp vrf all all
+neighbors', 'show ip route', 'show ip ospf interface') register narrower
+command variants taking {vrf}, {neighbor}, {interface}, ... When a caller
+only needs a subset of the output, running the narrower variant makes the
+device send, and the parser parse, only that subset.
+
+Parsers supporting it accept a `select` dictionary, also through parse():
+
+    >>> ShowBgpVrfAllNeighbors(device=device).parse(
+            select={'neighbor': '10.16.2.2'})
+
+which executes 'show bgp vrf all all neighbors 10.16.2.2'. Selecting a key
+which is also an argument of the parser, such as vrf, is the same as
+passing that argument; the argument already pushes the filter to the
+device. Both must then agree.
+'''
+
+# python
+import string
+
+# Placeholder names of command templates
+_formatter = string.Formatter()
+
+
+def placeholders(command):
+    '''return the set of placeholder names of a command template
+
+        example:
+
+            >>> placeholders('show bgp vrf {vrf} {address_family} summary')
+            >>> {'vrf', 'address_family'}
+    '''
+    return {name for _, name, _, _ in _formatter.parse(command) if name}
+
+
+def selectable(commands):
+    '''return the set of keys a command list can be narrowed on'''
+    if isinstance(commands, str):
+        commands = [commands]
+    keys = set()
+    for command in commands:
+        keys |= placeholders(command)
+    return keys
+
+
+def select_command(commands, select, unset=None, **defaults):
+    '''return the narrowest command variant covering a selection
+
+        Every key of `select` must be a placeholder of the chosen variant.
+        Placeholders of that variant which are not selected are filled with
+        `defaults`, the other arguments of the parser; a default of None
+        cannot fill a placeholder. Among the matching variants, the one
+        with the most placeholders, the narrowest, is used.
+
+        Args:
+            commands (`list`): command templates of the parser
+            select (`dict`): selected key/value, e.g. {'vrf': 'VRF1'}
+            unset (`str`): argument value standing for no filter, such as
+                           'all'. Such arguments fill placeholders but
+                           never conflict with the selection
+            defaults (`dict`): values of the other placeholders
+
+        Returns:
+            formatted command
+
+        Raises:
+            ValueError: a selected key conflicts with the argument of the
+                        same name, or no command variant covers the
+                        selection
+
+        example:
+
+            >>> select_command(['show bgp vrf all all summary',
+                                'show bgp vrf {vrf} all summary',
+                                'show bgp vrf {vrf} {address_family} summary'],
+                               {'address_family': 'ipv4 unicast'},
+                               vrf='all')
+            >>> 'show bgp vrf all ipv4 unicast summary'
+    '''
+    if isinstance(commands, str):
+        commands = [commands]
+    values = {key: value for key, value in defaults.items()
+              if value is not None}
+
+    conflicts = sorted(key for key, value in select.items()
+                       if values.get(key, unset) not in (unset, value))
+    if conflicts:
+        raise ValueError('Selection of {keys} conflicts with the arguments '
+                         '{arguments}'.format(
+                            keys=conflicts,
+                            arguments={key: values[key] for key in conflicts}))
+    values.update(select)
+
+    best = None
+    for command in commands:
+        names = placeholders(command)
+        if not names.issuperset(select) or not names.issubset(values):
+            continue
+        if best is None or len(names) > len(best[1]):
+            best = (command, names)
+
+    if best is None:
+        raise ValueError('Cannot select {keys} with commands {commands}, '
+                         'supported keys are {supported}'.format(
+                            keys=sorted(select), commands=commands,
+                            supported=sorted(selectable(commands))))
+
+    command, names = best
+    return command.format(**{name: values[name] for name in names})
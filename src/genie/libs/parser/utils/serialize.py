@@ -0,0 +1,540 @@
+'''Serialization of parsed results
+
+Parsed results are dictionaries of str, int, float, bool and None values,
+lists and nested dictionaries, keyed by str or int. Three encodings:
+
+  * JSON: dumps()/loads(), and streaming with write_ndjson()/read_ndjson()
+    (one result per line) or JSONWriter (one JSON array). int keys become
+    str keys, as with json.dumps()
+  * binary: pack()/unpack(), and streaming with write_packed()/
+    read_packed(). The format is MessagePack: int keys are kept, tuples
+    come back as lists
+  * canonical: canonical() is the binary form with the keys of every
+    dictionary sorted on their encoded form, the same bytes for equal
+    results whatever their insertion order; digest() hashes it
+
+Values of other types are passed to `default`, which returns a
+serializable value or raises TypeError, as with json.dumps().
+
+Throughput is compared with format_output() and json.dumps() on the parsed
+golden outputs:
+
+    $ python -m genie.libs.parser.utils.serialize --os iosxe
+'''
+
+# python
+import io
+import sys
+import json
+import time
+import struct
+import hashlib
+import argparse
+from unittest.mock import Mock
+
+# Parser
+from genie.libs.parser.utils.common import format_output
+
+# Bytes read at once by read_packed()
+CHUNK_SIZE = 65536
+
+# Hash of digest()
+ALGORITHM = 'sha256'
+
+_ENCODER = json.JSONEncoder(separators=(',', ':'), check_circular=False)
+_SORTED_ENCODER = json.JSONEncoder(separators=(',', ':'), sort_keys=True,
+                                   check_circular=False)
+_DECODER = json.JSONDecoder()
+
+_UINT8 = struct.Struct('>B')
+_UINT16 = struct.Struct('>H')
+_UINT32 = struct.Struct('>I')
+_UINT64 = struct.Struct('>Q')
+_INT8 = struct.Struct('>b')
+_INT16 = struct.Struct('>h')
+_INT32 = struct.Struct('>i')
+_INT64 = struct.Struct('>q')
+_FLOAT64 = struct.Struct('>d')
+
+
+def _encoder(sort_keys, default):
+    if default is None:
+        return _SORTED_ENCODER if sort_keys else _ENCODER
+    return json.JSONEncoder(separators=(',', ':'), sort_keys=sort_keys,
+                            check_circular=False, default=default)
+
+
+def dumps(data, sort_keys=False, default=None):
+    '''return the compact JSON str of a parsed result'''
+    return _encoder(sort_keys, default).encode(data)
+
+
+def loads(text):
+    '''return the parsed result of a JSON str'''
+    return _DECODER.decode(text)
+
+
+def write_ndjson(results, fp, sort_keys=False, default=None):
+    '''write parsed results to a text file, one JSON document per line
+
+        Returns:
+            number of results written
+    '''
+    encode = _encoder(sort_keys, default).encode
+    count = 0
+    for result in results:
+        fp.write(encode(result))
+        fp.write('\n')
+        count += 1
+    return count
+
+
+def read_ndjson(fp):
+    '''yield the parsed results of a text file written by write_ndjson()'''
+    decode = _DECODER.decode
+    for line in fp:
+        if line.strip():
+            yield decode(line)
+
+
+class JSONWriter(object):
+    '''Stream parsed results as one JSON array
+
+        >>> with JSONWriter(fp) as writer:
+        ...     for result in results:
+        ...         writer.write(result)
+    '''
+
+    def __init__(self, fp, sort_keys=False, default=None):
+        self.fp = fp
+        self.count = 0
+        self._encode = _encoder(sort_keys, default).encode
+
+    def __enter__(self):
+        self.fp.write('[')
+        return self
+
+    def write(self, result):
+        if self.count:
+            self.fp.write(',\n')
+        self.fp.write(self._encode(result))
+        self.count += 1
+
+    def __exit__(self, *exc_info):
+        self.fp.write(']\n')
+
+
+def _pack_int(value, out):
+    if 0 <= value < 0x80:
+        out.append(value)
+    elif -0x20 <= value < 0:
+        out.append(value & 0xff)
+    elif value >= 0:
+        if value <= 0xff:
+            out.append(0xcc)
+            out += _UINT8.pack(value)
+        elif value <= 0xffff:
+            out.append(0xcd)
+            out += _UINT16.pack(value)
+        elif value <= 0xffffffff:
+            out.append(0xce)
+            out += _UINT32.pack(value)
+        elif value <= 0xffffffffffffffff:
+            out.append(0xcf)
+            out += _UINT64.pack(value)
+        else:
+            raise ValueError('int out of the 64 bits range: {}'.format(value))
+    elif value >= -0x80:
+        out.append(0xd0)
+        out += _INT8.pack(value)
+    elif value >= -0x8000:
+        out.append(0xd1)
+        out += _INT16.pack(value)
+    elif value >= -0x80000000:
+        out.append(0xd2)
+        out += _INT32.pack(value)
+    elif value >= -0x8000000000000000:
+        out.append(0xd3)
+        out += _INT64.pack(value)
+    else:
+        raise ValueError('int out of the 64 bits range: {}'.format(value))
+
+
+def _pack_length(length, fix, fix_max, codes, out):
+    '''header of a str, bin, array or map of length'''
+    if length < fix_max:
+        out.append(fix | length)
+    elif length <= 0xff and codes[0] is not None:
+        out.append(codes[0])
+        out += _UINT8.pack(length)
+    elif length <= 0xffff:
+        out.append(codes[1])
+        out += _UINT16.pack(length)
+    else:
+        out.append(codes[2])
+        out += _UINT32.pack(length)
+
+
+_STR = (0xa0, 32, (0xd9, 0xda, 0xdb))
+_BIN = (0, 0, (0xc4, 0xc5, 0xc6))
+_ARRAY = (0x90, 16, (None, 0xdc, 0xdd))
+_MAP = (0x80, 16, (None, 0xde, 0xdf))
+
+
+def _pack_map(value, out, default, canonical):
+    _pack_length(len(value), *_MAP, out=out)
+    if not canonical:
+        for key, item in value.items():
+            _pack(key, out, default, canonical)
+            _pack(item, out, default, canonical)
+        return
+    pairs = []
+    for key, item in value.items():
+        key_out = bytearray()
+        _pack(key, key_out, default, canonical)
+        pairs.append((bytes(key_out), item))
+    pairs.sort(key=lambda pair: pair[0])
+    for key, item in pairs:
+        out += key
+        _pack(item, out, default, canonical)
+
+
+def _pack(value, out, default, canonical):
+    # Exact types first, the subclasses (OrderedDict, ...) are rare
+    kind = type(value)
+    if kind is str:
+        encoded = value.encode('utf-8')
+        _pack_length(len(encoded), *_STR, out=out)
+        out += encoded
+    elif kind is int:
+        _pack_int(value, out)
+    elif kind is dict:
+        _pack_map(value, out, default, canonical)
+    elif value is None:
+        out.append(0xc0)
+    elif kind is bool:
+        out.append(0xc3 if value else 0xc2)
+    elif kind is float:
+        out.append(0xcb)
+        out += _FLOAT64.pack(value)
+    elif kind is list or kind is tuple:
+        _pack_length(len(value), *_ARRAY, out=out)
+        for item in value:
+            _pack(item, out, default, canonical)
+    elif isinstance(value, dict):
+        _pack_map(value, out, default, canonical)
+    elif isinstance(value, (list, tuple)):
+        _pack(list(value), out, default, canonical)
+    elif isinstance(value, (bytes, bytearray)):
+        _pack_length(len(value), *_BIN, out=out)
+        out += value
+    elif isinstance(value, int):
+        _pack_int(int(value), out)
+    elif isinstance(value, str):
+        _pack(str(value), out, default, canonical)
+    elif isinstance(value, float):
+        _pack(float(value), out, default, canonical)
+    elif default is not None:
+        _pack(default(value), out, default, canonical)
+    else:
+        raise TypeError('Object of type {} is not serializable'.format(
+            kind.__name__))
+
+
+def pack(data, default=None):
+    '''return the binary form of a parsed result'''
+    out = bytearray()
+    _pack(data, out, default, False)
+    return bytes(out)
+
+
+def canonical(data, default=None):
+    '''return the binary form of a parsed result, keys sorted at every level
+
+        Equal results give the same bytes. The keys are sorted on their
+        encoded form, so int and str keys of a dictionary are ordered too.
+    '''
+    out = bytearray()
+    _pack(data, out, default, True)
+    return bytes(out)
+
+
+def digest(data, algorithm=ALGORITHM, default=None):
+    '''return the hex digest of the canonical form of a parsed result'''
+    return hashlib.new(algorithm, canonical(data, default)).hexdigest()
+
+
+class _Incomplete(Exception):
+    '''The buffer ends within a value'''
+
+
+def _take(data, offset, length):
+    end = offset + length
+    if end > len(data):
+        raise _Incomplete()
+    return end
+
+
+def _unpack(data, offset):
+    '''return (value, offset after the value) of the value at offset'''
+    if offset >= len(data):
+        raise _Incomplete()
+    code = data[offset]
+    offset += 1
+    if code < 0x80:
+        return code, offset
+    if code >= 0xe0:
+        return code - 0x100, offset
+    if 0xa0 <= code <= 0xbf:
+        end = _take(data, offset, code & 0x1f)
+        return str(data[offset:end], 'utf-8'), end
+    if 0x80 <= code <= 0x8f:
+        return _unpack_map(data, offset, code & 0x0f)
+    if 0x90 <= code <= 0x9f:
+        return _unpack_array(data, offset, code & 0x0f)
+    if code == 0xc0:
+        return None, offset
+    if code == 0xc2:
+        return False, offset
+    if code == 0xc3:
+        return True, offset
+    try:
+        unpacker, length, kind = _CODES[code]
+    except KeyError:
+        raise ValueError('Invalid code 0x{:02x} at offset {}'.format(
+            code, offset - 1))
+    end = _take(data, offset, length)
+    value = unpacker.unpack_from(data, offset)[0]
+    if kind is None:
+        return value, end
+    if kind is str or kind is bytes:
+        start = end
+        end = _take(data, start, value)
+        if kind is str:
+            return str(data[start:end], 'utf-8'), end
+        return bytes(data[start:end]), end
+    if kind is list:
+        return _unpack_array(data, end, value)
+    return _unpack_map(data, end, value)
+
+
+def _unpack_array(data, offset, length):
+    items = []
+    for _ in range(length):
+        item, offset = _unpack(data, offset)
+        items.append(item)
+    return items, offset
+
+
+def _unpack_map(data, offset, length):
+    items = {}
+    for _ in range(length):
+        key, offset = _unpack(data, offset)
+        items[key], offset = _unpack(data, offset)
+    return items, offset
+
+
+# code: (struct of the value or length, size, kind of the value)
+_CODES = {
+    0xcc: (_UINT8, 1, None), 0xcd: (_UINT16, 2, None),
+    0xce: (_UINT32, 4, None), 0xcf: (_UINT64, 8, None),
+    0xd0: (_INT8, 1, None), 0xd1: (_INT16, 2, None),
+    0xd2: (_INT32, 4, None), 0xd3: (_INT64, 8, None),
+    0xca: (struct.Struct('>f'), 4, None), 0xcb: (_FLOAT64, 8, None),
+    0xd9: (_UINT8, 1, str), 0xda: (_UINT16, 2, str), 0xdb: (_UINT32, 4, str),
+    0xc4: (_UINT8, 1, bytes), 0xc5: (_UINT16, 2, bytes),
+    0xc6: (_UINT32, 4, bytes),
+    0xdc: (_UINT16, 2, list), 0xdd: (_UINT32, 4, list),
+    0xde: (_UINT16, 2, dict), 0xdf: (_UINT32, 4, dict),
+}
+
+
+def unpack(data):
+    '''return the parsed result of a binary form'''
+    try:
+        value, offset = _unpack(data, 0)
+    except _Incomplete:
+        raise ValueError('Truncated data')
+    if offset != len(data):
+        raise ValueError('Extra data after offset {}'.format(offset))
+    return value
+
+
+def write_packed(results, fp, default=None):
+    '''write the binary form of parsed results to a binary file, one after
+    the other
+
+        Returns:
+            number of results written
+    '''
+    count = 0
+    for result in results:
+        fp.write(pack(result, default))
+        count += 1
+    return count
+
+
+def read_packed(fp, chunk_size=CHUNK_SIZE):
+    '''yield the parsed results of a binary file written by write_packed()
+
+        The file is read chunk_size bytes at a time, at least.
+    '''
+    buffer = b''
+    offset = 0
+    while True:
+        while offset < len(buffer):
+            try:
+                value, end = _unpack(buffer, offset)
+            except _Incomplete:
+                break
+            offset = end
+            yield value
+        # A value larger than chunk_size is read in doubling chunks, not
+        # decoded again for every chunk_size bytes
+        chunk = fp.read(max(chunk_size, len(buffer) - offset))
+        if not chunk:
+            if offset < len(buffer):
+                raise ValueError('Truncated data')
+            return
+        buffer = buffer[offset:] + chunk
+        offset = 0
+
+
+def _ndjson(results, sort_keys=False):
+    fp = io.StringIO()
+    write_ndjson(results, fp, sort_keys=sort_keys, default=str)
+    return fp.getvalue()
+
+
+def _packed(results):
+    fp = io.BytesIO()
+    write_packed(results, fp, default=str)
+    return fp.getvalue()
+
+
+# Serializations measured by benchmark(): name -> function of the results
+# returning the serialized str or bytes, or a list of them
+SERIALIZERS = {
+    'format_output': lambda results: [format_output(result)
+                                      for result in results],
+    'json.dumps': lambda results: [json.dumps(result, default=str)
+                                   for result in results],
+    'ndjson': _ndjson,
+    'ndjson_sorted': lambda results: _ndjson(results, sort_keys=True),
+    'pack': _packed,
+    'canonical': lambda results: [canonical(result, default=str)
+                                  for result in results],
+}
+
+
+def _size(serialized):
+    if isinstance(serialized, (str, bytes)):
+        return len(serialized)
+    return sum(len(item) for item in serialized)
+
+
+def _fastest(function, argument, repeat):
+    '''return (value, seconds) of the fastest of repeat calls'''
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        value = function(argument)
+        seconds = time.perf_counter() - start
+        if best is None or seconds < best:
+            best = seconds
+    return value, best
+
+
+def benchmark(results, repeat=3):
+    '''return the throughput of the serializations of parsed results
+
+        Returns:
+            {name: {'seconds', 'bytes', 'results_per_sec', 'mb_per_sec'}}
+            for the SERIALIZERS, and the reads of the ndjson and pack forms
+            as 'read_ndjson' and 'unpack'
+    '''
+    report = {}
+    forms = {}
+    for name, function in SERIALIZERS.items():
+        forms[name], seconds = _fastest(function, results, repeat)
+        report[name] = {'seconds': seconds, 'bytes': _size(forms[name])}
+
+    _, seconds = _fastest(lambda text: list(read_ndjson(io.StringIO(text))),
+                          forms['ndjson'], repeat)
+    report['read_ndjson'] = {'seconds': seconds,
+                             'bytes': report['ndjson']['bytes']}
+    _, seconds = _fastest(lambda data: list(read_packed(io.BytesIO(data))),
+                          forms['pack'], repeat)
+    report['unpack'] = {'seconds': seconds, 'bytes': report['pack']['bytes']}
+
+    for values in report.values():
+        seconds = values['seconds'] or float('nan')
+        values['results_per_sec'] = round(len(results) / seconds, 1)
+        values['mb_per_sec'] = round(values['bytes'] / seconds / 1e6, 2)
+        values['seconds'] = round(values['seconds'], 6)
+    return report
+
+
+def parsed_results(os_names=None, source='all'):
+    '''return the parsed results of the golden outputs
+
+        Results every serializer can encode, the sorted ones fail on mixed
+        int and str keys.
+    '''
+    # Imported here, loading the corpus imports every parser
+    from genie.libs.parser.utils.benchmark import (folder_fixtures,
+                                                   golden_fixtures)
+    fixtures = []
+    if source in ('all', 'folder'):
+        fixtures.extend(folder_fixtures(os_names))
+    if source in ('all', 'unittest'):
+        fixtures.extend(golden_fixtures(os_names))
+    results = []
+    for fixture in fixtures:
+        device = Mock(**{'execute.return_value': fixture.output})
+        try:
+            results.append(fixture.parser(
+                device=device, context=fixture.context).parse(
+                    **dict(fixture.arguments, output=fixture.output)))
+        except Exception:
+            continue
+        try:
+            format_output(results[-1])
+            dumps(results[-1], sort_keys=True)
+        except TypeError:
+            results.pop()
+    return results
+
+
+def main(argv=None):
+    '''Command line entry: serialization throughput on the golden outputs'''
+    args = argparse.ArgumentParser(
+        description='Serialization throughput of the parsed golden outputs')
+    args.add_argument('--os', nargs='*', dest='os_names',
+                      help='operating systems, all by default')
+    args.add_argument('--source', choices=('all', 'folder', 'unittest'),
+                      default='all', help='golden outputs to use')
+    args.add_argument('--repeat', type=int, default=3,
+                      help='runs per serialization, the fastest is kept')
+    args.add_argument('--output', default=None,
+                      help='json file to store the report in')
+    args = args.parse_args(argv)
+
+    results = parsed_results(args.os_names, args.source)
+    report = benchmark(results, repeat=args.repeat)
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+
+    print('{} results'.format(len(results)))
+    print('{:<15} {:>12} {:>14} {:>10}'.format('', 'bytes', 'results/s',
+                                                'MB/s'))
+    for name, values in report.items():
+        print('{:<15} {:>12} {:>14} {:>10}'.format(
+            name, values['bytes'], values['results_per_sec'],
+            values['mb_per_sec']))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
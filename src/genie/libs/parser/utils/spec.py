@@ -0,0 +1,303 @@
+'''Declarative line parsers
+
+Most parsers are the same loop: strip each line, try the patterns in turn,
+and store the groups of the first match under a key path built with
+setdefault(). A Spec declares the patterns and where their groups go, and
+compiles them to that loop:
+
+  * the group names are resolved to their position in m.groups() when the
+    Spec is built, no dictionary is built per line with m.groupdict()
+  * rules sharing a pattern share its match, the pattern is tried once per
+    line whatever the number of rules it dispatches to
+  * groups set by every match of their pattern are stored without checking
+    for None, the entries appended to lists are built in one go
+
+A Rule is a pattern, the Set actions applied when it matches and the
+conditions of the match:
+
+    >>> spec = Spec(
+    ...     Rule(r'^(?P<nve>\\S+) +(?P<peer>\\S+) +(?P<state>\\w+)$',
+    ...          Set(('{nve}', 'peer_ip', '{peer}'),
+    ...              {'state': ('state', str.lower)})))
+    >>> spec.parse('nve1  10.0.0.1  Up')
+    {'nve1': {'peer_ip': {'10.0.0.1': {'state': 'up'}}}}
+
+The items of a key path are:
+
+  * '{name}': the value of the group name
+  * '#name': the counter name, incremented each time a rule with it in its
+    path matches, '#index' numbers the records from 1
+  * '[]': the previous key holds a list, a new dictionary is appended
+  * any other string: the key itself
+
+The values of a Set map keys to:
+
+  * 'name': the value of the group name
+  * ('name', converter): converter(value of the group name)
+  * ('name', converter, default): default when the group did not match
+
+Keys of groups which did not match, None, are not set.
+
+Blocks spanning several lines are written with contexts: a rule with
+opens=True makes the dictionary of its last Set the context of its depth,
+the paths of the rules of depth n + 1 start from the context of depth n
+instead of the parsed dictionary. Rules of depth n + 1 are skipped until a
+context of depth n is opened.
+'''
+
+# python
+import re
+
+try:
+    # Python 3.11 and later
+    from re import _parser as sre_parse, _constants as sre_constants
+except ImportError:
+    import sre_parse
+    import sre_constants
+
+# Item of the key paths appending a new dictionary to a list
+APPEND = '[]'
+
+# Operators of the parsed patterns repeating their subpattern
+REPEATS = {getattr(sre_constants, name) for name in
+           ('MAX_REPEAT', 'MIN_REPEAT', 'POSSESSIVE_REPEAT')
+           if hasattr(sre_constants, name)}
+
+
+def _required(compiled):
+    '''return the numbers of the groups of compiled set by every match;
+    groups under a branch, an optional repeat or a condition may be None'''
+    try:
+        tree = sre_parse.parse(compiled.pattern, compiled.flags)
+    except Exception:
+        # Every group is checked
+        return set()
+    atomic = getattr(sre_constants, 'ATOMIC_GROUP', None)
+    required = set()
+
+    def walk(items):
+        for op, av in items:
+            if op is sre_constants.SUBPATTERN:
+                if av[0]:
+                    required.add(av[0])
+                walk(av[-1])
+            elif op in REPEATS and av[0] > 0:
+                walk(av[2])
+            elif op is atomic:
+                walk(av)
+
+    walk(tree)
+    return required
+
+
+class Set(object):
+    '''Values stored under a key path
+
+        Args:
+            path (`tuple`): keys from the parsed dictionary, or the context
+            values (`dict`): key -> group name, (group name, converter) or
+                             (group name, converter, default)
+    '''
+
+    def __init__(self, path, values=None):
+        self.path = tuple(path)
+        self.values = dict(values or {})
+
+
+class Rule(object):
+    '''Pattern and the actions applied to the lines it matches
+
+        Args:
+            pattern (`str`): pattern matched against each line
+            actions (`Set`): applied in order
+            when (`tuple`): (group name, predicate), the rule only applies
+                            when predicate(value of the group) is true. The
+                            next rule of the pattern is tried otherwise
+            depth (`int`): the paths start from the context of depth - 1.
+                           Default 0, from the parsed dictionary
+            opens (`bool`): the dictionary of the last action becomes the
+                            context of depth. Default False
+    '''
+
+    def __init__(self, pattern, *actions, when=None, depth=0, opens=False):
+        self.pattern = pattern
+        self.actions = actions
+        self.when = when
+        self.depth = depth
+        self.opens = opens
+
+
+class Spec(object):
+    '''Compiled rules of a parser
+
+    The rules are compiled to the source of a parse function, the loop a
+    parser would write: one match per pattern, the rules of the pattern in
+    order, their keys setdefault() chains and their values read from the
+    m.groups() tuple. The source is kept in the source attribute.
+
+    The parse function looks its names up in the namespace attribute when
+    called; matchers maps the names of its match functions to their
+    compiled patterns, for the instrumentation to replace them.
+
+        Args:
+            rules (`Rule`): tried in order, the first one applying to a
+                            line ends the line
+            strip (`bool`): lines are stripped before matching. Default True
+
+        Raises:
+            ValueError: a rule names a group missing from its pattern
+    '''
+
+    def __init__(self, *rules, strip=True):
+        self.rules = rules
+        self.strip = strip
+        # Names of the parse function -> patterns, converters, predicates
+        self.namespace = {}
+        # Names of the match functions -> compiled patterns
+        self.matchers = {}
+        # [(compiled pattern, [rule])], in the order of the rules
+        dispatch = []
+        patterns = {}
+        for rule in rules:
+            compiled = re.compile(rule.pattern)
+            if compiled not in patterns:
+                patterns[compiled] = []
+                dispatch.append((compiled, patterns[compiled]))
+            patterns[compiled].append(rule)
+        self.source = self._generate(dispatch)
+        exec(self.source, self.namespace)
+        self._parse = self.namespace['parse']
+
+    def _name(self, prefix, value):
+        '''return the name of value in the parse function'''
+        name = '{}_{}'.format(prefix, len(self.namespace))
+        self.namespace[name] = value
+        return name
+
+    @staticmethod
+    def _group(compiled, name):
+        '''return g[index], group name in the m.groups() tuple g'''
+        try:
+            # groups() is 0-based
+            return 'g[{}]'.format(compiled.groupindex[name] - 1)
+        except KeyError:
+            raise ValueError('Pattern {!r} has no group {!r}'.format(
+                compiled.pattern, name))
+
+    def _generate(self, dispatch):
+        '''return the source of the parse function of the rules'''
+        counters = {}
+        depth = max([rule.depth + rule.opens for rule in self.rules] + [0])
+        body = []
+        for compiled, rules in dispatch:
+            name = self._name('match', compiled.match)
+            self.matchers[name] = compiled
+            body.append('m = {}(line)'.format(name))
+            body.append('if m:')
+            body.append('    g = m.groups()')
+            for rule in rules:
+                lines = self._rule(compiled, rule, counters, depth)
+                conditions = []
+                if rule.when:
+                    name, predicate = rule.when
+                    conditions.append('{}({})'.format(
+                        self._name('when', predicate),
+                        self._group(compiled, name)))
+                if rule.depth:
+                    conditions.append('context_{} is not None'.format(
+                        rule.depth - 1))
+                if conditions:
+                    body.append('    if {}:'.format(' and '.join(conditions)))
+                    lines = ['    ' + line for line in lines]
+                body.extend('    ' + line for line in lines)
+
+        source = ['def parse(output):',
+                  '    parsed = {}']
+        source.extend('    {} = 0'.format(name)
+                      for name in sorted(counters.values()))
+        source.extend('    context_{} = None'.format(level)
+                      for level in range(depth))
+        source.append('    for line in output.splitlines():')
+        if self.strip:
+            source.append('        line = line.strip()')
+        source.extend('        ' + line for line in body)
+        source.append('    return parsed')
+        return '\n'.join(source) + '\n'
+
+    def _rule(self, compiled, rule, counters, depth):
+        '''return the lines applying rule to the groups g of a line'''
+        required = _required(compiled)
+        lines = []
+        # Counters are incremented once per line
+        for action in rule.actions:
+            for item in action.path:
+                if item.startswith('#'):
+                    if item not in counters:
+                        counters[item] = 'counter_{}'.format(len(counters))
+                    line = '{0} += 1'.format(counters[item])
+                    if line not in lines:
+                        lines.append(line)
+        base = 'context_{}'.format(rule.depth - 1) if rule.depth else 'parsed'
+        for action in rule.actions:
+            # Values of the groups set by every match, other values
+            always, checked = [], []
+            for key, value in action.values.items():
+                if isinstance(value, str):
+                    value = (value,)
+                group = self._group(compiled, value[0])
+                if len(value) > 1 and value[1] is not None:
+                    converter = self._name('convert', value[1])
+                else:
+                    converter = None
+                if compiled.groupindex[value[0]] in required:
+                    always.append((key, '{}({})'.format(converter, group)
+                                   if converter else group))
+                    continue
+                checked.append('value = {}'.format(group))
+                checked.append('if value is not None:')
+                checked.append('    node[{!r}] = {}'.format(
+                    key, '{}(value)'.format(converter) if converter
+                    else 'value'))
+                if len(value) > 2:
+                    checked.append('else:')
+                    checked.append('    node[{!r}] = {}'.format(
+                        key, self._name('default', value[2])))
+            node = base
+            path = action.path
+            for index, item in enumerate(path):
+                if item == APPEND:
+                    lines.append('node = {}'.format(node))
+                    if index + 1 == len(path):
+                        # The entry is built in one go
+                        lines.append('entry = {{{}}}'.format(', '.join(
+                            '{!r}: {}'.format(key, expression)
+                            for key, expression in always)))
+                        always = []
+                    else:
+                        lines.append('entry = {}')
+                    lines.append('node.append(entry)')
+                    node = 'entry'
+                    continue
+                if item.startswith('{') and item.endswith('}'):
+                    key = self._group(compiled, item[1:-1])
+                elif item.startswith('#'):
+                    key = counters[item]
+                else:
+                    key = repr(item)
+                is_list = index + 1 < len(path) and path[index + 1] == APPEND
+                node = '{}.setdefault({}, {})'.format(
+                    node, key, '[]' if is_list else '{}')
+            lines.append('node = {}'.format(node))
+            lines.extend('node[{!r}] = {}'.format(key, expression)
+                         for key, expression in always)
+            lines.extend(checked)
+        if rule.opens:
+            lines.append('context_{} = node'.format(rule.depth))
+            lines.extend('context_{} = None'.format(level)
+                         for level in range(rule.depth + 1, depth))
+        lines.append('continue')
+        return lines
+
+    def parse(self, output):
+        '''return the dictionary built from the lines of output'''
+        return self._parse(output)
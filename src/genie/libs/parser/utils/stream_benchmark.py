@@ -0,0 +1,144 @@
+'''Benchmark of the streaming parse of large outputs
+
+Parsers with a parse_stream() method yield their records one at a time as
+the lines are read (see utils.budget.lines()). The time and the peak
+resident size of the streaming parse of a synthetic 'show route protocol
+bgp extensive' are measured, against cli(), with:
+
+    $ python -m genie.libs.parser.utils.stream_benchmark --routes 1000000 \\
+          --cli-routes 100000
+'''
+
+# python
+import sys
+import time
+import argparse
+import resource
+from concurrent.futures import ProcessPoolExecutor
+
+# Parser
+from genie.libs.parser.junos.show_route import ShowRouteProtocolExtensive
+
+# Routes of the synthetic output of the benchmark
+ROUTES = 1000000
+
+# Routes of the synthetic output parsed by cli() in the benchmark
+CLI_ROUTES = 100000
+
+# Destinations of a route table of the synthetic output
+TABLE_SIZE = 2 ** 20
+
+HEADER = ('{table}: {count} destinations, {count} routes '
+          '({count} active, 0 holddown, 0 hidden)')
+
+ROUTE = '''\
+{prefix} (1 entry, 1 announced)
+TSI:
+KRT in-kernel {prefix} -> {{indirect(1048574)}}
+        *BGP    Preference: 170/-101
+                Next hop type: Indirect, Next hop index: 0
+                Address: 0xbb68bf4
+                Next-hop reference count: 4
+                Source: 10.4.1.1
+                Next hop type: Router, Next hop index: 595
+                Next hop: 10.20.0.2 via ge-0/0/0.0, selected
+                Session Id: 0x3bf
+                Protocol next hop: 10.5.5.5
+                Indirect next hop: 0xc298604 1048574 INH Session ID: 0x3c1
+                State: <Active Int Ext>
+                Local AS: 65000 Peer AS: 65000
+                Age: 3w2d 4:43:35     Metric2: 3
+                Validation State: unverified
+                Task: BGP_65000.10.4.1.1
+                Announcement bits (2): 0-KRT 5-Resolve tree 1
+                AS path: 65001 {origin_as} I
+                Accepted
+                Localpref: 100
+                Router ID: 10.4.1.1'''.splitlines()
+
+
+def synthetic(routes=ROUTES):
+    '''yield the lines of a 'show route protocol bgp extensive' output of
+    routes /24 routes, in inet.0 tables of TABLE_SIZE destinations'''
+    for first in range(0, routes, TABLE_SIZE):
+        count = min(TABLE_SIZE, routes - first)
+        yield ''
+        yield HEADER.format(table='inet.0' if not first else
+                            'VRF{}.inet.0'.format(first // TABLE_SIZE),
+                            count=count)
+        for number in range(count):
+            prefix = '{}.{}.{}.0/24'.format(
+                (number >> 16) + 1, number >> 8 & 255, number & 255)
+            for line in ROUTE:
+                yield line.format(prefix=prefix,
+                                  origin_as=64512 + number % 1000)
+
+
+def _parse(routes, mode):
+    '''return (seconds, peak resident size in KiB) of the parse of a
+    synthetic output in this process'''
+    parser = ShowRouteProtocolExtensive(device=None)
+    start = time.perf_counter()
+    if mode == 'cli':
+        parsed = parser.cli(output='\n'.join(synthetic(routes)))
+        count = sum(len(table.get('rt', [])) for table in
+                    parsed['route-information']['route-table'])
+    else:
+        count = sum(1 for _, rt in parser.parse_stream(
+            output=synthetic(routes)) if rt is not None)
+    seconds = time.perf_counter() - start
+    if count != routes:
+        raise AssertionError('{} routes parsed out of {}'.format(count,
+                                                                 routes))
+    return seconds, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def benchmark(routes=ROUTES, mode='stream'):
+    '''return the time and peak resident size of the parse of a synthetic
+    output of routes routes by junos ShowRouteProtocolExtensive
+
+        The parse runs in a new process, so its peak resident size is not
+        hidden by earlier runs. tracemalloc is not used, it slows this
+        parser down about twenty times.
+
+        Args:
+            routes (`int`): routes of the synthetic output
+            mode (`str`): 'stream' consumes parse_stream() over the lines
+                          generated one at a time, 'cli' parses the whole
+                          output string with cli()
+
+        Returns:
+            {'routes', 'seconds', 'max_rss_kib'}
+    '''
+    with ProcessPoolExecutor(max_workers=1) as pool:
+        seconds, max_rss = pool.submit(_parse, routes, mode).result()
+    return {'routes': routes, 'seconds': seconds, 'max_rss_kib': max_rss}
+
+
+def main(argv=None):
+    '''Command line entry: streaming parse against cli() of a large
+    'show route protocol bgp extensive' '''
+    args = argparse.ArgumentParser(
+        description='Time and peak resident size of the streaming parse of '
+                    'a large show route protocol bgp extensive')
+    args.add_argument('--routes', type=int, default=ROUTES,
+                      help='routes of the output parsed by parse_stream()')
+    args.add_argument('--cli-routes', type=int, default=CLI_ROUTES,
+                      help='routes of the output parsed by cli(), 0 to '
+                           'skip it')
+    args = args.parse_args(argv)
+
+    runs = [('parse_stream', args.routes, 'stream')]
+    if args.cli_routes:
+        runs.append(('cli', args.cli_routes, 'cli'))
+    print('{:>12} {:>10} {:>10} {:>14}'.format(
+        'mode', 'routes', 'seconds', 'max RSS KiB'))
+    for name, routes, mode in runs:
+        report = benchmark(routes, mode)
+        print('{:>12} {routes:>10} {seconds:>10.2f} '
+              '{max_rss_kib:>14}'.format(name, **report))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,265 @@
+'''Fixed-width tables
+
+Many outputs are tables, their cells aligned under the fields of a header
+line:
+
+    Interface              IP-Address      OK? Method Status    Protocol
+    GigabitEthernet1       10.1.1.1        YES manual up        up
+
+Table locates the columns once, from the positions of the header fields in
+the header line, then cuts every row at these offsets instead of matching
+it with a pattern. The columns follow the rules of parsergen
+oper_fill_tabular():
+
+  * the header fields are patterns searched in order in the header line,
+    the first line where all of them are found
+  * a column starts where its field starts, or, right justified, ends
+    where its field ends: spaces in the fields move the offsets
+  * the first column starts at the beginning of the line, the last ends at
+    its end; cells are stripped
+  * blank lines and separator lines ('-----') are skipped, the table ends
+    at the line where the terminal pattern is found
+
+Cells wrapped on the next lines are joined to the cells of their row when
+wrapped is set: a line with an empty first cell continues the row above.
+
+example:
+
+    >>> table = Table(['Interface', 'IP-Address', 'OK\\?', 'Method',
+    ...                'Status', 'Protocol'])
+    >>> table.entries(output)['GigabitEthernet1']['Status']
+    'up'
+
+The throughput on a synthetic table is compared with parsergen, when
+installed, and with a pattern per row:
+
+    $ python -m genie.libs.parser.utils.table --rows 10000
+'''
+
+# python
+import re
+import sys
+import time
+import argparse
+import operator
+
+# Characters of the separator lines between the header and the rows
+SEPARATOR = ' \t-=+'
+
+# Rows of the synthetic table of the benchmark
+ROWS = 10000
+
+
+class Table(object):
+    '''Fixed-width table, its columns located by a header line
+
+        Args:
+            headers (`list`): patterns of the header fields, in order
+            labels (`list`): names of the columns. Default the headers
+            right_justified (`bool`): columns end where their field ends.
+                                      Default False, columns start where
+                                      their field starts
+            terminal (`str`): pattern found in the line ending the table
+            wrapped (`bool`): rows with an empty first cell continue the
+                              cells of the row above. Default False
+    '''
+
+    def __init__(self, headers, labels=None, right_justified=False,
+                 terminal=None, wrapped=False):
+        if labels is not None and len(labels) != len(headers):
+            raise ValueError('{} labels for {} headers'.format(
+                len(labels), len(headers)))
+        self.headers = [re.compile(header) for header in headers]
+        self.labels = list(labels or headers)
+        self.right_justified = right_justified
+        self.terminal = re.compile(terminal) if terminal else None
+        self.wrapped = wrapped
+
+    def offsets(self, line):
+        '''return the (start, end) offsets of the columns in the lines of
+        the table headed by line, None if line is not the header'''
+        spans = []
+        position = 0
+        for header in self.headers:
+            m = header.search(line, position)
+            if not m:
+                return None
+            spans.append((m.start(), m.end()))
+            position = m.end()
+        # Boundaries between the columns
+        if self.right_justified:
+            bounds = [end for _, end in spans[:-1]]
+        else:
+            bounds = [start for start, _ in spans[1:]]
+        # The last cell runs to the end of the line
+        return list(zip([0] + bounds, bounds + [None]))
+
+    def _body(self, output):
+        '''return (offsets, lines of the rows) of output, offsets None
+        without header'''
+        lines = iter(output.splitlines())
+        for line in lines:
+            offsets = self.offsets(line)
+            if offsets is not None:
+                break
+        else:
+            return None, []
+        terminal = self.terminal
+        if terminal is None:
+            return offsets, [line for line in lines
+                             if line.strip(SEPARATOR)]
+        body = []
+        for line in lines:
+            if terminal.search(line):
+                break
+            if line.strip(SEPARATOR):
+                body.append(line)
+        return offsets, body
+
+    def rows(self, output):
+        '''return the cells of the rows of output, as tuples of str'''
+        offsets, body = self._body(output)
+        if not body:
+            return []
+        # One C call cuts all the cells of a line
+        cut = operator.itemgetter(*[slice(start, end)
+                                    for start, end in offsets])
+        strip = str.strip
+        if len(offsets) == 1:
+            rows = [(strip(cut(line)),) for line in body]
+        else:
+            rows = [tuple(map(strip, cut(line))) for line in body]
+        if self.wrapped:
+            rows = self._unwrap(rows)
+        return rows
+
+    @staticmethod
+    def _unwrap(rows):
+        '''join the rows with an empty first cell to the row above'''
+        joined = []
+        for cells in rows:
+            if cells[0] or not joined:
+                joined.append(cells)
+                continue
+            joined[-1] = tuple(
+                '{} {}'.format(before, after) if before and after
+                else before or after
+                for before, after in zip(joined[-1], cells))
+        return joined
+
+    def dicts(self, output):
+        '''return the rows of output, as dictionaries keyed by label'''
+        labels = self.labels
+        return [dict(zip(labels, cells)) for cells in self.rows(output)]
+
+    def entries(self, output, index=(0,)):
+        '''return the rows of output keyed by the cells of the index
+        columns, nested one level per index column; a later row replaces
+        the row of the same keys'''
+        labels = self.labels
+        *parents, last = index
+        if not parents:
+            return {cells[last]: dict(zip(labels, cells))
+                    for cells in self.rows(output)}
+        entries = {}
+        for cells in self.rows(output):
+            level = entries
+            for column in parents:
+                level = level.setdefault(cells[column], {})
+            level[cells[last]] = dict(zip(labels, cells))
+        return entries
+
+
+def parse_table(output, headers, labels=None, index=(0,),
+                right_justified=False, terminal=None, wrapped=False):
+    '''return Table(...).entries(output, index), the entries of
+    parsergen oper_fill_tabular()'''
+    return Table(headers, labels=labels, right_justified=right_justified,
+                 terminal=terminal, wrapped=wrapped).entries(output, index)
+
+
+# Synthetic 'show ip interface brief' of the benchmark
+HEADERS = ['Interface', 'IP-Address', r'OK\?', 'Method', 'Status',
+           'Protocol']
+ROW = '{:<23}{:<16}YES {:<7}{:<22}{}'
+
+
+def synthetic(rows=ROWS):
+    '''return a 'show ip interface brief' output of rows interfaces'''
+    lines = [ROW.format('Interface', 'IP-Address', 'Method', 'Status',
+                        'Protocol').replace('YES', 'OK?')]
+    for number in range(rows):
+        lines.append(ROW.format(
+            'GigabitEthernet{}/{}'.format(number // 48, number % 48),
+            '10.{}.{}.1'.format(number // 256 % 256, number % 256),
+            'manual', 'administratively down' if number % 7 else 'up',
+            'down' if number % 7 else 'up'))
+    return '\n'.join(lines) + '\n'
+
+
+_ROW = re.compile(r'^(?P<interface>\S+) +(?P<ip_address>\S+) +'
+                  r'(?P<interface_is_ok>\S+) +(?P<method>\S+) +'
+                  r'(?P<status>up|down|administratively down|deleted) +'
+                  r'(?P<protocol>\S+)$')
+
+
+def _patterns(output):
+    '''the handwritten path: a pattern per row'''
+    entries = {}
+    for line in output.splitlines():
+        m = _ROW.match(line.strip())
+        if m:
+            group = m.groupdict()
+            entries[group['interface']] = group
+    return entries
+
+
+def _parsergen(output):
+    from genie import parsergen
+    return parsergen.oper_fill_tabular(device_output=output,
+                                       device_os='iosxe',
+                                       header_fields=HEADERS,
+                                       index=[0]).entries
+
+
+def benchmark(rows=ROWS, repeat=3):
+    '''return {path: rows per second} on a synthetic table of rows rows,
+    parsergen only when installed'''
+    output = synthetic(rows)
+    paths = {'table': lambda output: parse_table(output, HEADERS),
+             'patterns': _patterns,
+             'parsergen': _parsergen}
+    report = {}
+    for name, path in paths.items():
+        best = None
+        for _ in range(repeat):
+            start = time.perf_counter()
+            try:
+                path(output)
+            except Exception:
+                break
+            spent = time.perf_counter() - start
+            best = spent if best is None else min(best, spent)
+        if best is not None:
+            report[name] = rows / best if best else float('inf')
+    return report
+
+
+def main(argv=None):
+    '''Command line entry: throughput of the table paths'''
+    args = argparse.ArgumentParser(
+        description='Throughput of the fixed-width table parsing paths')
+    args.add_argument('--rows', type=int, default=ROWS,
+                      help='rows of the synthetic table')
+    args.add_argument('--repeat', type=int, default=3,
+                      help='runs per path, the fastest is kept')
+    args = args.parse_args(argv)
+
+    for name, rate in sorted(benchmark(args.rows, args.repeat).items(),
+                             key=lambda item: -item[1]):
+        print('{:<12}{:>14.0f} rows/s'.format(name, rate))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
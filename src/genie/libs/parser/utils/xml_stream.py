@@ -0,0 +1,209 @@
+'''Streaming reader of NX-OS '| xml' outputs
+
+NX-OS '| xml' outputs are a netconf reply holding the command as nested
+tags, then the data as TABLE_<name>/ROW_<name> tables:
+
+    <nf:rpc-reply xmlns="http://www.cisco.com/nxos:7.0.3.I7.3.:bgp" ...>
+     <nf:data>
+      <show><bgp><vrf><all><all><summary>
+       <__readonly__>
+        <TABLE_vrf>
+         <ROW_vrf>
+          <vrf-name-out>default</vrf-name-out>
+          <TABLE_af>
+           <ROW_af>...</ROW_af>
+          </TABLE_af>
+         </ROW_vrf>
+        </TABLE_vrf>
+       </__readonly__>
+      </summary></all></all></vrf></bgp></show>
+     </nf:data>
+    </nf:rpc-reply>
+
+Building the whole tree with ET.fromstring holds the complete DOM next to
+the output string. XmlRowStream feeds the output to an incremental parser
+chunk by chunk and yields every ROW_ element as a dictionary of its leaves
+once it is complete. The parser target never builds elements, so only the
+rows being walked are in memory.
+
+example:
+
+    >>> stream = XmlRowStream(output)
+    >>> for name, row, parents in stream:
+    ...     if name == 'ROW_neighbor':
+    ...         vrf = parents[0]['vrf-name-out']
+    ...         neighbor = row['neighborid']
+'''
+
+# python
+import xml.etree.ElementTree as ET
+
+# Junk characters returned by the device after the reply
+JUNK = ']]>]]>'
+
+# Characters fed to the parser at once
+CHUNK_SIZE = 65536
+
+# Tag ending the command part of the reply
+READONLY = '__readonly__'
+
+
+class XmlRowStream(object):
+    '''Iterate over the ROW_ elements of a NX-OS '| xml' output
+
+        Iterating yields (name, row, parents) for each ROW_ element, in
+        the order the elements end:
+
+          * name is the local tag name ('ROW_vrf')
+          * row is the dictionary {tag: text} of the leaves of the row
+          * parents is the list of the dictionaries of the enclosing rows,
+            outermost first. Leaves of a parent which are after the nested
+            table may not be known yet.
+
+        Nested rows are yielded before their parent row.
+
+        Args:
+            output (`str`): device output
+            command (`str`): expected command; when given, the command
+                             composed from the tags of the reply is
+                             compared with it
+            chunk_size (`int`): characters fed to the parser at once.
+                                Default to CHUNK_SIZE
+
+        Attributes:
+            namespace (`str`): namespace of the data, '{...}', resolved
+                               from the first data tag
+            command (`str`): command composed from the tags of the reply
+            top (`dict`): leaves of the data which are not within a row
+
+        Raises:
+            xml.etree.ElementTree.ParseError: output is not valid xml
+            AssertionError: composed command and expected command differ
+    '''
+
+    def __init__(self, output, command=None, chunk_size=None):
+        self.output = output
+        self.expected_command = command
+        self.chunk_size = chunk_size or CHUNK_SIZE
+        self.namespace = None
+        self.command = None
+        self.top = {}
+
+    def chunks(self):
+        '''yield the output in chunks, skipping the junk characters'''
+        output = self.output
+        start = output.find('<')
+        if start == -1:
+            start = 0
+        size = self.chunk_size
+        while start < len(output):
+            end = output.find(JUNK, start)
+            if end == -1:
+                end = len(output)
+            for index in range(start, end, size):
+                yield output[index:min(index + size, end)]
+            start = end + len(JUNK)
+
+    def __iter__(self):
+        target = _RowTarget(self)
+        parser = ET.XMLParser(target=target)
+        completed = target.completed
+        for chunk in self.chunks():
+            parser.feed(chunk)
+            if completed:
+                yield from completed
+                completed.clear()
+        parser.close()
+        yield from completed
+        completed.clear()
+
+        if target.in_command:
+            # No data in the reply
+            self._check_command(target.words)
+
+    def _check_command(self, words):
+        self.command = ' '.join(words)
+        if self.expected_command is not None:
+            assert self.command == self.expected_command, \
+                'Cli created from XML tags does not match the actual cli:\n'\
+                'XML Tags cli: {c}\nCli command: {e}'.format(
+                    c=self.command, e=self.expected_command)
+
+    def rows(self, name):
+        '''yield (row, parents) of the rows with a given tag name'''
+        for row_name, row, parents in self:
+            if row_name == name:
+                yield row, parents
+
+
+class _RowTarget(object):
+    '''Parser target collecting the rows of a XmlRowStream
+
+        Elements are never built: leaves are stored in the dictionary of
+        their row and completed rows are queued in `completed` until the
+        stream yields them.
+    '''
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.completed = []
+        # tag -> local name, namespaces are only split once per tag
+        self.names = {}
+        # dictionaries of the rows being read, top at the bottom
+        self.rows = [stream.top]
+        # data tags before __readonly__, command words
+        self.words = []
+        self.in_data = False
+        self.in_command = True
+        # text of the current element, None once it has a child
+        self.text = None
+
+    def local_name(self, tag):
+        try:
+            return self.names[tag]
+        except KeyError:
+            name = self.names[tag] = tag[tag.find('}') + 1:]
+            return name
+
+    def start(self, tag, attrib):
+        self.text = []
+        name = self.local_name(tag)
+        if name.startswith('ROW_'):
+            self.rows.append({})
+        elif self.in_command:
+            if name == READONLY:
+                self.in_command = False
+                self.stream._check_command(self.words)
+            elif not self.in_data:
+                if name == 'data':
+                    self.in_data = True
+            else:
+                if self.stream.namespace is None:
+                    self.stream.namespace = tag[:tag.find('}') + 1]
+                if '__XML__' not in name and 'TABLE' not in name:
+                    self.words.append(name)
+
+    def data(self, data):
+        if self.text is not None:
+            self.text.append(data)
+
+    def end(self, tag):
+        name = self.local_name(tag)
+        text = self.text
+        self.text = None
+        if name.startswith('ROW_'):
+            row = self.rows.pop()
+            self.completed.append((name, row, self.rows[1:]))
+        elif text is not None:
+            # Leaf, no child element started since its start
+            text = ''.join(text) or None
+            if self.in_command:
+                # <__XML__PARAM__vrf-name>
+                #  <__XML__value>VRF1</__XML__value>
+                if name == '__XML__value' and text:
+                    self.words.append(text)
+            elif self.in_data:
+                self.rows[-1][name] = text
+
+    def close(self):
+        return None
@@ -1,7 +1,6 @@
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any, Or, Optional
-from genie import parsergen
 
 import re
 
@@ -1,7 +1,6 @@
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any
 import re
-import genie.parsergen as pg
 
 
 class ShowOmpSummarySchema(MetaParser):
@@ -4,7 +4,7 @@
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any, Or, Optional
-import genie.parsergen as pg
+from genie.libs.parser.utils.table import parse_table
 import re
 
 
@@ -48,10 +48,7 @@ class ShowRebootHistory(ShowRebootHistorySchema):
         # 2020-06-18T14:20:11+00:00  Software initiated - activate 99.99.999-4499  
         # 2020-07-06T08:49:18+00:00  Initiated by user - activate 99.99.999-4567
         if out:
-            out = pg.oper_fill_tabular(device_output=out,
-                                    header_fields=["REBOOT DATE TIME", "REBOOT REASON"],
-                                    index=[0])
-            return_dict = out.entries
+            return_dict = parse_table(out, ["REBOOT DATE TIME", "REBOOT REASON"])
             reboot_date_time ={}
             for keys in return_dict.keys() :
                 dict1={}
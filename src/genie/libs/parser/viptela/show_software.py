@@ -4,7 +4,7 @@
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any, Or, Optional
-import genie.parsergen as pg
+from genie.libs.parser.utils.table import parse_table
 import re
 
 # ===========================================
@@ -47,11 +47,9 @@ class ShowSoftwaretab(ShowSoftwaretabSchema):
         # 99.99.999-4542  false   false    false     -          2020-06-18T06:30:30-00:00
         # 99.99.999-4567  true    true     false     auto       2020-07-06T01:51:18-00:00
         if out:
-            out = pg.oper_fill_tabular(device_output=out,
-                                    header_fields=["VERSION", "ACTIVE", "DEFAULT", "PREVIOUS", "CONFIRMED", "TIMESTAMP"],
-                                    label_fields=["version", "active", "default", "previous", "confirmed", "timestamp"],
-                                    index=[0])
-            return_dict = out.entries
+            return_dict = parse_table(out,
+                                      ["VERSION", "ACTIVE", "DEFAULT", "PREVIOUS", "CONFIRMED", "TIMESTAMP"],
+                                      labels=["version", "active", "default", "previous", "confirmed", "timestamp"])
             version_dict ={}
             for keys in return_dict.keys() :
                 dict1={}
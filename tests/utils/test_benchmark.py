@@ -0,0 +1,136 @@
+import os
+import json
+import types
+import shutil
+import tempfile
+import unittest
+from unittest.mock import Mock
+
+from genie.libs.parser.utils import benchmark
+from genie.libs.parser.junos.show_ospf import (ShowOspfNeighbor,
+                                               ShowOspfNeighborInstance)
+
+
+OUTPUT = '''
+    show ospf neighbor
+    Address          Interface              State     ID               Pri  Dead
+    10.189.5.94      ge-0/0/0.0             Full      10.189.5.253     128    32
+    10.169.14.121    ge-0/0/1.0             Full      10.169.14.240    128    33
+'''
+
+
+class TestBenchmark(unittest.TestCase):
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.root)
+
+    def test_parser_key(self):
+        self.assertEqual(benchmark.parser_key(ShowOspfNeighbor),
+                         'junos.ShowOspfNeighbor')
+        self.assertEqual(benchmark.parser_key(ShowOspfNeighbor, 'xml'),
+                         'junos.ShowOspfNeighbor[xml]')
+
+    def test_folder_fixtures(self):
+        folder = os.path.join(self.root, 'junos', 'ShowOspfNeighborInstance',
+                              'cli', 'equal')
+        os.makedirs(folder)
+        with open(os.path.join(folder, 'golden_output.txt'), 'w') as f:
+            f.write(OUTPUT)
+        with open(os.path.join(folder, 'golden_arguments.json'), 'w') as f:
+            json.dump({'instance_name': 'master'}, f)
+
+        fixtures = list(benchmark.folder_fixtures(['junos'], root=self.root))
+        self.assertEqual(len(fixtures), 1)
+        self.assertIs(fixtures[0].parser, ShowOspfNeighborInstance)
+        self.assertEqual(fixtures[0].arguments, {'instance_name': 'master'})
+        self.assertEqual(fixtures[0].output, OUTPUT)
+        self.assertEqual(fixtures[0].context, 'cli')
+
+    def test_record(self):
+        class TestNeighbor(unittest.TestCase):
+            def test_golden(self):
+                device = Mock(**{'execute.return_value': OUTPUT})
+                ShowOspfNeighborInstance(device=device).parse(
+                    instance_name='master')
+
+            def test_output(self):
+                ShowOspfNeighbor(device=None).parse(output=OUTPUT)
+
+            def test_side_effect(self):
+                device = Mock(**{'execute.side_effect': [OUTPUT]})
+                ShowOspfNeighbor(device=device).parse()
+
+        module = types.ModuleType('test_module')
+        module.TestNeighbor = TestNeighbor
+        module.ShowOspfNeighbor = ShowOspfNeighbor
+        module.ShowOspfNeighborInstance = ShowOspfNeighborInstance
+
+        fixtures = benchmark._record(module, 'test_module.py')
+        self.assertEqual(
+            sorted((fixture.parser.__name__, fixture.arguments)
+                   for fixture in fixtures),
+            [('ShowOspfNeighbor', {}),
+             ('ShowOspfNeighborInstance', {'instance_name': 'master'})])
+        # parse() restored
+        self.assertNotIn('parse', ShowOspfNeighbor.__dict__)
+        self.assertNotIn('parse', ShowOspfNeighborInstance.__dict__)
+
+    def test_run(self):
+        fixtures = [benchmark.Fixture(ShowOspfNeighbor, {}, OUTPUT, 'a'),
+                    benchmark.Fixture(ShowOspfNeighbor, {}, OUTPUT, 'b'),
+                    benchmark.Fixture(ShowOspfNeighbor, {}, '', 'c')]
+        results = benchmark.run(fixtures, warmup=0, repeat=2)
+        result = results['results']['junos.ShowOspfNeighbor']
+        self.assertEqual(result['fixtures'], 2)
+        self.assertEqual(result['lines'], 2 * (OUTPUT.count('\n') + 1))
+        self.assertGreater(result['us_per_parse'], 0)
+        self.assertGreater(result['lines_per_sec'], 0)
+        self.assertGreater(result['peak_kib'], 0)
+        self.assertEqual([error['source'] for error in results['errors']],
+                         ['c'])
+        self.assertEqual(results['meta']['repeat'], 2)
+
+    def test_compare(self):
+        baseline = {'results': {
+            'junos.A': {'us_per_parse': 100.0},
+            'junos.B': {'us_per_parse': 100.0},
+            'junos.C': {'us_per_parse': 100.0}}}
+        results = {'results': {
+            'junos.A': {'us_per_parse': 150.0},
+            'junos.B': {'us_per_parse': 110.0},
+            'junos.D': {'us_per_parse': 500.0}}}
+        self.assertEqual(benchmark.compare(results, baseline, threshold=0.2),
+                         [{'parser': 'junos.A', 'baseline_us': 100.0,
+                           'current_us': 150.0, 'ratio': 1.5}])
+        self.assertEqual(
+            [item['parser'] for item in benchmark.compare(
+                results, baseline, threshold=0.05)],
+            ['junos.A', 'junos.B'])
+
+    def test_main(self):
+        folder = os.path.join(self.root, 'junos', 'ShowOspfNeighbor',
+                              'cli', 'equal')
+        os.makedirs(folder)
+        with open(os.path.join(folder, 'golden_output.txt'), 'w') as f:
+            f.write(OUTPUT)
+        output = os.path.join(self.root, 'results.json')
+        baseline = os.path.join(self.root, 'baseline.json')
+        with open(baseline, 'w') as f:
+            json.dump({'results': {'junos.ShowOspfNeighbor':
+                                   {'us_per_parse': 0.001}}}, f)
+
+        folder_root = benchmark.FOLDER_ROOT
+        benchmark.FOLDER_ROOT = self.root
+        self.addCleanup(setattr, benchmark, 'FOLDER_ROOT', folder_root)
+        with unittest.mock.patch('sys.stdout'):
+            code = benchmark.main(['--os', 'junos', '--source', 'folder',
+                                   '--repeat', '1', '--output', output,
+                                   '--baseline', baseline])
+        self.assertEqual(code, 1)
+        with open(output) as f:
+            self.assertIn('junos.ShowOspfNeighbor', json.load(f)['results'])
+
+
+if __name__ == '__main__':
+    unittest.main()
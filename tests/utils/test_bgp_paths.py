@@ -0,0 +1,126 @@
+import sys
+import unittest
+
+from genie.libs.parser.utils import bgp_paths
+from genie.libs.parser.utils.bgp_paths import BgpPath, CompactPaths, Values,\
+                                               AttributeSets
+
+
+class TestBgpPaths(unittest.TestCase):
+
+    def test_values(self):
+        values = Values()
+        self.assertEqual(values.id(None), 0)
+        self.assertEqual(values.id('10.1.1.1'), 1)
+        self.assertEqual(values.id('10.1.1.2'), 2)
+        self.assertEqual(values.id('10.1.1.1'), 1)
+        self.assertEqual(values[2], '10.1.1.2')
+        self.assertEqual(len(values), 2)
+
+    def test_add_path(self):
+        table = {}
+        bgp_paths.add_path(table, 'prefix', '10.1.1.0/24', 1,
+                           {'next_hop': '10.4.1.1'})
+        bgp_paths.add_path(table, 'prefix', '10.1.1.0/24', 1,
+                           {'weight': '0'})
+        bgp_paths.add_path(table, 'prefix', '10.1.1.0/24', 2,
+                           {'next_hop': '10.4.1.2'})
+        self.assertEqual(table, {'prefix': {'10.1.1.0/24': {'index': {
+            1: {'next_hop': '10.4.1.1', 'weight': '0'},
+            2: {'next_hop': '10.4.1.2'}}}}})
+
+    def test_compact(self):
+        records = [
+            BgpPath('default', 'VRF1', 'vpnv4 unicast RD 200:1',
+                    '10.1.1.0/24', 1,
+                    {'next_hop': '10.4.1.1', 'path': '200 300',
+                     'status_codes': '*>', 'weight': '0'}),
+            BgpPath('default', 'VRF1', 'vpnv4 unicast RD 200:1',
+                    '10.1.1.0/24', 2,
+                    {'next_hop': '10.4.1.2', 'path': '200 300',
+                     'status_codes': '*', 'weight': '0'}),
+            BgpPath('default', 'VRF1', 'vpnv4 unicast RD 200:1',
+                    '10.1.2.0/24', 1,
+                    {'next_hop': '10.4.1.1', 'path': '200 300',
+                     'status_codes': '*>', 'weight': '0'}),
+        ]
+        tables = {'instance': {'default': {'vrf': {'VRF1': {
+            'address_family': {'vpnv4 unicast RD 200:1': {
+                'route_distinguisher': '200:1'}}}}}}}
+        compact = CompactPaths(records, tables=tables)
+        self.assertEqual(len(compact), 3)
+        self.assertEqual(list(compact), records)
+        self.assertEqual(len(compact.values['next_hop']), 2)
+        self.assertEqual(len(compact.values['path']), 1)
+        self.assertEqual(len(compact.values['attributes']), 2)
+        self.assertEqual(len(compact.values['community']), 0)
+
+        parsed = compact.to_dict()
+        af_dict = parsed['instance']['default']['vrf']['VRF1'][
+            'address_family']['vpnv4 unicast RD 200:1']
+        self.assertEqual(af_dict['route_distinguisher'], '200:1')
+        self.assertEqual(af_dict['prefix']['10.1.1.0/24']['index'][2],
+                         records[1].path)
+        # The tables are copied
+        self.assertNotIn('prefix', tables['instance']['default']['vrf'][
+            'VRF1']['address_family']['vpnv4 unicast RD 200:1'])
+
+    def test_deep_size(self):
+        value = 'x' * 100
+        self.assertGreater(bgp_paths.deep_size({'a': value}),
+                           bgp_paths.deep_size({}) + 100)
+        # Shared objects are counted once
+        shared = [value, value]
+        self.assertEqual(bgp_paths.deep_size(shared),
+                         sys.getsizeof(shared) + sys.getsizeof(value))
+
+    def test_as_path_tuple(self):
+        self.assertEqual(bgp_paths.as_path_tuple('Local'), ())
+        self.assertEqual(bgp_paths.as_path_tuple('NONE'), ())
+        self.assertEqual(
+            bgp_paths.as_path_tuple('200 33299 51178 47751 {27016}'),
+            (200, 33299, 51178, 47751, (27016,)))
+        self.assertEqual(bgp_paths.as_path_tuple('(65001 65002) 3 {1,2}'),
+                         (65001, 65002, 3, (1, 2)))
+        self.assertEqual(bgp_paths.as_path_tuple('1.10 4200000000'),
+                         (65546, 4200000000))
+
+    def test_community_tuple(self):
+        self.assertEqual(bgp_paths.community_tuple('65100:101 no-export'),
+                         (65100 << 16 | 101, 0xFFFFFF01))
+        self.assertEqual(bgp_paths.community_tuple(['1:1', 'unknown']),
+                         (65537, 'unknown'))
+
+    def test_attribute_sets(self):
+        attributes = AttributeSets()
+        as_path = attributes.get('as_path', ' '.join(['200', '300']))
+        self.assertIs(attributes.get('as_path', '200 300'), as_path)
+        community = attributes.get('community', ['1:1', '2:2'])
+        self.assertIs(attributes.get('community', ['1:1', '2:2']),
+                      community)
+        self.assertEqual(community, ['1:1', '2:2'])
+        self.assertEqual(len(attributes), 2)
+        self.assertEqual(attributes.values['community'][1], ('1:1', '2:2'))
+
+        attributes = AttributeSets(as_tuples=True)
+        self.assertEqual(attributes.get('as_path', '200 300'), (200, 300))
+        self.assertIs(attributes.get('as_path', '200  300'),
+                      attributes.get('as_path', '200 300'))
+        self.assertEqual(attributes.get('ext_community', 'RT:1:1 SoO:1:1'),
+                         ('RT:1:1', 'SoO:1:1'))
+        self.assertEqual(len(attributes.values['as_path']), 1)
+
+    def test_benchmark(self):
+        report = bgp_paths.benchmark(prefixes=50)
+        self.assertEqual(report['paths'], 100)
+        self.assertLess(report['compact']['bytes'], report['cli']['bytes'])
+
+    def test_benchmark_attributes(self):
+        report = bgp_paths.benchmark_attributes(prefixes=50)
+        self.assertEqual(report['paths'], 100)
+        self.assertLess(report['attributes']['bytes'],
+                        report['cli']['bytes'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,114 @@
+import time
+import threading
+import unittest
+from unittest.mock import Mock
+
+from genie.libs.parser.utils import budget
+from genie.libs.parser.iosxe.show_routing import ShowIpRoute
+
+
+OUTPUT = '''\
+R1_iosv#show ip route
+Codes: L - local, C - connected, S - static, R - RIP, M - mobile, B - BGP
+
+Gateway of last resort is not set
+
+      10.0.0.0/8 is variably subnetted, 5 subnets, 2 masks
+C        10.1.1.0/24 is directly connected, GigabitEthernet0/1
+L        10.1.1.1/32 is directly connected, GigabitEthernet0/1
+C        10.1.2.0/24 is directly connected, GigabitEthernet0/2
+L        10.1.2.1/32 is directly connected, GigabitEthernet0/2
+C        10.1.3.0/24 is directly connected, GigabitEthernet0/3
+L        10.1.3.1/32 is directly connected, GigabitEthernet0/3
+C        10.1.4.0/24 is directly connected, GigabitEthernet0/4
+L        10.1.4.1/32 is directly connected, GigabitEthernet0/4
+C        10.1.5.0/24 is directly connected, GigabitEthernet0/5
+L        10.1.5.1/32 is directly connected, GigabitEthernet0/5
+C        10.1.6.0/24 is directly connected, GigabitEthernet0/6
+L        10.1.6.1/32 is directly connected, GigabitEthernet0/6
+C        10.1.7.0/24 is directly connected, GigabitEthernet0/7
+L        10.1.7.1/32 is directly connected, GigabitEthernet0/7
+'''
+
+
+class TestBudget(unittest.TestCase):
+
+    def test_no_budget(self):
+        self.assertIsNone(budget.current())
+        self.assertEqual(budget.lines('a\nb\n'), ['a', 'b'])
+        with budget.budget(None) as current:
+            self.assertIsNone(current)
+            self.assertEqual(budget.lines('a\nb\n'), ['a', 'b'])
+
+    def test_lines(self):
+        output = '\n'.join(str(number) for number in range(100))
+        parsed = {}
+        with budget.budget(0):
+            with self.assertRaises(budget.ParseTimeout) as e:
+                for line in budget.lines(output, parsed, every=10):
+                    parsed[line] = True
+        self.assertIs(e.exception.parsed, parsed)
+        self.assertEqual(e.exception.line, 9)
+        self.assertEqual(len(parsed), 9)
+        self.assertIsInstance(e.exception, TimeoutError)
+
+        with budget.budget(60) as current:
+            self.assertEqual(list(budget.lines(output)), output.splitlines())
+        self.assertGreater(current.spent, 0)
+
+    def test_iterable(self):
+        # Device outputs end lines with '\r\n', some with a bare '\r'
+        self.assertEqual(budget.lines('a\r\nb\rc\r'), ['a', 'b', 'c'])
+        lines = iter(['a\n', 'b\n'])
+        self.assertIs(budget.lines(lines), lines)
+
+        output = (str(number) for number in range(100))
+        with budget.budget(0):
+            with self.assertRaises(budget.ParseTimeout) as e:
+                for line in budget.lines(output, every=10):
+                    pass
+        self.assertEqual(e.exception.line, 9)
+        # Lines are read one at a time
+        self.assertEqual(next(output), '10')
+
+    def test_nested(self):
+        with budget.budget(10) as outer:
+            outer.spent = 8
+            with budget.budget(5) as inner:
+                self.assertAlmostEqual(inner.timeout, 2)
+                list(budget.lines('a\nb'))
+            self.assertIs(budget.current(), outer)
+            self.assertGreater(outer.spent, 8)
+        self.assertIsNone(budget.current())
+
+    def test_thread(self):
+        seen = []
+        with budget.budget(10):
+            thread = threading.Thread(
+                target=lambda: seen.append(budget.current()))
+            thread.start()
+            thread.join()
+        self.assertEqual(seen, [None])
+
+    def test_parse_timeout(self):
+        device = Mock(**{'execute.return_value': OUTPUT})
+        with self.assertRaises(budget.ParseTimeout) as e:
+            budget.parse(ShowIpRoute(device=device), timeout=0)
+        self.assertEqual(e.exception.line, budget.CHECK_EVERY - 1)
+        routes = e.exception.parsed['vrf']['default']['address_family'][
+            'ipv4']['routes']
+        # Lines after the 15th not parsed
+        self.assertIn('10.1.5.0/24', routes)
+        self.assertNotIn('10.1.5.1/32', routes)
+
+    def test_parse_excludes_device(self):
+        def execute(*args, **kwargs):
+            time.sleep(0.2)
+            return OUTPUT
+        device = Mock(**{'execute.side_effect': execute})
+        parsed = budget.parse(ShowIpRoute(device=device), timeout=0.1)
+        self.assertEqual(parsed, ShowIpRoute(device=device).parse())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,152 @@
+import os
+import sys
+import time
+import shutil
+import tempfile
+import importlib
+import unittest
+from unittest.mock import Mock, patch
+
+from genie.libs.parser.utils import cache
+from genie.libs.parser.iosxe.show_routing import ShowIpRoute
+from genie.libs.parser.ios.show_routing import ShowIpRoute as ShowIpRouteIos
+
+
+OUTPUT = '''\
+R1_iosv#show ip route
+Codes: L - local, C - connected, S - static, R - RIP, M - mobile, B - BGP
+
+Gateway of last resort is not set
+
+      10.0.0.0/8 is variably subnetted, 2 subnets, 2 masks
+C        10.1.1.0/24 is directly connected, GigabitEthernet0/1
+L        10.1.1.1/32 is directly connected, GigabitEthernet0/1
+'''
+
+MODULE = '''\
+class Parser(object):
+    calls = 0
+
+    def __init__(self, device=None):
+        self.device = device
+
+    def parse(self, output=None, vrf=''):
+        Parser.calls += 1
+        return {'lines': {i: line for i, line in
+                          enumerate(output.splitlines())},
+                'vrf': vrf, 'version': %d}
+'''
+
+
+class TestCache(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        sys.path.insert(0, self.directory)
+        self.addCleanup(sys.path.remove, self.directory)
+        self.cache = cache.ParseCache(os.path.join(self.directory, 'cache'))
+
+    def load(self, version):
+        path = os.path.join(self.directory, 'cached_parser.py')
+        with open(path, 'w') as f:
+            f.write(MODULE % version)
+        # Distinct modification time for the digest memo
+        os.utime(path, ns=(version * 10**9, version * 10**9))
+        sys.modules.pop('cached_parser', None)
+        module = importlib.import_module('cached_parser')
+        self.addCleanup(sys.modules.pop, 'cached_parser', None)
+        return module.Parser
+
+    def test_parse(self):
+        device = Mock(**{'execute.return_value': OUTPUT})
+        expected = ShowIpRoute(device=device).parse(output=OUTPUT)
+        for _ in range(2):
+            parsed = self.cache.parse(ShowIpRoute(device=device),
+                                      output=OUTPUT)
+            self.assertEqual(parsed, expected)
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+
+        # Another cache on the same directory
+        other = cache.ParseCache(self.cache.directory)
+        self.assertEqual(other.size, self.cache.size)
+        self.assertEqual(other.parse(ShowIpRoute(device=device),
+                                     output=OUTPUT), expected)
+        self.assertEqual(other.hits, 1)
+
+        # Without output, the device is executed and nothing cached
+        self.cache.parse(ShowIpRoute(device=device))
+        self.assertEqual(self.cache.hits, 1)
+
+    def test_key(self):
+        Parser = self.load(1)
+        self.cache.parse(Parser(), output='a\nb')
+        self.cache.parse(Parser(), output='a\nb')
+        self.cache.parse(Parser(), output='a\nb', vrf='blue')
+        self.cache.parse(Parser(), output='a\nc')
+        self.assertEqual(Parser.calls, 3)
+        self.assertEqual(self.cache.parse(Parser(), output='a\nb'),
+                         {'lines': {0: 'a', 1: 'b'}, 'vrf': '',
+                          'version': 1})
+
+        # Editing the module invalidates its results
+        Parser = self.load(2)
+        self.assertEqual(
+            self.cache.parse(Parser(), output='a\nb')['version'], 2)
+        self.assertEqual(Parser.calls, 1)
+
+    def test_key_base_module(self):
+        self.assertEqual(cache.parser_modules(ShowIpRouteIos), [
+            'genie.libs.parser.ios.show_routing',
+            'genie.libs.parser.iosxe.show_routing'])
+        key = self.cache.key(ShowIpRouteIos(device=None), OUTPUT)
+
+        # Editing the iosxe module invalidates the results of the ios
+        # parser inheriting from it
+        digest = cache.module_digest
+        def edited(name):
+            if name == ShowIpRoute.__module__:
+                return 'edited'
+            return digest(name)
+
+        with patch.object(cache, 'module_digest', edited):
+            self.assertNotEqual(
+                self.cache.key(ShowIpRouteIos(device=None), OUTPUT), key)
+        self.assertEqual(
+            self.cache.key(ShowIpRouteIos(device=None), OUTPUT), key)
+
+    def test_eviction(self):
+        Parser = self.load(1)
+        self.cache.parse(Parser(), output='x' * 100)
+        entry = self.cache.size
+        self.cache.max_size = entry * 5
+        for i in range(4):
+            self.cache.parse(Parser(), output=str(i) * 100)
+        keys = [self.cache.key(Parser(), str(i) * 100) for i in range(4)]
+        # Most recently used
+        past = time.time() - 60
+        for age, key in enumerate(keys):
+            os.utime(self.cache._path(key), (past + age, past + age))
+        self.cache.get(keys[0])
+
+        self.cache.parse(Parser(), output='y' * 100)
+        self.assertLessEqual(self.cache.size, self.cache.max_size)
+        self.assertIsNotNone(self.cache.get(keys[0]))
+        self.assertIsNone(self.cache.get(keys[1]))
+
+        self.assertEqual(self.cache.clear(), 4)
+        self.assertEqual(self.cache.size, 0)
+
+    def test_corrupt(self):
+        Parser = self.load(1)
+        key = self.cache.key(Parser(), 'a')
+        self.assertTrue(self.cache.put(key, {'a': 1}))
+        with open(self.cache._path(key), 'r+b') as f:
+            f.truncate(2)
+        self.assertIsNone(self.cache.get(key))
+        self.assertFalse(os.path.exists(self.cache._path(key)))
+        self.assertFalse(self.cache.put(key, {'a': object()}))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,122 @@
+import unittest
+
+from genie.libs.parser.iosxe.show_interface import ShowInterfaces
+from genie.libs.parser.utils.counters import (
+    counter_templates,
+    counter_deltas,
+    duration_to_seconds,
+    WRAP_32,
+    WRAP_64,
+)
+
+
+class TestCounterDeltas(unittest.TestCase):
+
+    before = {
+        'GigabitEthernet1': {
+            'counters': {
+                'in_octets': 1000,
+                'out_octets': WRAP_32 - 100,
+                'in_rate': 800,
+                'last_clear': 'never',
+            },
+            'queues': {'input_queue_drops': 3},
+        },
+        'GigabitEthernet2': {
+            'counters': {
+                'in_octets': 5000,
+                'out_octets': 7000,
+                'last_clear': '1d02h',
+            },
+        },
+    }
+
+    after = {
+        'GigabitEthernet1': {
+            'counters': {
+                'in_octets': 4000,
+                'out_octets': 200,
+                'in_rate': 900,
+                'last_clear': 'never',
+            },
+            'queues': {'input_queue_drops': 3},
+        },
+        'GigabitEthernet2': {
+            'counters': {
+                'in_octets': 10,
+                'out_octets': 9000,
+                'last_clear': '00:00:12',
+            },
+        },
+        'GigabitEthernet3': {
+            'counters': {'in_octets': 10},
+        },
+    }
+
+    def test_templates_from_exclude(self):
+        templates = counter_templates(ShowInterfaces)
+        self.assertIn((None, 'counters', 'in_octets'), templates)
+        self.assertIn((None, 'queues', 'input_queue_drops'), templates)
+        # Gauges and strings are not counters
+        self.assertNotIn((None, 'counters', 'in_rate'), templates)
+        self.assertNotIn((None, 'counters', 'last_clear'), templates)
+
+    def test_deltas(self):
+        result = counter_deltas(ShowInterfaces, self.before, self.after,
+                                interval=10)
+        deltas = result['deltas']
+        self.assertEqual(deltas[('GigabitEthernet1', 'counters', 'in_octets')],
+                         3000)
+        self.assertEqual(deltas[('GigabitEthernet1', 'counters', 'out_octets')],
+                         300)
+        self.assertEqual(
+            deltas[('GigabitEthernet1', 'queues', 'input_queue_drops')], 0)
+        # Cleared counters count from zero, even when higher than before
+        self.assertEqual(deltas[('GigabitEthernet2', 'counters', 'in_octets')],
+                         10)
+        self.assertEqual(deltas[('GigabitEthernet2', 'counters', 'out_octets')],
+                         9000)
+        # Interface not in previous output
+        self.assertNotIn(('GigabitEthernet3', 'counters', 'in_octets'), deltas)
+
+        self.assertEqual(result['wraps'],
+                         [('GigabitEthernet1', 'counters', 'out_octets')])
+        self.assertEqual(sorted(result['resets']),
+                         [('GigabitEthernet2', 'counters', 'in_octets'),
+                          ('GigabitEthernet2', 'counters', 'out_octets')])
+        self.assertEqual(
+            result['rates'][('GigabitEthernet1', 'counters', 'in_octets')],
+            300.0)
+
+    def test_64_bit(self):
+        before = {'Gi1': {'counters': {'in_octets': 5000000000,
+                                       'out_octets': WRAP_64 - 100}}}
+        after = {'Gi1': {'counters': {'in_octets': 100,
+                                      'out_octets': 200}}}
+        result = counter_deltas(ShowInterfaces, before, after)
+        # Cleared without last_clear going backwards: not a wrap
+        self.assertEqual(result['deltas'][('Gi1', 'counters', 'in_octets')],
+                         100)
+        self.assertEqual(result['resets'], [('Gi1', 'counters', 'in_octets')])
+        self.assertEqual(result['deltas'][('Gi1', 'counters', 'out_octets')],
+                         300)
+        self.assertEqual(result['wraps'], [('Gi1', 'counters', 'out_octets')])
+
+    def test_reload(self):
+        result = counter_deltas(ShowInterfaces, self.before, self.after,
+                                uptime=(86400, 60))
+        self.assertNotIn('rates', result)
+        self.assertEqual(
+            result['deltas'][('GigabitEthernet1', 'counters', 'in_octets')],
+            4000)
+        self.assertEqual(len(result['resets']), len(result['deltas']))
+
+    def test_duration_to_seconds(self):
+        self.assertEqual(duration_to_seconds('1d02h'), 93600)
+        self.assertEqual(duration_to_seconds('2w3d'), 1468800)
+        self.assertEqual(duration_to_seconds('00:00:12'), 12)
+        self.assertIsNone(duration_to_seconds('never'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+import copy
+import unittest
+
+from genie.libs.parser.iosxe.show_interface import ShowInterfaces
+from genie.libs.parser.utils.diff import diff, DigestCache
+
+
+class TestDiff(unittest.TestCase):
+
+    pre = {
+        'GigabitEthernet1': {
+            'mtu': 1500,
+            'counters': {'in_octets': 100, 'last_clear': 'never'},
+            'port_channel': {'port_channel_member_intfs': ['Gi2', 'Gi3']},
+        },
+        'Tunnel10': {'mtu': 1476},
+        'Loopback0': {'mtu': 1514},
+    }
+
+    def setUp(self):
+        self.post = copy.deepcopy(self.pre)
+
+    def test_identical_with_excluded_changes(self):
+        self.post['GigabitEthernet1']['counters']['in_octets'] = 200
+        # Tunnel keys are excluded with the '(Tunnel.*)' pattern
+        del self.post['Tunnel10']
+        result = diff(self.pre, self.post, exclude=ShowInterfaces)
+        self.assertEqual(result, {'added': {}, 'removed': {}, 'changed': {}})
+
+    def test_changes(self):
+        self.post['GigabitEthernet1']['mtu'] = 9000
+        self.post['GigabitEthernet1']['port_channel'][
+            'port_channel_member_intfs'].append('Gi4')
+        del self.post['Loopback0']
+        self.post['Loopback1'] = {'mtu': 1514}
+
+        result = diff(self.pre, self.post, exclude=ShowInterfaces)
+        self.assertEqual(result['changed'], {
+            ('GigabitEthernet1', 'mtu'): (1500, 9000)})
+        self.assertEqual(result['removed'], {('Loopback0',): {'mtu': 1514}})
+        self.assertEqual(result['added'], {
+            ('Loopback1',): {'mtu': 1514},
+            ('GigabitEthernet1', 'port_channel',
+             'port_channel_member_intfs', 2): 'Gi4'})
+
+    def test_exclude_list(self):
+        self.post['GigabitEthernet1']['mtu'] = 9000
+        result = diff(self.pre, self.post, exclude=['mtu', '(Tunnel.*)'])
+        self.assertEqual(result, {'added': {}, 'removed': {}, 'changed': {}})
+
+    def test_cache_reuse(self):
+        cache = DigestCache(ShowInterfaces)
+        for mtu in (1500, 9000):
+            post = copy.deepcopy(self.pre)
+            post['GigabitEthernet1']['mtu'] = mtu
+            post['GigabitEthernet1']['counters']['in_octets'] += 1
+            result = diff(self.pre, post, cache=cache)
+        self.assertEqual(result['changed'], {
+            ('GigabitEthernet1', 'mtu'): (1500, 9000)})
+        self.assertEqual(cache.digest(self.pre), cache.digest(
+            copy.deepcopy(self.pre)))
+
+    def test_types_and_hash_collisions(self):
+        # hash(-1) == hash(-2), and 1 == True
+        for old, new in ((-1, -2), (1, True), (1, 1.0), ([1], [True])):
+            pre = {'Gi1': {'counters': {'in_errors': old}}}
+            post = {'Gi1': {'counters': {'in_errors': new}}}
+            for cache in (None, DigestCache(), DigestCache(['mtu'])):
+                result = diff(pre, post, cache=cache)
+                self.assertTrue(result['changed'], (old, new, cache))
+                self.assertEqual(diff(pre, copy.deepcopy(pre), cache=cache),
+                                 {'added': {}, 'removed': {}, 'changed': {}})
+        cache = DigestCache()
+        self.assertNotEqual(cache.digest({'a': -1}), cache.digest({'a': -2}))
+        self.assertNotEqual(cache.digest([1]), cache.digest([True]))
+
+    def test_cache_bounded(self):
+        cache = DigestCache(ShowInterfaces, maxsize=8)
+        for mtu in range(20):
+            post = copy.deepcopy(self.pre)
+            post['GigabitEthernet1']['mtu'] = mtu
+            result = diff(self.pre, post, cache=cache)
+            self.assertLessEqual(len(cache), 8)
+        self.assertEqual(result['changed'], {
+            ('GigabitEthernet1', 'mtu'): (1500, 19)})
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,127 @@
+import unittest
+from unittest.mock import patch
+
+from genie.libs.parser.utils import facts
+from genie.libs.parser.utils.facts import StaticFacts
+
+
+VERSION = '''\
+Cisco IOS Software, IOSv Software (VIOS-ADVENTERPRISEK9-M), Version 15.6(3)M2, RELEASE SOFTWARE (fc2)
+Technical Support: http://www.cisco.com/techsupport
+Copyright (c) 1986-2017 by Cisco Systems, Inc.
+Compiled Wed 29-Mar-17 14:05 by prod_rel_team
+
+
+ROM: Bootstrap program is IOSv
+
+N95_1 uptime is {}
+System returned to ROM by reload
+System image file is "flash0:/vios-adventerprisek9-m"
+Last reload reason: Unknown reason
+
+Cisco IOSv (revision 1.0) with  with 435457K/87040K bytes of memory.
+Processor board ID 9K66Z7TOKAACDEQA24N7S
+6 Gigabit Ethernet interfaces
+DRAM configuration is 72 bits wide with parity disabled.
+256K bytes of non-volatile configuration memory.
+2097152K bytes of ATA System CompactFlash 0 (Read/Write)
+
+Configuration register is 0x0
+'''
+
+
+class Device(object):
+    os = 'ios'
+
+    def __init__(self):
+        self.uptime = '1 day, 16 hours, 42 minutes'
+        self.commands = []
+
+    def execute(self, command):
+        self.commands.append(command)
+        return VERSION.format(self.uptime)
+
+
+class Inventory(object):
+    '''parser of a static fact counting its parses'''
+    parses = 0
+
+    def __init__(self, device):
+        self.device = device
+
+    def parse(self, **kwargs):
+        Inventory.parses += 1
+        return {'slot': {'1': {'pid': 'IOSv'}}, 'arguments': kwargs}
+
+
+class TestFacts(unittest.TestCase):
+
+    def setUp(self):
+        Inventory.parses = 0
+        self.clock = 1000.0
+        patcher = patch.object(facts.time, 'monotonic',
+                               lambda: self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_hits(self):
+        device = Device()
+        cache = StaticFacts()
+        parsed = cache.parse(device, Inventory)
+        parsed['slot']['1']['pid'] = 'changed'
+        self.assertEqual(cache.parse(device, Inventory)['slot']['1']['pid'],
+                         'IOSv')
+        self.assertEqual(Inventory.parses, 1)
+        # The uptime reading stored the version
+        self.assertEqual(cache.parse(device, facts._parser(
+            'ios.show_platform', 'ShowVersion'))['version']['hostname'],
+            'N95_1')
+        self.assertEqual(len(device.commands), 1)
+        cache.parse(device, Inventory, slot='1')
+        self.assertEqual((cache.hits, cache.misses), (2, 2))
+
+    def test_reload(self):
+        device = Device()
+        cache = StaticFacts(revalidate=300)
+        cache.parse(device, Inventory)
+        # The uptime grew with the clock
+        self.clock += 420
+        device.uptime = '1 day, 16 hours, 49 minutes'
+        cache.parse(device, Inventory)
+        self.assertEqual((Inventory.parses, len(device.commands)), (1, 2))
+        self.assertEqual(cache.reloads, 0)
+        # Reloaded
+        self.clock += 420
+        device.uptime = '5 minutes'
+        cache.parse(device, Inventory)
+        self.assertEqual((Inventory.parses, cache.reloads), (2, 1))
+        cache.flush(device)
+        cache.parse(device, Inventory)
+        self.assertEqual(Inventory.parses, 3)
+
+    def test_other_os(self):
+        device = Device()
+        device.os = 'linux'
+        cache = StaticFacts()
+        cache.parse(device, Inventory)
+        self.clock += 3600
+        cache.parse(device, Inventory)
+        self.assertEqual((Inventory.parses, device.commands), (1, []))
+
+    def test_uptimes(self):
+        self.assertEqual(facts.cisco_uptime('1 day, 16 hours, 42 minutes'),
+                         146520)
+        self.assertEqual(facts.cisco_uptime('2 years, 1 week'),
+                         2 * 31536000 + 604800)
+        self.assertEqual(facts.junos_uptime('29w6d 23:14'),
+                         29 * 604800 + 6 * 86400 + 23 * 3600 + 14 * 60)
+        self.assertEqual(facts.junos_uptime('11:03:05'), 39785)
+        for text in ['', 'never']:
+            with self.assertRaises(ValueError):
+                facts.cisco_uptime(text)
+            with self.assertRaises(ValueError):
+                facts.junos_uptime(text)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+import unittest
+
+from genie.libs.parser.utils import interface_name
+from genie.libs.parser.utils.common import Common
+
+
+class TestInterfaceName(unittest.TestCase):
+
+    def test_common(self):
+        for intf, expected in [('Gi0/1', 'GigabitEthernet0/1'),
+                               ('Gi 1/0/1', 'GigabitEthernet1/0/1'),
+                               ('Eth2/1', 'Ethernet2/1'),
+                               ('Po10', 'Port-channel10'),
+                               ('Te1/1/1.100', 'TenGigabitEthernet1/1/1.100'),
+                               ('BE1', 'Bundle-Ether1'),
+                               # Unknown types are unified
+                               ('gigabitethernet1', 'GigabitEthernet1'),
+                               ('port-channel1', 'Port-channel1'),
+                               ('Se0/0/0:0', 'Serial0/0/0'),
+                               # No port
+                               ('Null', 'Null'),
+                               ('1/1', '1/1')]:
+            self.assertEqual(interface_name.normalize(intf), expected)
+            self.assertEqual(Common.convert_intf_name(intf), expected)
+            self.assertEqual(interface_name.normalize(intf, os='iosxe'),
+                             expected)
+
+    def test_os(self):
+        self.assertEqual(interface_name.normalize('Te0/0/0/1', os='iosxr'),
+                         'TenGigE0/0/0/1')
+        self.assertEqual(interface_name.normalize('BE10', os='iosxr'),
+                         'Bundle-Ether10')
+        self.assertEqual(interface_name.normalize('Hu0/0/0/0', os='iosxr'),
+                         'HundredGigE0/0/0/0')
+        self.assertEqual(interface_name.normalize('Mg0/RP0/CPU0/0',
+                                                  os='iosxr'),
+                         'MgmtEth0/RP0/CPU0/0')
+        self.assertEqual(interface_name.normalize('Gi 0/0/0/1', os='iosxr'),
+                         'GigabitEthernet0/0/0/1')
+        self.assertEqual(interface_name.normalize('Eth1/1', os='nxos'),
+                         'Ethernet1/1')
+        self.assertEqual(interface_name.normalize('Po10', os='nxos'),
+                         'port-channel10')
+        # Full names unchanged
+        self.assertEqual(interface_name.normalize('port-channel10',
+                                                  os='nxos'),
+                         'port-channel10')
+        self.assertEqual(interface_name.normalize('ge-0/0/0.0', os='junos'),
+                         'ge-0/0/0.0')
+        with self.assertRaises(KeyError):
+            interface_name.normalize('Gi1', os='unknown')
+
+    def test_normalize_many(self):
+        names = ['Gi0/1', 'Gi0/2', 'Gi0/1', 'Po1']
+        self.assertEqual(interface_name.normalize_many(names),
+                         [interface_name.normalize(n) for n in names])
+        self.assertEqual(interface_name.normalize_many(['Po1'], os='nxos'),
+                         ['port-channel1'])
+        self.assertEqual(interface_name.normalize_many([]), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
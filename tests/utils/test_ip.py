@@ -0,0 +1,58 @@
+import unittest
+
+from genie.libs.parser.utils import ip
+
+
+class TestIp(unittest.TestCase):
+
+    def test_area(self):
+        self.assertEqual(ip.area('0'), '0.0.0.0')
+        self.assertEqual(ip.area(1), '0.0.0.1')
+        self.assertEqual(ip.area('300'), '0.0.1.44')
+        self.assertEqual(ip.area('4294967295'), '255.255.255.255')
+        self.assertEqual(ip.area('0.0.0.10'), '0.0.0.10')
+        for value in ['4294967296', 'backbone', '']:
+            with self.assertRaises(ValueError):
+                ip.area(value)
+
+    def test_prefix(self):
+        self.assertEqual(ip.prefix('169.254.0.0/16'),
+                         ('169.254.0.0', '255.255.0.0'))
+        self.assertEqual(ip.prefix('10.1.1.1'),
+                         ('10.1.1.1', '255.255.255.255'))
+        self.assertEqual(ip.prefix('0.0.0.0/0'), ('0.0.0.0', '0.0.0.0'))
+        self.assertEqual(ip.prefix('10.0.0.0/255.0.0.0'),
+                         ('10.0.0.0', '255.0.0.0'))
+        self.assertEqual(ip.prefix('2001:db8::1/64'),
+                         ('2001:db8::1', 'ffff:ffff:ffff:ffff::'))
+        self.assertEqual(ip.prefix('fe80::'),
+                         ('fe80::', 'ffff:ffff:ffff:ffff:ffff:ffff:ffff:ffff'))
+        for value in ['10.0.0.0/33', '10.0.0.0/255.0.255.0', 'default',
+                      '2001:db8::/129', '10.0.0.0/x']:
+            with self.assertRaises(ValueError):
+                ip.prefix(value)
+
+    def test_netmask(self):
+        self.assertEqual(ip.netmask(24), '255.255.255.0')
+        self.assertEqual(ip.netmask('32'), '255.255.255.255')
+        self.assertEqual(ip.netmask(0), '0.0.0.0')
+        self.assertEqual(ip.netmask(48, version=6), 'ffff:ffff:ffff::')
+        self.assertEqual(ip.prefix_length('255.255.240.0'), 20)
+        self.assertEqual(ip.prefix_length('0.0.0.0'), 0)
+        with self.assertRaises(ValueError):
+            ip.prefix_length('0.0.0.255')
+
+    def test_int(self):
+        self.assertEqual(ip.to_int('10.0.0.1'), 167772161)
+        self.assertEqual(ip.from_int(167772161), '10.0.0.1')
+        self.assertEqual(ip.to_int('2001:db8::1'),
+                         0x20010db8000000000000000000000001)
+        self.assertEqual(ip.from_int(1, version=6), '::1')
+        with self.assertRaises(ValueError):
+            ip.from_int(1 << 32)
+        with self.assertRaises(ValueError):
+            ip.to_int('2001:db8::g')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,126 @@
+import unittest
+from xml.parsers import expat
+
+from genie.libs.parser.utils import junos_display
+
+
+class TestJunosDisplay(unittest.TestCase):
+
+    shape = {
+        'route-information': {
+            'route-table': [{
+                'table-name': str,
+                'rt': [{
+                    '@junos:style': str,
+                    'rt-destination': str,
+                    'rt-entry': [{
+                        'age': {'#text': str, '@junos:seconds': str},
+                        'current-active': str,
+                        'our-entry': bool,
+                    }],
+                }],
+            }],
+        },
+    }
+
+    xml_output = '''show route | display xml
+    <rpc-reply xmlns:junos="http://xml.juniper.net/junos/18.2R2/junos">
+        <route-information xmlns="http://xml.juniper.net/junos/18.2R2/junos-routing">
+            <route-table>
+                <table-name>inet.0</table-name>
+                <destination-count>1</destination-count>
+                <rt junos:style="brief" junos:unknown="1">
+                    <rt-destination>0.0.0.0/0</rt-destination>
+                    <rt-entry>
+                        <current-active/>
+                        <our-entry/>
+                        <age junos:seconds="2085898">3w3d 03:24:58</age>
+                        <nh><to>10.0.0.1</to></nh>
+                    </rt-entry>
+                </rt>
+            </route-table>
+        </route-information>
+    </rpc-reply>
+    lab@vmx> show route | display xml
+    '''
+
+    json_output = '''show route | display json
+    {"route-information": [{
+        "attributes": {"xmlns": "http://xml.juniper.net/junos/18.2R2/junos-routing"},
+        "route-table": [{
+            "table-name": [{"data": "inet.0"}],
+            "destination-count": [{"data": "1"}],
+            "rt": [{
+                "attributes": {"junos:style": "brief", "junos:unknown": "1"},
+                "rt-destination": [{"data": "0.0.0.0/0"}],
+                "rt-entry": [{
+                    "current-active": [{"data": [null]}],
+                    "our-entry": [{"data": [null]}],
+                    "age": [{"data": "3w3d 03:24:58",
+                             "attributes": {"junos:seconds": "2085898"}}],
+                    "nh": [{"to": [{"data": "10.0.0.1"}]}]
+                }]
+            }]
+        }]
+    }]}
+    lab@vmx>
+    '''
+
+    parsed = {
+        'route-information': {
+            'route-table': [{
+                'table-name': 'inet.0',
+                'rt': [{
+                    '@junos:style': 'brief',
+                    'rt-destination': '0.0.0.0/0',
+                    'rt-entry': [{
+                        'current-active': '',
+                        'our-entry': True,
+                        'age': {'#text': '3w3d 03:24:58',
+                                '@junos:seconds': '2085898'},
+                    }],
+                }],
+            }],
+        },
+    }
+
+    def test_parse_xml(self):
+        self.assertEqual(junos_display.parse_xml(self.xml_output, self.shape),
+                         self.parsed)
+
+    def test_parse_xml_chunks(self):
+        # Tags split across chunks
+        for chunk_size in (1, 7, 64):
+            self.assertEqual(junos_display.parse_xml(
+                self.xml_output, self.shape, chunk_size=chunk_size),
+                self.parsed)
+
+    def test_parse_xml_empty(self):
+        self.assertEqual(junos_display.parse_xml('', self.shape), {})
+        self.assertEqual(junos_display.parse_xml('\n  \n', self.shape), {})
+        with self.assertRaises(expat.ExpatError):
+            junos_display.parse_xml('<rpc-reply><route-information>',
+                                    self.shape)
+
+    def test_parse_json(self):
+        self.assertEqual(junos_display.parse_json(self.json_output,
+                                                  self.shape),
+                         self.parsed)
+
+    def test_parse_json_empty(self):
+        self.assertEqual(junos_display.parse_json('', self.shape), {})
+        with self.assertRaises(ValueError):
+            junos_display.parse_json('{"route-information": [', self.shape)
+
+    def test_repeated_leaf(self):
+        shape = {'a': {'b': [str]}}
+        self.assertEqual(junos_display.parse_xml(
+            '<rpc-reply><a><b>1</b><b>2</b></a></rpc-reply>', shape),
+            {'a': {'b': ['1', '2']}})
+        self.assertEqual(junos_display.parse_json(
+            '{"a": [{"b": [{"data": "1"}, {"data": "2"}]}]}', shape),
+            {'a': {'b': ['1', '2']}})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,56 @@
+import re
+import unittest
+
+from genie.libs.parser.utils import log_tail
+
+
+class Device(object):
+    name = 'R1'
+
+
+class TestLogTail(unittest.TestCase):
+
+    pattern = re.compile(r'^(?P<sequence>\d+): (?P<message>.*)$')
+    command = 'show logging'
+
+    def setUp(self):
+        log_tail.reset()
+        self.device = Device()
+
+    def tail(self, lines):
+        return log_tail.tail(self.device, self.command, lines,
+                             self.pattern)[0]
+
+    def test_tail(self):
+        self.assertEqual(self.tail(['a', 'b']), ['a', 'b'])
+        self.assertEqual(self.tail(['a', 'b', 'c']), ['c'])
+        self.assertEqual(self.tail(['a', 'b', 'c']), [])
+        # Buffer wrapped, mark is still in it
+        self.assertEqual(self.tail(['c', 'd']), ['d'])
+
+    def test_repeated_line(self):
+        self.assertEqual(self.tail(['link down', 'link up']),
+                         ['link down', 'link up'])
+        # The marked line is repeated after the new lines
+        self.assertEqual(
+            self.tail(['link down', 'link up', 'link down', 'link up']),
+            ['link down', 'link up'])
+        self.assertEqual(
+            self.tail(['link down', 'link up', 'link down', 'link up',
+                       'config', 'link up']),
+            ['config', 'link up'])
+        # Same after the buffer wrapped
+        self.assertEqual(
+            self.tail(['link up', 'config', 'link up', 'link up']),
+            ['link up'])
+
+    def test_rotated(self):
+        self.assertEqual(self.tail(['1: a', '2: b']), ['1: a', '2: b'])
+        self.assertEqual(self.tail(['3: c', '4: d']), ['3: c', '4: d'])
+        mark = log_tail.get_mark(self.device, self.command)
+        self.assertEqual(mark.sequence, 4)
+        self.assertEqual(mark.position, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
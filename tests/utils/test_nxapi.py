@@ -0,0 +1,56 @@
+import unittest
+
+from genie.libs.parser.utils import nxapi
+
+
+class TestNxapi(unittest.TestCase):
+
+    output = '''show bgp vrf all all summary | json
+    {"TABLE_vrf": {"ROW_vrf": {
+        "vrf-name-out": "default",
+        "vrf-local-as": 100,
+        "TABLE_af": {"ROW_af": [
+            {"af-id": "1", "TABLE_neighbor": {"ROW_neighbor": [
+                {"neighborid": "10.0.0.1"}, {"neighborid": "10.0.0.2"}]}},
+            {"af-id": "2"}]}}}}
+    ]]>]]>
+    '''
+
+    def test_loads(self):
+        data = nxapi.loads(self.output)
+        self.assertEqual(list(data), ['TABLE_vrf'])
+        self.assertEqual(nxapi.loads(''), {})
+        self.assertEqual(nxapi.loads('\n  \n'), {})
+        with self.assertRaises(ValueError):
+            nxapi.loads('{"TABLE_vrf": ')
+
+    def test_rows(self):
+        data = nxapi.loads(self.output)
+        vrfs = nxapi.rows(data, 'vrf')
+        self.assertEqual(len(vrfs), 1)
+        afs = nxapi.rows(vrfs[0], 'af')
+        self.assertEqual([af['af-id'] for af in afs], ['1', '2'])
+        self.assertEqual(nxapi.rows(afs[1], 'neighbor'), [])
+
+    def test_flag(self):
+        for value in ('true', 'TRUE', 'enabled', 'on', True, 1):
+            self.assertTrue(nxapi.flag(value))
+        for value in ('false', 'disabled', 'off', False, 0, None, ''):
+            self.assertFalse(nxapi.flag(value))
+
+    def test_iter_rows(self):
+        result = [(name, row, [parent.get('af-id', parent.get('vrf-name-out'))
+                               for parent in parents])
+                  for name, row, parents in nxapi.iter_rows(
+                      nxapi.loads(self.output))]
+        self.assertEqual(result, [
+            ('ROW_neighbor', {'neighborid': '10.0.0.1'}, ['default', '1']),
+            ('ROW_neighbor', {'neighborid': '10.0.0.2'}, ['default', '1']),
+            ('ROW_af', {'af-id': '1'}, ['default']),
+            ('ROW_af', {'af-id': '2'}, ['default']),
+            ('ROW_vrf', {'vrf-name-out': 'default', 'vrf-local-as': '100'}, []),
+        ])
+
+
+if __name__ == '__main__':
+    unittest.main()
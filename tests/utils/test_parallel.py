@@ -0,0 +1,47 @@
+import unittest
+
+from genie.libs.parser.utils import parallel
+
+
+class TestParallel(unittest.TestCase):
+
+    def test_split(self):
+        lines = ['header'] + ['line'] * 9
+        self.assertEqual(parallel.split(lines, [1, 4, 7], 4),
+                         [(0, 4), (4, 7), (7, 10)])
+        # A chunk holds at least a third of the lines
+        self.assertEqual(parallel.split(lines, [1, 4, 7], 3),
+                         [(0, 4), (4, 10)])
+        self.assertEqual(parallel.split(lines, [1, 4, 7], 1), [(0, 10)])
+        self.assertEqual(parallel.split(lines, [], 4), [(0, 10)])
+        # One chunk per block at most
+        self.assertEqual(len(parallel.split(lines, [1, 4, 7], 10)), 3)
+
+    def test_merge(self):
+        parsed = {'vrf': {'default': {'neighbor': {'a': {'as': 1,
+                                                         'af': {'v4': {}}}}}},
+                  'list': ['a']}
+        parallel.merge(parsed, {
+            'vrf': {'default': {'neighbor': {'a': {'af': {'v6': {}}},
+                                             'b': {'as': 2}}}},
+            'list': ['b']})
+        self.assertEqual(parsed, {
+            'vrf': {'default': {'neighbor': {
+                'a': {'as': 1, 'af': {'v4': {}, 'v6': {}}},
+                'b': {'as': 2}}}},
+            'list': ['b']})
+
+    def test_run(self):
+        jobs = [(2, 10), (3, 2), (5, 1)]
+        self.assertEqual(parallel.run(pow, jobs, 1), [1024, 9, 5])
+        self.assertEqual(parallel.run(pow, jobs, 2), [1024, 9, 5])
+        with self.assertRaises(ValueError):
+            parallel.run(int, [('x',), ('1',)], 2)
+
+    def test_benchmark(self):
+        report = parallel.benchmark(neighbors=20, counts=(1, 2))
+        self.assertEqual(sorted(report), [1, 2])
+
+
+if __name__ == '__main__':
+    unittest.main()
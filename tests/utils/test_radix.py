@@ -0,0 +1,167 @@
+import random
+import unittest
+import ipaddress
+
+from genie.libs.parser.utils import radix
+from genie.libs.parser.utils.radix import RadixTrie, build_index, changes
+
+
+class TestRadix(unittest.TestCase):
+
+    ip_route = {'vrf': {
+        'default': {'address_family': {'ipv4': {'routes': {
+            '0.0.0.0/0': {'route': '0.0.0.0/0', 'source_protocol': 'static'},
+            '10.0.0.0/8': {'route': '10.0.0.0/8', 'metric': 1,
+                           'next_hop': {'next_hop_list': {1: {
+                               'index': 1, 'next_hop': '10.1.1.1',
+                               'updated': '1d02h'}}}},
+            '10.4.0.0/16': {'route': '10.4.0.0/16'},
+            '10.4.1.0/24': {'route': '10.4.1.0/24'},
+            '10.4.1.1/32': {'route': '10.4.1.1/32'}}},
+            'ipv6': {'routes': {
+                '2001:db8::/32': {'route': '2001:db8::/32'},
+                '2001:db8:1::/48': {'route': '2001:db8:1::/48'}}}}},
+        'VRF1': {'address_family': {'ipv4': {'routes': {
+            '10.4.0.0/16': {'route': '10.4.0.0/16'}}}}}}}
+
+    def test_parse_prefix(self):
+        self.assertEqual(radix.parse_prefix('10.1.1.1/24'),
+                         (4, 0x0a010100, 24))
+        self.assertEqual(radix.parse_prefix('10.1.1.1'), (4, 0x0a010101, 32))
+        self.assertEqual(radix.parse_prefix('2001:db8::1/32'),
+                         (6, 0x20010db8 << 96, 32))
+        for value in ['10.0.0.0/33', 'default', '16(S=0)', '10.0.0.0/x']:
+            with self.assertRaises(ValueError):
+                radix.parse_prefix(value)
+
+    def test_lookup(self):
+        index = build_index(self.ip_route)
+        self.assertEqual(len(index), 8)
+        self.assertEqual(index.lookup('10.4.1.1')[0], '10.4.1.1/32')
+        self.assertEqual(index.lookup('10.4.1.2')[0], '10.4.1.0/24')
+        self.assertEqual(index.lookup('10.4.2.1')[0], '10.4.0.0/16')
+        self.assertIs(index.lookup('10.5.0.1')[1],
+                      self.ip_route['vrf']['default']['address_family'][
+                          'ipv4']['routes']['10.0.0.0/8'])
+        self.assertEqual(index.lookup('192.168.0.1')[0], '0.0.0.0/0')
+        self.assertIsNone(index.lookup('10.5.0.1', vrf='VRF1'))
+        self.assertIsNone(index.lookup('10.4.1.1', vrf='VRF2'))
+        self.assertEqual(
+            [result and result[0] for result in index.lookup_many(
+                ['2001:db8:1::1', '10.4.1.9', '2001:db8:2::1', '2002::1'])],
+            ['2001:db8:1::/48', '10.4.1.0/24', '2001:db8::/32', None])
+
+    def test_random_prefixes(self):
+        rand = random.Random(0)
+        for version, bits in ((4, 32), (6, 128)):
+            network_class, address_class = {
+                4: (ipaddress.IPv4Network, ipaddress.IPv4Address),
+                6: (ipaddress.IPv6Network, ipaddress.IPv6Address)}[version]
+            networks = set()
+            for _ in range(300):
+                length = rand.randint(0, bits)
+                host = bits - length
+                networks.add(network_class(
+                    (rand.getrandbits(bits) >> host << host, length)))
+            trie = RadixTrie(version)
+            for network in networks:
+                trie.insert(int(network.network_address), network.prefixlen,
+                            str(network), None)
+            self.assertEqual(len(trie), len(networks))
+
+            longest = sorted(networks, key=lambda network: network.prefixlen,
+                             reverse=True)
+            addresses = [rand.getrandbits(bits) for _ in range(200)]
+            addresses += [int(network.network_address) + 1
+                          for network in networks]
+            for address, entry in zip(addresses,
+                                      trie.lookup_many(addresses)):
+                expected = next((str(network) for network in longest
+                                 if address_class(address) in network), None)
+                self.assertEqual(trie.prefixes[entry] if entry >= 0
+                                 else None, expected)
+
+            items = [item[:2] for item in trie.items()]
+            self.assertEqual(items, sorted(items))
+
+    def test_cef_and_junos(self):
+        cef = {'vrf': {'default': {'address_family': {'ipv4': {'prefix': {
+            '0.0.0.0/0': {'nexthop': {}},
+            '10.169.197.93/32': {'nexthop': {}}}}}}}}
+        index = build_index(cef)
+        self.assertEqual(index.lookup('10.169.197.93')[0], '10.169.197.93/32')
+
+        junos = {'route-information': {'route-table': [
+            {'table-name': 'inet.0', 'rt': [
+                {'rt-destination': '10.1.0.0/24'},
+                {'rt-destination': '3.3.3.3'}]},
+            {'table-name': 'inet.3', 'rt': [
+                {'rt-destination': '10.1.0.1/32'}]},
+            {'table-name': 'VRF1.inet6.0', 'rt': {
+                'rt-destination': '2001:db8::/32'}},
+            {'table-name': 'mpls.0', 'rt': [
+                {'rt-destination': '16(S=0)'}]}]}}
+        index = build_index(junos)
+        self.assertEqual(sorted(index.tries),
+                         [('VRF1', 6), ('default', 4), ('inet.3', 4)])
+        self.assertEqual(index.lookup('10.1.0.1')[0], '10.1.0.0/24')
+        self.assertEqual(index.lookup('3.3.3.3')[0], '3.3.3.3')
+        self.assertEqual(index.lookup('10.1.0.1', vrf='inet.3')[0],
+                         '10.1.0.1/32')
+        self.assertEqual(index.lookup('2001:db8::1', vrf='VRF1')[0],
+                         '2001:db8::/32')
+
+    def test_changes(self):
+        before = build_index(self.ip_route)
+        self.assertEqual(changes(before, build_index(self.ip_route)),
+                         {'added': {}, 'removed': {}, 'changed': {}})
+
+        routes = self.ip_route['vrf']['default']['address_family']['ipv4'][
+            'routes']
+        after = {'vrf': {'default': {'address_family': {'ipv4': {
+            'routes': dict(routes)}}}}}
+        after_routes = after['vrf']['default']['address_family']['ipv4'][
+            'routes']
+        del after_routes['10.4.1.0/24']
+        after_routes['10.4.2.0/24'] = {'route': '10.4.2.0/24'}
+        after_routes['10.0.0.0/8'] = {
+            'route': '10.0.0.0/8', 'metric': 1,
+            'next_hop': {'next_hop_list': {1: {
+                'index': 1, 'next_hop': '10.1.1.1', 'updated': '1d03h'}}}}
+        after = build_index(after)
+
+        result = changes(before, after)
+        self.assertEqual(result['added'], {
+            ('default', '10.4.2.0/24'): {'route': '10.4.2.0/24'}})
+        self.assertEqual(sorted(result['removed']), [
+            ('VRF1', '10.4.0.0/16'), ('default', '10.4.1.0/24'),
+            ('default', '2001:db8:1::/48'), ('default', '2001:db8::/32')])
+        self.assertEqual(list(result['changed']),
+                         [('default', '10.0.0.0/8')])
+
+        result = changes(before, after, exclude=['updated'])
+        self.assertEqual(result['changed'], {})
+
+        result = changes(before.tries['default', 4], after.tries['default', 4])
+        self.assertEqual(list(result['added']), ['10.4.2.0/24'])
+
+        # Values of another type, or with the same hash, are changes
+        for old, new in ((1, True), (-1, -2)):
+            before = build_index({'vrf': {'default': {'address_family': {
+                'ipv4': {'routes': {'10.0.0.0/8': {'metric': old}}}}}}})
+            after = build_index({'vrf': {'default': {'address_family': {
+                'ipv4': {'routes': {'10.0.0.0/8': {'metric': new}}}}}}})
+            for exclude in (None, ['updated']):
+                self.assertEqual(
+                    list(changes(before, after, exclude)['changed']),
+                    [('default', '10.0.0.0/8')])
+
+    def test_benchmark(self):
+        report = radix.benchmark(prefixes=2000, lookups=500, scans=50)
+        self.assertEqual(report['prefixes'], 2000)
+        self.assertEqual(report['lookups'], 500)
+        self.assertGreater(report['matched'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
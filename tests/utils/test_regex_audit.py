@@ -0,0 +1,108 @@
+import os
+import re
+import inspect
+import shutil
+import tempfile
+import unittest
+
+from genie.libs.parser.utils import regex_audit
+from genie.libs.parser.iosxe.show_bgp import (
+    ShowBgpSuperParser, ShowBgpNeighborsAdvertisedRoutesSuperParser,
+    ShowBgpNeighborsReceivedRoutesSuperParser)
+from genie.libs.parser.iosxe.show_flow import ShowFlowMonitorCache
+
+
+SOURCE = '''\
+import re
+
+p0 = re.compile(r'^Interface +(?P<name>\\S+)$')
+
+
+class ShowExample(object):
+
+    def cli(self):
+        p1 = re.compile(r'^(?P<a>\\s+)+x$', re.I)
+        p2 = re.compile(r'^a' r'b' + 'c$', flags=re.M | re.I)
+        m = re.match(r'^Total +(?P<total>\\d+)$', 'Total 1')
+        pattern = 'not literal'
+        p3 = re.compile(pattern)
+'''
+
+
+class TestRegexAudit(unittest.TestCase):
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        os.mkdir(os.path.join(self.root, 'iosxe'))
+        with open(os.path.join(self.root, 'iosxe', 'show_example.py'),
+                  'w') as f:
+            f.write(SOURCE)
+
+    def tearDown(self):
+        shutil.rmtree(self.root)
+
+    def test_extract(self):
+        patterns = regex_audit.os_patterns(['iosxe'], 'example',
+                                           root=self.root)
+        self.assertEqual(
+            [pattern.label for pattern in patterns],
+            ['iosxe/show_example.py:3 p0', 'iosxe/show_example.py:9 p1',
+             'iosxe/show_example.py:10 p2',
+             'iosxe/show_example.py:11 re.match'])
+        self.assertEqual(patterns[1].flags, re.I)
+        self.assertEqual(patterns[2].expression, '^abc$')
+        self.assertEqual(patterns[2].flags, re.M | re.I)
+
+    def test_prefix(self):
+        self.assertEqual(regex_audit.prefix(r'^Interface +(?P<n>\S+)$'),
+                         'Interface')
+        self.assertEqual(regex_audit.prefix(r'^\s*x'), '')
+
+    def test_audit_pattern(self):
+        linear = regex_audit.audit_pattern(regex_audit.Pattern(
+            'linear', r'^Interface +(?P<name>\S+)$', 0))
+        self.assertLessEqual(linear['growth'], regex_audit.SUPERLINEAR)
+
+        quadratic = regex_audit.audit_pattern(regex_audit.Pattern(
+            'quadratic', r'^\s*(?P<a>\s+)\s*x$', 0), sizes=(256, 1024, 4096))
+        self.assertGreater(quadratic['growth'], regex_audit.SUPERLINEAR)
+        self.assertIn(quadratic['line'].split(' x ')[0], ("' '", "'\\t'"))
+
+        error = regex_audit.audit_pattern(regex_audit.Pattern(
+            'error', r'^(?P<a>x', 0))
+        self.assertIn('error', error)
+
+    def test_audit_timeout(self):
+        patterns = [regex_audit.Pattern('exponential', r'^(\s+)+x$', 0),
+                    regex_audit.Pattern('linear', r'^\d+ +\S+$', 0),
+                    regex_audit.Pattern('error', r'(', 0)]
+        report = regex_audit.audit(patterns, timeout=1)
+        self.assertEqual(report['patterns'], 3)
+        self.assertEqual([result['label'] for result in
+                          report['superlinear']], ['exponential'])
+        self.assertTrue(report['superlinear'][0]['timeout'])
+        self.assertEqual([result['label'] for result in report['errors']],
+                         ['error'])
+
+    def test_parser_patterns(self):
+        # Patterns rewritten not to backtrack on unexpected lines
+        fixed = {ShowBgpSuperParser: ('p3_1', 'p3_2', 'p4'),
+                 ShowBgpNeighborsAdvertisedRoutesSuperParser:
+                     ('p3_1', 'p3_2', 'p3_3'),
+                 ShowBgpNeighborsReceivedRoutesSuperParser: ('p3_1', 'p3_2'),
+                 ShowFlowMonitorCache: ('p7',)}
+        patterns = []
+        for parser, names in fixed.items():
+            lines, first = inspect.getsourcelines(parser)
+            for pattern in regex_audit.extract(inspect.getsourcefile(parser)):
+                site, _, name = pattern.label.partition(' ')
+                line = int(site.rsplit(':', 1)[1])
+                if name in names and first <= line < first + len(lines):
+                    patterns.append(pattern)
+        self.assertEqual(len(patterns), 10)
+        report = regex_audit.audit(patterns, timeout=30)
+        self.assertEqual([result['label'] for result in
+                          report['superlinear']], [])
+
+if __name__ == '__main__':
+    unittest.main()
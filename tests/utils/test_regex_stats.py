@@ -0,0 +1,124 @@
+import re
+import sys
+import types
+import unittest
+from unittest.mock import Mock
+
+from genie.libs.parser.utils import regex_stats
+from genie.libs.parser.junos.show_ospf import (ShowOspfNeighbor,
+                                               ShowOspfNeighborInstance)
+from genie.libs.parser.iosxe.show_interface import ShowInterfaces
+
+
+OUTPUT = '''
+    show ospf neighbor
+    Address          Interface              State     ID               Pri  Dead
+    10.189.5.94      ge-0/0/0.0             Full      10.189.5.253     128    32
+    10.169.14.121    ge-0/0/1.0             Full      10.169.14.240    128    33
+'''
+
+MODULE = '''
+import re
+
+P1 = re.compile(r'^a')
+
+def build():
+    return re.compile(r'^b')
+
+P2 = build()
+PATTERNS = [re.compile(expression) for expression in ('c', 'd')]
+
+class Parser(object):
+    p1 = re.compile(r'^e')
+    p2 = build()
+
+    def cli(self):
+        return re.compile(r'^f')
+'''
+
+
+class TestRegexStats(unittest.TestCase):
+
+    def test_instrument(self):
+        compile_ = re.compile
+        with regex_stats.instrument() as stats:
+            ShowOspfNeighbor(device=Mock()).parse(output=OUTPUT)
+            ShowOspfNeighborInstance(device=Mock()).parse(
+                instance_name='master', output=OUTPUT)
+            # Outside of the parsers
+            re.compile(r'\d+').match('1')
+
+        results = stats.results()
+        self.assertEqual({result['parser'] for result in results},
+                         {'junos.ShowOspfNeighbor',
+                          'junos.ShowOspfNeighborInstance'})
+        result = [result for result in results
+                  if result['parser'] == 'junos.ShowOspfNeighbor'][0]
+        self.assertEqual(result['pattern'], 'ShowOspfNeighbor.p1')
+        self.assertEqual(result['attempts'], 5)
+        self.assertEqual(result['matches'], 2)
+        self.assertGreater(result['seconds'], 0)
+        self.assertTrue(result['expression'].startswith('^'))
+        self.assertEqual(stats.unmatched(), [])
+        # Restored
+        self.assertIs(re.compile, compile_)
+        self.assertNotIn('parse', ShowOspfNeighbor.__dict__)
+        spec = ShowOspfNeighbor.spec
+        for name, compiled in spec.matchers.items():
+            self.assertEqual(spec.namespace[name], compiled.match)
+
+    def test_class_patterns(self):
+        pattern = ShowInterfaces.p1
+        output = ('GigabitEthernet1 is up, line protocol is up\n'
+                  '  Hardware is CSR vNIC, address is 5254.00ff.0f47\n')
+        with regex_stats.instrument() as stats:
+            self.assertIsNot(ShowInterfaces.p1, pattern)
+            ShowInterfaces(device=Mock()).parse(output=output)
+        self.assertIs(ShowInterfaces.p1, pattern)
+
+        counters = {result['pattern']: result for result in stats.results()
+                    if result['parser'] == 'iosxe.ShowInterfaces'}
+        self.assertEqual(counters['ShowInterfaces.p1']['matches'], 1)
+        unmatched = stats.unmatched()
+        self.assertIn(('iosxe.ShowInterfaces', 'ShowInterfaces.p15'),
+                      unmatched)
+        self.assertFalse([parser for parser, _ in unmatched
+                          if parser != 'iosxe.ShowInterfaces'])
+
+    def test_import_within_context(self):
+        name = 'genie.libs.parser.regex_stats_module'
+        module = types.ModuleType(name)
+        self.addCleanup(sys.modules.pop, name, None)
+        with regex_stats.instrument():
+            sys.modules[name] = module
+            exec(MODULE, vars(module))
+            self.assertIsInstance(module.P1, re.Pattern)
+            self.assertIsInstance(module.Parser.p1, re.Pattern)
+            self.assertIsInstance(module.PATTERNS[0], re.Pattern)
+            self.assertIsInstance(module.Parser().cli(),
+                                  regex_stats._Pattern)
+        # Instrumented while the module was imported, restored on exit
+        self.assertIsInstance(module.P2, re.Pattern)
+        self.assertIsInstance(module.Parser.p2, re.Pattern)
+
+    def test_table(self):
+        stats = regex_stats.RegexStats()
+        stats.register('a.py:1 p1', r'^a')
+        stats.parsers.append('junos.A')
+        stats.runs.add('junos.A')
+        stats.register('a.py:2 p2', r'^b')
+        stats.record('a.py:1 p1', True, 0.002)
+        stats.record('a.py:1 p1', False, 0.001)
+        self.assertEqual(stats.results(), [{
+            'parser': 'junos.A', 'pattern': 'a.py:1 p1', 'attempts': 2,
+            'matches': 1, 'seconds': 0.003, 'expression': '^a'}])
+        self.assertEqual(stats.unmatched(), [('junos.A', 'a.py:2 p2')])
+        self.assertEqual(stats.to_dict()['unmatched'],
+                         [{'parser': 'junos.A', 'pattern': 'a.py:2 p2'}])
+        table = stats.table().splitlines()
+        self.assertEqual(len(table), 2)
+        self.assertIn('3.000', table[1])
+
+
+if __name__ == '__main__':
+    unittest.main()
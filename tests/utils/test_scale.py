@@ -0,0 +1,120 @@
+import unittest
+from unittest.mock import Mock
+
+from genie.libs.parser.utils import scale
+from genie.libs.parser.junos.show_route import ShowRoute
+from genie.libs.parser.iosxe.show_ip_nat import ShowIpNatTranslations
+
+
+NAT_OUTPUT = '''\
+    Device# show ip nat translations
+
+    Pro  Inside global         Inside local          Outside local         Outside global
+    udp  10.5.5.1:1025          192.0.2.1:4000        ---                   ---
+    udp  10.5.5.1:1024          192.0.2.3:4000        ---                   ---
+    Total number of translations: 2
+'''
+
+ROUTE_OUTPUT = '''
+    show route table inet.3
+
+    inet.3: 2 destinations, 2 routes (2 active, 0 holddown, 0 hidden)
+    + = Active Route, - = Last Active, * = Both
+
+    10.64.4.4/32       *[LDP/9] 03:40:50, metric 110
+                        > to 192.168.220.6 via ge-0/0/1.0
+    10.100.5.5/32      *[LDP/9] 03:40:50, metric 110
+                        > to 192.168.220.6 via ge-0/0/1.0
+
+    inet6.0: 1 destinations, 1 routes (1 active, 0 holddown, 0 hidden)
+    + = Active Route, - = Last Active, * = Both
+
+    2001:db8:1::1/128  *[Direct/0] 03:40:50
+                        > via lo0.0
+'''
+
+
+class TestScale(unittest.TestCase):
+
+    def test_sections(self):
+        start, continuation = scale.profile('junos.ShowRoute')
+        parts = scale.sections(ROUTE_OUTPUT, start, continuation)
+        runs = [part for part in parts if isinstance(part, list)]
+        self.assertEqual([len(run) for run in runs], [2, 1])
+        self.assertEqual([len(record) for record in runs[0]], [2, 2])
+        self.assertEqual(''.join(
+            part if isinstance(part, str) else
+            ''.join(''.join(record) for record in part)
+            for part in parts), ROUTE_OUTPUT)
+
+    def test_profile(self):
+        self.assertIs(scale.profile(ShowRoute),
+                      scale.PROFILES['junos.ShowRoute'])
+        with self.assertRaises(KeyError):
+            scale.profile('junos.ShowVersion')
+
+    def test_scale_nat(self):
+        output = scale.scale(NAT_OUTPUT, 1000,
+                             parser='iosxe.ShowIpNatTranslations')
+        parsed = ShowIpNatTranslations(device=Mock()).parse(output=output)
+        index = parsed['vrf']['default']['index']
+        self.assertEqual(len(index), 1000)
+        self.assertEqual(
+            len({entry['inside_local'] for entry in index.values()}), 1000)
+        # Header and trailer kept once
+        self.assertEqual(output.count('Total number of translations'), 1)
+        # Columns aligned
+        self.assertEqual(
+            {line.index('---') for line in output.splitlines()
+             if '---' in line}, {line.index('---') for line in
+                                 NAT_OUTPUT.splitlines() if '---' in line})
+
+    def test_scale_sections(self):
+        output = scale.scale(ROUTE_OUTPUT, 300, parser='junos.ShowRoute')
+        parsed = ShowRoute(device=Mock()).parse(output=output)
+        tables = {table['table-name']: table['rt'] for table in
+                  parsed['route-information']['route-table']}
+        self.assertEqual(len(tables['inet.3']), 200)
+        self.assertEqual(len(tables['inet6.0']), 100)
+        destinations = [rt['rt-destination'] for rts in tables.values()
+                        for rt in rts]
+        self.assertEqual(len(set(destinations)), 300)
+        self.assertIn('2001:db8:0:1::1/128', destinations)
+        self.assertIn('ge-0/0/2.0', output)
+
+    def test_vary(self):
+        keys = scale._Keys('Gi1/0/3 aabb.cc00.0100 10.1.1.1 fe80::1')
+        mapping = keys.copy(1)
+        self.assertEqual(
+            scale._vary('Gi1/0/3   AA:BB:CC:00:01:00 10.1.1.2 fe80::1 '
+                        '0.0.0.0 255.255.255.0 aabb.cc00.0100', keys,
+                        mapping),
+            'Gi1/0/4   02:00:00:00:00:01 11.0.0.2 fe80::1 '
+            '0.0.0.0 255.255.255.0 0200.0000.0001')
+        # Same mapping for the same copy
+        self.assertEqual(scale._vary('10.1.1.9', keys, mapping), '11.0.0.9')
+        self.assertEqual(scale._vary('10.1.1.9', keys, keys.copy(2)),
+                         '11.0.1.9')
+
+    def test_scale_no_record(self):
+        with self.assertRaises(ValueError):
+            scale.scale('no record\n', 10, start=r'^\d')
+
+    def test_growth(self):
+        self.assertAlmostEqual(scale.growth([(10, 1), (100, 10),
+                                             (1000, 100)]), 1)
+        self.assertAlmostEqual(scale.growth([(10, 1), (100, 100)]), 2)
+        self.assertIsNone(scale.growth([(10, 1)]))
+
+    def test_sweep(self):
+        result = scale.sweep(ShowRoute, ROUTE_OUTPUT, [10, 100], repeat=1)
+        self.assertEqual([point['records'] for point in result['points']],
+                         [10, 100])
+        self.assertGreater(result['points'][1]['lines'],
+                           result['points'][0]['lines'])
+        self.assertIsNotNone(result['time_growth'])
+        self.assertIsNotNone(result['memory_growth'])
+
+
+if __name__ == '__main__':
+    unittest.main()
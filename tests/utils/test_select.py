@@ -0,0 +1,61 @@
+import unittest
+
+from genie.libs.parser.utils.select import (
+    placeholders,
+    selectable,
+    select_command,
+)
+
+
+class TestSelectCommand(unittest.TestCase):
+
+    commands = ['show bgp vrf all all summary',
+                'show bgp vrf {vrf} all summary',
+                'show bgp vrf {vrf} {address_family} summary']
+
+    def test_placeholders(self):
+        self.assertEqual(placeholders(self.commands[2]),
+                         {'vrf', 'address_family'})
+        self.assertEqual(selectable(self.commands), {'vrf', 'address_family'})
+
+    def test_narrowest_variant(self):
+        self.assertEqual(
+            select_command(self.commands, {'vrf': 'VRF1'}),
+            'show bgp vrf VRF1 all summary')
+        self.assertEqual(
+            select_command(self.commands, {'address_family': 'ipv4 unicast'},
+                           vrf='all'),
+            'show bgp vrf all ipv4 unicast summary')
+
+    def test_defaults_are_kept(self):
+        commands = ['show ip route vrf {vrf}',
+                    'show ip route vrf {vrf} {protocol}',
+                    'show ip route',
+                    'show ip route {protocol}']
+        self.assertEqual(
+            select_command(commands, {'protocol': 'ospf'}, vrf=None),
+            'show ip route ospf')
+        self.assertEqual(
+            select_command(commands, {'protocol': 'ospf'}, vrf='VRF1'),
+            'show ip route vrf VRF1 ospf')
+
+    def test_conflict(self):
+        with self.assertRaises(ValueError):
+            select_command(self.commands, {'vrf': 'VRF1'}, vrf='VRF2')
+        self.assertEqual(
+            select_command(self.commands, {'vrf': 'VRF1'}, vrf='VRF1'),
+            'show bgp vrf VRF1 all summary')
+        self.assertEqual(
+            select_command(self.commands, {'vrf': 'VRF1'}, unset='all',
+                           vrf='all', address_family='ipv4 unicast'),
+            'show bgp vrf VRF1 ipv4 unicast summary')
+
+    def test_unsupported(self):
+        with self.assertRaises(ValueError):
+            select_command(self.commands, {'neighbor': '10.1.1.1'})
+        with self.assertRaises(ValueError):
+            select_command(self.commands, {'address_family': 'ipv4 unicast'})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,143 @@
+import io
+import json
+import unittest
+from collections import OrderedDict
+
+from genie.libs.parser.utils import serialize
+from genie.libs.parser.utils.common import format_output
+
+
+RESULT = {
+    'vrf': {
+        'default': {
+            'address_family': {
+                'ipv4': {
+                    'routes': {
+                        '10.1.1.0/24': {
+                            'active': True,
+                            'metric': 0,
+                            'route_preference': 110,
+                            'next_hop': {
+                                'next_hop_list': {
+                                    1: {'index': 1,
+                                        'next_hop': '10.0.0.1',
+                                        'updated': '00:01:02'},
+                                    2: {'index': 2,
+                                        'next_hop': '10.0.0.2',
+                                        'updated': None}}}},
+                    },
+                },
+            },
+        },
+    },
+    'counters': [0, -1, -33, 127, 128, 255, 256, 65535, 65536, -129,
+                 -32769, 4294967296, -2147483649, 18446744073709551615,
+                 -9223372036854775808],
+    'rate': 0.25,
+    'flags': [False, None, 'é' * 40, 'x' * 300, 'y' * 70000],
+    'keys': {'a' * 20: i for i in range(20)},
+}
+
+
+class TestSerialize(unittest.TestCase):
+
+    def test_json(self):
+        text = serialize.dumps(RESULT)
+        self.assertEqual(serialize.loads(text), json.loads(json.dumps(RESULT)))
+        self.assertNotIn(' ', serialize.dumps({'a': [1, 2]}))
+        self.assertEqual(serialize.dumps({'b': 1, 'a': 2}, sort_keys=True),
+                         '{"a":2,"b":1}')
+        with self.assertRaises(TypeError):
+            serialize.dumps({'a': object()})
+        self.assertEqual(serialize.dumps({'a': {1, 2}}, default=sorted),
+                         '{"a":[1,2]}')
+
+    def test_ndjson(self):
+        fp = io.StringIO()
+        self.assertEqual(serialize.write_ndjson([RESULT, {'a': 1}], fp), 2)
+        self.assertEqual(fp.getvalue().count('\n'), 2)
+        fp.seek(0)
+        self.assertEqual(list(serialize.read_ndjson(fp)),
+                         [json.loads(json.dumps(RESULT)), {'a': 1}])
+
+    def test_json_writer(self):
+        fp = io.StringIO()
+        with serialize.JSONWriter(fp) as writer:
+            writer.write({'a': 1})
+            writer.write({'b': [True, None]})
+        self.assertEqual(json.loads(fp.getvalue()),
+                         [{'a': 1}, {'b': [True, None]}])
+
+    def test_pack(self):
+        data = serialize.pack(RESULT)
+        self.assertEqual(serialize.unpack(data), RESULT)
+        self.assertEqual(serialize.unpack(serialize.pack((1, b'\x00'))),
+                         [1, b'\x00'])
+        self.assertEqual(serialize.unpack(serialize.pack(OrderedDict(a=1))),
+                         {'a': 1})
+        # MessagePack encodings
+        self.assertEqual(serialize.pack({'a': [1, -1, None, True]}),
+                         b'\x81\xa1a\x94\x01\xff\xc0\xc3')
+        self.assertEqual(serialize.pack(1.5), b'\xcb?\xf8\x00\x00\x00\x00\x00\x00')
+        with self.assertRaises(ValueError):
+            serialize.pack(1 << 64)
+        with self.assertRaises(TypeError):
+            serialize.pack(object())
+        with self.assertRaises(ValueError):
+            serialize.unpack(data[:-1])
+        with self.assertRaises(ValueError):
+            serialize.unpack(data + b'\x00')
+
+    def test_packed_stream(self):
+        fp = io.BytesIO()
+        results = [RESULT, {'a': 1}, {1: 'b'}] * 3
+        self.assertEqual(serialize.write_packed(results, fp), 9)
+        fp.seek(0)
+        self.assertEqual(list(serialize.read_packed(fp, chunk_size=7)),
+                         results)
+        with self.assertRaises(ValueError):
+            list(serialize.read_packed(io.BytesIO(fp.getvalue()[:-1])))
+
+    def test_canonical(self):
+        first = {'b': {2: 'x', '1': 'y'}, 'a': [1, 2]}
+        second = {'a': [1, 2], 'b': {'1': 'y', 2: 'x'}}
+        self.assertNotEqual(serialize.pack(first), serialize.pack(second))
+        self.assertEqual(serialize.canonical(first),
+                         serialize.canonical(second))
+        self.assertEqual(serialize.unpack(serialize.canonical(first)), first)
+        self.assertEqual(serialize.digest(first), serialize.digest(second))
+        self.assertNotEqual(serialize.digest(first),
+                            serialize.digest({'a': [2, 1], 'b': first['b']}))
+        # int and str keys are distinct
+        self.assertNotEqual(serialize.digest({1: 'a'}),
+                            serialize.digest({'1': 'a'}))
+
+    def test_format_output(self):
+        def reference(parser_data, tab=2):
+            s = ['{\n']
+            for k, v in sorted(parser_data.items()):
+                if isinstance(v, dict):
+                    v = reference(v, tab + 2)
+                else:
+                    v = repr(v)
+                s.append('%s%r: %s,\n' % ('  ' * tab, k, v))
+            s.append('%s}' % ('  ' * (tab - 2)))
+            return ''.join(s)
+
+        result = dict(RESULT, keys={'b': {}, 'a': {'c': 1}})
+        self.assertEqual(format_output(result), reference(result))
+        self.assertEqual(format_output(result, tab=4),
+                         reference(result, tab=4))
+        self.assertIsNone(format_output(None))
+
+    def test_benchmark(self):
+        report = serialize.benchmark([RESULT, {'a': 1}], repeat=1)
+        self.assertEqual(set(report), set(serialize.SERIALIZERS) |
+                         {'read_ndjson', 'unpack'})
+        self.assertLess(report['pack']['bytes'],
+                        report['format_output']['bytes'])
+        self.assertGreater(report['ndjson']['results_per_sec'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+import re
+import unittest
+
+from genie.libs.parser.utils.spec import Spec, Rule, Set, _required
+
+
+NVE = '''\
+Interface Peer-IP          State LearnType Uptime   Router-Mac
+--------- ---------------  ----- --------- -------- -----------------
+nve1      192.168.16.1      Up    CP        01:15:09 n/a
+nve1      192.168.106.1     Up    CP        00:03:05 5e00.00ff.0209
+nve2      2001:db8:646:a2bb:0:abcd:1234:3   Down  DP  21:47:20 5254.00ff.3162
+'''
+
+
+def nve_loop(output):
+    '''the handwritten parser of NVE'''
+    p1 = re.compile(r'^(?P<nve_name>[\w\/]+) +(?P<peer_ip>[\w\.\:]+) +'
+                    r'(?P<peer_state>[\w]+) +(?P<learn_type>[\w]+) +'
+                    r'(?P<uptime>[\w\:]+) +(?P<router_mac>[\w\.\/]+)$')
+    result_dict = {}
+    for line in output.splitlines():
+        m = p1.match(line.strip())
+        if m:
+            group = m.groupdict()
+            nve_dict = result_dict.setdefault(group['nve_name'], {})
+            nve_dict['nve_name'] = group['nve_name']
+            peer_dict = nve_dict.setdefault('peer_ip', {}).setdefault(
+                group['peer_ip'], {})
+            peer_dict['learn_type'] = group['learn_type']
+            peer_dict['uptime'] = group['uptime']
+            peer_dict['router_mac'] = group['router_mac']
+            peer_dict['peer_state'] = group['peer_state'].lower()
+    return result_dict
+
+
+NVE_SPEC = Spec(
+    Rule(r'^(?P<nve_name>[\w\/]+) +(?P<peer_ip>[\w\.\:]+) +'
+         r'(?P<peer_state>[\w]+) +(?P<learn_type>[\w]+) +'
+         r'(?P<uptime>[\w\:]+) +(?P<router_mac>[\w\.\/]+)$',
+         Set(('{nve_name}',), {'nve_name': 'nve_name'}),
+         Set(('{nve_name}', 'peer_ip', '{peer_ip}'),
+             {'learn_type': 'learn_type',
+              'uptime': 'uptime',
+              'router_mac': 'router_mac',
+              'peer_state': ('peer_state', str.lower)})))
+
+
+class TestSpec(unittest.TestCase):
+
+    def test_equal_output(self):
+        self.assertEqual(NVE_SPEC.parse(NVE), nve_loop(NVE))
+        self.assertEqual(NVE_SPEC.parse(NVE)['nve2']['peer_ip'][
+            '2001:db8:646:a2bb:0:abcd:1234:3']['peer_state'], 'down')
+        self.assertEqual(NVE_SPEC.parse(''), {})
+        self.assertNotIn('groupdict', NVE_SPEC.source)
+
+    def test_when_and_defaults(self):
+        spec = Spec(
+            Rule(r'^(?P<name>\w+)(?: (?P<value>\d+))?$',
+                 Set(('numbers', '{name}'), {'value': ('value', int)}),
+                 when=('name', lambda name: name.startswith('n'))),
+            Rule(r'^(?P<name>\w+)(?: (?P<value>\d+))?$',
+                 Set(('others', '{name}'), {'value': ('value', int, 0),
+                                            'raw': 'value'})))
+        self.assertEqual(spec.parse('n1 10\nn2\nx 3\ny'), {
+            'numbers': {'n1': {'value': 10}, 'n2': {}},
+            'others': {'x': {'value': 3, 'raw': '3'}, 'y': {'value': 0}}})
+        # The pattern is matched once per line
+        self.assertEqual(spec.source.count('(line)'), 1)
+
+    def test_counters_and_contexts(self):
+        spec = Spec(
+            Rule(r'^Device (?P<device>\S+)$',
+                 Set(('index', '#index'), {'device': 'device'}),
+                 opens=True),
+            Rule(r'^Port (?P<port>\S+)$',
+                 Set(('ports', '[]'), {'port': 'port'}),
+                 depth=1))
+        output = '''\
+Port Gi0
+Device r1
+  Port Gi1
+  Port Gi2
+Device r2
+Port Gi3
+'''
+        self.assertEqual(spec.parse(output), {'index': {
+            1: {'device': 'r1', 'ports': [{'port': 'Gi1'},
+                                          {'port': 'Gi2'}]},
+            2: {'device': 'r2', 'ports': [{'port': 'Gi3'}]}}})
+
+    def test_required(self):
+        compiled = re.compile(r'^(?P<a>\w+)( +(?P<b>\d+))?(?P<c>x|y)'
+                              r'(?:(?P<d>z)|w)(?P<e>\d)+$')
+        # b and its group are optional, d is in a branch
+        self.assertEqual(_required(compiled), {1, 4, 6})
+        with self.assertRaises(ValueError):
+            Spec(Rule(r'^(?P<a>\w+)$', Set(('{b}',))))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,20 @@
+import unittest
+
+from genie.libs.parser.utils import stream_benchmark
+
+
+class TestStreamBenchmark(unittest.TestCase):
+
+    def test_synthetic(self):
+        lines = list(stream_benchmark.synthetic(3))
+        self.assertEqual(lines[1], 'inet.0: 3 destinations, 3 routes '
+                                   '(3 active, 0 holddown, 0 hidden)')
+        self.assertEqual(len(lines), 2 + 3 * len(stream_benchmark.ROUTE))
+        self.assertEqual(
+            [line for line in lines if line.endswith('announced)')],
+            ['1.0.{}.0/24 (1 entry, 1 announced)'.format(number)
+             for number in range(3)])
+
+
+if __name__ == '__main__':
+    unittest.main()
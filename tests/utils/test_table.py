@@ -0,0 +1,116 @@
+import unittest
+
+from genie.libs.parser.utils import table
+from genie.libs.parser.utils.table import Table, parse_table
+
+
+BRIEF = '''\
+R1#show ip interface brief
+Interface              IP-Address      OK? Method Status                Protocol
+GigabitEthernet0/0     10.1.10.20      YES NVRAM  up                    up
+GigabitEthernet1/0/1   unassigned      YES unset  administratively down down
+
+R1#
+'''
+
+SWITCHES = '''\
+Switch Ports Model              SW Version        SW Image
+------ ----- -----              ----------        ----------
+*    1 32    WS-C3850-24P       16.4.20170410:165034 CAT3K_CAA-UNIVERSALK9
+     2 32    WS-C3850-24P       16.4.20170410:165034 CAT3K_CAA-UNIVERSALK9
+
+Configuration register is 0x102
+'''
+
+WRAPPED = '''\
+Name        Description            Status
+----------- ---------------------- ------
+Gi1         uplink to the core     up
+            switch, second floor
+Gi2         spare                  down
+'''
+
+
+class TestTable(unittest.TestCase):
+
+    def test_left_justified(self):
+        entries = parse_table(BRIEF, table.HEADERS)
+        self.assertEqual(entries['GigabitEthernet1/0/1'], {
+            'Interface': 'GigabitEthernet1/0/1',
+            'IP-Address': 'unassigned',
+            r'OK\?': 'YES',
+            'Method': 'unset',
+            'Status': 'administratively down',
+            'Protocol': 'down'})
+        # Rows after the table, without terminal pattern
+        self.assertEqual(sorted(entries), ['GigabitEthernet0/0',
+                                           'GigabitEthernet1/0/1', 'R1#'])
+        entries = parse_table(BRIEF, table.HEADERS, terminal=r'^R1#')
+        self.assertEqual(len(entries), 2)
+
+    def test_right_justified(self):
+        headers = ['Switch', 'Ports', 'Model              ',
+                   'SW Version       ', 'SW Image']
+        labels = ['switch_num', 'ports', 'model', 'sw_ver', 'sw_image']
+        entries = parse_table(SWITCHES, headers, labels=labels,
+                              right_justified=True, terminal=r'^\s*$')
+        self.assertEqual(entries, {
+            '*    1': {'switch_num': '*    1', 'ports': '32',
+                       'model': 'WS-C3850-24P',
+                       'sw_ver': '16.4.20170410:165',
+                       'sw_image': '034 CAT3K_CAA-UNIVERSALK9'},
+            '2': {'switch_num': '2', 'ports': '32',
+                  'model': 'WS-C3850-24P', 'sw_ver': '16.4.20170410:165',
+                  'sw_image': '034 CAT3K_CAA-UNIVERSALK9'}})
+
+    def test_offsets(self):
+        line = '    Line       User'
+        self.assertEqual(Table([' ', ' Line', 'User']).offsets(line),
+                         [(0, 3), (3, 15), (15, None)])
+        self.assertEqual(Table(['Line', 'User'],
+                               right_justified=True).offsets(line),
+                         [(0, 8), (8, None)])
+        self.assertIsNone(Table(['User', 'Line']).offsets(line))
+
+    def test_rows(self):
+        self.assertEqual(list(Table(['Name', 'Status']).rows(WRAPPED))[:2], [
+            ('Gi1         uplink to the core', 'up'),
+            ('switch, second floor', '')])
+        self.assertEqual(list(Table(['Name']).rows('Name\n a \n\nb')),
+                         [('a',), ('b',)])
+        self.assertEqual(list(Table(['Name']).rows('no header')), [])
+
+    def test_wrapped(self):
+        rows = Table(['Name', 'Description', 'Status'], wrapped=True)
+        self.assertEqual(list(rows.dicts(WRAPPED)), [
+            {'Name': 'Gi1', 'Status': 'up',
+             'Description': 'uplink to the core switch, second floor'},
+            {'Name': 'Gi2', 'Description': 'spare', 'Status': 'down'}])
+
+    def test_index(self):
+        output = '''\
+Interface    User               Mode         Idle     Peer Address
+unknown      NETCONF(ONEP)      com.cisco.ne 00:00:49
+unknown      a(ONEP)            com.cisco.sy 00:00:49
+'''
+        entries = parse_table(output, ['Interface', 'User', 'Mode', 'Idle',
+                                       'Peer Address'], index=[0, 1])
+        self.assertEqual(sorted(entries['unknown']), ['NETCONF(ONEP)',
+                                                      'a(ONEP)'])
+        self.assertEqual(entries['unknown']['a(ONEP)']['Peer Address'], '')
+        with self.assertRaises(ValueError):
+            Table(['Interface', 'User'], labels=['interface'])
+
+    def test_benchmark(self):
+        self.assertEqual(len(list(Table(table.HEADERS).rows(
+            table.synthetic(50)))), 50)
+        self.assertEqual(table.parse_table(table.synthetic(50),
+                                           table.HEADERS).keys(),
+                         table._patterns(table.synthetic(50)).keys())
+        report = table.benchmark(rows=50, repeat=1)
+        self.assertIn('table', report)
+        self.assertIn('patterns', report)
+
+
+if __name__ == '__main__':
+    unittest.main()
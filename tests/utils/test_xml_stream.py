@@ -0,0 +1,83 @@
+import unittest
+
+from genie.libs.parser.utils.xml_stream import XmlRowStream
+
+
+class TestXmlRowStream(unittest.TestCase):
+
+    output = '''
+<?xml version="1.0" encoding="ISO-8859-1"?>
+<nf:rpc-reply xmlns="http://www.cisco.com/nxos:7.0.3.I7.1.:bgp" xmlns:nf="urn:ietf:params:xml:ns:netconf:base:1.0">
+ <nf:data>
+  <show>
+   <bgp>
+    <vrf>
+     <__XML__PARAM__vrf-name>
+      <__XML__value>VRF1</__XML__value>
+      <summary>
+       <__readonly__>
+        <processid>23800</processid>
+        <TABLE_vrf>
+         <ROW_vrf>
+          <vrf-name-out>VRF1</vrf-name-out>
+          <TABLE_neighbor>
+           <ROW_neighbor>
+            <neighborid>10.1.1.1</neighborid>
+            <state>Established</state>
+           </ROW_neighbor>
+           <ROW_neighbor>
+            <neighborid>10.1.1.2</neighborid>
+            <state/>
+           </ROW_neighbor>
+          </TABLE_neighbor>
+          <vrf-local-as>100</vrf-local-as>
+         </ROW_vrf>
+        </TABLE_vrf>
+       </__readonly__>
+      </summary>
+     </__XML__PARAM__vrf-name>
+    </vrf>
+   </bgp>
+  </show>
+ </nf:data>
+</nf:rpc-reply>
+]]>]]>
+'''
+
+    def test_rows(self):
+        # Small chunks split tags and the junk characters
+        for chunk_size in (7, 65536):
+            stream = XmlRowStream(self.output, chunk_size=chunk_size)
+            rows = list(stream)
+            self.assertEqual([name for name, _, _ in rows],
+                             ['ROW_neighbor', 'ROW_neighbor', 'ROW_vrf'])
+
+            name, row, parents = rows[1]
+            self.assertEqual(row, {'neighborid': '10.1.1.2', 'state': None})
+            self.assertEqual(len(parents), 1)
+            self.assertEqual(parents[0]['vrf-name-out'], 'VRF1')
+
+            name, row, parents = rows[2]
+            self.assertEqual(row, {'vrf-name-out': 'VRF1',
+                                   'vrf-local-as': '100'})
+            self.assertEqual(parents, [])
+
+            self.assertEqual(stream.top, {'processid': '23800'})
+            self.assertEqual(stream.namespace,
+                             '{http://www.cisco.com/nxos:7.0.3.I7.1.:bgp}')
+            self.assertEqual(stream.command, 'show bgp vrf VRF1 summary')
+
+    def test_rows_by_name(self):
+        stream = XmlRowStream(self.output)
+        self.assertEqual([row['neighborid'] for row, _ in
+                          stream.rows('ROW_neighbor')],
+                         ['10.1.1.1', '10.1.1.2'])
+
+    def test_command(self):
+        list(XmlRowStream(self.output, command='show bgp vrf VRF1 summary'))
+        with self.assertRaises(AssertionError):
+            list(XmlRowStream(self.output, command='show bgp vrf all summary'))
+
+
+if __name__ == '__main__':
+    unittest.main()